@@ -84,6 +84,9 @@ def parseCommandLineArguments():
     parser.add_argument('-t', '--walltime', type=str, nargs=1, default='0',
         metavar='HH:MM:SS', help='set the maximum execution time')
 
+    parser.add_argument('-n', '--nprocs', type=int, default=1,
+        metavar='N', help='use N worker processes for thermo estimation when not running under SCOOP')
+
     #Add option to output a folder that stores the details of each kinetic database entry source
     parser.add_argument('-k', '--kineticsdatastore', action='store_true', help='output a folder, kinetics_database, that contains a .txt file for each reaction family listing the source(s) for each entry')
 
@@ -125,7 +128,8 @@ if __name__ == '__main__':
         'scratch_directory': args.scratch_directory,
         'restart': args.restart,
         'walltime': args.walltime,
-        'kineticsdatastore': args.kineticsdatastore
+        'kineticsdatastore': args.kineticsdatastore,
+        'nprocs': args.nprocs
         }
 
     if args.profile:
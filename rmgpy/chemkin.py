@@ -52,6 +52,7 @@ from rmgpy.data.kinetics.library import LibraryReaction
 from rmgpy.data.kinetics.family import TemplateReaction
 from rmgpy.rmg.pdep import PDepNetwork
 from rmgpy.molecule import Molecule
+from rmgpy.molecule.adjlist import splitAdjacencyLists
 from rmgpy.molecule.util import retrieveElementCount
 from rmgpy.transport import TransportData
 
@@ -686,47 +687,30 @@ def readReactionComments(reaction, comments, read = True):
 
 ################################################################################
 
-def loadSpeciesDictionary(path):
+def loadSpeciesDictionary(path, check=True):
     """
     Load an RMG dictionary - containing species identifiers and the associated
     adjacency lists - from the file located at `path` on disk. Returns a dict
     mapping the species identifiers to the loaded species. Resonance isomers
-    for each species are automatically generated.
+    for each species are automatically generated. The whole file is read and
+    split into adjacency lists at once; if `check` is ``False``, the adjacency
+    lists are trusted (e.g. because they were written by RMG) and are not
+    checked for consistency.
     """
     speciesDict = {}
     
     inerts = [Species().fromSMILES(inert) for inert in ('[He]', '[Ne]', 'N#N', '[Ar]')]
     with open(path, 'r') as f:
-        adjlist = ''
-        for line in f:
-            if line.strip() == '' and adjlist.strip() != '':
-                # Finish this adjacency list
-                species = Species().fromAdjacencyList(adjlist)
-                species.generateResonanceIsomers()
-                label = species.label
-                for inert in inerts:
-                    if inert.isIsomorphic(species):
-                        species.reactive = False
-                        break
-                speciesDict[label] = species
-                adjlist = ''
-            else:
-                if "InChI" in line:
-                    line = line.split()[0] + '\n'
-                if '//' in line:
-                    index = line.index('//')
-                    line = line[0:index]
-                adjlist += line
-        else: #reach end of file
-            if adjlist.strip() != '':
-                species = Species().fromAdjacencyList(adjlist)
-                species.generateResonanceIsomers()
-                label = species.label
-                for inert in inerts:
-                    if inert.isIsomorphic(species):
-                        species.reactive = False
-                        break
-                speciesDict[label] = species
+        adjlists = splitAdjacencyLists(f.read())
+    for adjlist in adjlists:
+        species = Species().fromAdjacencyList(adjlist, check=check)
+        species.generateResonanceIsomers()
+        label = species.label
+        for inert in inerts:
+            if inert.isIsomorphic(species):
+                species.reactive = False
+                break
+        speciesDict[label] = species
 
     return speciesDict
 
@@ -788,11 +772,13 @@ def loadTransportFile(path, speciesDict):
                     comment = comment.strip(),
                 )
 
-def loadChemkinFile(path, dictionaryPath=None, transportPath=None, readComments = True, thermoPath = None, useChemkinNames=False):
+def loadChemkinFile(path, dictionaryPath=None, transportPath=None, readComments = True, thermoPath = None, useChemkinNames=False, checkDictionary=True):
     """
     Load a Chemkin input file located at `path` on disk to `path`, returning lists of the species
     and reactions in the Chemkin file. The 'thermoPath' point to a separate thermo file, or, if 'None' is 
-    specified, the function will look for the thermo database within the chemkin mechanism file
+    specified, the function will look for the thermo database within the chemkin mechanism file.
+    If `checkDictionary` is ``False``, the species dictionary is trusted (e.g. because it was
+    written by RMG) and its adjacency lists are not checked for consistency.
     """
     
     speciesList = []; speciesDict = {}; speciesAliases = {}
@@ -803,7 +789,7 @@ def loadChemkinFile(path, dictionaryPath=None, transportPath=None, readComments
     # as N2, or else the species objects will not store any structures for the final
     # HTML output.
     if dictionaryPath:
-        speciesDict = loadSpeciesDictionary(dictionaryPath)
+        speciesDict = loadSpeciesDictionary(dictionaryPath, check=checkDictionary)
     
     with open(path, 'r+b') as f:
     
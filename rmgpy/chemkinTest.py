@@ -121,6 +121,26 @@ class ChemkinTest(unittest.TestCase):
         os.remove(chemkinSavePath)
         os.remove(dictionarySavePath)
 
+    def testReadTrustedDictionary(self):
+        """
+        Test that skipping the checks of an RMG-generated species dictionary
+        gives the same species.
+        """
+        folder = os.path.join(os.path.dirname(rmgpy.__file__), 'test_data/chemkin/chemkin_py')
+
+        chemkinPath = os.path.join(folder, 'pdd', 'chem.inp')
+        dictionaryPath = os.path.join(folder, 'pdd', 'species_dictionary.txt')
+
+        species, reactions = loadChemkinFile(chemkinPath, dictionaryPath)
+        trustedSpecies, trustedReactions = loadChemkinFile(chemkinPath, dictionaryPath, checkDictionary=False)
+
+        self.assertEqual(len(species), len(trustedSpecies))
+        for spec, trustedSpec in zip(species, trustedSpecies):
+            self.assertEqual(spec.label, trustedSpec.label)
+            self.assertTrue(spec.isIsomorphic(trustedSpec))
+            self.assertEqual(spec.molecule[0].multiplicity, trustedSpec.molecule[0].multiplicity)
+        self.assertEqual(len(reactions), len(trustedReactions))
+
     def testReadAndWriteTemplateReactionFamilyForPDDExample(self):
         """
         This example is mainly to ensure comments like
@@ -38,6 +38,7 @@ import os
 import logging
 import re
 import codecs
+import itertools
 try:
     from collections import OrderedDict
 except ImportError:
@@ -45,6 +46,8 @@ except ImportError:
     OrderedDict = dict
 from rmgpy.molecule import Molecule, Group
 from rmgpy.molecule.adjlist import InvalidAdjacencyListError
+from rmgpy.molecule.resonance import getStructureHash
+from rmgpy.species import Species
 
 from reference import Reference, Article, Book, Thesis
 
@@ -138,6 +141,45 @@ class Entry(object):
 
 ################################################################################
 
+def getFormulas(molecules):
+    """
+    Return a sorted tuple of the formulas of the given `molecules`, which can
+    be :class:`Molecule` or :class:`Species` objects.
+    """
+    formulas = []
+    for molecule in molecules:
+        if isinstance(molecule, Species):
+            molecule = molecule.molecule[0]
+        formulas.append(molecule.getFingerprint())
+    formulas.sort()
+    return tuple(formulas)
+
+def getEntryStructureHashes(entry):
+    """
+    Return the set of structure hashes of the :class:`Molecule` item of an
+    `entry`, or of the molecules of its :class:`Species` item. Other items
+    have no structure hashes.
+    """
+    if isinstance(entry.item, Molecule):
+        return set([getStructureHash(entry.item)])
+    elif isinstance(entry.item, Species):
+        return set([getStructureHash(molecule) for molecule in entry.item.molecule])
+    return set()
+
+def getEntryReactionFormulas(entry):
+    """
+    Return the set of sorted tuples of the formulas of the reactants and of
+    the products of the reaction item of an `entry`. Items that are not
+    reactions have no formulas.
+    """
+    reactants = getattr(entry.item, 'reactants', None)
+    products = getattr(entry.item, 'products', None)
+    if not reactants or not products:
+        return set()
+    return set([getFormulas(reactants), getFormulas(products)])
+
+################################################################################
+
 class Database:
     """
     An RMG-style database, consisting of a dictionary of entries (associating
@@ -185,6 +227,71 @@ class Database:
         self.solvent = solvent
         self.shortDesc = shortDesc
         self.longDesc = longDesc
+        self._indexes = {}
+
+    def getIndex(self, name, getKeys):
+        """
+        Return the index of the entries of the database called `name`. This is
+        a dictionary mapping each of the keys returned by the function
+        `getKeys` for an entry to a list of ``(position, entry)`` pairs, where
+        `position` is the position of the entry in :attr:`entries`. The index
+        is built the first time it is needed, extended when entries are added,
+        and rebuilt when entries are removed or the :attr:`entries` dictionary
+        is replaced.
+        """
+        indexes = self.__dict__.setdefault('_indexes', {})
+        entries = self.entries
+        size = len(entries)
+        indexEntries, indexSize, index = indexes.get(name, (None, 0, None))
+        if (index is None or indexEntries is not entries or indexSize > size
+                or (indexSize < size and not isinstance(entries, OrderedDict))):
+            index = {}
+            indexSize = 0
+        if indexSize < size:
+            # Entries are only ever appended to an OrderedDict, so only the
+            # entries after those already indexed need to be added
+            for position, entry in enumerate(itertools.islice(entries.itervalues(), indexSize, None), indexSize):
+                for key in getKeys(entry):
+                    index.setdefault(key, []).append((position, entry))
+        indexes[name] = (entries, size, index)
+        return index
+
+    def findEntriesByKeys(self, name, getKeys, keys):
+        """
+        Return a list of the entries stored under any of the given `keys` in
+        the index called `name` (see :meth:`getIndex`), in the order they
+        appear in :attr:`entries`.
+        """
+        index = self.getIndex(name, getKeys)
+        candidates = {}
+        for key in keys:
+            for position, entry in index.get(key, []):
+                candidates[position] = entry
+        return [candidates[position] for position in sorted(candidates)]
+
+    def findEntriesByStructure(self, molecules):
+        """
+        Return a list of the entries whose item may be isomorphic to one of the
+        given `molecules`, in the order they appear in :attr:`entries`. The
+        entries are indexed by the structure hash of each :class:`Molecule`
+        item or each molecule of a :class:`Species` item. Entries not in the
+        list are certainly not isomorphic to any of the molecules, but each
+        returned entry still needs to be checked for isomorphism.
+        """
+        return self.findEntriesByKeys('structure', getEntryStructureHashes,
+                                      set([getStructureHash(molecule) for molecule in molecules]))
+
+    def findEntriesByReactants(self, reactants):
+        """
+        Return a list of the reaction entries whose reactants or products may
+        match the given `reactants`, which can be :class:`Molecule` or
+        :class:`Species` objects, in the order they appear in :attr:`entries`.
+        The entries are indexed by the formulas of their reactants and of
+        their products, which do not change if resonance isomers are added to
+        the species. Each returned entry still needs to be checked for
+        isomorphism.
+        """
+        return self.findEntriesByKeys('reactants', getEntryReactionFormulas, [getFormulas(reactants)])
 
     def load(self, path, local_context=None, global_context=None):
         """
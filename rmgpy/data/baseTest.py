@@ -6,7 +6,9 @@ import unittest
 from external.wip import work_in_progress
 
 from rmgpy.data.base import Entry, Database
-from rmgpy.molecule import Group
+from rmgpy.molecule import Group, Molecule
+from rmgpy.species import Species
+from rmgpy.reaction import Reaction
 
 ################################################################################
 
@@ -91,6 +93,45 @@ class TestBaseDatabase(unittest.TestCase):
 
 
 
+    def testFindEntriesByStructure(self):
+        """
+        Test that entries are found from the structure index in database order.
+        """
+        for index, smiles in enumerate(['CC', 'C=C', 'CCO', 'OCC', '[CH2]C']):
+            self.database.entries['entry{0:d}'.format(index)] = Entry(index=index, label='entry{0:d}'.format(index), item=Molecule().fromSMILES(smiles))
+        entries = self.database.findEntriesByStructure([Molecule().fromSMILES('C(O)C'), Molecule().fromSMILES('C=C')])
+        self.assertEqual([entry.label for entry in entries], ['entry1', 'entry2', 'entry3'])
+        self.assertEqual(self.database.findEntriesByStructure([Molecule().fromSMILES('C[CH2]')])[0].label, 'entry4')
+        self.assertEqual(self.database.findEntriesByStructure([Molecule().fromSMILES('CCC')]), [])
+
+        # Entries added or removed later are taken into account
+        self.database.entries['entry5'] = Entry(index=5, label='entry5', item=Species().fromSMILES('CCC'))
+        self.assertEqual([entry.label for entry in self.database.findEntriesByStructure([Molecule().fromSMILES('CCC')])], ['entry5'])
+        del self.database.entries['entry1']
+        self.assertEqual(self.database.findEntriesByStructure([Molecule().fromSMILES('C=C')]), [])
+
+    def testFindEntriesByReactants(self):
+        """
+        Test that reaction entries are found by the formulas of either their
+        reactants or their products.
+        """
+        reactions = [
+            (['C', '[OH]'], ['[CH3]', 'O']),
+            (['CC', '[OH]'], ['C[CH2]', 'O']),
+            (['[CH3]', '[CH3]'], ['CC']),
+        ]
+        for index, (reactants, products) in enumerate(reactions):
+            reaction = Reaction(reactants=[Species().fromSMILES(smiles) for smiles in reactants],
+                                products=[Species().fromSMILES(smiles) for smiles in products])
+            self.database.entries['reaction{0:d}'.format(index)] = Entry(index=index, label='reaction{0:d}'.format(index), item=reaction)
+        entries = self.database.findEntriesByReactants([Molecule().fromSMILES('[OH]'), Molecule().fromSMILES('C')])
+        self.assertEqual([entry.label for entry in entries], ['reaction0'])
+        entries = self.database.findEntriesByReactants([Species().fromSMILES('CC')])
+        self.assertEqual([entry.label for entry in entries], ['reaction2'])
+        entries = self.database.findEntriesByReactants([Molecule().fromSMILES('[CH3]'), Molecule().fromSMILES('O')])
+        self.assertEqual([entry.label for entry in entries], ['reaction0'])
+        self.assertEqual(self.database.findEntriesByReactants([Molecule().fromSMILES('CCC')]), [])
+
 ################################################################################
 
 if __name__ == '__main__':
@@ -31,6 +31,7 @@
 
 import os.path
 import logging
+import time
 from copy import deepcopy
 import numpy
 
@@ -80,6 +81,7 @@ class KineticsDatabase(object):
         A helper function used when pickling a KineticsDatabase object.
         """
         d = {
+            'recommendedFamilies': self.recommendedFamilies,
             'families': self.families,
             'libraries': self.libraries,
             'libraryOrder': self.libraryOrder,
@@ -90,17 +92,20 @@ class KineticsDatabase(object):
         """
         A helper function used when unpickling a KineticsDatabase object.
         """
+        self.recommendedFamilies = d['recommendedFamilies']
         self.families = d['families']
         self.libraries = d['libraries']
         self.libraryOrder = d['libraryOrder']
 
-    def load(self, path, families=None, libraries=None, depositories=None):
+    def load(self, path, families=None, libraries=None, depositories=None, lazy=False):
         """
         Load the kinetics database from the given `path` on disk, where `path`
-        points to the top-level folder of the families database.
+        points to the top-level folder of the families database. If `lazy` is
+        ``True``, the rate rules and depositories of the families are only
+        loaded when first needed.
         """
         self.loadRecommendedFamiliesList(os.path.join(path, 'families', 'recommended.py')),
-        self.loadFamilies(os.path.join(path, 'families'), families, depositories)
+        self.loadFamilies(os.path.join(path, 'families'), families, depositories, lazy)
         self.loadLibraries(os.path.join(path, 'libraries'), libraries)
 
     def loadRecommendedFamiliesList(self, filepath):
@@ -128,10 +133,15 @@ class KineticsDatabase(object):
             if not isinstance(recommended, bool):
                 raise DatabaseError("recommendedFamilies dictionary should contain only True or False values")
 
-    def loadFamilies(self, path, families=None, depositories=None):
+    def loadFamilies(self, path, families=None, depositories=None, lazy=False):
         """
         Load the kinetics families from the given `path` on disk, where `path`
         points to the top-level folder of the kinetics families.
+
+        If `lazy` is ``True``, only the groups and templates needed to generate
+        reactions are loaded now, and the rate rules and depositories of each
+        family are loaded the first time they are accessed, e.g. when
+        estimating kinetics for one of its reactions.
         """
         
         familiesToLoad = []
@@ -184,11 +194,14 @@ class KineticsDatabase(object):
         
         # Now we know what families to load, so let's load them
         self.families = {}
+        startTime = time.time()
         for label in familiesToLoad:
             familyPath = os.path.join(path, label)
             family = KineticsFamily(label=label)
-            family.load(familyPath, self.local_context, self.global_context, depositoryLabels=depositories)
+            family.load(familyPath, self.local_context, self.global_context, depositoryLabels=depositories, lazy=lazy)
             self.families[label] = family
+        if familiesToLoad:
+            logging.info('Loaded {0:d} kinetics families in {1:.1f} s'.format(len(familiesToLoad), time.time() - startTime))
 
     def loadLibraries(self, path, libraries=None):
         """
@@ -205,9 +218,11 @@ class KineticsDatabase(object):
                 library_file = os.path.join(path, library_name,'reactions.py')
                 if os.path.exists(library_file):
                     logging.info('Loading kinetics library {0} from {1}...'.format(library_name, library_file))
+                    startTime = time.time()
                     library = KineticsLibrary(label=library_name)
                     library.load(library_file, self.local_context, self.global_context)
                     self.libraries[library.label] = library
+                    logging.debug('Loaded kinetics library {0} in {1:.2f} s'.format(library_name, time.time() - startTime))
                 else:
                     if library_name == "KlippensteinH2O2":
                         logging.info("""\n** Note: The KlippensteinH2O2 library was replaced and is no longer available in RMG.
@@ -386,7 +401,7 @@ library instead, depending on the main bath gas (N2 or Ar/He, respectively)\n"""
         searches the depository.
         """
         reactionList = []
-        for entry in library.entries.values():
+        for entry in library.findEntriesByReactants(reactants):
             if entry.item.matchesMolecules(reactants):
                 reaction = LibraryReaction(
                     reactants = entry.item.reactants[:],
@@ -35,6 +35,8 @@ This module contains functionality for working with kinetics libraries.
 import os.path
 import logging
 import codecs
+import inspect
+import time
 from copy import deepcopy
 import itertools
 
@@ -44,6 +46,8 @@ from rmgpy.data.base import Database, Entry, LogicNode, LogicOr, ForbiddenStruct
 from rmgpy.reaction import Reaction
 from rmgpy.kinetics import Arrhenius, ArrheniusEP
 from rmgpy.molecule import Bond, GroupBond, Group, Molecule, ActionError
+from rmgpy.molecule.atomtype import atomTypes, allElements
+from rmgpy.molecule.compact import CompactMolecule
 from rmgpy.species import Species
 
 from .common import KineticsError, UndeterminableKineticsError, saveEntry
@@ -203,6 +207,9 @@ class ReactionRecipe:
         the structure should be labeled with the appropriate atom centers.
         """
 
+        if isinstance(struct, CompactMolecule):
+            return self.__applyCompact(struct, doForward)
+
         pattern = isinstance(struct, Group)
 
         for action in self.actions:
@@ -285,6 +292,59 @@ class ReactionRecipe:
             else:
                 raise InvalidActionError('Unknown action "' + action[0] + '" encountered.')
 
+    def __applyCompact(self, struct, doForward):
+        """
+        Apply the reaction recipe to `struct`, a :class:`CompactMolecule`
+        containing one or more structures, in the same way as :meth:`__apply`
+        does for :class:`Molecule` objects.
+        """
+
+        for action in self.actions:
+            if action[0] in ['CHANGE_BOND', 'FORM_BOND', 'BREAK_BOND']:
+
+                label1, info, label2 = action[1:]
+
+                # Find associated atoms
+                index1 = struct.getLabeledAtom(label1)
+                index2 = struct.getLabeledAtom(label2)
+                if index1 == index2:
+                    raise InvalidActionError('Invalid atom labels encountered.')
+
+                # Apply the action
+                if action[0] == 'CHANGE_BOND':
+                    info = int(info)
+                    struct.changeBond(index1, index2, info if doForward else -info)
+                elif (action[0] == 'FORM_BOND' and doForward) or (action[0] == 'BREAK_BOND' and not doForward):
+                    if struct.hasBond(index1, index2):
+                        raise InvalidActionError('Attempted to create an existing bond.')
+                    struct.formBond(index1, index2, 1)
+                elif (action[0] == 'BREAK_BOND' and doForward) or (action[0] == 'FORM_BOND' and not doForward):
+                    if not struct.hasBond(index1, index2):
+                        raise InvalidActionError('Attempted to remove a nonexistent bond.')
+                    struct.breakBond(index1, index2)
+
+            elif action[0] in ['LOSE_RADICAL', 'GAIN_RADICAL', 'LOSE_PAIR', 'GAIN_PAIR']:
+
+                label, change = action[1:]
+                change = int(change)
+
+                # Find associated atom
+                index = struct.getLabeledAtom(label)
+
+                # Apply the action
+                for i in range(change):
+                    if (action[0] == 'GAIN_RADICAL' and doForward) or (action[0] == 'LOSE_RADICAL' and not doForward):
+                        struct.incrementRadical(index)
+                    elif (action[0] == 'LOSE_RADICAL' and doForward) or (action[0] == 'GAIN_RADICAL' and not doForward):
+                        struct.decrementRadical(index)
+                    elif (action[0] == 'GAIN_PAIR' and doForward) or (action[0] == 'LOSE_PAIR' and not doForward):
+                        struct.incrementLonePairs(index)
+                    elif (action[0] == 'LOSE_PAIR' and doForward) or (action[0] == 'GAIN_PAIR' and not doForward):
+                        struct.decrementLonePairs(index)
+
+            else:
+                raise InvalidActionError('Unknown action "' + action[0] + '" encountered.')
+
     def applyForward(self, struct, unique=True):
         """
         Apply the forward reaction recipe to `molecule`, a single
@@ -302,6 +362,40 @@ class ReactionRecipe:
 
 ################################################################################
 
+def getGroupElements(group):
+    """
+    Return the set of element symbols that any molecule matching the given
+    :class:`Group` must contain. Atoms with generic atom types, e.g. ``R!H``,
+    do not require any particular element.
+    """
+    elements = set()
+    for atom in group.atoms:
+        symbols = set()
+        for atomType in atom.atomType:
+            for symbol in allElements:
+                if atomType.isSpecificCaseOf(atomTypes[symbol]):
+                    symbols.add(symbol)
+                    break
+            else:
+                symbols.add(None)
+        if len(symbols) == 1 and None not in symbols:
+            elements |= symbols
+    return elements
+
+def getMoleculeElements(molecules):
+    """
+    Return the set of element symbols in the given list of `molecules`, each
+    of which is either a :class:`Molecule` object or a list of resonance
+    isomers of one.
+    """
+    elements = set()
+    for molecule in molecules:
+        for isomer in (molecule if isinstance(molecule, list) else [molecule]):
+            elements.update([atom.element.symbol for atom in isomer.atoms])
+    return elements
+
+################################################################################
+
 class KineticsFamily(Database):
     """
     A class for working with an RMG kinetics family: a set of reactions with 
@@ -358,6 +452,10 @@ class KineticsFamily(Database):
         self.groups = None
         self.rules = None
         self.depositories = []
+        self.requiredElements = None
+        self.kineticsDataSource = None
+        self.kineticsDataSteps = []
+        self.loadTimes = {}
 
     def __repr__(self):
         return '<ReactionFamily "{0}">'.format(self.label)
@@ -517,7 +615,7 @@ class KineticsFamily(Database):
         
         ftemp.close()
     
-    def load(self, path, local_context=None, global_context=None, depositoryLabels=None):
+    def load(self, path, local_context=None, global_context=None, depositoryLabels=None, lazy=False):
         """
         Load a kinetics database from a file located at `path` on disk.
         
@@ -527,7 +625,13 @@ class KineticsFamily(Database):
         
         If depositoryLabels is None then load 'training' first then everything else.
         If depositoryLabels is not None then load in the order specified in depositoryLabels.
+
+        If `lazy` is ``True``, only the groups, template, recipe and forbidden
+        structures needed to generate reactions are loaded now. The rate rules
+        and depositories are then loaded by :meth:`loadKineticsData` the first
+        time the `rules` or `depositories` attribute is accessed.
         """
+        startTime = time.time()
         local_context['recipe'] = self.loadRecipe
         local_context['template'] = self.loadTemplate
         local_context['forbidden'] = self.loadForbidden
@@ -557,8 +661,64 @@ class KineticsFamily(Database):
             self.reverseRecipe = self.forwardRecipe.getReverse()
         
         self.groups.numReactants = len(self.forwardTemplate.reactants)
-            
+        self.requiredElements = None
+        self.loadTimes['groups'] = time.time() - startTime
+        logging.debug("Loaded kinetics family groups of {0} in {1:.2f} s".format(self.label, self.loadTimes['groups']))
+
+        if lazy:
+            # The loader methods in the context belong to this family and its
+            # groups, and are replaced anyway when the rate rules and depositories
+            # are loaded, so only the data types are kept
+            context = dict([(key, value) for key, value in local_context.iteritems() if not inspect.ismethod(value)])
+            self.kineticsDataSource = (path, context, dict(global_context), depositoryLabels)
+            # Removing the attributes makes the next access go through __getattr__
+            del self.rules
+            del self.depositories
+        else:
+            self.loadKineticsData(path, local_context, global_context, depositoryLabels)
+
+    def __getattr__(self, name):
+        """
+        Load the rate rules and depositories of a lazily loaded family the
+        first time that either of them is accessed.
+        """
+        if name in ('rules', 'depositories') and self.__dict__.get('kineticsDataSource') is not None:
+            self.loadKineticsData(*self.kineticsDataSource)
+            self.processKineticsData()
+            return self.__dict__[name]
+        raise AttributeError(name)
+
+    def deferKineticsDataStep(self, methodName, **kwargs):
+        """
+        Call the method `methodName` of this family with the keyword arguments
+        `kwargs` once its rate rules and depositories are loaded, e.g.
+        ``'fillKineticsRulesByAveragingUp'``. If they are already loaded, the
+        method is called immediately.
+        """
+        self.kineticsDataSteps.append((methodName, kwargs))
+        if self.kineticsDataSource is None:
+            self.processKineticsData()
+
+    def processKineticsData(self):
+        """
+        Call the methods registered by :meth:`deferKineticsDataStep`, in order.
+        """
+        steps, self.kineticsDataSteps = self.kineticsDataSteps, []
+        for methodName, kwargs in steps:
+            getattr(self, methodName)(**kwargs)
+
+    def loadKineticsData(self, path, local_context=None, global_context=None, depositoryLabels=None):
+        """
+        Load the rate rules and the kinetics depositories of the family from
+        the directory `path` on disk. This is called by :meth:`load`, either
+        immediately or, for lazily loaded families, on first use.
+        """
+        startTime = time.time()
+        self.kineticsDataSource = None
+        if local_context is None: local_context = {}
+        if global_context is None: global_context = {}
         self.rules = KineticsRules(label='{0}/rules'.format(self.label))
+        self.depositories = []
         logging.debug("Loading kinetics family rules from {0}".format(os.path.join(path, 'rules.py')))
         self.rules.load(os.path.join(path, 'rules.py'), local_context, global_context)
         # load the groups indicated in the entry label
@@ -568,8 +728,7 @@ class KineticsFamily(Database):
             reaction = Reaction(reactants=reactants, products=[])
             for entry in entries:
                 entry.item = reaction
-        self.depositories = []
-        
+
         if depositoryLabels=='all':
             # Load everything. This option is generally used for working with the database
             # load all the remaining depositories, in order returned by os.walk
@@ -584,6 +743,8 @@ class KineticsFamily(Database):
                     logging.debug("Loading kinetics family depository from {0}".format(fpath))
                     depository.load(fpath, local_context, global_context)
                     self.depositories.append(depository)
+            self.loadTimes['kinetics'] = time.time() - startTime
+            logging.debug("Loaded rate rules and depositories of kinetics family {0} in {1:.2f} s".format(self.label, self.loadTimes['kinetics']))
             return
                     
         if not depositoryLabels:
@@ -611,7 +772,43 @@ class KineticsFamily(Database):
             logging.debug("Loading kinetics family depository from {0}".format(fpath))
             depository.load(fpath, local_context, global_context)
             self.depositories.append(depository)
-        
+        self.loadTimes['kinetics'] = time.time() - startTime
+        logging.debug("Loaded rate rules and depositories of kinetics family {0} in {1:.2f} s".format(self.label, self.loadTimes['kinetics']))
+
+    def getRequiredElements(self):
+        """
+        Return the set of element symbols that the reactants must contain
+        between them for this family to generate any reactions, in either
+        direction. The set is determined from the atom types in the template
+        groups: an atom only requires an element if all of its atom types are
+        specific cases of that element.
+        """
+        if self.requiredElements is None:
+            requiredElements = self.__getTemplateElements(self.forwardTemplate.reactants)
+            if not self.ownReverse:
+                requiredElements &= self.__getTemplateElements(self.reverseTemplate.reactants)
+            self.requiredElements = frozenset(requiredElements)
+        return self.requiredElements
+
+    def __getTemplateElements(self, templateReactants):
+        """
+        Return the set of element symbols required by the list of
+        `templateReactants`.
+        """
+        elements = set()
+        for templateReactant in templateReactants:
+            if isinstance(templateReactant, list): templateReactant = templateReactant[0]
+            struct = templateReactant.item
+            if isinstance(struct, LogicOr):
+                try:
+                    structures = struct.getPossibleStructures(self.groups.entries)
+                except NotImplementedError:
+                    continue
+                if structures:
+                    elements |= reduce(set.intersection, [getGroupElements(group) for group in structures])
+            elif isinstance(struct, Group):
+                elements |= getGroupElements(struct)
+        return elements
 
     def loadTemplate(self, reactants, products, ownReverse=False):
         """
@@ -923,10 +1120,12 @@ class KineticsFamily(Database):
             raise ValueError('No entry for template {0}.'.format(template))
         return entry
 
-    def addKineticsRulesFromTrainingSet(self, thermoDatabase=None):
+    def addKineticsRulesFromTrainingSet(self, thermoDatabase=None, ignoreSpeciesConstraints=False):
         """
         For each reaction involving real reactants and products in the training
-        set, add a rate rule for that reaction.
+        set, add a rate rule for that reaction. If `ignoreSpeciesConstraints`
+        is ``True``, the species constraints of the RMG job are not applied
+        when computing the degeneracies of the reverse training reactions.
         """
         try:
             depository = self.getTrainingDepository()
@@ -1003,7 +1202,7 @@ class KineticsFamily(Database):
             
             item = Reaction(reactants=[m.molecule[0].copy(deep=True) for m in entry.item.products], products=[m.molecule[0].copy(deep=True) for m in entry.item.reactants])
             template = self.getReactionTemplate(item)
-            item.degeneracy = self.calculateDegeneracy(item)
+            item.degeneracy = self.calculateDegeneracy(item, ignoreSpeciesConstraints=ignoreSpeciesConstraints)
             
             new_entry = Entry(
                 index = index,
@@ -1030,6 +1229,8 @@ class KineticsFamily(Database):
             except KeyError:
                 self.rules.entries[new_entry.label] = [new_entry]
             index += 1
+
+        self.rules.clearEstimateCache()
     
     def getRootTemplate(self):
         """
@@ -1060,6 +1261,10 @@ class KineticsFamily(Database):
         of the reactant structures must already be tagged with the appropriate
         labels. Returns a list of structures corresponding to the products
         after checking that the correct number of products was produced.
+
+        :class:`Molecule` reactants are copied, merged, reacted and split as
+        :class:`CompactMolecule` arrays, and :class:`Molecule` objects are
+        only created for the products once their number has been checked.
         """
 
         # There is some hardcoding of reaction families in this function, so
@@ -1072,10 +1277,12 @@ class KineticsFamily(Database):
         # products will have tags
         if isinstance(reactantStructures[0], Group):
             reactantStructure = Group()
+            for s in reactantStructures:
+                reactantStructure = reactantStructure.merge(s.copy(deep=True))
         else:
-            reactantStructure = Molecule()
-        for s in reactantStructures:
-            reactantStructure = reactantStructure.merge(s.copy(deep=True))
+            reactantStructure = CompactMolecule()
+            for s in reactantStructures:
+                reactantStructure = reactantStructure.merge(CompactMolecule().fromMolecule(s))
 
         # Hardcoding of reaction family for radical recombination (colligation)
         # because the two reactants are identical, they have the same tags
@@ -1083,10 +1290,17 @@ class KineticsFamily(Database):
         # '*2'
         if label == 'r_recombination' and forward:
             identicalCenterCounter = 0
-            for atom in reactantStructure.atoms:
-                if atom.label == '*':
-                    identicalCenterCounter += 1
-                    atom.label = '*' + str(identicalCenterCounter)
+            if isinstance(reactantStructure, CompactMolecule):
+                labels = reactantStructure.labels
+                for index in range(len(labels)):
+                    if labels[index] == '*':
+                        identicalCenterCounter += 1
+                        labels[index] = '*' + str(identicalCenterCounter)
+            else:
+                for atom in reactantStructure.atoms:
+                    if atom.label == '*':
+                        identicalCenterCounter += 1
+                        atom.label = '*' + str(identicalCenterCounter)
             if identicalCenterCounter != 2:
                 raise KineticsError('Unable to change labels from "*" to "*1" and "*2" for reaction family {0}.'.format(label))
 
@@ -1097,22 +1311,47 @@ class KineticsFamily(Database):
             self.reverseRecipe.applyForward(reactantStructure, unique)
         productStructure = reactantStructure
 
+        if not forward: template = self.reverseTemplate
+        else:           template = self.forwardTemplate
+
+        # Split product structure into multiple species if necessary
+        productStructures = productStructure.split()
+
+        # Make sure we've made the expected number of products
+        if len(template.products) != len(productStructures):
+            # We have a different number of products than expected by the template.
+            # By definition this means that the template is not a match, so
+            # we return None to indicate that we could not generate the product
+            # structures
+            # We need to think this way in order to distinguish between
+            # intermolecular and intramolecular versions of reaction families,
+            # which will have very different kinetics
+            # Unfortunately this may also squash actual errors with malformed
+            # reaction templates
+            return None
+
+        # Only now create the product Molecule objects
+        if isinstance(productStructure, CompactMolecule):
+            productStructures = [struct.toMolecule() for struct in productStructures]
+
         # Hardcoding of reaction family for reverse of radical recombination
         # (Unimolecular homolysis)
         # Because the two products are identical, they should the same tags
         # In this case, we must change the labels from '*1' and '*2' to '*' and
         # '*'
         if label == 'r_recombination' and not forward:
-            for atom in productStructure.atoms:
-                if atom.label == '*1' or atom.label == '*2': atom.label = '*'
+            for struct in productStructures:
+                for atom in struct.atoms:
+                    if atom.label == '*1' or atom.label == '*2': atom.label = '*'
 
         # If reaction family is its own reverse, relabel atoms
         if not self.reverseTemplate:
             # Get atom labels for products
             atomLabels = {}
-            for atom in productStructure.atoms:
-                if atom.label != '':
-                    atomLabels[atom.label] = atom
+            for struct in productStructures:
+                for atom in struct.atoms:
+                    if atom.label != '':
+                        atomLabels[atom.label] = atom
 
             # This is hardcoding of reaction families (bad!)
             label = self.label.lower()
@@ -1141,25 +1380,6 @@ class KineticsFamily(Database):
                 atomLabels['*3'].label = '*5'
                 atomLabels['*5'].label = '*3'
 
-        if not forward: template = self.reverseTemplate
-        else:           template = self.forwardTemplate
-
-        # Split product structure into multiple species if necessary
-        productStructures = productStructure.split()
-
-        # Make sure we've made the expected number of products
-        if len(template.products) != len(productStructures):
-            # We have a different number of products than expected by the template.
-            # By definition this means that the template is not a match, so
-            # we return None to indicate that we could not generate the product
-            # structures
-            # We need to think this way in order to distinguish between
-            # intermolecular and intramolecular versions of reaction families,
-            # which will have very different kinetics
-            # Unfortunately this may also squash actual errors with malformed
-            # reaction templates
-            return None
-
         # If there are two product structures, place the one containing '*1' first
         if len(productStructures) == 2:
             if not productStructures[0].containsLabeledAtom('*1') and \
@@ -1174,7 +1394,7 @@ class KineticsFamily(Database):
         # Return the product structures
         return productStructures
 
-    def __generateProductStructures(self, reactantStructures, maps, forward):
+    def __generateProductStructures(self, reactantStructures, maps, forward, ignoreSpeciesConstraints=False):
         """
         For a given set of `reactantStructures` and a given set of `maps`,
         generate and return the corresponding product structures. The
@@ -1182,7 +1402,9 @@ class KineticsFamily(Database):
         reactants are stored in the reaction family template. The `maps`
         parameter is a list of mappings of the top-level tree node of each
         *template* reactant to the corresponding *structure*. This function
-        returns a list of the product structures.
+        returns a list of the product structures. The species constraints
+        are not applied to the products if `ignoreSpeciesConstraints` is
+        ``True``.
         """
         
         productStructures = None
@@ -1232,7 +1454,7 @@ class KineticsFamily(Database):
         for struct in productStructures:
             if self.isMoleculeForbidden(struct):
                 raise ForbiddenStructureException() 
-            if failsSpeciesConstraints(struct):
+            if not ignoreSpeciesConstraints and failsSpeciesConstraints(struct):
                 raise ForbiddenStructureException() 
                 
         return productStructures
@@ -1318,7 +1540,12 @@ class KineticsFamily(Database):
         consistent with the template of this reaction family.
         """
         reactionList = []
-        
+
+        # Skip the subgraph matching if the reactants lack an element that
+        # the templates of this family require
+        if not self.getRequiredElements() <= getMoleculeElements(reactants):
+            return reactionList
+
         # Forward direction (the direction in which kinetics is defined)
         reactionList.extend(self.__generateReactions(reactants, forward=True))
         
@@ -1377,12 +1604,15 @@ class KineticsFamily(Database):
             
         return reactionList
     
-    def calculateDegeneracy(self, reaction):
+    def calculateDegeneracy(self, reaction, ignoreSpeciesConstraints=False):
         """
         For a `reaction` given in the direction in which the kinetics are
-        defined, compute the reaction-path degeneracy.
+        defined, compute the reaction-path degeneracy. The species constraints
+        are not applied to the products if `ignoreSpeciesConstraints` is
+        ``True``.
         """
-        reactions = self.__generateReactions(reaction.reactants, products=reaction.products, forward=True)
+        reactions = self.__generateReactions(reaction.reactants, products=reaction.products, forward=True,
+                                             ignoreSpeciesConstraints=ignoreSpeciesConstraints)
         if len(reactions) != 1:
             for reactant in reaction.reactants:
                 logging.error("Reactant: {0!r}".format(reactant))
@@ -1393,14 +1623,15 @@ class KineticsFamily(Database):
                                  'but generated {2}').format(reaction, self.label, len(reactions)))
         return reactions[0].degeneracy
         
-    def __generateReactions(self, reactants, products=None, forward=True):
+    def __generateReactions(self, reactants, products=None, forward=True, ignoreSpeciesConstraints=False):
         """
         Generate a list of all of the possible reactions of this family between
         the list of `reactants`. The number of reactants provided must match
         the number of reactants expected by the template, or this function
         will return an empty list. Each item in the list of reactants should
         be a list of :class:`Molecule` objects, each representing a resonance
-        isomer of the species of interest.
+        isomer of the species of interest. The species constraints are not
+        applied to the products if `ignoreSpeciesConstraints` is ``True``.
         """
 
         rxnList = []; speciesList = []
@@ -1429,7 +1660,7 @@ class KineticsFamily(Database):
                 for map in mappings:
                     reactantStructures = [molecule]
                     try:
-                        productStructures = self.__generateProductStructures(reactantStructures, [map], forward)
+                        productStructures = self.__generateProductStructures(reactantStructures, [map], forward, ignoreSpeciesConstraints)
                     except ForbiddenStructureException:
                         pass
                     else:
@@ -1456,7 +1687,7 @@ class KineticsFamily(Database):
                         for mapB in mappingsB:
                             reactantStructures = [moleculeA, moleculeB]
                             try:
-                                productStructures = self.__generateProductStructures(reactantStructures, [mapA, mapB], forward)
+                                productStructures = self.__generateProductStructures(reactantStructures, [mapA, mapB], forward, ignoreSpeciesConstraints)
                             except ForbiddenStructureException:
                                 pass
                             else:
@@ -1476,7 +1707,7 @@ class KineticsFamily(Database):
                             for mapB in mappingsB:
                                 reactantStructures = [moleculeA, moleculeB]
                                 try:
-                                    productStructures = self.__generateProductStructures(reactantStructures, [mapA, mapB], forward)
+                                    productStructures = self.__generateProductStructures(reactantStructures, [mapA, mapB], forward, ignoreSpeciesConstraints)
                                 except ForbiddenStructureException:
                                     pass
                                 else:
@@ -1755,7 +1986,7 @@ class KineticsFamily(Database):
         direction.
         """
         kineticsList = []
-        entries = depository.entries.values()
+        entries = depository.findEntriesByReactants(reaction.reactants)
         for entry in entries:
             if entry.item.isIsomorphic(reaction):
                 kineticsList.append([deepcopy(entry.data), entry, entry.item.isIsomorphic(reaction, eitherDirection=False)])
@@ -1,7 +1,9 @@
 import unittest
+import cPickle
 from rmgpy.data.kinetics.database import KineticsDatabase
 import os.path
 from rmgpy.molecule.group import Group
+from rmgpy.molecule.molecule import Molecule
 from rmgpy import settings
 ###################################################
 
@@ -41,4 +43,102 @@ class TestFamily(unittest.TestCase):
         topGroups = self.family.getTopLevelGroups(self.family.groups.entries["RnH"])
         self.assertEquals(len(topGroups), 2)
         self.assertIn(self.family.groups.entries["R5Hall"], topGroups)
-        self.assertIn(self.family.groups.entries["R6Hall"], topGroups)
\ No newline at end of file
+        self.assertIn(self.family.groups.entries["R6Hall"], topGroups)
+
+    def testGetRequiredElements(self):
+        """
+        Test that reactants without the elements required by the templates are skipped
+        """
+        self.assertIn('H', self.family.getRequiredElements())
+        argon = Molecule().fromAdjacencyList("1 Ar u0 p4 c0")
+        self.assertEqual(self.family.generateReactions([argon]), [])
+
+    def testEstimateKineticsCache(self):
+        """
+        Test that rate rule estimates are cached per template and copied with the degeneracy applied
+        """
+        rules = self.family.rules
+        label = rules.entries.keys()[0]
+        template = [self.family.groups.entries[node] for node in label.split(';')]
+        kinetics1, entry1 = rules.estimateKinetics(template)
+        misses = rules.estimateCacheMisses
+        kinetics1.A.value_si *= 10
+        kinetics2, entry2 = rules.estimateKinetics(template, degeneracy=2)
+        self.assertEqual(rules.estimateCacheMisses, misses)
+        self.assertTrue(rules.estimateCacheHits > 0)
+        self.assertIs(entry1, entry2)
+        self.assertAlmostEqual(kinetics2.A.value_si / kinetics1.A.value_si, 0.2)
+        self.assertIn('Multiplied by reaction path degeneracy 2', kinetics2.comment)
+        self.assertNotIn('degeneracy', kinetics1.comment)
+        rules.clearEstimateCache()
+        rules.estimateKinetics(template)
+        self.assertEqual(rules.estimateCacheMisses, misses + 1)
+
+    def testIgnoreSpeciesConstraints(self):
+        """
+        Test that the species constraints can be ignored when computing the degeneracy
+        """
+        import rmgpy.rmg.input
+        from rmgpy.rmg.main import RMG
+        from rmgpy.reaction import Reaction
+        from rmgpy.data.kinetics.common import KineticsError
+        rmg = RMG()
+        rmg.speciesConstraints = {'maximumCarbonAtoms': 4}
+        rmgpy.rmg.input.rmg = rmg
+        try:
+            reaction = Reaction(reactants=[Molecule().fromSMILES('[CH2]CCCC')],
+                                products=[Molecule().fromSMILES('CCC[CH]C')])
+            self.assertRaises(KineticsError, self.family.calculateDegeneracy, reaction)
+            self.assertEqual(rmg.speciesConstraints, {'maximumCarbonAtoms': 4})
+            self.assertTrue(self.family.calculateDegeneracy(reaction, ignoreSpeciesConstraints=True) > 0)
+        finally:
+            rmgpy.rmg.input.rmg = None
+
+class TestLazyFamily(unittest.TestCase):
+
+    def setUp(self):
+        """
+        A function run before each unit test in this class.
+        """
+        self.database = KineticsDatabase()
+        self.database.loadFamilies(os.path.join(settings['test_data.directory'], 'testing_database/kinetics/families'),
+                                   families=['intra_H_migration'], lazy=True)
+        self.family = self.database.families['intra_H_migration']
+
+    def testLazyLoad(self):
+        """
+        Test that the rules and depositories are only loaded when first accessed
+        """
+        self.assertIn('groups', self.family.loadTimes)
+        self.assertNotIn('rules', self.family.__dict__)
+        self.assertNotIn('depositories', self.family.__dict__)
+        self.assertTrue(len(self.family.rules.entries) > 0)
+        self.assertEqual([depository.label for depository in self.family.depositories], ['intra_H_migration/training'])
+        self.assertIn('kinetics', self.family.loadTimes)
+        self.assertIsNone(self.family.kineticsDataSource)
+
+    def testPickleLazyFamily(self):
+        """
+        Test that a family that has not yet loaded its rules can be pickled
+        """
+        family = cPickle.loads(cPickle.dumps(self.family, -1))
+        self.assertNotIn('rules', family.__dict__)
+        self.assertEqual(len(family.rules.entries), len(self.family.rules.entries))
+
+    def testDeferKineticsDataStep(self):
+        """
+        Test that processing steps are deferred until the rules are first loaded
+        """
+        self.family.deferKineticsDataStep('fillKineticsRulesByAveragingUp')
+        self.assertNotIn('rules', self.family.__dict__)
+        self.assertEqual(len(self.family.kineticsDataSteps), 1)
+        rules = self.family.rules
+        self.assertEqual(self.family.kineticsDataSteps, [])
+
+        database = KineticsDatabase()
+        database.loadFamilies(os.path.join(settings['test_data.directory'], 'testing_database/kinetics/families'),
+                              families=['intra_H_migration'])
+        family = database.families['intra_H_migration']
+        family.deferKineticsDataStep('fillKineticsRulesByAveragingUp')
+        self.assertEqual(family.kineticsDataSteps, [])
+        self.assertEqual(sorted(rules.entries.keys()), sorted(family.rules.entries.keys()))
@@ -149,7 +149,7 @@ class KineticsLibrary(Database):
             if not reaction0.duplicate:
                 # This reaction is not marked as a duplicate reaction
                 # This means that if we find any duplicate reactions, it is an error
-                for entry in self.entries.values():
+                for entry in self.findEntriesByReactants(reaction0.reactants):
                     reaction = entry.item
                     if reaction0 is not reaction and reaction0.isIsomorphic(reaction): 
                         # We found a duplicate reaction that wasn't marked!
@@ -176,7 +176,7 @@ class KineticsLibrary(Database):
                 continue
             print "Found a duplicate reaction: {0}".format(reaction0)
             duplicates = [entry0]
-            for entry in self.entries.values():
+            for entry in self.findEntriesByReactants(reaction0.reactants):
                 reaction = entry.item
                 if reaction0 is reaction:
                     continue
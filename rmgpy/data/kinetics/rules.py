@@ -56,6 +56,9 @@ class KineticsRules(Database):
     
     def __init__(self, label='', name='', shortDesc='', longDesc=''):
         Database.__init__(self, label=label, name=name, shortDesc=shortDesc, longDesc=longDesc)
+        self._estimateCache = (None, {})
+        self.estimateCacheHits = 0
+        self.estimateCacheMisses = 0
 
     def __repr__(self):
         return '<KineticsRules "{0}">'.format(self.label)
@@ -89,6 +92,7 @@ class KineticsRules(Database):
             self.entries[label].append(entry)
         except KeyError:
             self.entries[label] = [entry]
+        self.clearEstimateCache()
         return entry
 
     def saveEntry(self, f, entry):
@@ -526,6 +530,7 @@ class KineticsRules(Database):
                 rank = 10, # Indicates this is an averaged estimate
             )
             self.entries[entry.label] = [entry]
+            self.clearEstimateCache()
             alreadyDone[rootLabel] = entry.data
             return entry.data
             
@@ -587,10 +592,55 @@ class KineticsRules(Database):
         norm = numpy.dot(distance,distance)
         return norm
         
+    def clearEstimateCache(self):
+        """
+        Empty the cache of kinetics estimated from the rate rules by
+        :meth:`estimateKinetics`. This must be called whenever the entries of
+        an existing template are modified; replacing the :attr:`entries`
+        dictionary empties the cache automatically.
+        """
+        self._estimateCache = (None, {})
+
+    def getEstimateCacheHitRate(self):
+        """
+        Return the fraction of the calls to :meth:`estimateKinetics` that were
+        answered from the cache, or ``None`` if it has not been called yet.
+        """
+        hits = self.__dict__.get('estimateCacheHits', 0)
+        total = hits + self.__dict__.get('estimateCacheMisses', 0)
+        return float(hits) / total if total > 0 else None
+
     def estimateKinetics(self, template, degeneracy=1):
         """
         Determine the appropriate kinetics for a reaction with the given
-        `template` using rate rules.
+        `template` using rate rules. The estimate for each template, before
+        the reaction path `degeneracy` is applied, is cached, so later calls
+        with the same template only copy the cached kinetics.
+        """
+        cacheEntries, cache = self.__dict__.get('_estimateCache', (None, {}))
+        if cacheEntries is not self.entries:
+            cache = {}
+            self._estimateCache = (self.entries, cache)
+        key = tuple(template)
+        try:
+            kinetics, entry = cache[key]
+        except KeyError:
+            kinetics, entry = cache[key] = self.__estimateKinetics(template)
+            self.estimateCacheMisses = self.__dict__.get('estimateCacheMisses', 0) + 1
+        else:
+            self.estimateCacheHits = self.__dict__.get('estimateCacheHits', 0) + 1
+
+        kinetics = deepcopy(kinetics)
+        kinetics.A.value_si *= degeneracy
+        if degeneracy > 1:
+            kinetics.comment += "\n"
+            kinetics.comment += "Multiplied by reaction path degeneracy {0}".format(degeneracy)
+        return kinetics, entry
+
+    def __estimateKinetics(self, template):
+        """
+        Estimate the kinetics for a reaction with the given `template` from
+        the rate rules, without applying the reaction path degeneracy.
         """
         def getTemplateLabel(template):
             # Get string format of the template in the form "(leaf1,leaf2)"
@@ -648,10 +698,6 @@ class KineticsRules(Database):
                     )
                 
                 kinetics.comment +=  ' for rate rule ' + originalLeaves
-                kinetics.A.value_si *= degeneracy
-                if degeneracy > 1:
-                    kinetics.comment += "\n"
-                    kinetics.comment += "Multiplied by reaction path degeneracy {0}".format(degeneracy)
 
                 return kinetics, entry if 'Exact' in kinetics.comment else None
             
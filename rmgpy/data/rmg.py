@@ -35,6 +35,9 @@ for working with the RMG database.
 
 import os.path
 import logging
+import hashlib
+import cPickle
+import tempfile
 
 from base import ForbiddenStructures
 from thermo import ThermoDatabase
@@ -43,11 +46,20 @@ from rmgpy.data.kinetics.database import KineticsDatabase
 from statmech import StatmechDatabase
 from solvation import SolvationDatabase
 
+import rmgpy
 from rmgpy.scoop_framework.util import get, broadcast
 
 # Module-level variable to store the (only) instance of RMGDatabase in use.
 database = None
 
+# The version of the layout of database snapshots; increment this whenever a
+# change to the database classes makes existing snapshots unusable
+snapshotFormatVersion = 1
+
+# The hash of the RMG-Py sources that build the objects in a snapshot,
+# computed once per process by getSourceHash()
+_sourceHash = None
+
 ################################################################################
 
 class RMGDatabase:
@@ -83,7 +95,8 @@ class RMGDatabase:
              statmechLibraries=None,
              depository=True,
              solvation=True,
-             testing = False):
+             testing = False,
+             lazyKinetics=False):
         """
         Load the RMG database from the given `path` on disk, where `path`
         points to the top-level folder of the RMG database. If none of the
@@ -92,6 +105,9 @@ class RMGDatabase:
         components of the database be loaded.
 
         Argument testing will load a lighter version of the database used for unit-tests
+
+        If `lazyKinetics` is ``True``, the rate rules and depositories of the
+        kinetics families are only loaded when first needed.
         """
         self.loadThermo(os.path.join(path, 'thermo'), thermoLibraries, depository)
         if not testing:
@@ -101,7 +117,8 @@ class RMGDatabase:
                           reactionLibraries,
                           seedMechanisms,
                           kineticsFamilies,
-                          kineticsDepositories
+                          kineticsDepositories,
+                          lazyKinetics
                           )
         if not testing:
             self.loadStatmech(os.path.join(path, 'statmech'), statmechLibraries, depository)
@@ -141,11 +158,14 @@ class RMGDatabase:
                      reactionLibraries=None,
                      seedMechanisms=None,
                      kineticsFamilies=None,
-                     kineticsDepositories=None
+                     kineticsDepositories=None,
+                     lazy=False
                      ):
         """
         Load the RMG kinetics database from the given `path` on disk, where
         `path` points to the top-level folder of the RMG kinetics database.
+        If `lazy` is ``True``, the rate rules and depositories of the kinetics
+        families are only loaded when first needed.
         """
         kineticsLibraries = []
         libraryOrder = []
@@ -165,7 +185,8 @@ class RMGDatabase:
         self.kinetics.load(path,
                            families=kineticsFamilies,
                            libraries=kineticsLibraries,
-                           depositories=kineticsDepositories
+                           depositories=kineticsDepositories,
+                           lazy=lazy
                            )
 
         broadcast(self.kinetics, 'kinetics')
@@ -188,6 +209,52 @@ class RMGDatabase:
         self.statmech.load(path, statmechLibraries, depository)
         broadcast(self.statmech, 'statmech')
 
+    def saveSnapshot(self, path):
+        """
+        Save a binary snapshot of the loaded (and possibly further processed,
+        e.g. with averaged kinetics rules) database to the given `path` on
+        disk. The snapshot is written to a temporary file first and then
+        renamed, so concurrent jobs never see a partially written snapshot.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        if not os.path.exists(directory): os.makedirs(directory)
+        d = {
+            'thermo': self.thermo,
+            'transport': self.transport,
+            'forbiddenStructures': self.forbiddenStructures,
+            'kinetics': self.kinetics,
+            'statmech': self.statmech,
+            'solvation': self.solvation,
+        }
+        fd, tempPath = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                cPickle.dump(d, f, cPickle.HIGHEST_PROTOCOL)
+            os.rename(tempPath, path)
+        except:
+            if os.path.exists(tempPath): os.remove(tempPath)
+            raise
+
+    def loadSnapshot(self, path):
+        """
+        Load a binary snapshot of the database saved by :meth:`saveSnapshot`
+        from the given `path` on disk. This replaces the databases that would
+        otherwise be loaded by :meth:`load`, and can be used by worker
+        processes to obtain the fully processed database cheaply.
+        """
+        with open(path, 'rb') as f:
+            d = cPickle.load(f)
+        self.thermo = d['thermo']
+        self.transport = d['transport']
+        self.forbiddenStructures = d['forbiddenStructures']
+        self.kinetics = d['kinetics']
+        self.statmech = d['statmech']
+        self.solvation = d['solvation']
+        for name, db in [('thermo', self.thermo), ('transport', self.transport), ('forbidden', self.forbiddenStructures),
+                         ('kinetics', self.kinetics), ('statmech', self.statmech), ('solvation', self.solvation)]:
+            if db is not None:
+                broadcast(db, name)
+
     def loadOld(self, path):
         """
         Load the old RMG database from the given `path` on disk, where `path`
@@ -231,6 +298,55 @@ class RMGDatabase:
         self.kinetics.saveOld(path)
         self.statmech.saveOld(path)
 
+def getSnapshotKey(path, **options):
+    """
+    Return a key identifying a snapshot of the database at the given `path` on
+    disk, loaded and processed according to the keyword `options` (e.g. the
+    selected libraries and families). The key is the SHA-1 hash of the options
+    and of the name and contents of every file in the database, so it changes
+    whenever the database checkout or the selection changes. The snapshot
+    format version, the RMG-Py version and the hash of the RMG-Py sources from
+    :func:`getSourceHash` are included as well, so that snapshots made by
+    other versions of the code are not reused.
+    """
+    sha = hashlib.sha1()
+    sha.update(repr((snapshotFormatVersion, rmgpy.__version__, getSourceHash())))
+    sha.update(repr(sorted(options.items())))
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for filename in sorted(files):
+            if filename.startswith('.') or filename.endswith('.pyc'):
+                continue
+            filepath = os.path.join(root, filename)
+            sha.update(os.path.relpath(filepath, path))
+            with open(filepath, 'rb') as f:
+                sha.update(hashlib.sha1(f.read()).digest())
+    return sha.hexdigest()
+
+def getSourceHash():
+    """
+    Return the SHA-1 hash of the source and extension module files of the
+    :mod:`rmgpy.data` and :mod:`rmgpy.molecule` packages, which define and
+    process the objects stored in a database snapshot. The hash is computed
+    once and reused for the rest of the process.
+    """
+    global _sourceHash
+    if _sourceHash is None:
+        root = os.path.dirname(os.path.abspath(rmgpy.__file__))
+        sha = hashlib.sha1()
+        for package in ['data', 'molecule']:
+            for dirpath, dirs, files in os.walk(os.path.join(root, package)):
+                dirs.sort()
+                for filename in sorted(files):
+                    if os.path.splitext(filename)[1] not in ['.py', '.pyx', '.pxd', '.so', '.pyd'] or filename.endswith('Test.py'):
+                        continue
+                    filepath = os.path.join(dirpath, filename)
+                    sha.update(os.path.relpath(filepath, root))
+                    with open(filepath, 'rb') as f:
+                        sha.update(hashlib.sha1(f.read()).digest())
+        _sourceHash = sha.hexdigest()
+    return _sourceHash
+
 def getDB(name):
     """
     Returns the RMG database object that corresponds
@@ -0,0 +1,94 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import rmgpy.data.rmg
+from rmgpy import settings
+from rmgpy.data.rmg import RMGDatabase, getSnapshotKey, getSourceHash
+
+################################################################################
+
+class TestDatabaseSnapshot(unittest.TestCase):
+    """
+    Contains unit tests for saving and loading binary snapshots of the RMG database.
+    """
+
+    def setUp(self):
+        """
+        A function run before each unit test in this class.
+        """
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        A function run after each unit test in this class.
+        """
+        shutil.rmtree(self.directory)
+
+    def testSnapshotKey(self):
+        """
+        Test that the snapshot key changes with the database files and the load options.
+        """
+        path = os.path.join(self.directory, 'database')
+        os.makedirs(os.path.join(path, 'thermo'))
+        with open(os.path.join(path, 'thermo', 'library.py'), 'w') as f:
+            f.write('name = "library"\n')
+
+        key = getSnapshotKey(path, thermoLibraries=['library'])
+        self.assertEqual(key, getSnapshotKey(path, thermoLibraries=['library']))
+        self.assertNotEqual(key, getSnapshotKey(path, thermoLibraries=[]))
+
+        with open(os.path.join(path, 'thermo', 'library.py'), 'a') as f:
+            f.write('shortDesc = "modified"\n')
+        self.assertNotEqual(key, getSnapshotKey(path, thermoLibraries=['library']))
+
+    def testSnapshotKeyCode(self):
+        """
+        Test that the snapshot key changes with the snapshot format version
+        and the RMG-Py sources.
+        """
+        path = os.path.join(self.directory, 'database')
+        os.makedirs(path)
+        key = getSnapshotKey(path)
+        sourceHash = getSourceHash()
+        self.assertEqual(len(sourceHash), 40)
+        formatVersion = rmgpy.data.rmg.snapshotFormatVersion
+        try:
+            rmgpy.data.rmg.snapshotFormatVersion = formatVersion + 1
+            self.assertNotEqual(key, getSnapshotKey(path))
+            rmgpy.data.rmg.snapshotFormatVersion = formatVersion
+            rmgpy.data.rmg._sourceHash = '0' * 40
+            self.assertNotEqual(key, getSnapshotKey(path))
+        finally:
+            rmgpy.data.rmg.snapshotFormatVersion = formatVersion
+            rmgpy.data.rmg._sourceHash = sourceHash
+        self.assertEqual(key, getSnapshotKey(path))
+
+    def testSnapshotRoundTrip(self):
+        """
+        Test that a database loaded from a snapshot matches the original.
+        """
+        path = os.path.join(settings['test_data.directory'], 'testing_database', 'thermo')
+        database = RMGDatabase()
+        database.loadThermo(path, thermoLibraries=['primaryThermoLibrary'], depository=False)
+
+        snapshot = os.path.join(self.directory, 'database.pkl')
+        database.saveSnapshot(snapshot)
+        self.assertEqual(os.listdir(self.directory), ['database.pkl'])
+
+        loaded = RMGDatabase()
+        loaded.loadSnapshot(snapshot)
+        self.assertEqual(sorted(loaded.thermo.libraries.keys()), sorted(database.thermo.libraries.keys()))
+        self.assertEqual(sorted(loaded.thermo.groups.keys()), sorted(database.thermo.groups.keys()))
+        for label, group in database.thermo.groups.iteritems():
+            self.assertEqual(sorted(loaded.thermo.groups[label].entries.keys()), sorted(group.entries.keys()))
+        self.assertIsNone(loaded.kinetics)
+
+################################################################################
+
+if __name__ == '__main__':
+    unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
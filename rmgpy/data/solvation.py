@@ -34,6 +34,7 @@
 
 import os.path
 import math
+import numpy
 import logging
 import rmgpy.constants as constants
 from rmgpy.species import Species
@@ -41,6 +42,7 @@ from copy import deepcopy
 from base import Database, Entry, makeLogicNode, DatabaseError
 
 from rmgpy.molecule import Molecule, Atom, Bond, Group, atomTypes
+from rmgpy.molecule.resonance import getStructureHash
 
 ################################################################################
 
@@ -463,6 +465,7 @@ class SolvationDatabase(object):
             'SolventData': SolventData
         }
         self.global_context = {}
+        self.clearSoluteCache()
 
     def __reduce__(self):
         """
@@ -493,6 +496,7 @@ class SolvationDatabase(object):
         self.libraries['solute'].load(os.path.join(path,'libraries','solute.py'))
          
         self.loadGroups(os.path.join(path, 'groups'))
+        self.clearSoluteCache()
         
     def getSolventData(self, solvent_name):
         try:
@@ -521,6 +525,7 @@ class SolvationDatabase(object):
         self.groups['abraham']   =   SoluteGroups(label='abraham').load(os.path.join(path, 'abraham.py'  ), self.local_context, self.global_context)
         self.groups['nonacentered']  =  SoluteGroups(label='nonacentered').load(os.path.join(path, 'nonacentered.py' ), self.local_context, self.global_context)
         self.groups['radical']  =  SoluteGroups(label='radical').load(os.path.join(path, 'radical.py' ), self.local_context, self.global_context)
+        self.clearSoluteCache()
    
     def save(self, path):
         """
@@ -606,12 +611,58 @@ class SolvationDatabase(object):
             libstr = os.path.join(groupsPath, 'Abraham_Library.txt'),
         )
 
+    def clearSoluteCache(self):
+        """
+        Forget the solute parameters of all species seen so far. The cached
+        parameters are stored row by row in the `soluteParameters` array, with
+        columns S, B, E, L, A and V, and the corresponding :class:`SoluteData`
+        objects in the `soluteData` list.
+        """
+        self.soluteSpecies = {}
+        self.soluteData = []
+        self.soluteParameters = numpy.zeros((16, 6), numpy.float64)
+
+    def getSoluteIndex(self, species):
+        """
+        Return the row of the `soluteParameters` array holding the solute
+        descriptors of the :class:`Species` object `species`, estimating and
+        caching them if this is the first time an isomorphic species is seen.
+        """
+        bucket = self.soluteSpecies.setdefault(getStructureHash(species.molecule[0]), [])
+        for other, index in bucket:
+            if other is species or other.isIsomorphic(species):
+                return index
+
+        soluteData = self.estimateSoluteData(species)
+        index = len(self.soluteData)
+        if index == self.soluteParameters.shape[0]:
+            self.soluteParameters = numpy.concatenate((self.soluteParameters, numpy.zeros_like(self.soluteParameters)))
+        self.soluteParameters[index, :] = [soluteData.S, soluteData.B, soluteData.E, soluteData.L, soluteData.A, soluteData.V]
+        self.soluteData.append(soluteData)
+        bucket.append((species, index))
+        return index
+
+    def getSoluteIndices(self, speciesList):
+        """
+        Return an array of the rows of the `soluteParameters` array holding
+        the solute descriptors of each species in `speciesList`.
+        """
+        return numpy.array([self.getSoluteIndex(species) for species in speciesList], numpy.int64)
+
     def getSoluteData(self, species):
         """
         Return the solute descriptors for a given :class:`Species`
         object `species`. This function first searches the loaded libraries
         in order, returning the first match found, before falling back to
-        estimation via Platts group additivity.
+        estimation via Platts group additivity. The result is cached, so the
+        descriptors of each species are only determined once.
+        """
+        return deepcopy(self.soluteData[self.getSoluteIndex(species)])
+
+    def estimateSoluteData(self, species):
+        """
+        Return the solute descriptors for a given :class:`Species`
+        object `species`, bypassing the cache used by :meth:`getSoluteData`.
         """
         soluteData = None
         
@@ -661,7 +712,7 @@ class SolvationDatabase(object):
         ``None`` is returned. If no corresponding library is found, a
         :class:`DatabaseError` is raised.
         """
-        for label, entry in library.entries.iteritems():
+        for entry in library.findEntriesByStructure(species.molecule):
             if species.isIsomorphic(entry.item) and entry.data is not None:
                 return (deepcopy(entry.data), library, entry)
         return None
@@ -184,6 +184,47 @@ multiplicity 2
             self.assertAlmostEqual(solvationCorrection.enthalpy / 10000., H / 10000., 0, msg="Solvation enthalpy discrepancy ({2:.0f}!={3:.0f}) for {0} in {1}".format(soluteName, solventName, solvationCorrection.enthalpy, H))  #0 decimal place, in 10kJ.
             self.assertAlmostEqual(solvationCorrection.gibbs / 10000., G / 10000., 0, msg="Solvation Gibbs free energy discrepancy ({2:.0f}!={3:.0f}) for {0} in {1}".format(soluteName, solventName, solvationCorrection.gibbs, G))
 
+    def testSoluteCache(self):
+        "Test that the solute data of isomorphic species are only estimated once"
+        species1 = Species(molecule=[Molecule(SMILES='CCO')])
+        species2 = Species(molecule=[Molecule(SMILES='OCC')])
+        index1 = self.database.getSoluteIndex(species1)
+        self.assertEqual(self.database.getSoluteIndex(species2), index1)
+        self.assertEqual(len(self.database.soluteData), index1 + 1)
+
+        soluteData = self.database.getSoluteData(species2)
+        self.assertEqual(list(self.database.soluteParameters[index1, :]), [soluteData.S, soluteData.B, soluteData.E, soluteData.L, soluteData.A, soluteData.V])
+        soluteData.S = 0.0
+        self.assertNotEqual(self.database.getSoluteData(species1).S, 0.0)
+
+    def testDiffusionLimitsVectorized(self):
+        "Test that the vectorized diffusion limits match those of each reaction"
+        from rmgpy.kinetics import Arrhenius
+        from rmgpy.kinetics.table import KineticsTable
+        from rmgpy.kinetics.diffusionLimited import diffusionLimiter
+        from rmgpy.reaction import Reaction
+
+        ch3, ch4, oh, h2o, c2h6 = [Species(molecule=[Molecule(SMILES=smiles)]) for smiles in ['[CH3]', 'C', '[OH]', 'O', 'CC']]
+        kinetics = Arrhenius(A=(1e13, 'cm^3/(mol*s)'), n=0, Ea=(0, 'kJ/mol'), T0=(1, 'K'))
+        reactions = [
+            Reaction(reactants=[ch3, ch3], products=[c2h6], kinetics=kinetics),
+            Reaction(reactants=[ch4, oh], products=[ch3, h2o], kinetics=kinetics),
+        ]
+        T = 298.
+
+        diffusionLimiter.enable(self.database.getSolventData('water'), self.database)
+        try:
+            table = KineticsTable(reactions)
+            forward = diffusionLimiter.getDiffusionLimits(table, T, forward=True)
+            reverse = diffusionLimiter.getDiffusionLimits(table, T, forward=False, indices=[1])
+            self.assertAlmostEqual(forward[0] / diffusionLimiter.getDiffusionLimit(T, reactions[0], forward=True), 1.0, 6)
+            self.assertAlmostEqual(forward[1] / diffusionLimiter.getDiffusionLimit(T, reactions[1], forward=True), 1.0, 6)
+            self.assertAlmostEqual(reverse[0] / diffusionLimiter.getDiffusionLimit(T, reactions[1], forward=False), 1.0, 6)
+            # The reverse direction of the recombination is unimolecular
+            self.assertRaises(AssertionError, diffusionLimiter.getDiffusionLimits, table, T, forward=False)
+        finally:
+            diffusionLimiter.enabled = False
+
     def testInitialSpecies(self):
         " Test we can check whether the solvent is listed as one of the initial species in various scenarios "
 
@@ -31,10 +31,12 @@
 import os.path
 import logging
 import numpy
+from copy import deepcopy
 
 import rmgpy.constants as constants
 from rmgpy.statmech import Conformer, HarmonicOscillator, LinearRotor, NonlinearRotor, HinderedRotor, IdealGasTranslation
 from rmgpy.molecule import Molecule, Group
+from rmgpy.molecule.resonance import getStructureHash
 
 from base import Database, Entry, LogicOr, makeLogicNode
 
@@ -112,6 +114,18 @@ def processOldLibraryEntry(data, format):
 
 ################################################################################
 
+def getHeatCapacities(thermoModel):
+    """
+    Return an array of the heat capacities of `thermoModel` in J/mol*K at the
+    temperatures used to fit statmech data, or ``None`` if `thermoModel` is
+    ``None``.
+    """
+    if thermoModel is None:
+        return None
+    return numpy.array([thermoModel.getHeatCapacity(T) for T in numpy.arange(300.0, 1501.0, 100.0, numpy.float64)], numpy.float64)
+
+################################################################################
+
 class StatmechDepository(Database):
     """
     A class for working with the RMG statistical mechanics (frequencies)
@@ -457,6 +471,7 @@ class StatmechDatabase(object):
             'GroupFrequencies': GroupFrequencies,
         }
         self.global_context = {}
+        self.clearStatmechCache()
 
     def __reduce__(self):
         """
@@ -517,6 +532,7 @@ class StatmechDatabase(object):
                     self.libraryOrder.append(library.label)
         if libraries is not None:
             self.libraryOrder = libraries
+        self.clearStatmechCache()
 
     def loadGroups(self, path):
         """
@@ -526,6 +542,7 @@ class StatmechDatabase(object):
         logging.info('Loading frequencies group database from {0}...'.format(path))
         self.groups = {}
         self.groups['groups'] = StatmechGroups().load(os.path.join(path, 'groups.py' ), self.local_context, self.global_context)
+        self.clearStatmechCache()
 
     def save(self, path):
         """
@@ -624,13 +641,67 @@ class StatmechDatabase(object):
             libstr = os.path.join(groupsPath, 'Library.txt'),
         )
 
+    def clearStatmechCache(self):
+        """
+        Forget the statmech data generated so far by :meth:`getStatmechData`.
+        """
+        self._statmechCache = {}
+
+    def getStatmechCache(self):
+        """
+        Return a list of the (molecule, heat capacities, conformer) tuples of
+        all statmech data generated so far, for instance to save them in the
+        restart file.
+        """
+        fits = []
+        for entries in self._statmechCache.values():
+            fits.extend(entries)
+        return fits
+
+    def addStatmechData(self, molecule, thermoModel, conformer):
+        """
+        Store the statmech `conformer` generated for `molecule` with the
+        thermo model `thermoModel` (which may be ``None``), unless data are
+        already stored for an isomorphic molecule with the same heat capacity.
+        """
+        self.__addStatmechData(molecule, getHeatCapacities(thermoModel), conformer)
+
+    def addStatmechCache(self, fits):
+        """
+        Store the (molecule, heat capacities, conformer) tuples `fits`, as
+        returned by :meth:`getStatmechCache`.
+        """
+        for molecule, Cp, conformer in fits:
+            self.__addStatmechData(molecule, Cp, conformer)
+
+    def __findStatmechData(self, molecule, Cp):
+        entries = self._statmechCache.get(getStructureHash(molecule), [])
+        for molecule0, Cp0, conformer in entries:
+            if (Cp is None) == (Cp0 is None) and (Cp is None or numpy.allclose(Cp, Cp0, rtol=1e-9, atol=0)) and molecule.isIsomorphic(molecule0):
+                return conformer
+        return None
+
+    def __addStatmechData(self, molecule, Cp, conformer):
+        if self.__findStatmechData(molecule, Cp) is None:
+            entries = self._statmechCache.setdefault(getStructureHash(molecule), [])
+            entries.append((molecule.copy(deep=True), Cp, deepcopy(conformer)))
+
     def getStatmechData(self, molecule, thermoModel=None):
         """
         Return the thermodynamic parameters for a given :class:`Molecule`
         object `molecule`. This function first searches the loaded libraries
         in order, returning the first match found, before falling back to
         estimation via group additivity.
+
+        Fitting the internal modes to the heat capacity is slow, so the result
+        is cached for each structure and heat capacity of `thermoModel`; a
+        copy of the cached conformer is returned.
         """
+        Cp = getHeatCapacities(thermoModel)
+        statmechModel = self.__findStatmechData(molecule, Cp)
+        if statmechModel is not None:
+            return deepcopy(statmechModel)
+
         statmechModel = None
         # Check the libraries in order first; return the first successful match
         for label in self.libraryOrder:
@@ -639,7 +710,8 @@ class StatmechDatabase(object):
         else:
             # Thermo not found in any loaded libraries, so estimate
             statmechModel = self.getStatmechDataFromGroups(molecule, thermoModel)
-        return statmechModel[0]
+        self.__addStatmechData(molecule, Cp, statmechModel[0])
+        return deepcopy(statmechModel[0])
 
     def getStatmechDataFromDepository(self, molecule):
         """
@@ -649,7 +721,7 @@ class StatmechDatabase(object):
         """
         items = []
         for name, depository in self.depository.iteritems():
-            for label, entry in depository.entries.iteritems():
+            for entry in depository.findEntriesByStructure([molecule]):
                 if molecule.isIsomorphic(entry.item):
                     items.append((entry.data, self.depository[name], entry))
         return items
@@ -660,7 +732,7 @@ class StatmechDatabase(object):
         by searching the entries in the specified :class:`StatmechLibrary` object
         `library`. Returns ``None`` if no data was found.
         """
-        for label, entry in library.entries.iteritems():
+        for entry in library.findEntriesByStructure([molecule]):
             if molecule.isIsomorphic(entry.item):
                 return (entry.data, library, entry)
         return None
@@ -0,0 +1,58 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import os
+import unittest
+
+from rmgpy import settings
+from rmgpy.data.statmech import StatmechDatabase
+from rmgpy.molecule import Molecule
+from rmgpy.statmech import Conformer
+from rmgpy.thermo import ThermoData
+
+################################################################################
+
+class TestStatmechDatabase(unittest.TestCase):
+    """
+    Contains unit tests of the StatmechDatabase class.
+    """
+
+    def setUp(self):
+        """
+        A function run before each unit test in this class.
+        """
+        self.database = StatmechDatabase()
+        self.database.load(os.path.join(settings['database.directory'], 'statmech'), libraries=[])
+        self.thermo = ThermoData(
+            Tdata = ([300,400,500,600,800,1000,1500],'K'),
+            Cpdata = ([17.66,22.0,26.3,29.9,35.6,39.9,46.6],'cal/(mol*K)'),
+            H298 = (-25.02,'kcal/mol'),
+            S298 = (64.51,'cal/(mol*K)'),
+        )
+
+    def testStatmechCache(self):
+        """
+        Test that the fitted states data are cached for each structure and
+        heat capacity, and can be restored into another database.
+        """
+        conformer1 = self.database.getStatmechData(Molecule(SMILES='CCC'), self.thermo)
+        self.assertTrue(isinstance(conformer1, Conformer))
+        self.assertEqual(len(self.database.getStatmechCache()), 1)
+
+        conformer2 = self.database.getStatmechData(Molecule(SMILES='C(C)C'), self.thermo)
+        self.assertEqual(len(self.database.getStatmechCache()), 1)
+        self.assertFalse(conformer2 is conformer1)
+        self.assertEqual(len(conformer2.modes), len(conformer1.modes))
+        for T in [300, 1000]:
+            self.assertAlmostEqual(conformer2.getHeatCapacity(T), conformer1.getHeatCapacity(T), 6)
+
+        # The cached data must be found without fitting again
+        database = StatmechDatabase()
+        database.addStatmechCache(self.database.getStatmechCache())
+        conformer3 = database.getStatmechData(Molecule(SMILES='CCC'), self.thermo)
+        self.assertAlmostEqual(conformer3.getHeatCapacity(500), conformer1.getHeatCapacity(500), 6)
+
+################################################################################
+
+if __name__ == '__main__':
+    unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
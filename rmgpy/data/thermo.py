@@ -45,6 +45,7 @@ import rmgpy.constants as constants
 from rmgpy.thermo import NASAPolynomial, NASA, ThermoData, Wilhoit
 from rmgpy.molecule import Molecule, Atom, Bond, Group
 import rmgpy.molecule
+from rmgpy.molecule.resonance import getStructureHash
 from rmgpy.species import Species
 
 from rmgpy.scoop_framework.util import get
@@ -480,6 +481,67 @@ def bicyclicDecompositionForPolyring(polyring):
         bicyclicsMergedFromRingPair.append(mergedRing)
 
     return bicyclicsMergedFromRingPair, ringOccurancesDict
+
+def getGroupTreeRadius(database):
+    """
+    Return the largest number of bonds between the atom labeled ``*`` and
+    any other atom in the groups of the given group `database`, or ``None``
+    if any group has no atom labeled ``*`` or is not connected.
+    """
+    radius = 0
+    for entry in database.entries.values():
+        group = entry.item
+        if not isinstance(group, Group):
+            continue
+        center = group.getLabeledAtoms().get('*')
+        if center is None or isinstance(center, list):
+            return None
+        distances = {center: 0}
+        atoms = [center]
+        for atom in atoms:
+            for neighbor in atom.edges:
+                if neighbor not in distances:
+                    distances[neighbor] = distances[atom] + 1
+                    atoms.append(neighbor)
+        if len(distances) != len(group.atoms):
+            return None
+        radius = max(radius, max(distances.values()))
+    return radius
+
+def getLocalEnvironment(molecule, atom, radius):
+    """
+    Return a :class:`Molecule` containing copies of the atoms within `radius`
+    bonds of `atom` in `molecule` and of the bonds between them, the copy of
+    `atom`, and a hashable summary of the environment that is the same for
+    any two isomorphic environments. The environment has the multiplicity of
+    `molecule`, as groups may restrict it.
+    """
+    distances = {atom: 0}
+    atoms = [atom]
+    for atom1 in atoms:
+        if distances[atom1] < radius:
+            for atom2 in atom1.edges:
+                if atom2 not in distances:
+                    distances[atom2] = distances[atom1] + 1
+                    atoms.append(atom2)
+
+    environment = Molecule(multiplicity=molecule.multiplicity)
+    copies = {}
+    for atom1 in atoms:
+        copies[atom1] = atom1.copy()
+        environment.addAtom(copies[atom1])
+    key = []
+    for atom1 in atoms:
+        degree = 0
+        for atom2, bond in atom1.edges.iteritems():
+            if atom2 in copies:
+                degree += 1
+                if not environment.hasBond(copies[atom1], copies[atom2]):
+                    environment.addBond(Bond(copies[atom1], copies[atom2], order=bond.order))
+        key.append((distances[atom1], atom1.element.number, atom1.radicalElectrons, atom1.lonePairs, atom1.charge, degree))
+    key.sort()
+    return environment, copies[atom], (molecule.multiplicity, tuple(key))
+
 ################################################################################
 
 class ThermoDepository(Database):
@@ -539,7 +601,7 @@ class ThermoLibrary(Database):
         if label in self.entries.keys():
             raise DatabaseError('Found a duplicate molecule with label {0} in the thermo library {1}.  Please correct your library.'.format(label, self.name))
         
-        for entry in self.entries.values():
+        for entry in self.findEntriesByStructure([molecule]):
             if molecule.isIsomorphic(entry.item):
                 if molecule.multiplicity == entry.item.multiplicity:
                     raise DatabaseError('Adjacency list and multiplicity of {0} matches that of existing molecule {1} in thermo library {2}.  Please correct your library.'.format(label, entry.label, self.name))
@@ -703,6 +765,7 @@ class ThermoDatabase(object):
             'NASA': NASA,
         }
         self.global_context = {}
+        self.clearHBICache()
 
     def __reduce__(self):
         """
@@ -724,6 +787,18 @@ class ThermoDatabase(object):
         self.libraries = d['libraries']
         self.groups = d['groups']
         self.libraryOrder = d['libraryOrder']
+        self.clearHBICache()
+
+    def clearHBICache(self):
+        """
+        Empty the caches used by :meth:`estimateRadicalThermoViaHBI`: the
+        thermo of the saturated parents of radicals and the radical
+        correction groups found for each local environment of a radical site.
+        This is done whenever the libraries or groups are loaded.
+        """
+        self._saturatedThermoCache = {}
+        self._radicalGroupCache = {}
+        self._radicalGroupRadius = None
 
     def load(self, path, libraries=None, depository=True):
         """
@@ -752,6 +827,7 @@ class ThermoDatabase(object):
         points to the top-level folder of the thermo database.
         """
         self.libraries = {}; self.libraryOrder = []
+        self.clearHBICache()
         if libraries is None:
             for (root, dirs, files) in os.walk(os.path.join(path)):
                 for f in files:
@@ -787,6 +863,7 @@ class ThermoDatabase(object):
         """
         logging.info('Loading thermodynamics group database from {0}...'.format(path))
         self.groups = {}
+        self.clearHBICache()
         self.groups['group']   =   ThermoGroups(label='group').load(os.path.join(path, 'group.py'  ), self.local_context, self.global_context)
         self.groups['gauche']  =  ThermoGroups(label='gauche').load(os.path.join(path, 'gauche.py' ), self.local_context, self.global_context)
         self.groups['int15']   =   ThermoGroups(label='int15').load(os.path.join(path, 'int15.py'  ), self.local_context, self.global_context)
@@ -1196,12 +1273,12 @@ class ThermoDatabase(object):
         Returns: a list of tuples (thermoData, depository, entry) without any Cp0 or CpInf data.
         """
         items = []
-        for label, entry in self.depository['stable'].entries.iteritems():
+        for entry in self.depository['stable'].findEntriesByStructure(species.molecule):
             for molecule in species.molecule:
                 if molecule.isIsomorphic(entry.item):
                     items.append((deepcopy(entry.data), self.depository['stable'], entry))
                     break
-        for label, entry in self.depository['radical'].entries.iteritems():
+        for entry in self.depository['radical'].findEntriesByStructure(species.molecule):
             for molecule in species.molecule:
                 if molecule.isIsomorphic(entry.item):
                     items.append((deepcopy(entry.data), self.depository['radical'], entry))
@@ -1219,7 +1296,7 @@ class ThermoDatabase(object):
         
         Returns a tuple: (ThermoData, library, entry)  or None.
         """
-        for label, entry in library.entries.iteritems():
+        for entry in library.findEntriesByStructure(species.molecule):
             for molecule in species.molecule:
                 if molecule.isIsomorphic(entry.item) and entry.data is not None:
                     thermoData = deepcopy(entry.data)
@@ -1300,29 +1377,10 @@ class ThermoDatabase(object):
         saturatedStruct.props['saturated'] = True
         
         # Get thermo estimate for saturated form of structure
-        if stableThermoEstimator == self.getThermoDataFromLibraries:
-            # Get data from libraries
-            saturatedSpec = Species(molecule=[saturatedStruct])
-            thermoData_sat = stableThermoEstimator(saturatedSpec)
-            if thermoData_sat:
-                assert len(thermoData_sat) == 3, "thermoData should be a tuple at this point: (thermoData, library, entry)"
-                thermoData_sat = thermoData_sat[0]
-        else:
-            thermoData_sat = stableThermoEstimator(saturatedStruct)
+        thermoData_sat = self.__getSaturatedThermoData(saturatedStruct, stableThermoEstimator)
         if thermoData_sat is None:
             # logging.info("Thermo data of saturated {0} of molecule {1} is None.".format(saturatedStruct, molecule))
             return None
-        assert thermoData_sat is not None, "Thermo data of saturated {0} of molecule {1} is None!".format(saturatedStruct, molecule)
-        
-        # Convert to ThermoData object if necessary in order to add and subtract from enthalpy and entropy values
-        if not isinstance(thermoData_sat, ThermoData):
-            thermoData_sat = thermoData_sat.toThermoData()
-        
-        
-        if not stableThermoEstimator == self.computeGroupAdditivityThermo:
-            #remove the symmetry contribution to the entropy of the saturated molecule
-            ##assumes that the thermo data comes from QMTP or from a thermolibrary
-            thermoData_sat.S298.value_si += constants.R * math.log(saturatedStruct.getSymmetryNumber())
         
         thermoData = thermoData_sat
         
@@ -1340,7 +1398,7 @@ class ThermoDatabase(object):
                 atom.incrementRadical()
             saturatedStruct.update()
             try:
-                self.__addGroupThermoData(thermoData, self.groups['radical'], saturatedStruct, {'*':atom})
+                addThermoData(thermoData, self.__getRadicalGroupThermoData(saturatedStruct, atom), groupAdditivity=True)
             except KeyError:
                 logging.error("Couldn't find in radical thermo database:")
                 logging.error(molecule)
@@ -1356,8 +1414,70 @@ class ThermoDatabase(object):
                 thermoData.H298.value_si -= 52.103 * 4184
 
         return thermoData
-        
-        
+
+    def __getSaturatedThermoData(self, saturatedStruct, stableThermoEstimator):
+        """
+        Return the thermo data of the saturated parent `saturatedStruct` of a
+        radical from the given `stableThermoEstimator`, as a new
+        :class:`ThermoData` object whose entropy does not include the symmetry
+        contribution, or ``None`` if the estimator has no data. Many radicals
+        share the same saturated parent, so the result of each estimator is
+        cached for each saturated structure.
+        """
+        entries = self._saturatedThermoCache.setdefault((stableThermoEstimator, getStructureHash(saturatedStruct)), [])
+        for molecule, thermoData_sat in entries:
+            if saturatedStruct.isIsomorphic(molecule):
+                return deepcopy(thermoData_sat)
+
+        if stableThermoEstimator == self.getThermoDataFromLibraries:
+            # Get data from libraries
+            saturatedSpec = Species(molecule=[saturatedStruct])
+            thermoData_sat = stableThermoEstimator(saturatedSpec)
+            if thermoData_sat:
+                assert len(thermoData_sat) == 3, "thermoData should be a tuple at this point: (thermoData, library, entry)"
+                thermoData_sat = thermoData_sat[0]
+        else:
+            thermoData_sat = stableThermoEstimator(saturatedStruct)
+
+        if thermoData_sat is not None:
+            # Convert to ThermoData object if necessary in order to add and subtract from enthalpy and entropy values
+            if not isinstance(thermoData_sat, ThermoData):
+                thermoData_sat = thermoData_sat.toThermoData()
+            else:
+                thermoData_sat = deepcopy(thermoData_sat)
+
+            if not stableThermoEstimator == self.computeGroupAdditivityThermo:
+                #remove the symmetry contribution to the entropy of the saturated molecule
+                ##assumes that the thermo data comes from QMTP or from a thermolibrary
+                thermoData_sat.S298.value_si += constants.R * math.log(saturatedStruct.getSymmetryNumber())
+
+        entries.append((saturatedStruct.copy(deep=True), thermoData_sat))
+        return deepcopy(thermoData_sat)
+
+    def __getRadicalGroupThermoData(self, molecule, atom):
+        """
+        Return the thermo data of the radical correction group for the
+        radical site `atom` in `molecule`. The group found depends only on the
+        atoms within the largest radius of the radical groups around the site,
+        and their atom types only on one more shell of atoms, so the group is
+        cached for each such local environment and the radical tree is only
+        descended for environments that have not been seen before.
+        """
+        if self._radicalGroupRadius is None:
+            radius = getGroupTreeRadius(self.groups['radical'])
+            self._radicalGroupRadius = -1 if radius is None else radius
+        if self._radicalGroupRadius < 0:
+            return self.__addGroupThermoData(None, self.groups['radical'], molecule, {'*':atom})
+
+        environment, center, key = getLocalEnvironment(molecule, atom, self._radicalGroupRadius + 1)
+        entries = self._radicalGroupCache.setdefault(key, [])
+        for environment0, center0, data in entries:
+            if environment.isIsomorphic(environment0, initialMap={center: center0}):
+                return data
+        data = self.__addGroupThermoData(None, self.groups['radical'], molecule, {'*':atom})
+        entries.append((environment, center, data))
+        return data
+
     def estimateThermoViaGroupAdditivity(self, molecule):
         """
         Return the set of thermodynamic parameters corresponding to a given
@@ -296,6 +296,42 @@ class TestThermoDatabase(unittest.TestCase):
         self.assertEqual(set(initial), set(spec.molecule))
         self.assertTrue('group additivity' in thermo.comment, 'Thermo not found from GAV, test purpose not fulfilled.')
 
+    def testHBICache(self):
+        """
+        Test that radicals sharing a saturated parent and radical site environments get the same thermo from the HBI caches.
+        """
+        smilesList = ['C[CH]CCCCC', 'CC[CH]CCCC', 'CCC[CH]CCC', 'C[CH]CCCCC']
+        self.database.clearHBICache()
+        cached = [self.database.estimateThermoViaGroupAdditivity(Molecule().fromSMILES(smiles)) for smiles in smilesList]
+        self.assertEqual(sum([len(entries) for entries in self.database._saturatedThermoCache.values()]), 1)
+        for smiles, thermo in zip(smilesList, cached):
+            self.database.clearHBICache()
+            thermo0 = self.database.estimateThermoViaGroupAdditivity(Molecule().fromSMILES(smiles))
+            self.assertAlmostEqual(thermo.getEnthalpy(298), thermo0.getEnthalpy(298), 6)
+            self.assertAlmostEqual(thermo.getEntropy(298), thermo0.getEntropy(298), 6)
+            self.assertAlmostEqual(thermo.getHeatCapacity(1000), thermo0.getHeatCapacity(1000), 6)
+            self.assertEqual(thermo.comment, thermo0.comment)
+
+    def testLocalEnvironmentMultiplicity(self):
+        """
+        Test that the local environments of radical sites differ when the multiplicities of the molecules differ.
+        """
+        adjlist = """
+        multiplicity {0}
+        1 C u1 p0 c0 {{2,S}} {{3,S}} {{4,S}}
+        2 C u1 p0 c0 {{1,S}} {{5,S}} {{6,S}}
+        3 H u0 p0 c0 {{1,S}}
+        4 H u0 p0 c0 {{1,S}}
+        5 H u0 p0 c0 {{2,S}}
+        6 H u0 p0 c0 {{2,S}}
+        """
+        singlet = Molecule().fromAdjacencyList(adjlist.format(1))
+        triplet = Molecule().fromAdjacencyList(adjlist.format(3))
+        environment1, center1, key1 = getLocalEnvironment(singlet, singlet.atoms[0], 2)
+        environment3, center3, key3 = getLocalEnvironment(triplet, triplet.atoms[0], 2)
+        self.assertNotEqual(key1, key3)
+        self.assertFalse(environment1.isIsomorphic(environment3, initialMap={center1: center3}))
+
 
 class TestThermoDatabaseAromatics(TestThermoDatabase):
     """
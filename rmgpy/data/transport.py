@@ -37,9 +37,11 @@ import logging
 from copy import deepcopy
 
 from base import Database, Entry, makeLogicNode, DatabaseError
+from thermo import getGroupTreeRadius, getLocalEnvironment
 
 import rmgpy.constants as constants
 from rmgpy.molecule import Molecule, Atom, Bond, Group
+from rmgpy.molecule.resonance import getStructureHash
 from rmgpy.transport import TransportData
 
 
@@ -239,6 +241,7 @@ class TransportDatabase(object):
             'TransportData': TransportData,
         }
         self.global_context = {}
+        self.clearGroupCache()
         
     def __reduce__(self):
         """
@@ -295,6 +298,16 @@ class TransportDatabase(object):
         self.groups = {}
         self.groups['ring'] = TransportGroups(label='ring').load(os.path.join(path, 'ring.py'), self.local_context, self.global_context)
         self.groups['nonring'] = TransportGroups(label='nonring').load(os.path.join(path, 'nonring.py'), self.local_context, self.global_context)
+        self.clearGroupCache()
+
+    def clearGroupCache(self):
+        """
+        Empty the cache of the critical point group contributions found for
+        each local environment of a heavy atom. This is done whenever the
+        groups are loaded.
+        """
+        self._groupContributionCache = {}
+        self._groupTreeRadius = {}
         
     def save(self, path):
         """
@@ -348,6 +361,26 @@ class TransportDatabase(object):
 
         return transport
     
+    def setTransportData(self, speciesList):
+        """
+        Estimate the transport properties of all species in `speciesList` that
+        do not have any yet, and store them in the `transportData` attribute
+        of each species so they are kept with the species. Isomorphic species
+        share a single estimate.
+        """
+        buckets = {}
+        for species in speciesList:
+            if species.transportData:
+                continue
+            bucket = buckets.setdefault(getStructureHash(species.molecule[0]), [])
+            for other in bucket:
+                if other.isIsomorphic(species):
+                    species.transportData = deepcopy(other.transportData)
+                    break
+            else:
+                species.transportData = self.getTransportProperties(species)[0]
+                bucket.append(species)
+
     def getAllTransportProperties(self, species):
         """
         Return all possible sets of transport parameters for a given
@@ -377,7 +410,7 @@ class TransportDatabase(object):
         ``None`` is returned. If no corresponding library is found, a
         :class:`DatabaseError` is raised.
         """
-        for label, entry in library.entries.iteritems():
+        for entry in library.findEntriesByStructure(species.molecule):
             for molecule in species.molecule:
                 if molecule.isIsomorphic(entry.item) and entry.data is not None:
                     return (deepcopy(entry.data), library, entry)
@@ -510,8 +543,48 @@ class TransportDatabase(object):
         in the structure `structure`, and add it to the existing criticalPointContribution
         `criticalPointContribution`.
         """
+        data = self.__getCriticalPointContribution(database, molecule, atom['*'])
+
+        groupData.Tc += data.Tc
+        groupData.Pc += data.Pc
+        groupData.Vc += data.Vc
+        groupData.Tb += data.Tb
+        groupData.structureIndex += data.structureIndex
         
-        node0 = database.descendTree(molecule, atom, None)
+        return groupData
+
+    def __getCriticalPointContribution(self, database, molecule, atom):
+        """
+        Return the critical point contribution of the atom `atom` in
+        `molecule` from the group `database`. The group found depends only on
+        the atoms within the largest radius of the groups around the atom, and
+        their atom types only on one more shell of atoms, so the contribution
+        is cached for each such local environment and multiplicity of
+        `molecule`, and the tree is only descended for environments that have
+        not been seen before.
+        """
+        if database.label not in self._groupTreeRadius:
+            radius = getGroupTreeRadius(database)
+            self._groupTreeRadius[database.label] = -1 if radius is None else radius
+        radius = self._groupTreeRadius[database.label]
+        if radius < 0:
+            return self.__findCriticalPointContribution(database, molecule, atom)
+
+        environment, center, key = getLocalEnvironment(molecule, atom, radius + 1)
+        entries = self._groupContributionCache.setdefault((database.label, key), [])
+        for environment0, center0, data in entries:
+            if environment.isIsomorphic(environment0, initialMap={center: center0}):
+                return data
+        data = self.__findCriticalPointContribution(database, molecule, atom)
+        entries.append((environment, center, data))
+        return data
+
+    def __findCriticalPointContribution(self, database, molecule, atom):
+        """
+        Return the critical point contribution of the atom `atom` in
+        `molecule` by descending the tree of the group `database`.
+        """
+        node0 = database.descendTree(molecule, {'*':atom}, None)
 
         if node0 is None:
             raise KeyError('Node not found in database.')
@@ -526,22 +599,13 @@ class TransportDatabase(object):
         if node is None:
             raise KeyError('Node {!r} has no parent with data in the transport database.'.format(node0))
         data = node.data
-        comment = node.label
         while isinstance(data, basestring) and data is not None:
             for entry in database.entries.values():
                 if entry.label == data:
                     data = entry.data
-                    comment = entry.label
                     break
-        comment = '{0}({1})'.format(database.label, comment)
         
-        groupData.Tc += data.Tc
-        groupData.Pc += data.Pc
-        groupData.Vc += data.Vc
-        groupData.Tb += data.Tb
-        groupData.structureIndex += data.structureIndex
-        
-        return groupData
+        return data
     
     def getTransportPropertiesViaLennardJonesParameters(self,species):
         """
@@ -29,9 +29,11 @@
 ################################################################################
 
 from .model import KineticsModel, PDepKineticsModel, TunnelingModel, \
-                   getRateCoefficientUnitsFromReactionOrder, getReactionOrderFromRateCoefficientUnits
+                   getRateCoefficientUnitsFromReactionOrder, getReactionOrderFromRateCoefficientUnits, \
+                   evaluateRateCoefficients
 from .arrhenius import Arrhenius, ArrheniusEP, PDepArrhenius, MultiArrhenius, MultiPDepArrhenius
 from .chebyshev import Chebyshev
 from .falloff import ThirdBody, Lindemann, Troe
 from .kineticsdata import KineticsData, PDepKineticsData
+from .table import KineticsTable
 from .tunneling import Wigner, Eckart
@@ -41,6 +41,8 @@ cdef class Arrhenius(KineticsModel):
     
     cpdef double getRateCoefficient(self, double T, double P=?) except -1
 
+    cpdef numpy.ndarray getRateCoefficients(self, Tlist, double P=?)
+
     cpdef changeT0(self, double T0)
 
     cpdef fitToData(self, numpy.ndarray Tlist, numpy.ndarray klist, str kunits, double T0=?, numpy.ndarray weights=?, bint threeParams=?)
@@ -60,6 +62,8 @@ cdef class ArrheniusEP(KineticsModel):
     
     cpdef double getRateCoefficient(self, double T, double dHrxn=?) except -1
 
+    cpdef numpy.ndarray getRateCoefficients(self, Tlist, double dHrxn=?)
+
     cpdef double getActivationEnergy(self, double dHrxn) except -1
     
     cpdef Arrhenius toArrhenius(self, double dHrxn)
@@ -78,6 +82,8 @@ cdef class PDepArrhenius(PDepKineticsModel):
     cdef getAdjacentExpressions(self, double P)
     
     cpdef double getRateCoefficient(self, double T, double P=?) except -1
+
+    cpdef numpy.ndarray getRateCoefficients(self, Tlist, double P=?)
     
     cpdef fitToData(self, numpy.ndarray Tlist, numpy.ndarray Plist, numpy.ndarray K, str kunits, double T0=?)
 
@@ -93,6 +99,8 @@ cdef class MultiArrhenius(KineticsModel):
     
     cpdef double getRateCoefficient(self, double T, double P=?) except -1
 
+    cpdef numpy.ndarray getRateCoefficients(self, Tlist, double P=?)
+
     cpdef bint isIdenticalTo(self, KineticsModel otherKinetics) except -2
     
     cpdef Arrhenius toArrhenius(self, double Tmin=?, double Tmax=?)
@@ -107,6 +115,8 @@ cdef class MultiPDepArrhenius(PDepKineticsModel):
     
     cpdef double getRateCoefficient(self, double T, double P=?) except -1
 
+    cpdef numpy.ndarray getRateCoefficients(self, Tlist, double P=?)
+
     cpdef bint isIdenticalTo(self, KineticsModel otherKinetics) except -2
     
     cpdef changeRate(self, double factor)
\ No newline at end of file
@@ -28,6 +28,7 @@
 ################################################################################
 
 import numpy
+import cython
 from libc.math cimport exp, log, sqrt, log10
 
 cimport rmgpy.constants as constants
@@ -123,6 +124,41 @@ cdef class Arrhenius(KineticsModel):
         T0 = self._T0.value_si
         return A * (T / T0)**n * exp(-Ea / (constants.R * T))
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef numpy.ndarray getRateCoefficients(self, Tlist, double P=0.0):
+        """
+        Return the rate coefficients in the appropriate combination of m^3,
+        mol, and s at the temperatures `Tlist` in K.
+        """
+        cdef double[:] T = numpy.asarray(Tlist, numpy.float64)
+        cdef double[:] k = numpy.empty(T.shape[0], numpy.float64)
+        cdef double A, n, Ea, T0
+        cdef Py_ssize_t i
+        A = self._A.value_si
+        n = self._n.value_si
+        Ea = self._Ea.value_si
+        T0 = self._T0.value_si
+        for i in range(T.shape[0]):
+            k[i] = A * (T[i] / T0)**n * exp(-Ea / (constants.R * T[i]))
+        return numpy.asarray(k)
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def evaluateRateCoefficients(list models, double T, double P=0.0):
+        """
+        Return the rate coefficients in the appropriate combination of m^3,
+        mol, and s of each of the Arrhenius `models` at temperature `T` in K.
+        """
+        cdef double[:] k = numpy.empty(len(models), numpy.float64)
+        cdef Arrhenius arrh
+        cdef Py_ssize_t i
+        for i in range(len(models)):
+            arrh = models[i]
+            k[i] = arrh._A.value_si * (T / arrh._T0.value_si)**arrh._n.value_si * exp(-arrh._Ea.value_si / (constants.R * T))
+        return numpy.asarray(k)
+
     cpdef changeT0(self, double T0):
         """
         Changes the reference temperature used in the exponent to `T0` in K, 
@@ -341,6 +377,25 @@ cdef class ArrheniusEP(KineticsModel):
         n = self._n.value_si
         return A * T**n * exp(-Ea / (constants.R * T))
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef numpy.ndarray getRateCoefficients(self, Tlist, double dHrxn=0.0):
+        """
+        Return the rate coefficients in the appropriate combination of m^3,
+        mol, and s at the temperatures `Tlist` in K and enthalpy of reaction
+        `dHrxn` in J/mol.
+        """
+        cdef double[:] T = numpy.asarray(Tlist, numpy.float64)
+        cdef double[:] k = numpy.empty(T.shape[0], numpy.float64)
+        cdef double A, n, Ea
+        cdef Py_ssize_t i
+        Ea = self.getActivationEnergy(dHrxn)
+        A = self._A.value_si
+        n = self._n.value_si
+        for i in range(T.shape[0]):
+            k[i] = A * T[i]**n * exp(-Ea / (constants.R * T[i]))
+        return numpy.asarray(k)
+
     cpdef double getActivationEnergy(self, double dHrxn) except -1:
         """
         Return the activation energy in J/mol corresponding to the given
@@ -496,6 +551,36 @@ cdef class PDepArrhenius(PDepKineticsModel):
             if klow == khigh == 0.0: return 0.0
             k = klow * 10**(log10(P/Plow)/log10(Phigh/Plow)*log10(khigh/klow))
         return k
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef numpy.ndarray getRateCoefficients(self, Tlist, double P=0.0):
+        """
+        Return the rate coefficients in the appropriate combination of m^3,
+        mol, and s at the temperatures `Tlist` in K and pressure `P` in Pa.
+        """
+        cdef numpy.ndarray T
+        cdef double[:] k, klow, khigh
+        cdef double Plow, Phigh
+        cdef KineticsModel alow, ahigh
+        cdef Py_ssize_t i
+
+        if P == 0:
+            raise ValueError('No pressure specified to pressure-dependent PDepArrhenius.getRateCoefficients().')
+
+        T = numpy.asarray(Tlist, numpy.float64)
+        Plow, Phigh, alow, ahigh = self.getAdjacentExpressions(P)
+        if Plow == Phigh:
+            return alow.getRateCoefficients(T)
+        klow = alow.getRateCoefficients(T)
+        khigh = ahigh.getRateCoefficients(T)
+        k = numpy.empty(T.shape[0], numpy.float64)
+        for i in range(T.shape[0]):
+            if klow[i] == khigh[i] == 0.0:
+                k[i] = 0.0
+            else:
+                k[i] = klow[i] * 10**(log10(P/Plow)/log10(Phigh/Plow)*log10(khigh[i]/klow[i]))
+        return numpy.asarray(k)
     
     cpdef fitToData(self, numpy.ndarray Tlist, numpy.ndarray Plist, numpy.ndarray K, str kunits, double T0=1):
         """
@@ -613,6 +698,19 @@ cdef class MultiArrhenius(KineticsModel):
             k += arrh.getRateCoefficient(T)
         return k
 
+    cpdef numpy.ndarray getRateCoefficients(self, Tlist, double P=0.0):
+        """
+        Return the rate coefficients in the appropriate combination of m^3,
+        mol, and s at the temperatures `Tlist` in K.
+        """
+        cdef numpy.ndarray T, k
+        cdef Arrhenius arrh
+        T = numpy.asarray(Tlist, numpy.float64)
+        k = numpy.zeros(T.shape[0], numpy.float64)
+        for arrh in self.arrhenius:
+            k += arrh.getRateCoefficients(T)
+        return k
+
     cpdef bint isIdenticalTo(self, KineticsModel otherKinetics) except -2:
         """
         Returns ``True`` if kinetics matches that of another kinetics model.  Each duplicate
@@ -756,6 +854,51 @@ cdef class MultiPDepArrhenius(PDepKineticsModel):
         
         return k
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef numpy.ndarray getRateCoefficients(self, Tlist, double P=0.0):
+        """
+        Return the rate coefficients in the appropriate combination of m^3,
+        mol, and s at the temperatures `Tlist` in K and pressure `P` in Pa.
+        """
+        cdef numpy.ndarray T, klowSum, khighSum
+        cdef double[:] k, klow, khigh
+        cdef double Plow, Phigh
+        cdef PDepArrhenius arrh
+        cdef KineticsModel arrh_low, arrh_high
+        cdef numpy.ndarray Plist1, Plist2
+        cdef Py_ssize_t i
+
+        if P == 0:
+            raise ValueError('No pressure specified to pressure-dependent MultiPDepArrhenius.getRateCoefficients().')
+
+        Plist1 = self.arrhenius[0].pressures.value_si
+        for arrh in self.arrhenius[1:]:
+            Plist2 = arrh.pressures.value_si
+            assert Plist1.shape[0] == Plist2.shape[0]
+            for i in range(Plist1.shape[0]):
+                assert 0.99 < (Plist2[i] / Plist1[i]) < 1.01
+
+        T = numpy.asarray(Tlist, numpy.float64)
+        klowSum = numpy.zeros(T.shape[0], numpy.float64)
+        khighSum = numpy.zeros(T.shape[0], numpy.float64)
+        for arrh in self.arrhenius:
+            Plow, Phigh, arrh_low, arrh_high = arrh.getAdjacentExpressions(P)
+            klowSum += arrh_low.getRateCoefficients(T)
+            khighSum += arrh_high.getRateCoefficients(T)
+
+        klow = klowSum
+        khigh = khighSum
+        k = numpy.empty(T.shape[0], numpy.float64)
+        for i in range(T.shape[0]):
+            if klow[i] == khigh[i] == 0.0:
+                k[i] = 0.0
+            elif Plow == Phigh:
+                k[i] = klow[i]
+            else:
+                k[i] = klow[i] * 10**(log10(P/Plow)/log10(Phigh/Plow)*log10(khigh[i]/klow[i]))
+        return numpy.asarray(k)
+
     cpdef bint isIdenticalTo(self, KineticsModel otherKinetics) except -2:
         """
         Returns ``True`` if kinetics matches that of another kinetics model.  Each duplicate
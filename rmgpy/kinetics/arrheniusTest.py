@@ -37,6 +37,7 @@ import math
 import numpy
 
 from rmgpy.kinetics.arrhenius import Arrhenius, ArrheniusEP, PDepArrhenius, MultiArrhenius, MultiPDepArrhenius
+from rmgpy.kinetics.model import evaluateRateCoefficients
 import rmgpy.constants as constants
 
 ################################################################################
@@ -129,6 +130,26 @@ class TestArrhenius(unittest.TestCase):
             kact = self.arrhenius.getRateCoefficient(T)
             self.assertAlmostEqual(kexp, kact, delta=1e-4*kexp)
 
+    def test_getRateCoefficients(self):
+        """
+        Test the vectorized Arrhenius.getRateCoefficients() method.
+        """
+        Tlist = numpy.array([200,400,600,800,1000,1200,1400,1600,1800,2000], numpy.float64)
+        klist = self.arrhenius.getRateCoefficients(Tlist)
+        self.assertEqual(klist.shape, Tlist.shape)
+        for T, kact in zip(Tlist, klist):
+            kexp = self.arrhenius.getRateCoefficient(T)
+            self.assertAlmostEqual(kexp, kact, delta=1e-10*kexp)
+
+    def test_evaluateRateCoefficients(self):
+        """
+        Test the evaluation of several kinetics models at a single temperature.
+        """
+        other = Arrhenius(A=(1.0e6,"s^-1"), n=0.5, Ea=(10.0,"kJ/mol"), T0=(1,"K"))
+        klist = evaluateRateCoefficients([self.arrhenius, other], 1000.)
+        self.assertAlmostEqual(klist[0], self.arrhenius.getRateCoefficient(1000.), delta=1e-10*klist[0])
+        self.assertAlmostEqual(klist[1], other.getRateCoefficient(1000.), delta=1e-10*klist[1])
+
     def test_changeT0(self):
         """
         Test the Arrhenius.changeT0() method.
@@ -307,6 +328,17 @@ class TestArrheniusEP(unittest.TestCase):
             kact = self.arrhenius.getRateCoefficient(T, )
             self.assertAlmostEqual(kexp, kact, delta=1e-4*kexp)
 
+    def test_getRateCoefficients(self):
+        """
+        Test the vectorized ArrheniusEP.getRateCoefficients() method.
+        """
+        Tlist = numpy.array([200,400,600,800,1000,1200,1400,1600,1800,2000])
+        for dHrxn in [-20000., 0., 20000.]:
+            klist = self.arrhenius.getRateCoefficients(Tlist, dHrxn)
+            for T, kact in zip(Tlist, klist):
+                kexp = self.arrhenius.getRateCoefficient(T, dHrxn)
+                self.assertAlmostEqual(kexp, kact, delta=1e-10*kexp)
+
     def test_pickle(self):
         """
         Test that an ArrheniusEP object can be pickled and unpickled with no loss
@@ -500,6 +532,17 @@ class TestPDepArrhenius(unittest.TestCase):
             for p in range(len(Pdata)):
                 self.assertAlmostEqual(kinetics.getRateCoefficient(Tdata[t], Pdata[p]), kdata[t,p], delta=1e-6*kdata[t,p])
         
+    def test_getRateCoefficients(self):
+        """
+        Test the vectorized PDepArrhenius.getRateCoefficients() method.
+        """
+        Tlist = numpy.array([300,400,500,600,700,800,900,1000,1100,1200,1300,1400,1500])
+        for P in [1e4,3e4,1e5,3e5,1e6]:
+            klist = self.kinetics.getRateCoefficients(Tlist, P)
+            for T, kact in zip(Tlist, klist):
+                kexp = self.kinetics.getRateCoefficient(T, P)
+                self.assertAlmostEqual(kexp, kact, delta=1e-10*kexp)
+
     def test_pickle(self):
         """
         Test that a PDepArrhenius object can be successfully pickled and
@@ -664,6 +707,16 @@ class TestMultiArrhenius(unittest.TestCase):
             kact = self.kinetics.getRateCoefficient(T)
             self.assertAlmostEqual(kexp, kact, delta=1e-4*kexp)
         
+    def test_getRateCoefficients(self):
+        """
+        Test the vectorized MultiArrhenius.getRateCoefficients() method.
+        """
+        Tlist = [200,400,600,800,1000,1200,1400,1600,1800,2000]
+        klist = self.kinetics.getRateCoefficients(Tlist)
+        for T, kact in zip(Tlist, klist):
+            kexp = self.kinetics.getRateCoefficient(T)
+            self.assertAlmostEqual(kexp, kact, delta=1e-10*kexp)
+
     def test_pickle(self):
         """
         Test that a MultiArrhenius object can be pickled and unpickled with no loss
@@ -910,6 +963,17 @@ class TestMultiPDepArrhenius(unittest.TestCase):
                 kact = self.kinetics.getRateCoefficient(Tlist[i], Plist[j])
                 self.assertAlmostEqual(kexp, kact, delta=1e-4*kexp)
         
+    def test_getRateCoefficients(self):
+        """
+        Test the vectorized MultiPDepArrhenius.getRateCoefficients() method.
+        """
+        Tlist = numpy.array([300,400,500,600,700,800,900,1000,1100,1200,1300,1400,1500])
+        for P in [1e4,3e4,1e5,3e5,1e6]:
+            klist = self.kinetics.getRateCoefficients(Tlist, P)
+            for T, kact in zip(Tlist, klist):
+                kexp = self.kinetics.getRateCoefficient(T, P)
+                self.assertAlmostEqual(kexp, kact, delta=1e-10*kexp)
+
     def test_pickle(self):
         """
         Test that a MultiPDepArrhenius object can be pickled and unpickled with
@@ -28,6 +28,7 @@
 ################################################################################
 
 import numpy
+import cython
 from libc.math cimport exp, log, sqrt, log10
 
 cimport rmgpy.constants as constants
@@ -166,6 +167,45 @@ cdef class Chebyshev(PDepKineticsModel):
                 k += coeffs[t,p] * self.chebyshev(t, Tred) * self.chebyshev(p, Pred)
         return 10.0**k
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef numpy.ndarray getRateCoefficients(self, Tlist, double P=0.0):
+        """
+        Return the rate coefficients in the appropriate combination of m^3,
+        mol, and s at the temperatures `Tlist` in K and pressure `P` in Pa by
+        evaluating the Chebyshev expression. The pressure polynomials are
+        summed once for all of the temperatures.
+        """
+        cdef double[:] T = numpy.asarray(Tlist, numpy.float64)
+        cdef double[:] k = numpy.empty(T.shape[0], numpy.float64)
+        cdef double[:,:] coeffs
+        cdef double[:] coeffsT
+        cdef double Tmin, Tmax, Tred, Pred, logk
+        cdef int t, p
+        cdef Py_ssize_t i
+
+        if P == 0:
+            raise ValueError('No pressure specified to pressure-dependent Chebyshev.getRateCoefficients().')
+
+        coeffs = self._coeffs.value_si
+        Tmin = self._Tmin.value_si
+        Tmax = self._Tmax.value_si
+
+        # Coefficients of the temperature polynomials at this pressure
+        Pred = self.getReducedPressure(P)
+        coeffsT = numpy.zeros(self.degreeT, numpy.float64)
+        for t in range(self.degreeT):
+            for p in range(self.degreeP):
+                coeffsT[t] += coeffs[t,p] * self.chebyshev(p, Pred)
+
+        for i in range(T.shape[0]):
+            Tred = (2.0/T[i] - 1.0/Tmin - 1.0/Tmax) / (1.0/Tmax - 1.0/Tmin)
+            logk = 0.0
+            for t in range(self.degreeT):
+                logk += coeffsT[t] * self.chebyshev(t, Tred)
+            k[i] = 10.0**logk
+        return numpy.asarray(k)
+
     cpdef fitToData(self, numpy.ndarray Tlist, numpy.ndarray Plist, numpy.ndarray K,
         str kunits, int degreeT, int degreeP, double Tmin, double Tmax, double Pmin, double Pmax):
         """
@@ -154,6 +154,17 @@ class TestChebyshev(unittest.TestCase):
                 kfit = chebyshev.getRateCoefficient(Tdata[t], Pdata[p]) * 1e6
                 self.assertAlmostEqual(kfit, kdata[t,p], delta=1e-4*kdata[t,p])
         
+    def test_getRateCoefficients(self):
+        """
+        Test the vectorized Chebyshev.getRateCoefficients() method.
+        """
+        Tlist = numpy.array([300,500,1000,1500])
+        for P in [1e4,1e5,1e6]:
+            klist = self.chebyshev.getRateCoefficients(Tlist, P)
+            for T, kact in zip(Tlist, klist):
+                kexp = self.chebyshev.getRateCoefficient(T, P)
+                self.assertAlmostEqual(kexp, kact, delta=1e-10*kexp)
+
     def test_pickle(self):
         """
         Test that a Chebyshev object can be pickled and unpickled with no loss
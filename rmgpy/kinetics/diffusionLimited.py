@@ -1,3 +1,4 @@
+import numpy
 import rmgpy.quantity as quantity
 import logging
 import rmgpy.constants as constants
@@ -94,6 +95,63 @@ class DiffusionLimited():
         k_diff = 4 * constants.pi * radii * diffusivities * constants.Na  # m3/mol/s
         return k_diff
 
+    def getDiffusionLimits(self, table, T, forward=True, indices=None):
+        """
+        Return an array of the diffusive limits on the rate coefficients
+        k_diff in m3/mol/s of the reactions at the given `indices` (by default
+        all reactions) in the :class:`KineticsTable` `table` at temperature
+        `T` in K, in the forward direction if `forward` is ``True`` or the
+        reverse direction otherwise. Each of these reactions must be
+        bimolecular in that direction.
+        
+        This is the vectorized form of :meth:`getDiffusionLimit`, in which
+        the radius and diffusivity of each species are evaluated only once.
+        """
+        reactionIndices, speciesIndices, coefficients = table.stoichiometry
+        mask = coefficients < 0 if forward else coefficients > 0
+        reactionIndices, speciesIndices = reactionIndices[mask], speciesIndices[mask]
+        if indices is None:
+            indices = numpy.arange(len(table))
+        assert numpy.all(numpy.bincount(reactionIndices, minlength=len(table))[indices] == 2), "Can only calculate diffusion limit in a bimolecular direction"
+
+        V = self.database.soluteParameters[self.database.getSoluteIndices(table.species), 5]
+        # calculate radius with the McGowan volume and assuming sphere
+        radius = ((75 * V / constants.pi / constants.Na) ** (1. / 3)) / 100  # m
+        diffusivity = constants.kB * T / 6 / constants.pi / self.getSolventViscosity(T) / radius  # m^2/s
+
+        radii = numpy.bincount(reactionIndices, weights=radius[speciesIndices], minlength=len(table))
+        diffusivities = numpy.bincount(reactionIndices, weights=diffusivity[speciesIndices], minlength=len(table))
+        return 4 * constants.pi * radii[indices] * diffusivities[indices] * constants.Na  # m3/mol/s
+
+    def getEffectiveRates(self, table, T):
+        """
+        Return arrays of the effective forward rate coefficients and of the
+        equilibrium constants :math:`K_c` of all reactions in the
+        :class:`KineticsTable` `table` at temperature `T` in K.
+        
+        This is the vectorized form of :meth:`getEffectiveRate`, and applies
+        the diffusion limit in the same direction for each reaction.
+        """
+        k_forward = table.getRateCoefficients(T, P=100e5)
+        Keq = table.getEquilibriumConstants(T)
+        k_reverse = k_forward / Keq
+        k_eff = k_forward.copy()
+
+        reactants = numpy.array([len(reaction.reactants) for reaction in table.reactions])
+        products = numpy.array([len(reaction.products) for reaction in table.reactions])
+        unimolecular = reactants == 1
+        limitReverse = numpy.where(unimolecular, products != 1, (products != 1) & (products != 3) & ~(Keq > 1.0))
+        limitForward = ~unimolecular & ~limitReverse
+
+        if numpy.any(limitForward):
+            k_diff = self.getDiffusionLimits(table, T, forward=True, indices=numpy.flatnonzero(limitForward))
+            k_eff[limitForward] = k_forward[limitForward]*k_diff/(k_forward[limitForward]+k_diff)
+        if numpy.any(limitReverse):
+            k_diff = self.getDiffusionLimits(table, T, forward=False, indices=numpy.flatnonzero(limitReverse))
+            k_eff_reverse = k_reverse[limitReverse]*k_diff/(k_reverse[limitReverse]+k_diff)
+            k_eff[limitReverse] = k_eff_reverse * Keq[limitReverse]
+        return k_eff, Keq
+
 
 # module level variable. There should only ever be one. It starts off disabled
 diffusionLimiter = DiffusionLimited()
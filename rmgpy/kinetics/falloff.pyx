@@ -33,6 +33,7 @@ of "standard" falloff.
 """
 
 import numpy
+import cython
 from libc.math cimport exp, log, log10
 
 cimport rmgpy.constants as constants
@@ -99,6 +100,24 @@ cdef class ThirdBody(PDepKineticsModel):
         
         return k0 * C
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef numpy.ndarray getRateCoefficients(self, Tlist, double P=0.0):
+        """
+        Return the values of the rate coefficient :math:`k(T)` in units of m^3,
+        mol, and s at the specified temperatures `Tlist` in K and pressure `P`
+        in Pa. If you wish to consider collision efficiencies, then you should
+        first use :meth:`getEffectivePressure()` to compute the effective
+        pressure, and pass that value as the pressure to this method.
+        """
+        cdef double[:] T = numpy.asarray(Tlist, numpy.float64)
+        cdef double[:] k0 = self.arrheniusLow.getRateCoefficients(Tlist)
+        cdef double[:] k = numpy.empty(T.shape[0], numpy.float64)
+        cdef Py_ssize_t i
+        for i in range(T.shape[0]):
+            k[i] = k0[i] * P / constants.R / T[i]
+        return numpy.asarray(k)
+
     cpdef bint isIdenticalTo(self, KineticsModel otherKinetics) except -2:
         """
         Checks to see if kinetics matches that of other kinetics and returns ``True``
@@ -193,6 +212,28 @@ cdef class Lindemann(PDepKineticsModel):
         
         return kinf * (Pr / (1 + Pr))
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef numpy.ndarray getRateCoefficients(self, Tlist, double P=0.0):
+        """
+        Return the values of the rate coefficient :math:`k(T)` in units of m^3,
+        mol, and s at the specified temperatures `Tlist` in K and pressure `P`
+        in Pa. If you wish to consider collision efficiencies, then you should
+        first use :meth:`getEffectivePressure()` to compute the effective
+        pressure, and pass that value as the pressure to this method.
+        """
+        cdef double[:] T = numpy.asarray(Tlist, numpy.float64)
+        cdef double[:] k0 = self.arrheniusLow.getRateCoefficients(Tlist)
+        cdef double[:] kinf = self.arrheniusHigh.getRateCoefficients(Tlist)
+        cdef double[:] k = numpy.empty(T.shape[0], numpy.float64)
+        cdef double C, Pr
+        cdef Py_ssize_t i
+        for i in range(T.shape[0]):
+            C = P / constants.R / T[i]     # bath gas concentration in mol/m^3
+            Pr = k0[i] * C / kinf[i]
+            k[i] = kinf[i] * (Pr / (1 + Pr))
+        return numpy.asarray(k)
+
     cpdef bint isIdenticalTo(self, KineticsModel otherKinetics) except -2:
         """
         Checks to see if kinetics matches that of other kinetics and returns ``True``
@@ -343,6 +384,45 @@ cdef class Troe(PDepKineticsModel):
 
         return kinf * (Pr / (1 + Pr)) * F
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef numpy.ndarray getRateCoefficients(self, Tlist, double P=0.0):
+        """
+        Return the values of the rate coefficient :math:`k(T)` in units of m^3,
+        mol, and s at the specified temperatures `Tlist` in K and pressure `P`
+        in Pa. If you wish to consider collision efficiencies, then you should
+        first use :meth:`getEffectivePressure()` to compute the effective
+        pressure, and pass that value as the pressure to this method.
+        """
+        cdef double[:] T = numpy.asarray(Tlist, numpy.float64)
+        cdef double[:] k0 = self.arrheniusLow.getRateCoefficients(Tlist)
+        cdef double[:] kinf = self.arrheniusHigh.getRateCoefficients(Tlist)
+        cdef double[:] k = numpy.empty(T.shape[0], numpy.float64)
+        cdef double C, Pr
+        cdef double d, n, c, Fcent, F
+        cdef double alpha, T1, T2, T3
+        cdef Py_ssize_t i
+
+        alpha = self.alpha
+        T1 = self._T1.value_si if self._T1 is not None else 0.0
+        T2 = self._T2.value_si if self._T2 is not None else 0.0
+        T3 = self._T3.value_si if self._T3 is not None else 0.0
+
+        for i in range(T.shape[0]):
+            C = P / constants.R / T[i]     # bath gas concentration in mol/m^3
+            Pr = k0[i] * C / kinf[i]
+            if T1 == 0 and T3 == 0:
+                F = 1.0
+            else:
+                Fcent = (1 - alpha) * exp(-T[i] / T3) + alpha * exp(-T[i] / T1)
+                if T2 != 0.0: Fcent += exp(-T2 / T[i])
+                d = 0.14
+                n = 0.75 - 1.27 * log10(Fcent)
+                c = -0.4 - 0.67 * log10(Fcent)
+                F = 10.0**(log10(Fcent)/(1 + ((log10(Pr) + c)/(n - d * (log10(Pr))))**2))
+            k[i] = kinf[i] * (Pr / (1 + Pr)) * F
+        return numpy.asarray(k)
+
     cpdef bint isIdenticalTo(self, KineticsModel otherKinetics) except -2:
         """
         Checks to see if kinetics matches that of other kinetics and returns ``True``
@@ -210,6 +210,17 @@ class TestThirdBody(unittest.TestCase):
                 Kact = self.thirdBody.getRateCoefficient(Tlist[t], Plist[p])
                 self.assertAlmostEqual(Kact, Kexp[t,p], delta=1e-4*Kexp[t,p])
 
+    def test_getRateCoefficients(self):
+        """
+        Test the vectorized ThirdBody.getRateCoefficients() method.
+        """
+        Tlist = numpy.array([300,500,1000,1500])
+        for P in [1e4,1e5,1e6]:
+            klist = self.thirdBody.getRateCoefficients(Tlist, P)
+            for T, kact in zip(Tlist, klist):
+                kexp = self.thirdBody.getRateCoefficient(T, P)
+                self.assertAlmostEqual(kexp, kact, delta=1e-10*kexp)
+
     def test_pickle(self):
         """
         Test that a ThirdBody object can be successfully pickled and
@@ -390,6 +401,17 @@ class TestLindemann(unittest.TestCase):
                 Kact = self.lindemann.getRateCoefficient(Tlist[t], Plist[p])
                 self.assertAlmostEqual(Kact, Kexp[t,p], delta=1e-4*Kexp[t,p])
 
+    def test_getRateCoefficients(self):
+        """
+        Test the vectorized Lindemann.getRateCoefficients() method.
+        """
+        Tlist = numpy.array([300,500,1000,1500])
+        for P in [1e4,1e5,1e6]:
+            klist = self.lindemann.getRateCoefficients(Tlist, P)
+            for T, kact in zip(Tlist, klist):
+                kexp = self.lindemann.getRateCoefficient(T, P)
+                self.assertAlmostEqual(kexp, kact, delta=1e-10*kexp)
+
     def test_pickle(self):
         """
         Test that a Lindemann object can be pickled and unpickled with no loss
@@ -618,6 +640,17 @@ class TestTroe(unittest.TestCase):
                 Kact = self.troe.getRateCoefficient(Tlist[t], Plist[p])
                 self.assertAlmostEqual(Kact, Kexp[t,p], delta=1e-4*Kexp[t,p])
 
+    def test_getRateCoefficients(self):
+        """
+        Test the vectorized Troe.getRateCoefficients() method.
+        """
+        Tlist = numpy.array([300,500,1000,1500])
+        for P in [1e4,1e5,1e6]:
+            klist = self.troe.getRateCoefficients(Tlist, P)
+            for T, kact in zip(Tlist, klist):
+                kexp = self.troe.getRateCoefficient(T, P)
+                self.assertAlmostEqual(kexp, kact, delta=1e-10*kexp)
+
     def test_pickle(self):
         """
         Test that a Troe object can be pickled and unpickled with no loss of
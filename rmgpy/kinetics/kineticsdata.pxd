@@ -39,6 +39,8 @@ cdef class KineticsData(KineticsModel):
     
     cpdef double getRateCoefficient(self, double T, double P=?) except -1
 
+    cpdef numpy.ndarray getRateCoefficients(self, Tlist, double P=?)
+
     cpdef bint isIdenticalTo(self, KineticsModel otherKinetics) except -2
 
 ################################################################################
@@ -28,6 +28,7 @@
 ################################################################################
 
 import numpy
+import cython
 from libc.math cimport exp, log, sqrt, log10
 
 cimport rmgpy.constants as constants
@@ -98,29 +99,22 @@ cdef class KineticsData(KineticsModel):
         Return the rate coefficient in the appropriate combination of m^3, 
         mol, and s at temperature `T` in K. 
         """
-        cdef numpy.ndarray[numpy.float64_t,ndim=1] Tdata, kdata
-        cdef double Tlow, Thigh, klow, khigh
-        cdef double k
-        cdef int i, N
-        
-        Tdata = self._Tdata.value_si
-        kdata = self._kdata.value_si
-        N = kdata.shape[0]
-        k = 0.0
-        
-        # Make sure we are interpolating and not extrapolating
-        if T < Tdata[0]:
-            raise ValueError('Unable to compute rate coefficient at {0:g} K using KineticsData model.'.format(T))
-        elif T > Tdata[N-1]:
-            raise ValueError('Unable to compute rate coefficient at {0:g} K using KineticsData model.'.format(T))
-        else:
-            for i in range(N-1):
-                Tlow = Tdata[i]; Thigh = Tdata[i+1]
-                if Tlow <= T and T <= Thigh:
-                    klow = kdata[i]; khigh = kdata[i+1]
-                    k = klow * (khigh / klow)**((T - Tlow) / (Thigh - Tlow))
-                    break
-        return k
+        return interpolateRateCoefficient(T, self._Tdata.value_si, self._kdata.value_si)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef numpy.ndarray getRateCoefficients(self, Tlist, double P=0.0):
+        """
+        Return the rate coefficients in the appropriate combination of m^3,
+        mol, and s at the temperatures `Tlist` in K.
+        """
+        cdef double[:] T = numpy.asarray(Tlist, numpy.float64)
+        cdef double[:] Tdata = self._Tdata.value_si, kdata = self._kdata.value_si
+        cdef double[:] k = numpy.empty(T.shape[0], numpy.float64)
+        cdef Py_ssize_t i
+        for i in range(T.shape[0]):
+            k[i] = interpolateRateCoefficient(T[i], Tdata, kdata)
+        return numpy.asarray(k)
     
     cpdef bint isIdenticalTo(self, KineticsModel otherKinetics) except -2:
         """
@@ -258,3 +252,33 @@ cdef class PDepKineticsData(PDepKineticsModel):
         if not self.Tdata.equals(otherKinetics.Tdata) or not self.Pdata.equals(otherKinetics.Pdata) or not self.kdata.equals(otherKinetics.kdata):
             return False
         return True
+
+################################################################################
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef double interpolateRateCoefficient(double T, double[:] Tdata, double[:] kdata) except -1:
+    """
+    Return the rate coefficient at temperature `T` in K by interpolating the
+    rate coefficients `kdata` known at the temperatures `Tdata` in K.
+    """
+    cdef double Tlow, Thigh, klow, khigh
+    cdef double k
+    cdef Py_ssize_t i, N
+
+    N = kdata.shape[0]
+    k = 0.0
+
+    # Make sure we are interpolating and not extrapolating
+    if T < Tdata[0]:
+        raise ValueError('Unable to compute rate coefficient at {0:g} K using KineticsData model.'.format(T))
+    elif T > Tdata[N-1]:
+        raise ValueError('Unable to compute rate coefficient at {0:g} K using KineticsData model.'.format(T))
+    else:
+        for i in range(N-1):
+            Tlow = Tdata[i]; Thigh = Tdata[i+1]
+            if Tlow <= T and T <= Thigh:
+                klow = kdata[i]; khigh = kdata[i+1]
+                k = klow * (khigh / klow)**((T - Tlow) / (Thigh - Tlow))
+                break
+    return k
@@ -117,6 +117,17 @@ class TestKineticsData(unittest.TestCase):
             kact = self.kinetics.getRateCoefficient(T)
             self.assertAlmostEqual(kexp, kact, delta=1e-4*kexp)
 
+    def test_getRateCoefficients(self):
+        """
+        Test the vectorized KineticsData.getRateCoefficients() method.
+        """
+        Tlist = numpy.array([300,400,500,600,800,1000,1200,1400,1600,1800,2000])
+        klist = self.kinetics.getRateCoefficients(Tlist)
+        for T, kact in zip(Tlist, klist):
+            kexp = self.kinetics.getRateCoefficient(T)
+            self.assertAlmostEqual(kexp, kact, delta=1e-10*kexp)
+        self.assertRaises(ValueError, self.kinetics.getRateCoefficients, [300, 3000])
+
     def test_pickle(self):
         """
         Test that a KineticsData object can be pickled and unpickled with no
@@ -35,6 +35,8 @@ cpdef str getRateCoefficientUnitsFromReactionOrder(order)
 
 cpdef int getReactionOrderFromRateCoefficientUnits(kunits) except -1
 
+cpdef numpy.ndarray evaluateRateCoefficients(list models, double T, double P=?)
+
 ################################################################################
 
 cdef class KineticsModel:
@@ -48,6 +50,8 @@ cdef class KineticsModel:
     cpdef bint isTemperatureValid(self, double T) except -2
 
     cpdef double getRateCoefficient(self, double T, double P=?) except -1
+
+    cpdef numpy.ndarray getRateCoefficients(self, Tlist, double P=?)
     
     cpdef toHTML(self)
 
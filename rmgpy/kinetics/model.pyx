@@ -33,6 +33,8 @@ models.
 """
 
 import numpy
+cimport numpy
+import cython
 
 import rmgpy.quantity as quantity
 from rmgpy.molecule import Molecule
@@ -89,6 +91,25 @@ cpdef int getReactionOrderFromRateCoefficientUnits(kunits) except -1:
         raise ValueError('Invalid rate coefficient units "{0}".'.format(str(dimensionality)))
     return order
 
+cpdef numpy.ndarray evaluateRateCoefficients(list models, double T, double P=0.0):
+    """
+    Return the rate coefficients in units of m^3, mol, and s of each of the
+    kinetics `models` at the specified temperature `T` in K and pressure `P`
+    in Pa. The pressure is ignored for pressure-independent kinetics models.
+    The models are grouped by class, and each group is evaluated together by
+    the :meth:`evaluateRateCoefficients` static method of its class.
+    """
+    cdef dict groups = {}
+    cdef numpy.ndarray k
+    cdef list indices
+    cdef Py_ssize_t i
+    for i in range(len(models)):
+        groups.setdefault(type(models[i]), []).append(i)
+    k = numpy.empty(len(models), numpy.float64)
+    for cls, indices in groups.iteritems():
+        k[indices] = cls.evaluateRateCoefficients([models[i] for i in indices], T, P)
+    return k
+
 ################################################################################
 
 cdef class KineticsModel:
@@ -180,6 +201,41 @@ cdef class KineticsModel:
         """
         raise NotImplementedError('Unexpected call to KineticsModel.getRateCoefficient(); you should be using a class derived from KineticsModel.')
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef numpy.ndarray getRateCoefficients(self, Tlist, double P=0.0):
+        """
+        Return the values of the rate coefficient :math:`k(T)` in units of
+        m^3, mol, and s at the specified temperatures `Tlist` in K and
+        pressure `P` in Pa. The pressure is ignored for pressure-independent
+        kinetics models. Derived classes may overload this method with a
+        faster loop.
+        """
+        cdef double[:] T = numpy.asarray(Tlist, numpy.float64)
+        cdef double[:] k = numpy.empty(T.shape[0], numpy.float64)
+        cdef Py_ssize_t i
+        for i in range(T.shape[0]):
+            k[i] = self.getRateCoefficient(T[i], P)
+        return numpy.asarray(k)
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def evaluateRateCoefficients(list models, double T, double P=0.0):
+        """
+        Return the rate coefficients in units of m^3, mol, and s of each of
+        the `models`, all of this class, at the specified temperature `T` in
+        K and pressure `P` in Pa. Derived classes may overload this method
+        with a faster loop.
+        """
+        cdef double[:] k = numpy.empty(len(models), numpy.float64)
+        cdef KineticsModel model
+        cdef Py_ssize_t i
+        for i in range(len(models)):
+            model = models[i]
+            k[i] = model.getRateCoefficient(T, P)
+        return numpy.asarray(k)
+
     cpdef toHTML(self):
         """
         Return an HTML rendering.
@@ -0,0 +1,339 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+################################################################################
+#
+#   RMG - Reaction Mechanism Generator
+#
+#   Copyright (c) 2002-2010 Prof. William H. Green (whgreen@mit.edu) and the
+#   RMG Team (rmg_dev@mit.edu)
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a
+#   copy of this software and associated documentation files (the 'Software'),
+#   to deal in the Software without restriction, including without limitation
+#   the rights to use, copy, modify, merge, publish, distribute, sublicense,
+#   and/or sell copies of the Software, and to permit persons to whom the
+#   Software is furnished to do so, subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#   FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#   DEALINGS IN THE SOFTWARE.
+#
+################################################################################
+
+"""
+This module contains the :class:`KineticsTable` class, which packs the
+kinetics of a list of reactions into one structured NumPy array per kinetics
+type so that the rate coefficients and equilibrium constants of all reactions
+can be evaluated at a given temperature and pressure in a single vectorized
+call. Reactions whose kinetics cannot be packed are evaluated through their
+kinetics objects as usual.
+"""
+
+import numpy
+
+import rmgpy.constants as constants
+from rmgpy.kinetics.arrhenius import Arrhenius, MultiArrhenius
+from rmgpy.kinetics.chebyshev import Chebyshev
+from rmgpy.kinetics.falloff import ThirdBody, Lindemann, Troe
+
+################################################################################
+
+arrheniusDtype = numpy.dtype([
+    ('index', numpy.int64),
+    ('A', numpy.float64),
+    ('n', numpy.float64),
+    ('Ea', numpy.float64),
+    ('T0', numpy.float64),
+])
+
+# The falloff type codes used in the `falloff` column of the falloff table
+THIRDBODY, LINDEMANN, TROE = 0, 1, 2
+
+falloffDtype = numpy.dtype([
+    ('index', numpy.int64),
+    ('falloff', numpy.int8),
+    ('A0', numpy.float64),
+    ('n0', numpy.float64),
+    ('Ea0', numpy.float64),
+    ('T00', numpy.float64),
+    ('Ainf', numpy.float64),
+    ('ninf', numpy.float64),
+    ('Eainf', numpy.float64),
+    ('T0inf', numpy.float64),
+    ('alpha', numpy.float64),
+    ('T1', numpy.float64),
+    ('T2', numpy.float64),
+    ('T3', numpy.float64),
+])
+
+def getChebyshevDtype(degreeT, degreeP):
+    """
+    Return the structured array type used to store Chebyshev kinetics with
+    coefficient blocks of up to `degreeT` by `degreeP` terms.
+    """
+    return numpy.dtype([
+        ('index', numpy.int64),
+        ('Tmin', numpy.float64),
+        ('Tmax', numpy.float64),
+        ('Pmin', numpy.float64),
+        ('Pmax', numpy.float64),
+        ('coeffs', numpy.float64, (degreeT, degreeP)),
+    ])
+
+################################################################################
+
+class KineticsTable:
+    """
+    A packed, column-oriented table of the kinetics of a list of reactions.
+    The attributes are:
+
+    =================== ========================================================
+    Attribute           Description
+    =================== ========================================================
+    `reactions`         The reactions in the table, in evaluation order
+    `arrhenius`         A structured array of all Arrhenius expressions
+    `falloff`           A structured array of all third-body, Lindemann and Troe expressions
+    `chebyshev`         A structured array of all Chebyshev expressions
+    `other`             A list of (index, kinetics) pairs that could not be packed
+    `reversible`        A boolean array indicating which reactions are reversible
+    `species`           The unique reactant and product species
+    `stoichiometry`     The (reaction index, species index, coefficient) columns
+    =================== ========================================================
+
+    The table is built once from the `reactions` and reflects the kinetics at
+    that time; rebuild it if the kinetics of any reaction are modified. Use
+    :meth:`matches` to check whether a table can be reused for a list of
+    reactions. The rate coefficients and equilibrium constants from the most
+    recent evaluation are kept, so evaluating again at the same temperature
+    and pressure does not repeat the work.
+    """
+
+    def __init__(self, reactions):
+        self.reactions = list(reactions)
+        self.arrhenius = None
+        self.falloff = None
+        self.chebyshev = None
+        self.other = []
+        self.reversible = None
+        self.species = []
+        self.stoichiometry = None
+        self.deltaN = None
+        self.kinetics = []
+        self.rateCache = None
+        self.equilibriumCache = None
+        self.pack()
+
+    def __len__(self):
+        return len(self.reactions)
+
+    def matches(self, reactions):
+        """
+        Return ``True`` if the table holds exactly the given `reactions`, in
+        the same order and with the same kinetics objects as when the table
+        was packed, or ``False`` otherwise.
+        """
+        if len(reactions) != len(self.reactions):
+            return False
+        for reaction, packed, kinetics in zip(reactions, self.reactions, self.kinetics):
+            if reaction is not packed or reaction.kinetics is not kinetics:
+                return False
+        return True
+
+    def pack(self):
+        """
+        Sort the kinetics of each reaction into the appropriate structured
+        array, and build the stoichiometry used for equilibrium constants.
+        """
+        arrheniusRows = []
+        falloffRows = []
+        chebyshevList = []
+        self.other = []
+        self.kinetics = [reaction.kinetics for reaction in self.reactions]
+        self.rateCache = None
+        self.equilibriumCache = None
+
+        for index, reaction in enumerate(self.reactions):
+            kinetics = reaction.kinetics
+            if isinstance(kinetics, Arrhenius):
+                arrheniusRows.append(self.__packArrhenius(index, kinetics))
+            elif isinstance(kinetics, MultiArrhenius) and all([isinstance(arrh, Arrhenius) for arrh in kinetics.arrhenius]):
+                # Each term becomes its own row; the terms are summed when evaluated
+                for arrh in kinetics.arrhenius:
+                    arrheniusRows.append(self.__packArrhenius(index, arrh))
+            elif isinstance(kinetics, (ThirdBody, Lindemann, Troe)):
+                falloffRows.append(self.__packFalloff(index, kinetics))
+            elif isinstance(kinetics, Chebyshev):
+                chebyshevList.append((index, kinetics))
+            else:
+                self.other.append((index, kinetics))
+
+        self.arrhenius = numpy.array(arrheniusRows, dtype=arrheniusDtype)
+        self.falloff = numpy.array(falloffRows, dtype=falloffDtype)
+
+        degreeT = max([kinetics.degreeT for index, kinetics in chebyshevList] or [1])
+        degreeP = max([kinetics.degreeP for index, kinetics in chebyshevList] or [1])
+        self.chebyshev = numpy.zeros(len(chebyshevList), dtype=getChebyshevDtype(degreeT, degreeP))
+        for row, (index, kinetics) in enumerate(chebyshevList):
+            self.chebyshev['index'][row] = index
+            self.chebyshev['Tmin'][row] = kinetics.Tmin.value_si
+            self.chebyshev['Tmax'][row] = kinetics.Tmax.value_si
+            self.chebyshev['Pmin'][row] = kinetics.Pmin.value_si
+            self.chebyshev['Pmax'][row] = kinetics.Pmax.value_si
+            self.chebyshev['coeffs'][row, :kinetics.degreeT, :kinetics.degreeP] = kinetics.coeffs.value_si
+
+        self.reversible = numpy.array([reaction.reversible for reaction in self.reactions], bool)
+        self.__packStoichiometry()
+
+    def __packArrhenius(self, index, kinetics):
+        return (index, kinetics.A.value_si, kinetics.n.value_si, kinetics.Ea.value_si, kinetics.T0.value_si)
+
+    def __packFalloff(self, index, kinetics):
+        low = kinetics.arrheniusLow
+        row = [index, THIRDBODY, low.A.value_si, low.n.value_si, low.Ea.value_si, low.T0.value_si,
+               0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0]
+        if isinstance(kinetics, (Lindemann, Troe)):
+            high = kinetics.arrheniusHigh
+            row[1] = LINDEMANN
+            row[6:10] = [high.A.value_si, high.n.value_si, high.Ea.value_si, high.T0.value_si]
+        if isinstance(kinetics, Troe):
+            row[1] = TROE
+            row[10] = kinetics.alpha
+            row[11] = kinetics.T1.value_si if kinetics.T1 is not None else 0.0
+            row[12] = kinetics.T2.value_si if kinetics.T2 is not None else 0.0
+            row[13] = kinetics.T3.value_si if kinetics.T3 is not None else 0.0
+        return tuple(row)
+
+    def __packStoichiometry(self):
+        speciesIndex = {}
+        reactionIndices, speciesIndices, coefficients = [], [], []
+        self.species = []
+        self.deltaN = numpy.zeros(len(self.reactions), numpy.float64)
+        for index, reaction in enumerate(self.reactions):
+            for spec, coefficient in [(s, -1) for s in reaction.reactants] + [(s, 1) for s in reaction.products]:
+                if spec not in speciesIndex:
+                    speciesIndex[spec] = len(self.species)
+                    self.species.append(spec)
+                reactionIndices.append(index)
+                speciesIndices.append(speciesIndex[spec])
+                coefficients.append(coefficient)
+            self.deltaN[index] = len(reaction.products) - len(reaction.reactants)
+        self.stoichiometry = (numpy.array(reactionIndices, numpy.int64),
+                              numpy.array(speciesIndices, numpy.int64),
+                              numpy.array(coefficients, numpy.float64))
+
+    def getRateCoefficients(self, T, P=0.0):
+        """
+        Return the forward rate coefficients in units of m^3, mol, and s of all
+        reactions in the table at temperature `T` in K and pressure `P` in Pa.
+        The pressure can also be given as an array with one (effective)
+        pressure per reaction.
+        """
+        N = len(self.reactions)
+        P = numpy.ones(N, numpy.float64) * P
+        key = (T, P.tostring())
+        if self.rateCache is not None and self.rateCache[0] == key:
+            return self.rateCache[1].copy()
+        k = numpy.zeros(N, numpy.float64)
+
+        if self.arrhenius.shape[0] > 0:
+            arrh = self.arrhenius
+            k += numpy.bincount(arrh['index'], weights=self.__evaluateArrhenius(arrh['A'], arrh['n'], arrh['Ea'], arrh['T0'], T), minlength=N)
+
+        if self.falloff.shape[0] > 0:
+            k[self.falloff['index']] = self.__evaluateFalloff(self.falloff, T, P[self.falloff['index']])
+
+        if self.chebyshev.shape[0] > 0:
+            k[self.chebyshev['index']] = self.__evaluateChebyshev(self.chebyshev, T, P[self.chebyshev['index']])
+
+        for index, kinetics in self.other:
+            k[index] = kinetics.getRateCoefficient(T, P[index])
+
+        self.rateCache = (key, k.copy())
+        return k
+
+    def __evaluateArrhenius(self, A, n, Ea, T0, T):
+        return A * (T / T0)**n * numpy.exp(-Ea / (constants.R * T))
+
+    def __evaluateFalloff(self, table, T, P):
+        C = P / constants.R / T     # bath gas concentration in mol/m^3
+        k0 = self.__evaluateArrhenius(table['A0'], table['n0'], table['Ea0'], table['T00'], T)
+        k = k0 * C
+
+        falloff = table['falloff'] != THIRDBODY
+        if numpy.any(falloff):
+            kinf = self.__evaluateArrhenius(table['Ainf'][falloff], table['ninf'][falloff], table['Eainf'][falloff], table['T0inf'][falloff], T)
+            Pr = k[falloff] / kinf
+            F = numpy.ones_like(Pr)
+
+            troe = (table['falloff'][falloff] == TROE) & ((table['T1'][falloff] != 0) | (table['T3'][falloff] != 0))
+            if numpy.any(troe):
+                alpha = table['alpha'][falloff][troe]
+                T1 = table['T1'][falloff][troe]
+                T2 = table['T2'][falloff][troe]
+                T3 = table['T3'][falloff][troe]
+                with numpy.errstate(divide='ignore', over='ignore'):
+                    Fcent = (1 - alpha) * numpy.exp(-T / T3) + alpha * numpy.exp(-T / T1)
+                    Fcent += numpy.where(T2 != 0, numpy.exp(-T2 / T), 0.0)
+                logFcent = numpy.log10(Fcent)
+                logPr = numpy.log10(Pr[troe])
+                d = 0.14
+                n = 0.75 - 1.27 * logFcent
+                c = -0.4 - 0.67 * logFcent
+                F[troe] = 10.0**(logFcent / (1 + ((logPr + c) / (n - d * logPr))**2))
+
+            k[falloff] = kinf * (Pr / (1 + Pr)) * F
+
+        return k
+
+    def __evaluateChebyshev(self, table, T, P):
+        if numpy.any(P == 0):
+            raise ValueError('No pressure specified to pressure-dependent Chebyshev kinetics.')
+        Tmin = table['Tmin']; Tmax = table['Tmax']
+        Pmin = table['Pmin']; Pmax = table['Pmax']
+        Tred = (2.0/T - 1.0/Tmin - 1.0/Tmax) / (1.0/Tmax - 1.0/Tmin)
+        Pred = (2.0*numpy.log10(P) - numpy.log10(Pmin) - numpy.log10(Pmax)) / (numpy.log10(Pmax) - numpy.log10(Pmin))
+        coeffs = table['coeffs']
+        phiT = self.__chebyshevPolynomials(Tred, coeffs.shape[1])
+        phiP = self.__chebyshevPolynomials(Pred, coeffs.shape[2])
+        return 10.0**numpy.einsum('rtp,rt,rp->r', coeffs, phiT, phiP)
+
+    def __chebyshevPolynomials(self, x, degree):
+        """
+        Return the values of the Chebyshev polynomials of order 0 to
+        `degree` - 1 at each value of `x`, as a len(x) by `degree` array.
+        """
+        phi = numpy.ones((x.shape[0], degree), numpy.float64)
+        if degree > 1:
+            phi[:,1] = x
+        for i in range(2, degree):
+            phi[:,i] = 2 * x * phi[:,i-1] - phi[:,i-2]
+        return phi
+
+    def getEquilibriumConstants(self, T):
+        """
+        Return the equilibrium constants :math:`K_c` of all reactions in the
+        table at temperature `T` in K. The free energy of each species is
+        evaluated only once, regardless of the number of reactions it
+        participates in.
+        """
+        if self.equilibriumCache is not None and self.equilibriumCache[0] == T:
+            return self.equilibriumCache[1].copy()
+        reactionIndices, speciesIndices, coefficients = self.stoichiometry
+        G = numpy.array([spec.getFreeEnergy(T) for spec in self.species], numpy.float64)
+        dGrxn = numpy.bincount(reactionIndices, weights=coefficients * G[speciesIndices], minlength=len(self.reactions))
+        P0 = 1e5
+        C0 = P0 / constants.R / T
+        K = numpy.exp(-dGrxn / constants.R / T) * C0 ** self.deltaN
+        for index in numpy.flatnonzero((K == 0) & self.reversible):
+            # Let the reaction raise the appropriate error
+            K[index] = self.reactions[index].getEquilibriumConstant(T)
+        self.equilibriumCache = (T, K.copy())
+        return K
@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+################################################################################
+#
+#   RMG - Reaction Mechanism Generator
+#
+#   Copyright (c) 2002-2010 Prof. William H. Green (whgreen@mit.edu) and the
+#   RMG Team (rmg_dev@mit.edu)
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a
+#   copy of this software and associated documentation files (the 'Software'),
+#   to deal in the Software without restriction, including without limitation
+#   the rights to use, copy, modify, merge, publish, distribute, sublicense,
+#   and/or sell copies of the Software, and to permit persons to whom the
+#   Software is furnished to do so, subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#   FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#   DEALINGS IN THE SOFTWARE.
+#
+################################################################################
+
+"""
+This script contains unit tests of the :mod:`rmgpy.kinetics.table` module.
+"""
+
+import unittest
+import numpy
+
+from rmgpy.kinetics.arrhenius import Arrhenius, MultiArrhenius, PDepArrhenius
+from rmgpy.kinetics.chebyshev import Chebyshev
+from rmgpy.kinetics.falloff import ThirdBody, Lindemann, Troe
+from rmgpy.kinetics.table import KineticsTable
+from rmgpy.reaction import Reaction
+from rmgpy.species import Species
+from rmgpy.thermo import ThermoData
+
+################################################################################
+
+class TestKineticsTable(unittest.TestCase):
+    """
+    Contains unit tests of the KineticsTable class.
+    """
+
+    def setUp(self):
+        """
+        A function run before each unit test in this class.
+        """
+        Tdata = ([300,400,500,600,800,1000,1500], "K")
+        A = Species(label='A', thermo=ThermoData(Tdata=Tdata, Cpdata=([3.0,3.5,4.0,4.5,5.0,5.5,6.0],"cal/(mol*K)"), H298=(-10.0,"kcal/mol"), S298=(50.0,"cal/(mol*K)")))
+        B = Species(label='B', thermo=ThermoData(Tdata=Tdata, Cpdata=([4.0,4.5,5.0,5.5,6.0,6.5,7.0],"cal/(mol*K)"), H298=(5.0,"kcal/mol"), S298=(40.0,"cal/(mol*K)")))
+        C = Species(label='C', thermo=ThermoData(Tdata=Tdata, Cpdata=([6.0,7.0,8.0,9.0,10.0,11.0,12.0],"cal/(mol*K)"), H298=(-20.0,"kcal/mol"), S298=(70.0,"cal/(mol*K)")))
+
+        arrhenius = Arrhenius(A=(1.0e6,"m^3/(mol*s)"), n=0.5, Ea=(10.0,"kJ/mol"), T0=(1,"K"))
+        arrheniusLow = Arrhenius(A=(2.62e33,"cm^6/(mol^2*s)"), n=-4.76, Ea=(10.21,"kJ/mol"), T0=(1,"K"))
+        arrheniusHigh = Arrhenius(A=(1.39e16,"cm^3/(mol*s)"), n=-0.534, Ea=(2.243,"kJ/mol"), T0=(1,"K"))
+
+        kineticsList = [
+            arrhenius,
+            MultiArrhenius(arrhenius=[arrhenius, Arrhenius(A=(2.0e5,"m^3/(mol*s)"), n=1.0, Ea=(20.0,"kJ/mol"), T0=(1,"K"))]),
+            ThirdBody(arrheniusLow=arrheniusLow),
+            Lindemann(arrheniusHigh=arrheniusHigh, arrheniusLow=arrheniusLow),
+            Troe(arrheniusHigh=arrheniusHigh, arrheniusLow=arrheniusLow, alpha=0.783, T3=(74,"K"), T1=(2941,"K"), T2=(6964,"K")),
+            Chebyshev(
+                coeffs = [[11.67723, 0.729281, -0.11984, 0.00882175],
+                          [-1.02669, 0.853639, -0.0323485, -0.027367],
+                          [-0.447011, 0.244144, 0.0559122, -0.0101723],
+                          [-0.128261, 0.0111596, 0.0281176, 0.00604353],
+                          [-0.0117034, -0.0235646, 0.00061009, 0.00401309],
+                          [0.0155433, -0.0136846, -0.00463048, -0.000261353]],
+                kunits = 'cm^3/(mol*s)', Tmin=(300,"K"), Tmax=(2000,"K"), Pmin=(0.01,"bar"), Pmax=(100,"bar"),
+            ),
+            PDepArrhenius(
+                pressures = ([0.1, 10.0], "bar"),
+                arrhenius = [
+                    Arrhenius(A=(1.4e-9,"m^3/(mol*s)"), n=0.0, Ea=(11.2,"kJ/mol"), T0=(1,"K")),
+                    Arrhenius(A=(1.4e-8,"m^3/(mol*s)"), n=0.0, Ea=(11.2,"kJ/mol"), T0=(1,"K")),
+                ],
+            ),
+        ]
+        self.reactions = [Reaction(reactants=[A, B], products=[C], kinetics=kinetics) for kinetics in kineticsList]
+        self.reactions[1].reversible = False
+        self.table = KineticsTable(self.reactions)
+
+    def test_pack(self):
+        """
+        Test that the kinetics are sorted into the appropriate tables.
+        """
+        self.assertEqual(len(self.table), len(self.reactions))
+        self.assertEqual(self.table.arrhenius.shape[0], 3)
+        self.assertEqual(self.table.falloff.shape[0], 3)
+        self.assertEqual(self.table.chebyshev.shape[0], 1)
+        self.assertEqual(len(self.table.other), 1)
+        self.assertEqual(len(self.table.species), 3)
+        self.assertEqual(list(self.table.reversible), [True, False, True, True, True, True, True])
+
+    def test_getRateCoefficients(self):
+        """
+        Test that the vectorized rate coefficients match those of the
+        individual reactions.
+        """
+        for T in [300, 800, 1500]:
+            for P in [1e4, 1e5, 1e6]:
+                klist = self.table.getRateCoefficients(T, P)
+                for reaction, k in zip(self.reactions, klist):
+                    kexp = reaction.getRateCoefficient(T, P)
+                    self.assertAlmostEqual(k / kexp, 1.0, 8)
+
+    def test_getRateCoefficientsEffectivePressure(self):
+        """
+        Test that a separate pressure can be given for each reaction.
+        """
+        Plist = numpy.linspace(1e4, 1e6, len(self.reactions))
+        klist = self.table.getRateCoefficients(1000., Plist)
+        for reaction, P, k in zip(self.reactions, Plist, klist):
+            kexp = reaction.getRateCoefficient(1000., P)
+            self.assertAlmostEqual(k / kexp, 1.0, 8)
+
+    def test_getEquilibriumConstants(self):
+        """
+        Test that the vectorized equilibrium constants match those of the
+        individual reactions.
+        """
+        for T in [300, 800, 1500]:
+            Klist = self.table.getEquilibriumConstants(T)
+            for reaction, K in zip(self.reactions, Klist):
+                Kexp = reaction.getEquilibriumConstant(T)
+                self.assertAlmostEqual(K / Kexp, 1.0, 8)
+
+    def test_matches(self):
+        """
+        Test that a table matches only the reactions and kinetics it was
+        packed from.
+        """
+        self.assertTrue(self.table.matches(list(self.reactions)))
+        self.assertFalse(self.table.matches(self.reactions[:-1]))
+        self.assertFalse(self.table.matches(self.reactions[::-1]))
+        kinetics = self.reactions[0].kinetics
+        self.reactions[0].kinetics = Arrhenius(A=(1.0e6,"m^3/(mol*s)"), n=0.0, Ea=(0.0,"kJ/mol"), T0=(1,"K"))
+        self.assertFalse(self.table.matches(self.reactions))
+        self.reactions[0].kinetics = kinetics
+        self.assertTrue(self.table.matches(self.reactions))
+
+    def test_evaluationCache(self):
+        """
+        Test that evaluating again at the same conditions returns the same
+        values, and that the returned arrays can be modified freely.
+        """
+        klist1 = self.table.getRateCoefficients(1000., 1e5)
+        Klist1 = self.table.getEquilibriumConstants(1000.)
+        expected = klist1.copy(), Klist1.copy()
+        klist1[:] = 0.0
+        Klist1[:] = 0.0
+        klist2 = self.table.getRateCoefficients(1000., 1e5)
+        Klist2 = self.table.getEquilibriumConstants(1000.)
+        self.assertTrue(numpy.all(klist2 == expected[0]))
+        self.assertTrue(numpy.all(Klist2 == expected[1]))
+        klist3 = self.table.getRateCoefficients(1000., 1e6)
+        for reaction, k in zip(self.reactions, klist3):
+            self.assertAlmostEqual(k / reaction.getRateCoefficient(1000., 1e6), 1.0, 8)
+
+################################################################################
+
+if __name__ == '__main__':
+    unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
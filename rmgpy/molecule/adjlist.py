@@ -416,10 +416,35 @@ re_OldAdjList = re.compile('^\s*(\d*)\s+' +  # atom number digit
                           '(?P<bonds>(\s+\{\d+\,(?:[SDTB]|\{.+?\})\},?)*)' +  # bonds, eg {2,S} {4,{S,D}}
                           '\s*$')  # the end!
 
-def fromAdjacencyList(adjlist, group=False, saturateH=False):
+re_GroupMultiplicity = re.compile('\s*multiplicity\s+\[\s*(\d(?:,\s*\d)*)\s*\]\s*$')
+re_GroupMultiplicityWildcard = re.compile('\s*multiplicity\s+x\s*$')
+re_Multiplicity = re.compile('\s*multiplicity\s+\d+\s*$')
+re_SpaceInBraces = re.compile('\{[^}]*\s+[^}]*\}')
+
+# A complete line of a molecule adjacency list in the usual form written by
+# toAdjacencyList(), and a single bond in the bond list of such a line
+re_MoleculeAtom = re.compile('\s*(\d+)\.?\s+' +  # atom number
+                             '(?:(\*\d*)\s+)?' +  # optional label eg * or *2
+                             '([A-Z][a-z]?)\s+' +  # element
+                             'u([0-4])\s+p([0-4])\s+c(0|[-+][1-4])' +  # unpaired electrons, lone pairs, and charge
+                             '(?:\s+i(\d+))?' +  # optional isotope
+                             '((?:\s+\{\d+,[SDTB]\},?)*)\s*$')  # bonds, eg {2,S} {4,D}
+re_MoleculeBond = re.compile('\{(\d+),([SDTB])\}')
+
+# The values of the unpaired electron, lone pair, and charge fields of an atom
+_unpairedElectrons = {'0': 0, '1': 1, '2': 2, '3': 3, '4': 4}
+_lonePairs = {'0': 0, '1': 1, '2': 2, '3': 3, '4': 4}
+_partialCharges = {'0': 0, '+1': 1, '+2': 2, '+3': 3, '+4': 4, '-1': -1, '-2': -2, '-3': -3, '-4': -4}
+
+def fromAdjacencyList(adjlist, group=False, saturateH=False, check=True):
     """
     Convert a string adjacency list `adjlist` into a set of :class:`Atom` and
     :class:`Bond` objects.
+    
+    The adjacency list is read in a single pass over its lines, and the atoms
+    and bonds are created directly. If `check` is ``False``, the adjacency
+    list is trusted to be valid, and the bond symmetry, valence, and
+    multiplicity checks are skipped.
     """
     atoms = []
     atomdict = {}
@@ -436,10 +461,13 @@ def fromAdjacencyList(adjlist, group=False, saturateH=False):
     while not lastLine:  # Remove any empty lines from the end
         lines.pop()
         lastLine = lines[-1].strip()
-    if re_IntermediateAdjList.match(lastLine):
+    if re_MoleculeAtom.match(lastLine):
+        # This is clearly a new-style adjacency list
+        pass
+    elif re_IntermediateAdjList.match(lastLine):
         logging.debug("adjacency list:\n{1}\nline '{0}' looks like an intermediate style adjacency list".format(lastLine, adjlist))
         return fromOldAdjacencyList(adjlist, group=group, saturateH=saturateH)
-    if re_OldAdjList.match(lastLine):
+    elif re_OldAdjList.match(lastLine):
         logging.debug("Adjacency list:\n{1}\nline '{0}' looks like an old style adjacency list".format(lastLine, adjlist))
         if not group:
             logging.debug("Will assume implicit H atoms")
@@ -455,9 +483,9 @@ def fromAdjacencyList(adjlist, group=False, saturateH=False):
     if lines[0].split()[0] == 'multiplicity':
         line = lines.pop(0)
         if group:
-            match = re.match('\s*multiplicity\s+\[\s*(\d(?:,\s*\d)*)\s*\]\s*$', line)
+            match = re_GroupMultiplicity.match(line)
             if not match:
-                rematch = re.match('\s*multiplicity\s+x\s*$', line)
+                rematch = re_GroupMultiplicityWildcard.match(line)
                 assert rematch, "Invalid multiplicity line '{0}'. Should be a list like 'multiplicity [1,2,3]' or a wildcard 'multiplicity x'".format(line)
             else:
             # should match "multiplicity [1]" or " multiplicity   [ 1, 2, 3 ]" or " multiplicity [1,2,3]"
@@ -468,26 +496,46 @@ def fromAdjacencyList(adjlist, group=False, saturateH=False):
                 multiplicities = match.group(1).split(',')
                 multiplicity = [int(i) for i in multiplicities]
         else:
-            match = re.match('\s*multiplicity\s+\d+\s*$', line)
+            match = re_Multiplicity.match(line)
             assert match, "Invalid multiplicity line '{0}'. Should be an integer like 'multiplicity 2'".format(line)
             multiplicity = int(line.split()[1])
         if len(lines) == 0:
             raise InvalidAdjacencyListError('No atoms specified in adjacency list: \n{0}'.format(adjlist))
     
-    mistake1 = re.compile('\{[^}]*\s+[^}]*\}')
     # Iterate over the remaining lines, generating Atom or GroupAtom objects
     for line in lines:
 
+        if not group:
+            # Read atom lines in the usual form in one step
+            match = re_MoleculeAtom.match(line)
+            if match:
+                aid, label, symbol, unpairedElectrons, lonePairs, charge, isotope, bondList = match.groups()
+                aid = int(aid)
+                atom = Atom(symbol, int(unpairedElectrons), int(charge), label or '', int(lonePairs))
+                if isotope is not None:
+                    atom.element = getElement(atom.number, int(isotope))
+                atoms.append(atom)
+                atomdict[aid] = atom
+                bonds[aid] = atomBonds = {}
+                for aid2, order in re_MoleculeBond.findall(bondList):
+                    aid2 = int(aid2)
+                    if aid == aid2:
+                        raise InvalidAdjacencyListError('Error in adjacency list:\n{1}\nAttempted to create a bond between atom {0:d} and itself.'.format(aid, adjlist))
+                    atomBonds[aid2] = [order]
+                continue
+
         # Sometimes people put spaces after commas, which messes up the
         # parse-by-whitespace. Examples include '[Cd, Ct]'.
-        if mistake1.search(line):
+        match = re_SpaceInBraces.search(line)
+        if match:
             raise InvalidAdjacencyListError(
-                "{1} Shouldn't have spaces inside braces:\n{0}".format(mistake1.search(line).group(), adjlist)
+                "{1} Shouldn't have spaces inside braces:\n{0}".format(match.group(), adjlist)
                 )
 
         # Sometimes commas are used to delimit bonds in the bond list,
         # so replace them just in case
-        line = line.replace('},{', '} {')
+        if '},{' in line:
+            line = line.replace('},{', '} {')
         
         data = line.split()
 
@@ -525,16 +573,8 @@ def fromAdjacencyList(adjlist, group=False, saturateH=False):
             else:
                 uState = [uState[1]]
             for u in uState:
-                if u == '0':
-                    unpairedElectrons.append(0)
-                elif u == '1':
-                    unpairedElectrons.append(1)
-                elif u == '2':
-                    unpairedElectrons.append(2)
-                elif u == '3':
-                    unpairedElectrons.append(3)
-                elif u == '4':
-                    unpairedElectrons.append(4)
+                if u in _unpairedElectrons:
+                    unpairedElectrons.append(_unpairedElectrons[u])
                 elif u == 'x':
                     if not group:
                         raise InvalidAdjacencyListError("Error on:\n{0}\nA molecule should not assign a wildcard to number of unpaired electrons.".format(adjlist))
@@ -546,87 +586,49 @@ def fromAdjacencyList(adjlist, group=False, saturateH=False):
         
         # Next the number of lone electron pairs (if provided)
         lonePairs = []
-        if len(data) > index:
+        if len(data) > index and data[index][0] == 'p':
             lpState = data[index]
-            if lpState[0] == 'p':
-                if lpState[1] == '[':
-                    lpState = lpState[2:-1].split(',')
-                else:
-                    lpState = [lpState[1]]
-                for l in lpState:
-                    if l == '0':
-                        lonePairs.append(0)
-                    elif l == '1':
-                        lonePairs.append(1)
-                    elif l == '2':
-                        lonePairs.append(2)
-                    elif l == '3':
-                        lonePairs.append(3)
-                    elif l == '4':
-                        lonePairs.append(4)
-                    elif l == 'x':
-                        if not group:
-                            raise InvalidAdjacencyListError("Error in adjacency list:\n{0}\nA molecule should not have a wildcard assigned to number of lone pairs.".format(adjlist))
-                    else:
-                        raise InvalidAdjacencyListError('Error in adjacency list:\n{0}\nNumber of lone electron pairs not recognized.'.format(adjlist))
-                index += 1
+            if lpState[1] == '[':
+                lpState = lpState[2:-1].split(',')
             else:
-                if not group:
-                    lonePairs.append(0)
-        else:
-            if not group:
-                lonePairs.append(0)
+                lpState = [lpState[1]]
+            for l in lpState:
+                if l in _lonePairs:
+                    lonePairs.append(_lonePairs[l])
+                elif l == 'x':
+                    if not group:
+                        raise InvalidAdjacencyListError("Error in adjacency list:\n{0}\nA molecule should not have a wildcard assigned to number of lone pairs.".format(adjlist))
+                else:
+                    raise InvalidAdjacencyListError('Error in adjacency list:\n{0}\nNumber of lone electron pairs not recognized.'.format(adjlist))
+            index += 1
+        elif not group:
+            lonePairs.append(0)
             
         # Next the number of partial charges (if provided)
         partialCharges = []
-        if len(data) > index:
+        if len(data) > index and data[index][0] == 'c':
             eState = data[index]
-            if eState[0] == 'c':
-                if eState[1] == '[':
-                    eState = eState[2:-1].split(',')
-                else:
-                    eState = [eState[1:]]
-                for e in eState:
-                    if e == '0':
-                        partialCharges.append(0)
-                    elif e == '+1':
-                        partialCharges.append(1)
-                    elif e == '+2':
-                        partialCharges.append(2)
-                    elif e == '+3':
-                        partialCharges.append(3)
-                    elif e == '+4':
-                        partialCharges.append(4)
-                    elif e == '-1':
-                        partialCharges.append(-1)
-                    elif e == '-2':
-                        partialCharges.append(-2)
-                    elif e == '-3':
-                        partialCharges.append(-3)
-                    elif e == '-4':
-                        partialCharges.append(-4)
-                    elif e == 'x':
-                        if not group:
-                            raise InvalidAdjacencyListError("Error on adjacency list:\n{0}\nA molecule should not have a wildcard assigned to number of charges.".format(adjlist))
-                    else:
-                        raise InvalidAdjacencyListError('Error on adjacency list:\n{0}\nNumber of partial charges not recognized.'.format(adjlist))
-                index += 1
+            if eState[1] == '[':
+                eState = eState[2:-1].split(',')
             else:
-                if not group:
-                    partialCharges.append(0)
-        else:
-            if not group:
-                partialCharges.append(0)
-        
+                eState = [eState[1:]]
+            for e in eState:
+                if e in _partialCharges:
+                    partialCharges.append(_partialCharges[e])
+                elif e == 'x':
+                    if not group:
+                        raise InvalidAdjacencyListError("Error on adjacency list:\n{0}\nA molecule should not have a wildcard assigned to number of charges.".format(adjlist))
+                else:
+                    raise InvalidAdjacencyListError('Error on adjacency list:\n{0}\nNumber of partial charges not recognized.'.format(adjlist))
+            index += 1
+        elif not group:
+            partialCharges.append(0)
 
         # Next the isotope (if provided)
         isotope = -1
-        if len(data) > index:
-            iState = data[index]
-            if iState[0] == 'i':
-                isotope = int(iState[1:])
-                index += 1
-
+        if len(data) > index and data[index][0] == 'i':
+            isotope = int(data[index][1:])
+            index += 1
 
         # Create a new atom based on the above information
         if group:
@@ -641,7 +643,7 @@ def fromAdjacencyList(adjlist, group=False, saturateH=False):
         atomdict[aid] = atom
         
         # Process list of bonds
-        bonds[aid] = {}
+        bonds[aid] = atomBonds = {}
         for datum in data[index:]:
 
             # Sometimes commas are used to delimit bonds in the bond list,
@@ -658,29 +660,25 @@ def fromAdjacencyList(adjlist, group=False, saturateH=False):
             else:
                 order = [order]
 
-            bonds[aid][aid2] = order
+            atomBonds[aid2] = order
 
     # Check consistency using bonddict
-    for atom1 in bonds:
-        for atom2 in bonds[atom1]:
-            if atom2 not in bonds:
-                raise InvalidAdjacencyListError('Error in adjacency list:\n{1}\nAtom {0:d} not in bond dictionary.'.format(atom2, adjlist))
-            elif atom1 not in bonds[atom2]:
-                raise InvalidAdjacencyListError('Error in adjacency list:\n{2}\nFound bond between {0:d} and {1:d}, but not the reverse.'.format(atom1, atom2, adjlist))
-            elif bonds[atom1][atom2] != bonds[atom2][atom1]:
-                raise InvalidAdjacencyListError('Error in adjacency list:\n{4}\nFound bonds between {0:d} and {1:d}, but of different orders "{2}" and "{3}".'.format(atom1, atom2, bonds[atom1][atom2], bonds[atom2][atom1], adjlist))
+    if check:
+        for atom1 in bonds:
+            for atom2 in bonds[atom1]:
+                if atom2 not in bonds:
+                    raise InvalidAdjacencyListError('Error in adjacency list:\n{1}\nAtom {0:d} not in bond dictionary.'.format(atom2, adjlist))
+                elif atom1 not in bonds[atom2]:
+                    raise InvalidAdjacencyListError('Error in adjacency list:\n{2}\nFound bond between {0:d} and {1:d}, but not the reverse.'.format(atom1, atom2, adjlist))
+                elif bonds[atom1][atom2] != bonds[atom2][atom1]:
+                    raise InvalidAdjacencyListError('Error in adjacency list:\n{4}\nFound bonds between {0:d} and {1:d}, but of different orders "{2}" and "{3}".'.format(atom1, atom2, bonds[atom1][atom2], bonds[atom2][atom1], adjlist))
 
     # Convert bonddict to use Atom[group] and Bond[group] objects
-    atomkeys = atomdict.keys()
-    atomkeys.sort()
-    for aid1 in atomkeys:
-        atomkeys2 = bonds[aid1].keys()
-        atomkeys2.sort()
-        for aid2 in atomkeys2:
+    for aid1, atomBonds in bonds.iteritems():
+        atom1 = atomdict[aid1]
+        for aid2, order in atomBonds.iteritems():
             if aid1 < aid2:
-                atom1 = atomdict[aid1]
                 atom2 = atomdict[aid2]
-                order = bonds[aid1][aid2]
                 if group:
                     bond = GroupBond(atom1, atom2, order)
                 elif len(order) == 1:
@@ -698,21 +696,45 @@ def fromAdjacencyList(adjlist, group=False, saturateH=False):
     
     # Consistency checks
     if not group:
-        # Molecule consistency check
-        # Electron and valency consistency check for each atom
-        for atom in atoms: ConsistencyChecker.check_partial_charge(atom)
-
         nRad = sum([atom.radicalElectrons for atom in atoms])
-        absolute_spin_per_electron = 1/2.
-        if multiplicity == None: multiplicity = 2* (nRad * absolute_spin_per_electron) + 1
-            
-        ConsistencyChecker.check_multiplicity(nRad, multiplicity)
-        for atom in atoms: ConsistencyChecker.check_hund_rule(atom, multiplicity)
+        if multiplicity == None: multiplicity = nRad + 1
+
+        if check:
+            # Molecule consistency check
+            # Electron and valency consistency check for each atom
+            for atom in atoms: ConsistencyChecker.check_partial_charge(atom)
+            ConsistencyChecker.check_multiplicity(nRad, multiplicity)
+            for atom in atoms: ConsistencyChecker.check_hund_rule(atom, multiplicity)
         return atoms, multiplicity
     else:
         # Currently no group consistency check
         return atoms, multiplicity
 
+def splitAdjacencyLists(text):
+    """
+    Split a string `text` containing any number of adjacency lists separated
+    by blank lines into a list of the individual adjacency list strings.
+    Comments beginning with ``//`` are removed, as is anything after the
+    label on a label line containing an InChI.
+    """
+    adjlists = []
+    lines = []
+    for line in text.splitlines():
+        if line.strip() == '':
+            if lines:
+                adjlists.append('\n'.join(lines) + '\n')
+                lines = []
+            continue
+        if '//' in line:
+            line = line[:line.index('//')]
+            if line.strip() == '': continue
+        if 'InChI' in line:
+            line = line.split()[0]
+        lines.append(line)
+    if lines:
+        adjlists.append('\n'.join(lines) + '\n')
+    return adjlists
+
 
 def toAdjacencyList(atoms, multiplicity, label=None, group=False, removeH=False, removeLonePairs=False, oldStyle=False):
     """
@@ -814,6 +836,7 @@ def toAdjacencyList(atoms, multiplicity, label=None, group=False, removeH=False,
     #atomChargeWidth = max([len(s) for s in atomCharge.values()])
     
     # Assemble the adjacency list
+    atomIndices = dict([(atom, index) for index, atom in enumerate(atoms)])
     for atom in atoms:
         if atom not in atomNumbers: continue
 
@@ -838,7 +861,7 @@ def toAdjacencyList(atoms, multiplicity, label=None, group=False, removeH=False,
         # Bonds list
         atoms2 = atom.bonds.keys()
         # sort them the same way as the atoms
-        atoms2.sort(key=atoms.index)
+        atoms2.sort(key=atomIndices.__getitem__)
 
         for atom2 in atoms2:
             if atom2 not in atomNumbers: continue
@@ -952,6 +975,7 @@ def toOldAdjacencyList(atoms, multiplicity=None, label=None, group=False, remove
     atomElectronStateWidth = max([len(s) for s in atomElectronStates.values()])
     
     # Assemble the adjacency list
+    atomIndices = dict([(atom, index) for index, atom in enumerate(atoms)])
     for atom in atoms:
         if atom not in atomNumbers: continue
 
@@ -967,7 +991,7 @@ def toOldAdjacencyList(atoms, multiplicity=None, label=None, group=False, remove
         # Bonds list
         atoms2 = atom.bonds.keys()
         # sort them the same way as the atoms
-        atoms2.sort(key=atoms.index)
+        atoms2.sort(key=atomIndices.__getitem__)
 
         for atom2 in atoms2:
             if atom2 not in atomNumbers: continue
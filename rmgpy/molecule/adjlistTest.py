@@ -3,7 +3,7 @@
 
 import unittest
 from external.wip import work_in_progress
-from rmgpy.molecule.adjlist import InvalidAdjacencyListError
+from rmgpy.molecule.adjlist import InvalidAdjacencyListError, splitAdjacencyLists
 from rmgpy.molecule.molecule import Molecule
 from rmgpy.molecule.group import Group
 import logging
@@ -726,6 +726,52 @@ class TestMoleculeAdjLists(unittest.TestCase):
 5 C 1 {4,S} {6,S}
 6 C 0 {5,S}"""
         self.assertEqual(molecule2.toAdjacencyList(removeH=True,oldStyle=True).strip(),string.strip())
+
+    def testAdjacencyListWithoutCheck(self):
+        """
+        adjlist: Check that trusted adjacency lists can be read without the consistency checks.
+        """
+        molecule1 = Molecule().fromSMILES('OC=C[CH]C')
+        adjlist = molecule1.toAdjacencyList()
+        molecule2 = Molecule().fromAdjacencyList(adjlist, check=False)
+        self.assertTrue(molecule1.isIsomorphic(molecule2))
+        self.assertEqual(molecule2.multiplicity, 2)
+        self.assertEqual(molecule2.toAdjacencyList(), adjlist)
+        # An inconsistent multiplicity is only caught when checking
+        adjlist = """
+        multiplicity 3
+        1 C u1 p0 c0 {2,S} {3,S} {4,S}
+        2 H u0 p0 c0 {1,S}
+        3 H u0 p0 c0 {1,S}
+        4 H u0 p0 c0 {1,S}
+        """
+        self.assertRaises(InvalidAdjacencyListError, Molecule().fromAdjacencyList, adjlist)
+        self.assertEqual(Molecule().fromAdjacencyList(adjlist, check=False).multiplicity, 3)
+
+    def testSplitAdjacencyLists(self):
+        """
+        adjlist: Check that a species dictionary is split into its adjacency lists.
+        """
+        text = """
+CH3
+multiplicity 2
+1 C u1 p0 c0 {2,S} {3,S} {4,S}
+// a comment line
+2 H u0 p0 c0 {1,S}
+3 H u0 p0 c0 {1,S}
+4 H u0 p0 c0 {1,S} // a trailing comment
+
+
+H2O   InChI=1S/H2O/h1H2
+1 O u0 p2 c0 {2,S} {3,S}
+2 H u0 p0 c0 {1,S}
+3 H u0 p0 c0 {1,S}
+"""
+        adjlists = splitAdjacencyLists(text)
+        self.assertEqual(len(adjlists), 2)
+        self.assertEqual(adjlists[1].splitlines()[0], 'H2O')
+        self.assertTrue(Molecule().fromAdjacencyList(adjlists[0]).isIsomorphic(Molecule().fromSMILES('[CH3]')))
+        self.assertTrue(Molecule().fromAdjacencyList(adjlists[1]).isIsomorphic(Molecule().fromSMILES('O')))
 ################################################################################
 class TestConsistencyChecker(unittest.TestCase):
     def test_check_hund_rule_fail(self):
@@ -57,3 +57,5 @@ cdef class AtomType:
 cpdef list getFeatures(atom, dict bonds)
 
 cpdef AtomType getAtomType(atom, dict bonds)
+
+cpdef list getAtomTypes(list atoms)
@@ -465,13 +465,23 @@ def getFeatures(atom, bonds):
 
     return features
 
+# The atom types found so far for each combination of element and features,
+# keyed by the element symbol followed by the features from getFeatures()
+# except for the total number of double bonds, which is implied by the others
+atomTypeTable = {}
+
 def getAtomType(atom, bonds):
     """
     Determine the appropriate atom type for an :class:`Atom` object `atom`
     with local bond structure `bonds`, a ``dict`` containing atom-bond pairs.
+
+    The atom type only depends on the element and the features returned by
+    :meth:`getFeatures()`, so the result is looked up in ``atomTypeTable``.
+    Each combination missing from the table is found by matching against the
+    specific atom types of the element, and is then added to the table.
     """
 
-    cython.declare(atomSymbol=str)
+    cython.declare(atomSymbol=str, key=tuple)
     cython.declare(molFeatureList=cython.list, atomTypeFeatureList=cython.list)
 
     # Use element and counts to determine proper atom type
@@ -481,6 +491,13 @@ def getAtomType(atom, bonds):
         return atomTypes[atomSymbol]
 
     molFeatureList = getFeatures(atom, bonds)
+    key = (atomSymbol, molFeatureList[0], molFeatureList[2], molFeatureList[3], molFeatureList[4],
+           molFeatureList[5], molFeatureList[6], molFeatureList[7])
+    try:
+        return atomTypeTable[key]
+    except KeyError:
+        pass
+
     for specificAtomType in atomTypes[atomSymbol].specific:
         atomtypeFeatureList = specificAtomType.getFeatures()
         for molFeature, atomtypeFeature in zip(molFeatureList, atomtypeFeatureList):
@@ -488,7 +505,9 @@ def getAtomType(atom, bonds):
                 continue
             elif molFeature not in atomtypeFeature:
                 break
-        else: return specificAtomType
+        else:
+            atomTypeTable[key] = specificAtomType
+            return specificAtomType
     else:
         rDouble = molFeatureList[2]
         oDouble = molFeatureList[3]
@@ -498,3 +517,11 @@ def getAtomType(atom, bonds):
 
         raise AtomTypeError('Unable to determine atom type for atom {0}, which has {1:d} double bonds to C, {2:d} double bonds to O, {3:d} double bonds to S, {4:d} triple bonds, and {5:d} benzene bonds.'.format(atom, rDouble, oDouble, sDouble, triple, benzene))
 
+def getAtomTypes(atoms):
+    """
+    Return a list of the appropriate atom types for each of the :class:`Atom`
+    objects in `atoms`, using the bonds stored on each atom. An
+    :class:`AtomTypeError` is raised if any of the atom types cannot be
+    determined.
+    """
+    return [getAtomType(atom, atom.edges) for atom in atoms]
@@ -269,6 +269,18 @@ class TestGetAtomType(unittest.TestCase):
         self.assertEqual(self.atomType(self.mol7, 0), 'He')
         self.assertEqual(self.atomType(self.mol8, 0), 'Ne')
 
+    def testGetAtomTypes(self):
+        """
+        Test that getAtomTypes() returns the same types as getAtomType() for
+        each atom, both before and after the atom types are added to the table.
+        """
+        for mol in [self.mol1, self.mol2, self.mol4, self.mol21]:
+            atomtype.atomTypeTable.clear()
+            types = atomtype.getAtomTypes(mol.atoms)
+            self.assertEqual(types, [getAtomType(atom, atom.edges) for atom in mol.atoms])
+            self.assertEqual(types, atomtype.getAtomTypes(mol.atoms))
+        self.assertTrue(len(atomtype.atomTypeTable) > 0)
+
 ################################################################################
 
 if __name__ == '__main__':
@@ -0,0 +1,95 @@
+################################################################################
+#
+#   RMG - Reaction Mechanism Generator
+#
+#   Copyright (c) 2009-2011 by the RMG Team (rmg_dev@mit.edu)
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a
+#   copy of this software and associated documentation files (the 'Software'),
+#   to deal in the Software without restriction, including without limitation
+#   the rights to use, copy, modify, merge, publish, distribute, sublicense,
+#   and/or sell copies of the Software, and to permit persons to whom the
+#   Software is furnished to do so, subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#   FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#   DEALINGS IN THE SOFTWARE.
+#
+################################################################################
+
+cimport numpy
+
+from .molecule cimport Atom, Bond, Molecule
+
+################################################################################
+
+cdef class CompactMolecule:
+
+    cdef public numpy.ndarray elements
+    cdef public numpy.ndarray radicalElectrons
+    cdef public numpy.ndarray charges
+    cdef public numpy.ndarray lonePairs
+    cdef public list atomTypes
+    cdef public list labels
+    cdef public numpy.ndarray indptr
+    cdef public numpy.ndarray indices
+    cdef public numpy.ndarray orders
+    cdef public int multiplicity
+
+    cpdef CompactMolecule fromMolecule(self, Molecule molecule)
+
+    cpdef Molecule toMolecule(self)
+
+    cpdef CompactMolecule copy(self)
+
+    cpdef CompactMolecule merge(self, CompactMolecule other)
+
+    cpdef list split(self)
+
+    cpdef CompactMolecule getSubgraph(self, numpy.ndarray atomIndices)
+
+    cpdef numpy.ndarray getDegrees(self)
+
+    cpdef int getLabeledAtom(self, str label) except -1
+
+    cpdef bint containsLabeledAtom(self, str label)
+
+    cpdef clearLabeledAtoms(self)
+
+    cdef int getBondIndex(self, int index1, int index2)
+
+    cpdef double getBondOrder(self, int index1, int index2)
+
+    cpdef bint hasBond(self, int index1, int index2)
+
+    cpdef changeBond(self, int index1, int index2, double order)
+
+    cpdef formBond(self, int index1, int index2, double order)
+
+    cpdef breakBond(self, int index1, int index2)
+
+    cpdef incrementRadical(self, int index)
+
+    cpdef decrementRadical(self, int index)
+
+    cpdef incrementLonePairs(self, int index)
+
+    cpdef decrementLonePairs(self, int index)
+
+    cpdef updateCharge(self, int index)
+
+    cpdef numpy.ndarray getAtomInvariants(self)
+
+    cpdef bint isIsomorphic(self, CompactMolecule other) except -2
+
+    cpdef numpy.ndarray findIsomorphism(self, CompactMolecule other)
+
+    cdef bint match(self, CompactMolecule other, long[:] invariants1, long[:] invariants2, int[:] order,
+                    int[:] parents, int[:] mapping, int[:] mapped, int depth)
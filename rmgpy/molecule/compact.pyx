@@ -0,0 +1,862 @@
+################################################################################
+#
+#   RMG - Reaction Mechanism Generator
+#
+#   Copyright (c) 2009-2011 by the RMG Team (rmg_dev@mit.edu)
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a
+#   copy of this software and associated documentation files (the 'Software'),
+#   to deal in the Software without restriction, including without limitation
+#   the rights to use, copy, modify, merge, publish, distribute, sublicense,
+#   and/or sell copies of the Software, and to permit persons to whom the
+#   Software is furnished to do so, subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#   FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#   DEALINGS IN THE SOFTWARE.
+#
+################################################################################
+
+"""
+This module provides the :class:`CompactMolecule` class, an array-backed
+representation of a molecular graph. The atom properties are stored in typed
+NumPy arrays and the bonds in a compressed sparse row (CSR) adjacency
+structure, so that copying, merging and splitting a molecule only copies a
+handful of arrays instead of creating a Python object for every atom and bond.
+:class:`Molecule` objects are only created when needed via
+:meth:`CompactMolecule.toMolecule`.
+"""
+
+cimport cython
+import numpy
+cimport numpy
+from libc.string cimport memcpy
+
+from .molecule cimport Atom, Bond, Molecule
+from .element import elementList, PeriodicSystem
+from .group import ActionError
+
+numpy.import_array()
+
+################################################################################
+
+# The elements are stored by their index in the element list; elements that
+# are not the objects in the list (e.g. unpickled ones) are found by symbol
+# and isotope
+_elementIndices = dict([(element, index) for index, element in enumerate(elementList)])
+_elementSymbolIndices = dict([((element.symbol, element.isotope), index) for index, element in enumerate(elementList)])
+
+# The atoms created by toMolecule() have no coordinates
+_noCoords = numpy.array([])
+
+cdef inline numpy.ndarray _emptyArray(int length, int typenum):
+    """
+    Return a new uninitialized one-dimensional array. This avoids the Python
+    call overhead of :func:`numpy.empty`, which dominates for arrays the size
+    of a molecule.
+    """
+    cdef numpy.npy_intp dims = length
+    return numpy.PyArray_EMPTY(1, &dims, typenum, 0)
+
+cdef inline numpy.ndarray _copyArray(numpy.ndarray array):
+    """
+    Return a C-contiguous copy of the one-dimensional `array`.
+    """
+    return numpy.PyArray_NewCopy(array, numpy.NPY_CORDER)
+
+cdef inline numpy.ndarray _mergeArrays(numpy.ndarray array1, numpy.ndarray array2, int typenum, size_t itemSize):
+    """
+    Return a new array with the items of `array2` after those of `array1`.
+    Both arrays must be C-contiguous and of the type `typenum`.
+    """
+    cdef int length1 = array1.shape[0], length2 = array2.shape[0]
+    cdef numpy.ndarray merged = _emptyArray(length1 + length2, typenum)
+    memcpy(numpy.PyArray_DATA(merged), numpy.PyArray_DATA(array1), length1 * itemSize)
+    memcpy(<char *> numpy.PyArray_DATA(merged) + length1 * itemSize, numpy.PyArray_DATA(array2), length2 * itemSize)
+    return merged
+
+################################################################################
+
+cdef class CompactMolecule:
+    """
+    A molecular graph stored as arrays. The attributes are:
+
+    =================== =================== ====================================
+    Attribute           Type                Description
+    =================== =================== ====================================
+    `elements`          ``numpy.ndarray``   The index of the element of each atom in :data:`elementList`
+    `radicalElectrons`  ``numpy.ndarray``   The number of radical electrons on each atom
+    `charges`           ``numpy.ndarray``   The formal charge of each atom
+    `lonePairs`         ``numpy.ndarray``   The number of lone electron pairs on each atom
+    `atomTypes`         ``list``            The :class:`AtomType` of each atom, or ``None`` if not set
+    `labels`            ``list``            The label of each atom, or ``''`` if not labeled
+    `indptr`            ``numpy.ndarray``   The CSR row pointers: the bonds of atom `i` are stored at ``indptr[i]:indptr[i+1]``
+    `indices`           ``numpy.ndarray``   The CSR column indices, i.e. the index of the atom at the other end of each bond
+    `orders`            ``numpy.ndarray``   The order of each bond
+    `multiplicity`      ``int``             The multiplicity of the molecule
+    =================== =================== ====================================
+
+    Each bond is stored twice, once for each of its atoms, and the bonds of
+    each atom are sorted by the index of the other atom. Atom coordinates are
+    not stored.
+
+    The methods work directly on the data of the arrays, so the atom arrays
+    must be C-contiguous ``int16`` arrays, `indptr` and `indices` C-contiguous
+    ``int32`` arrays and `orders` a C-contiguous ``float64`` array.
+    """
+
+    def __init__(self, int numAtoms=0, int multiplicity=-187):
+        self.elements = numpy.zeros(numAtoms, numpy.int16)
+        self.radicalElectrons = numpy.zeros(numAtoms, numpy.int16)
+        self.charges = numpy.zeros(numAtoms, numpy.int16)
+        self.lonePairs = numpy.zeros(numAtoms, numpy.int16)
+        self.atomTypes = [None] * numAtoms
+        self.labels = [''] * numAtoms
+        self.indptr = numpy.zeros(numAtoms + 1, numpy.int32)
+        self.indices = numpy.zeros(0, numpy.int32)
+        self.orders = numpy.zeros(0, numpy.float64)
+        self.multiplicity = multiplicity
+
+    def __reduce__(self):
+        """
+        A helper function used when pickling an object.
+        """
+        return (_restoreCompactMolecule, (self.elements, self.radicalElectrons, self.charges, self.lonePairs,
+                                          self.atomTypes, self.labels, self.indptr, self.indices, self.orders,
+                                          self.multiplicity))
+
+    def __len__(self):
+        return self.elements.shape[0]
+
+    def __repr__(self):
+        return '<CompactMolecule with {0:d} atoms and {1:d} bonds>'.format(len(self), self.indices.shape[0] // 2)
+
+    cpdef CompactMolecule fromMolecule(self, Molecule molecule):
+        """
+        Set the arrays from the given :class:`Molecule` object, with the atoms
+        in the same order as in `molecule.atoms`. Returns the compact molecule.
+        """
+        cdef list atoms, atomTypes, labels
+        cdef dict atomIndices
+        cdef Atom atom, neighbor
+        cdef Bond bond
+        cdef int numAtoms, index, k, l, neighborIndex
+        cdef short *elements
+        cdef short *radicalElectrons
+        cdef short *charges
+        cdef short *lonePairs
+        cdef int *indptr
+        cdef int *indices
+        cdef double *orders
+
+        atoms = molecule.vertices
+        numAtoms = len(atoms)
+        self.elements = _emptyArray(numAtoms, numpy.NPY_INT16)
+        self.radicalElectrons = _emptyArray(numAtoms, numpy.NPY_INT16)
+        self.charges = _emptyArray(numAtoms, numpy.NPY_INT16)
+        self.lonePairs = _emptyArray(numAtoms, numpy.NPY_INT16)
+        self.indptr = _emptyArray(numAtoms + 1, numpy.NPY_INT32)
+        self.multiplicity = molecule.multiplicity
+        elements = <short *> numpy.PyArray_DATA(self.elements)
+        radicalElectrons = <short *> numpy.PyArray_DATA(self.radicalElectrons)
+        charges = <short *> numpy.PyArray_DATA(self.charges)
+        lonePairs = <short *> numpy.PyArray_DATA(self.lonePairs)
+        indptr = <int *> numpy.PyArray_DATA(self.indptr)
+
+        atomIndices = {}
+        indptr[0] = 0
+        for index in range(numAtoms):
+            atom = atoms[index]
+            atomIndices[atom] = index
+            indptr[index + 1] = indptr[index] + len(atom.edges)
+        self.indices = _emptyArray(indptr[numAtoms], numpy.NPY_INT32)
+        self.orders = _emptyArray(indptr[numAtoms], numpy.NPY_FLOAT64)
+        indices = <int *> numpy.PyArray_DATA(self.indices)
+        orders = <double *> numpy.PyArray_DATA(self.orders)
+
+        atomTypes = [None] * numAtoms
+        labels = [''] * numAtoms
+        for index in range(numAtoms):
+            atom = atoms[index]
+            try:
+                elements[index] = _elementIndices[atom.element]
+            except KeyError:
+                elements[index] = _elementSymbolIndices[(atom.element.symbol, atom.element.isotope)]
+            radicalElectrons[index] = atom.radicalElectrons
+            charges[index] = atom.charge
+            lonePairs[index] = atom.lonePairs
+            atomTypes[index] = atom.atomType
+            labels[index] = atom.label
+            # Insert each bond so that the bonds of the atom stay sorted
+            k = indptr[index]
+            for neighbor, bond in atom.edges.iteritems():
+                neighborIndex = atomIndices[neighbor]
+                l = k
+                while l > indptr[index] and indices[l - 1] > neighborIndex:
+                    indices[l] = indices[l - 1]
+                    orders[l] = orders[l - 1]
+                    l -= 1
+                indices[l] = neighborIndex
+                orders[l] = bond.order
+                k += 1
+        self.atomTypes = atomTypes
+        self.labels = labels
+        return self
+
+    cpdef Molecule toMolecule(self):
+        """
+        Return a new :class:`Molecule` object with the atoms in the same order
+        as in the compact molecule.
+        """
+        cdef list atoms
+        cdef Atom atom, neighbor
+        cdef Bond bond
+        cdef Molecule molecule
+        cdef int numAtoms, index, k
+        cdef short *elements = <short *> numpy.PyArray_DATA(self.elements)
+        cdef short *radicalElectrons = <short *> numpy.PyArray_DATA(self.radicalElectrons)
+        cdef short *charges = <short *> numpy.PyArray_DATA(self.charges)
+        cdef short *lonePairs = <short *> numpy.PyArray_DATA(self.lonePairs)
+        cdef int *indptr = <int *> numpy.PyArray_DATA(self.indptr)
+        cdef int *indices = <int *> numpy.PyArray_DATA(self.indices)
+        cdef double *orders = <double *> numpy.PyArray_DATA(self.orders)
+
+        numAtoms = self.elements.shape[0]
+        atoms = []
+        for index in range(numAtoms):
+            atom = Atom.__new__(Atom)
+            atom.edges = {}
+            atom.resetConnectivityValues()
+            atom.element = elementList[elements[index]]
+            atom.radicalElectrons = radicalElectrons[index]
+            atom.charge = charges[index]
+            atom.label = self.labels[index]
+            atom.atomType = self.atomTypes[index]
+            atom.lonePairs = lonePairs[index]
+            atom.coords = _noCoords
+            atoms.append(atom)
+        for index in range(numAtoms):
+            atom = atoms[index]
+            for k in range(indptr[index], indptr[index + 1]):
+                if indices[k] > index:
+                    neighbor = atoms[indices[k]]
+                    bond = Bond.__new__(Bond)
+                    bond.vertex1 = atom
+                    bond.vertex2 = neighbor
+                    bond.order = orders[k]
+                    atom.edges[neighbor] = bond
+                    neighbor.edges[atom] = bond
+        molecule = Molecule(atoms=atoms)
+        molecule.multiplicity = self.multiplicity
+        return molecule
+
+    cpdef CompactMolecule copy(self):
+        """
+        Return a deep copy of the compact molecule. This only copies arrays,
+        so it is linear in the number of atoms and bonds.
+        """
+        cdef CompactMolecule other
+        other = CompactMolecule.__new__(CompactMolecule)
+        other.elements = _copyArray(self.elements)
+        other.radicalElectrons = _copyArray(self.radicalElectrons)
+        other.charges = _copyArray(self.charges)
+        other.lonePairs = _copyArray(self.lonePairs)
+        other.atomTypes = self.atomTypes[:]
+        other.labels = self.labels[:]
+        other.indptr = _copyArray(self.indptr)
+        other.indices = _copyArray(self.indices)
+        other.orders = _copyArray(self.orders)
+        other.multiplicity = self.multiplicity
+        return other
+
+    cpdef CompactMolecule merge(self, CompactMolecule other):
+        """
+        Merge two compact molecules so as to store them in a single
+        :class:`CompactMolecule` object, with the atoms of `other` after those
+        of this molecule. The merged compact molecule is returned. As for
+        :meth:`Molecule.merge`, its multiplicity is not set.
+        """
+        cdef CompactMolecule merged
+        cdef int numAtoms1 = self.elements.shape[0], numAtoms2 = other.elements.shape[0]
+        cdef int numBonds1 = self.indices.shape[0], numBonds2 = other.indices.shape[0]
+        cdef int *indptr
+        cdef int *indices
+        cdef int *otherIndptr = <int *> numpy.PyArray_DATA(other.indptr)
+        cdef int *otherIndices = <int *> numpy.PyArray_DATA(other.indices)
+        cdef int index, k
+
+        merged = CompactMolecule.__new__(CompactMolecule)
+        merged.elements = _mergeArrays(self.elements, other.elements, numpy.NPY_INT16, sizeof(short))
+        merged.radicalElectrons = _mergeArrays(self.radicalElectrons, other.radicalElectrons, numpy.NPY_INT16, sizeof(short))
+        merged.charges = _mergeArrays(self.charges, other.charges, numpy.NPY_INT16, sizeof(short))
+        merged.lonePairs = _mergeArrays(self.lonePairs, other.lonePairs, numpy.NPY_INT16, sizeof(short))
+        merged.atomTypes = self.atomTypes + other.atomTypes
+        merged.labels = self.labels + other.labels
+        merged.orders = _mergeArrays(self.orders, other.orders, numpy.NPY_FLOAT64, sizeof(double))
+        # The bonds of other are shifted by the number of atoms and bonds of
+        # this molecule
+        merged.indptr = _emptyArray(numAtoms1 + numAtoms2 + 1, numpy.NPY_INT32)
+        merged.indices = _emptyArray(numBonds1 + numBonds2, numpy.NPY_INT32)
+        indptr = <int *> numpy.PyArray_DATA(merged.indptr)
+        indices = <int *> numpy.PyArray_DATA(merged.indices)
+        memcpy(indptr, numpy.PyArray_DATA(self.indptr), (numAtoms1 + 1) * sizeof(int))
+        memcpy(indices, numpy.PyArray_DATA(self.indices), numBonds1 * sizeof(int))
+        for index in range(numAtoms2):
+            indptr[numAtoms1 + index + 1] = otherIndptr[index + 1] + numBonds1
+        for k in range(numBonds2):
+            indices[numBonds1 + k] = otherIndices[k] + numAtoms1
+        merged.multiplicity = -187
+        return merged
+
+    cpdef list split(self):
+        """
+        Convert a compact molecule containing two or more unconnected
+        molecules into a list of separate :class:`CompactMolecule` objects.
+        As in :meth:`Graph.split`, the fragment containing the last atom comes
+        first, then the fragment containing the last of the remaining atoms,
+        and so on. The atoms of each fragment keep their relative order.
+        """
+        cdef numpy.ndarray components, queueArray, selected
+        cdef int *component
+        cdef int *queue
+        cdef int *selectedIndices
+        cdef int *indptr = <int *> numpy.PyArray_DATA(self.indptr)
+        cdef int *indices = <int *> numpy.PyArray_DATA(self.indices)
+        cdef int numAtoms, numComponents, start, head, tail, index, k, count
+        cdef list fragments
+
+        numAtoms = self.elements.shape[0]
+        if numAtoms == 0:
+            return [self.copy()]
+
+        components = _emptyArray(numAtoms, numpy.NPY_INT32)
+        queueArray = _emptyArray(numAtoms, numpy.NPY_INT32)
+        component = <int *> numpy.PyArray_DATA(components)
+        queue = <int *> numpy.PyArray_DATA(queueArray)
+        for index in range(numAtoms):
+            component[index] = -1
+        numComponents = 0
+        for start in range(numAtoms - 1, -1, -1):
+            if component[start] >= 0:
+                continue
+            # Breadth-first search for the atoms connected to start
+            component[start] = numComponents
+            queue[0] = start
+            head = 0; tail = 1
+            while head < tail:
+                index = queue[head]
+                head += 1
+                for k in range(indptr[index], indptr[index + 1]):
+                    if component[indices[k]] < 0:
+                        component[indices[k]] = numComponents
+                        queue[tail] = indices[k]
+                        tail += 1
+            numComponents += 1
+
+        if numComponents == 1:
+            return [self.copy()]
+        fragments = []
+        for start in range(numComponents):
+            count = 0
+            for index in range(numAtoms):
+                if component[index] == start:
+                    count += 1
+            selected = _emptyArray(count, numpy.NPY_INT32)
+            selectedIndices = <int *> numpy.PyArray_DATA(selected)
+            count = 0
+            for index in range(numAtoms):
+                if component[index] == start:
+                    selectedIndices[count] = index
+                    count += 1
+            fragments.append(self.getSubgraph(selected))
+        return fragments
+
+    cpdef CompactMolecule getSubgraph(self, numpy.ndarray atomIndices):
+        """
+        Return a new compact molecule containing only the atoms at the given
+        sorted `atomIndices` and the bonds between them. Its multiplicity is
+        not set.
+        """
+        cdef CompactMolecule subgraph
+        cdef numpy.ndarray selectedArray, newIndexArray
+        cdef int *selected
+        cdef int *newIndices
+        cdef int *indptr = <int *> numpy.PyArray_DATA(self.indptr)
+        cdef int *indices = <int *> numpy.PyArray_DATA(self.indices)
+        cdef double *orders = <double *> numpy.PyArray_DATA(self.orders)
+        cdef short *elements = <short *> numpy.PyArray_DATA(self.elements)
+        cdef short *radicalElectrons = <short *> numpy.PyArray_DATA(self.radicalElectrons)
+        cdef short *charges = <short *> numpy.PyArray_DATA(self.charges)
+        cdef short *lonePairs = <short *> numpy.PyArray_DATA(self.lonePairs)
+        cdef int *subIndptr
+        cdef int *subIndices
+        cdef double *subOrders
+        cdef short *subElements
+        cdef short *subRadicalElectrons
+        cdef short *subCharges
+        cdef short *subLonePairs
+        cdef list atomTypes, labels
+        cdef int numAtoms, numSelected, index, i, k, count
+
+        selectedArray = numpy.PyArray_FROMANY(atomIndices, numpy.NPY_INT32, 1, 1, numpy.NPY_ARRAY_IN_ARRAY)
+        selected = <int *> numpy.PyArray_DATA(selectedArray)
+        numSelected = selectedArray.shape[0]
+        numAtoms = self.elements.shape[0]
+        newIndexArray = _emptyArray(numAtoms, numpy.NPY_INT32)
+        newIndices = <int *> numpy.PyArray_DATA(newIndexArray)
+        for index in range(numAtoms):
+            newIndices[index] = -1
+        for i in range(numSelected):
+            newIndices[selected[i]] = i
+
+        subgraph = CompactMolecule.__new__(CompactMolecule)
+        subgraph.elements = _emptyArray(numSelected, numpy.NPY_INT16)
+        subgraph.radicalElectrons = _emptyArray(numSelected, numpy.NPY_INT16)
+        subgraph.charges = _emptyArray(numSelected, numpy.NPY_INT16)
+        subgraph.lonePairs = _emptyArray(numSelected, numpy.NPY_INT16)
+        subgraph.indptr = _emptyArray(numSelected + 1, numpy.NPY_INT32)
+        subElements = <short *> numpy.PyArray_DATA(subgraph.elements)
+        subRadicalElectrons = <short *> numpy.PyArray_DATA(subgraph.radicalElectrons)
+        subCharges = <short *> numpy.PyArray_DATA(subgraph.charges)
+        subLonePairs = <short *> numpy.PyArray_DATA(subgraph.lonePairs)
+        subIndptr = <int *> numpy.PyArray_DATA(subgraph.indptr)
+
+        # Keep the bonds of the selected atoms whose other atom is also
+        # selected; since the renumbering keeps the order of the atoms, the
+        # bonds of each atom stay sorted
+        count = 0
+        for i in range(numSelected):
+            for k in range(indptr[selected[i]], indptr[selected[i] + 1]):
+                if newIndices[indices[k]] >= 0:
+                    count += 1
+        subgraph.indices = _emptyArray(count, numpy.NPY_INT32)
+        subgraph.orders = _emptyArray(count, numpy.NPY_FLOAT64)
+        subIndices = <int *> numpy.PyArray_DATA(subgraph.indices)
+        subOrders = <double *> numpy.PyArray_DATA(subgraph.orders)
+
+        atomTypes = []
+        labels = []
+        count = 0
+        subIndptr[0] = 0
+        for i in range(numSelected):
+            index = selected[i]
+            subElements[i] = elements[index]
+            subRadicalElectrons[i] = radicalElectrons[index]
+            subCharges[i] = charges[index]
+            subLonePairs[i] = lonePairs[index]
+            atomTypes.append(self.atomTypes[index])
+            labels.append(self.labels[index])
+            for k in range(indptr[index], indptr[index + 1]):
+                if newIndices[indices[k]] >= 0:
+                    subIndices[count] = newIndices[indices[k]]
+                    subOrders[count] = orders[k]
+                    count += 1
+            subIndptr[i + 1] = count
+        subgraph.atomTypes = atomTypes
+        subgraph.labels = labels
+        subgraph.multiplicity = -187
+        return subgraph
+
+    cpdef numpy.ndarray getDegrees(self):
+        """
+        Return an array of the number of bonds on each atom.
+        """
+        return numpy.diff(self.indptr)
+
+    cpdef int getLabeledAtom(self, str label) except -1:
+        """
+        Return the index of the atom with the given `label`.
+        """
+        try:
+            return self.labels.index(label)
+        except ValueError:
+            raise ValueError('No atom in the molecule has the label "{0}".'.format(label))
+
+    cpdef bint containsLabeledAtom(self, str label):
+        """
+        Return ``True`` if the compact molecule contains an atom with the label
+        `label` and ``False`` otherwise.
+        """
+        return label in self.labels
+
+    cpdef clearLabeledAtoms(self):
+        """
+        Remove the labels from all atoms in the compact molecule.
+        """
+        self.labels = [''] * len(self)
+
+    cdef int getBondIndex(self, int index1, int index2):
+        """
+        Return the position in `indices` and `orders` of the bond from the
+        atom at `index1` to the atom at `index2`, or -1 if they are not bonded.
+        """
+        cdef int *indptr = <int *> numpy.PyArray_DATA(self.indptr)
+        cdef int *indices = <int *> numpy.PyArray_DATA(self.indices)
+        cdef int k
+        for k in range(indptr[index1], indptr[index1 + 1]):
+            if indices[k] == index2:
+                return k
+            elif indices[k] > index2:
+                break
+        return -1
+
+    cpdef double getBondOrder(self, int index1, int index2):
+        """
+        Return the order of the bond between the atoms at `index1` and
+        `index2`, or zero if they are not bonded.
+        """
+        cdef int k = self.getBondIndex(index1, index2)
+        return (<double *> numpy.PyArray_DATA(self.orders))[k] if k >= 0 else 0
+
+    cpdef bint hasBond(self, int index1, int index2):
+        """
+        Return ``True`` if the atoms at `index1` and `index2` are bonded, or
+        ``False`` if not.
+        """
+        return self.getBondIndex(index1, index2) >= 0
+
+    cpdef changeBond(self, int index1, int index2, double order):
+        """
+        Change the order of the bond between the atoms at `index1` and
+        `index2` by `order`, as for a CHANGE_BOND action. The atom types of
+        both atoms are reset.
+        """
+        cdef double *orders = <double *> numpy.PyArray_DATA(self.orders)
+        cdef int k1, k2
+        k1 = self.getBondIndex(index1, index2)
+        k2 = self.getBondIndex(index2, index1)
+        if k1 < 0:
+            raise ValueError('The specified atoms are not connected by a bond.')
+        self.atomTypes[index1] = None
+        self.atomTypes[index2] = None
+        orders[k1] += order
+        orders[k2] = orders[k1]
+        if orders[k1] < 0 or orders[k1] > 3:
+            raise ActionError('Unable to update Bond due to CHANGE_BOND action: Invalid resulting order "{0}".'.format(orders[k1]))
+
+    cpdef formBond(self, int index1, int index2, double order):
+        """
+        Form a new bond of the given `order` between the atoms at `index1`
+        and `index2`, as for a FORM_BOND action. The atom types of both atoms
+        are reset.
+        """
+        cdef numpy.ndarray newIndexArray, newOrderArray
+        cdef int *indptr = <int *> numpy.PyArray_DATA(self.indptr)
+        cdef int *indices = <int *> numpy.PyArray_DATA(self.indices)
+        cdef double *orders = <double *> numpy.PyArray_DATA(self.orders)
+        cdef int *newIndices
+        cdef double *newOrders
+        cdef int numAtoms, numBonds, i1, i2, k1, k2, k, shift, index
+
+        if self.hasBond(index1, index2):
+            raise ValueError('The specified atoms are already connected by a bond.')
+        numAtoms = self.elements.shape[0]
+        numBonds = self.indices.shape[0]
+        # Find where the new bond goes in the sorted bonds of each atom
+        i1, i2 = (index1, index2) if index1 < index2 else (index2, index1)
+        k1 = indptr[i1]
+        while k1 < indptr[i1 + 1] and indices[k1] < i2: k1 += 1
+        k2 = indptr[i2]
+        while k2 < indptr[i2 + 1] and indices[k2] < i1: k2 += 1
+
+        newIndexArray = _emptyArray(numBonds + 2, numpy.NPY_INT32)
+        newOrderArray = _emptyArray(numBonds + 2, numpy.NPY_FLOAT64)
+        newIndices = <int *> numpy.PyArray_DATA(newIndexArray)
+        newOrders = <double *> numpy.PyArray_DATA(newOrderArray)
+        shift = 0
+        for k in range(numBonds + 1):
+            if k == k1:
+                newIndices[k + shift] = i2
+                newOrders[k + shift] = order
+                shift += 1
+            if k == k2:
+                newIndices[k + shift] = i1
+                newOrders[k + shift] = order
+                shift += 1
+            if k < numBonds:
+                newIndices[k + shift] = indices[k]
+                newOrders[k + shift] = orders[k]
+        for index in range(i1 + 1, numAtoms + 1):
+            indptr[index] += 1
+        for index in range(i2 + 1, numAtoms + 1):
+            indptr[index] += 1
+        self.indices = newIndexArray
+        self.orders = newOrderArray
+        self.atomTypes[index1] = None
+        self.atomTypes[index2] = None
+
+    cpdef breakBond(self, int index1, int index2):
+        """
+        Remove the bond between the atoms at `index1` and `index2`, as for a
+        BREAK_BOND action. The atom types of both atoms are reset.
+        """
+        cdef numpy.ndarray newIndexArray, newOrderArray
+        cdef int *indptr = <int *> numpy.PyArray_DATA(self.indptr)
+        cdef int *indices = <int *> numpy.PyArray_DATA(self.indices)
+        cdef double *orders = <double *> numpy.PyArray_DATA(self.orders)
+        cdef int *newIndices
+        cdef double *newOrders
+        cdef int numAtoms, numBonds, k1, k2, k, count, index
+
+        k1 = self.getBondIndex(index1, index2)
+        k2 = self.getBondIndex(index2, index1)
+        if k1 < 0:
+            raise ValueError('The specified atoms are not connected by a bond.')
+        numAtoms = self.elements.shape[0]
+        numBonds = self.indices.shape[0]
+        newIndexArray = _emptyArray(numBonds - 2, numpy.NPY_INT32)
+        newOrderArray = _emptyArray(numBonds - 2, numpy.NPY_FLOAT64)
+        newIndices = <int *> numpy.PyArray_DATA(newIndexArray)
+        newOrders = <double *> numpy.PyArray_DATA(newOrderArray)
+        count = 0
+        for k in range(numBonds):
+            if k != k1 and k != k2:
+                newIndices[count] = indices[k]
+                newOrders[count] = orders[k]
+                count += 1
+        for index in range(index1 + 1, numAtoms + 1):
+            indptr[index] -= 1
+        for index in range(index2 + 1, numAtoms + 1):
+            indptr[index] -= 1
+        self.indices = newIndexArray
+        self.orders = newOrderArray
+        self.atomTypes[index1] = None
+        self.atomTypes[index2] = None
+
+    cpdef incrementRadical(self, int index):
+        """
+        Add a radical electron to the atom at `index`, as for a GAIN_RADICAL
+        action.
+        """
+        cdef short *radicalElectrons = <short *> numpy.PyArray_DATA(self.radicalElectrons)
+        self.atomTypes[index] = None
+        radicalElectrons[index] += 1
+        if radicalElectrons[index] <= 0:
+            raise ActionError('Unable to update Atom due to GAIN_RADICAL action: Invalid radical electron set "{0}".'.format(radicalElectrons[index]))
+
+    cpdef decrementRadical(self, int index):
+        """
+        Remove a radical electron from the atom at `index`, as for a
+        LOSE_RADICAL action.
+        """
+        cdef short *radicalElectrons = <short *> numpy.PyArray_DATA(self.radicalElectrons)
+        self.atomTypes[index] = None
+        radicalElectrons[index] -= 1
+        if radicalElectrons[index] < 0:
+            raise ActionError('Unable to update Atom due to LOSE_RADICAL action: Invalid radical electron set "{0}".'.format(radicalElectrons[index]))
+
+    cpdef incrementLonePairs(self, int index):
+        """
+        Add a lone electron pair to the atom at `index` and update its charge,
+        as for a GAIN_PAIR action.
+        """
+        cdef short *lonePairs = <short *> numpy.PyArray_DATA(self.lonePairs)
+        self.atomTypes[index] = None
+        lonePairs[index] += 1
+        if lonePairs[index] <= 0:
+            raise ActionError('Unable to update Atom due to GAIN_PAIR action: Invalid lone electron pairs set "{0}".'.format(lonePairs[index]))
+        self.updateCharge(index)
+
+    cpdef decrementLonePairs(self, int index):
+        """
+        Remove a lone electron pair from the atom at `index` and update its
+        charge, as for a LOSE_PAIR action.
+        """
+        cdef short *lonePairs = <short *> numpy.PyArray_DATA(self.lonePairs)
+        self.atomTypes[index] = None
+        lonePairs[index] -= 1
+        if lonePairs[index] < 0:
+            raise ActionError('Unable to update Atom due to LOSE_PAIR action: Invalid lone electron pairs set "{0}".'.format(lonePairs[index]))
+        self.updateCharge(index)
+
+    cpdef updateCharge(self, int index):
+        """
+        Update the charge of the atom at `index` from its valence electrons,
+        bonds, radical electrons and lone pairs, as :meth:`Atom.updateCharge`
+        does.
+        """
+        cdef int *indptr = <int *> numpy.PyArray_DATA(self.indptr)
+        cdef double *orders = <double *> numpy.PyArray_DATA(self.orders)
+        cdef short *charges = <short *> numpy.PyArray_DATA(self.charges)
+        cdef short *radicalElectrons = <short *> numpy.PyArray_DATA(self.radicalElectrons)
+        cdef short *lonePairs = <short *> numpy.PyArray_DATA(self.lonePairs)
+        cdef short *elements = <short *> numpy.PyArray_DATA(self.elements)
+        cdef int k, valenceElectrons, numBenzeneBonds = 0
+        cdef double order = 0
+        valenceElectrons = PeriodicSystem.valence_electrons[elementList[elements[index]].symbol]
+        for k in range(indptr[index], indptr[index + 1]):
+            if abs(orders[k] - 1.5) <= 1e-9:
+                numBenzeneBonds += 1
+            else:
+                order += orders[k]
+        if numBenzeneBonds == 3:
+            order += numBenzeneBonds * 4 / 3.0
+        else:
+            order += numBenzeneBonds * 3 / 2.0
+        charges[index] = <short>(valenceElectrons - order - radicalElectrons[index] - 2 * lonePairs[index])
+
+    cpdef numpy.ndarray getAtomInvariants(self):
+        """
+        Return an array of integers that summarize the element, radical
+        electrons, charge, lone pairs and number of bonds of each atom. Atoms
+        with different invariants can never be mapped onto each other.
+        """
+        return (((self.elements.astype(numpy.int64) * 16 + self.radicalElectrons) * 32 + (self.charges + 16)) * 256
+                + (self.lonePairs + 128)) * 64 + self.getDegrees()
+
+    cpdef bint isIsomorphic(self, CompactMolecule other) except -2:
+        """
+        Returns :data:`True` if the two compact molecules are isomorphic and
+        :data:`False` otherwise.
+        """
+        return self.findIsomorphism(other) is not None
+
+    cpdef numpy.ndarray findIsomorphism(self, CompactMolecule other):
+        """
+        Return an array that maps the index of each atom of this molecule to
+        the index of the corresponding atom of the compact molecule `other`,
+        or ``None`` if the two are not isomorphic. As for
+        :meth:`Molecule.isIsomorphic`, atom labels and atom types are ignored.
+
+        The search is a VF2-style depth-first search directly on the arrays.
+        The atoms are visited in breadth-first order, so that every atom after
+        the first in each fragment only needs to be tried against the
+        unmapped neighbors of the atom its parent is mapped to.
+        """
+        cdef numpy.ndarray invariants1, invariants2, mapping, mapped, order, parents, visited
+        cdef numpy.ndarray values, inverse, counts
+        cdef int[:] indptr = self.indptr
+        cdef int[:] indices = self.indices
+        cdef int[:] orderView, parentView, visitedView
+        cdef int numAtoms, count, head, start, index, k
+
+        numAtoms = len(self)
+        if numAtoms != len(other) or self.indices.shape[0] != other.indices.shape[0]:
+            return None
+        if self.multiplicity != other.multiplicity:
+            return None
+        invariants1 = self.getAtomInvariants()
+        invariants2 = other.getAtomInvariants()
+        if not numpy.array_equal(numpy.sort(invariants1), numpy.sort(invariants2)):
+            return None
+        if not numpy.allclose(numpy.sort(self.orders), numpy.sort(other.orders), rtol=0, atol=1e-9):
+            return None
+
+        # Visit the atoms in breadth-first order, starting each fragment from
+        # its atom with the rarest invariant
+        values, inverse, counts = numpy.unique(invariants1, return_inverse=True, return_counts=True)
+        order = numpy.empty(numAtoms, numpy.int32)
+        parents = numpy.empty(numAtoms, numpy.int32)
+        visited = numpy.zeros(numAtoms, numpy.int32)
+        orderView = order
+        parentView = parents
+        visitedView = visited
+        count = 0
+        head = 0
+        for start in numpy.lexsort((numpy.arange(numAtoms), counts[inverse])):
+            if visitedView[start]: continue
+            visitedView[start] = 1
+            orderView[count] = start
+            parentView[count] = -1
+            count += 1
+            while head < count:
+                index = orderView[head]
+                head += 1
+                for k in range(indptr[index], indptr[index + 1]):
+                    if not visitedView[indices[k]]:
+                        visitedView[indices[k]] = 1
+                        orderView[count] = indices[k]
+                        parentView[count] = index
+                        count += 1
+
+        mapping = -numpy.ones(numAtoms, numpy.int32)
+        mapped = numpy.zeros(numAtoms, numpy.int32)
+        if self.match(other, invariants1, invariants2, order, parents, mapping, mapped, 0):
+            return mapping
+        return None
+
+    cdef bint match(self, CompactMolecule other, long[:] invariants1, long[:] invariants2, int[:] order,
+                    int[:] parents, int[:] mapping, int[:] mapped, int depth):
+        """
+        Extend the partial `mapping` of the first `depth` atoms in `order`,
+        returning ``True`` if a complete isomorphism was found.
+        """
+        cdef int[:] indptr1 = self.indptr
+        cdef int[:] indices1 = self.indices
+        cdef double[:] orders1 = self.orders
+        cdef int[:] indptr2 = other.indptr
+        cdef int[:] indices2 = other.indices
+        cdef double[:] orders2 = other.orders
+        cdef int index, parent, candidate, first, last, c, k, k2, numMappedBonds, numMappedNeighbors
+        cdef bint consistent
+
+        if depth == order.shape[0]:
+            return True
+        index = order[depth]
+        parent = parents[depth]
+        if parent >= 0:
+            # Only the neighbors of the image of the parent are candidates
+            first = indptr2[mapping[parent]]
+            last = indptr2[mapping[parent] + 1]
+        else:
+            first = 0
+            last = invariants2.shape[0]
+        for c in range(first, last):
+            candidate = indices2[c] if parent >= 0 else c
+            if mapped[candidate] or invariants2[candidate] != invariants1[index]:
+                continue
+            # Every bond to an already mapped atom must be matched by a bond of
+            # the same order in other, and the candidate must have no other
+            # bonds to mapped atoms
+            consistent = True
+            numMappedBonds = 0
+            for k in range(indptr1[index], indptr1[index + 1]):
+                if mapping[indices1[k]] >= 0:
+                    numMappedBonds += 1
+                    k2 = other.getBondIndex(candidate, mapping[indices1[k]])
+                    if k2 < 0 or abs(orders2[k2] - orders1[k]) > 1e-9:
+                        consistent = False
+                        break
+            if not consistent:
+                continue
+            numMappedNeighbors = 0
+            for k in range(indptr2[candidate], indptr2[candidate + 1]):
+                if mapped[indices2[k]]:
+                    numMappedNeighbors += 1
+            if numMappedBonds != numMappedNeighbors:
+                continue
+            mapping[index] = candidate
+            mapped[candidate] = 1
+            if self.match(other, invariants1, invariants2, order, parents, mapping, mapped, depth + 1):
+                return True
+            mapping[index] = -1
+            mapped[candidate] = 0
+        return False
+
+################################################################################
+
+def _restoreCompactMolecule(elements, radicalElectrons, charges, lonePairs, atomTypes, labels, indptr, indices,
+                            orders, multiplicity):
+    """
+    Create a compact molecule from its arrays when unpickling.
+    """
+    cdef CompactMolecule compact
+    compact = CompactMolecule.__new__(CompactMolecule)
+    compact.elements = elements
+    compact.radicalElectrons = radicalElectrons
+    compact.charges = charges
+    compact.lonePairs = lonePairs
+    compact.atomTypes = atomTypes
+    compact.labels = labels
+    compact.indptr = indptr
+    compact.indices = indices
+    compact.orders = orders
+    compact.multiplicity = multiplicity
+    return compact
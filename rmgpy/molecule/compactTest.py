@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+This script contains unit tests of the :mod:`rmgpy.molecule.compact` module.
+"""
+
+import unittest
+import cPickle
+import random
+
+from rmgpy.molecule.molecule import Molecule
+from rmgpy.molecule.compact import CompactMolecule
+from rmgpy.molecule.group import ActionError
+
+################################################################################
+
+class TestCompactMolecule(unittest.TestCase):
+    """
+    Contains unit tests of the CompactMolecule class.
+    """
+
+    def setUp(self):
+        """
+        A method called before each unit test in this class.
+        """
+        self.molecule = Molecule().fromAdjacencyList("""
+multiplicity 2
+1 *1 C u1 p0 c0 {2,S} {4,S} {5,S}
+2    C u0 p0 c0 {1,S} {3,D} {6,S}
+3    O u0 p2 c0 {2,D}
+4    H u0 p0 c0 {1,S}
+5    H u0 p0 c0 {1,S}
+6    H u0 p0 c0 {2,S}
+""")
+        self.water = Molecule().fromAdjacencyList("""
+1 O u0 p2 c0 {2,S} {3,S}
+2 H u0 p0 c0 {1,S}
+3 H u0 p0 c0 {1,S}
+""")
+        self.compact = CompactMolecule().fromMolecule(self.molecule)
+
+    def testFromMolecule(self):
+        """
+        Test that the arrays match the atoms and bonds of the molecule.
+        """
+        self.assertEqual(len(self.compact), 6)
+        self.assertEqual(self.compact.indices.shape[0], 10)
+        self.assertEqual(list(self.compact.getDegrees()), [3, 3, 1, 1, 1, 1])
+        self.assertEqual(self.compact.getBondOrder(1, 2), 2)
+        self.assertEqual(self.compact.getBondOrder(0, 2), 0)
+        self.assertEqual(self.compact.labels, ['*1', '', '', '', '', ''])
+        self.assertEqual(self.compact.getLabeledAtom('*1'), 0)
+        self.assertRaises(ValueError, self.compact.getLabeledAtom, '*2')
+        self.assertEqual(self.compact.multiplicity, 2)
+
+    def testToMolecule(self):
+        """
+        Test that the compact molecule converts back to the same molecule.
+        """
+        molecule = self.compact.toMolecule()
+        self.assertTrue(molecule.isIsomorphic(self.molecule))
+        self.assertEqual(molecule.atoms[0].label, '*1')
+        self.assertEqual(molecule.atoms[2].lonePairs, 2)
+        self.assertTrue(molecule.atoms[1].atomType is self.molecule.atoms[1].atomType)
+        self.assertEqual(molecule.multiplicity, 2)
+
+    def testCopy(self):
+        """
+        Test that a copy is isomorphic but does not share any arrays.
+        """
+        other = self.compact.copy()
+        self.assertTrue(other.isIsomorphic(self.compact))
+        other.radicalElectrons[0] = 0
+        other.clearLabeledAtoms()
+        self.assertEqual(self.compact.radicalElectrons[0], 1)
+        self.assertEqual(self.compact.labels[0], '*1')
+
+    def testMergeAndSplit(self):
+        """
+        Test that merging two compact molecules and splitting the result
+        gives back the original molecules, with the fragment containing the
+        last atom first as in :meth:`Graph.split`.
+        """
+        water = CompactMolecule().fromMolecule(self.water)
+        merged = self.compact.merge(water)
+        self.assertEqual(len(merged), 9)
+        self.assertEqual(merged.getBondOrder(6, 7), 1)
+        fragments = merged.split()
+        self.assertEqual(len(fragments), 2)
+        water.multiplicity = self.compact.multiplicity = -187
+        self.assertTrue(fragments[0].isIsomorphic(water))
+        self.assertTrue(fragments[1].isIsomorphic(self.compact))
+        self.assertEqual(fragments[1].labels[0], '*1')
+
+    def testRecipeActions(self):
+        """
+        Test that forming and breaking bonds and changing bond orders, radical
+        electrons and lone pairs gives the same molecules as on Molecule
+        objects.
+        """
+        # Add an H atom from water to the radical center, and split off OH
+        compact = self.compact.merge(CompactMolecule().fromMolecule(self.water))
+        compact.breakBond(6, 7)
+        compact.incrementRadical(6)
+        compact.formBond(0, 7, 1)
+        compact.decrementRadical(0)
+        products = [product.toMolecule() for product in compact.split()]
+        for product in products: product.update()
+        self.assertTrue(products[0].isIsomorphic(Molecule().fromSMILES('[OH]')))
+        self.assertTrue(products[1].isIsomorphic(Molecule().fromSMILES('CC=O')))
+
+        compact = self.compact.copy()
+        compact.changeBond(1, 2, -1)
+        compact.incrementRadical(2)
+        compact.changeBond(0, 1, 1)
+        compact.decrementRadical(0)
+        molecule = compact.toMolecule()
+        molecule.update()
+        self.assertTrue(molecule.isIsomorphic(Molecule().fromSMILES('C=C[O]')))
+
+        self.assertRaises(ActionError, self.compact.copy().decrementRadical, 1)
+        self.assertRaises(ActionError, self.compact.copy().changeBond, 1, 2, 2)
+        self.assertRaises(ValueError, self.compact.copy().breakBond, 0, 2)
+
+    def testUpdateCharge(self):
+        """
+        Test that changing the lone pairs of an atom updates its charge.
+        """
+        compact = CompactMolecule().fromMolecule(self.water)
+        compact.incrementLonePairs(0)
+        self.assertEqual(compact.charges[0], -2)
+        compact.decrementLonePairs(0)
+        self.assertEqual(compact.charges[0], 0)
+
+    def testIsIsomorphic(self):
+        """
+        Test isomorphism checks of compact molecules with shuffled atoms.
+        """
+        molecule = Molecule().fromSMILES('CC(O)C=CC1CCCC1')
+        compact = CompactMolecule().fromMolecule(molecule)
+        atoms = molecule.atoms[:]
+        random.seed(0)
+        for i in range(5):
+            random.shuffle(atoms)
+            molecule.atoms = atoms[:]
+            shuffled = CompactMolecule().fromMolecule(molecule)
+            mapping = compact.findIsomorphism(shuffled)
+            self.assertIsNotNone(mapping)
+            for index1 in range(len(compact)):
+                for index2 in range(len(compact)):
+                    self.assertEqual(compact.getBondOrder(index1, index2), shuffled.getBondOrder(mapping[index1], mapping[index2]))
+        self.assertFalse(compact.isIsomorphic(CompactMolecule().fromMolecule(Molecule().fromSMILES('CC(O)CC=C1CCCC1'))))
+        self.assertFalse(compact.isIsomorphic(self.compact))
+
+    def testPickle(self):
+        """
+        Test that a compact molecule can be pickled and unpickled.
+        """
+        other = cPickle.loads(cPickle.dumps(self.compact, -1))
+        self.assertTrue(other.isIsomorphic(self.compact))
+        self.assertEqual(other.labels, self.compact.labels)
+
+################################################################################
+
+if __name__ == '__main__':
+    unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
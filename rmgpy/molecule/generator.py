@@ -55,6 +55,51 @@ _known_smiles_radicals = {
                  'O2': '[O][O]',
              }
 
+#: The OpenBabel conversion objects created so far, keyed by output format and options
+_ob_conversions = {}
+
+#: The Molecule methods used to generate each kind of identifier by toIdentifiers()
+_identifier_methods = {
+                 'SMILES': Molecule.toSMILES,
+                 'InChI': Molecule.toInChI,
+                 'InChIKey': Molecule.toInChIKey,
+                 'AugmentedInChI': Molecule.toAugmentedInChI,
+                 'AugmentedInChIKey': Molecule.toAugmentedInChIKey,
+             }
+
+def getOBConversion(outFormat, options):
+    """
+    Return an `OpenBabel <http://openbabel.org/>`_ OBConversion object that
+    writes the given `outFormat` with the list of output `options` set. The
+    object is created on the first call and reused afterwards, so that the
+    OpenBabel format plugins are only set up once.
+    """
+    key = (outFormat, tuple(options))
+    try:
+        return _ob_conversions[key]
+    except KeyError:
+        pass
+    obConversion = openbabel.OBConversion()
+    obConversion.SetOutFormat(outFormat)
+    for option in options:
+        obConversion.SetOptions(option, openbabel.OBConversion.OUTOPTIONS)
+    _ob_conversions[key] = obConversion
+    return obConversion
+
+def toIdentifiers(molecules, identifier='SMILES'):
+    """
+    Return a list of the identifiers of each of the given `molecules`, where
+    `identifier` is one of ``'SMILES'``, ``'InChI'``, ``'InChIKey'``,
+    ``'AugmentedInChI'``, or ``'AugmentedInChIKey'``. The identifiers are
+    taken from the cache on each molecule where possible, and the backend
+    objects are shared by all of the conversions.
+    """
+    try:
+        method = _identifier_methods[identifier]
+    except KeyError:
+        raise ValueError('Invalid identifier type "{0}".'.format(identifier))
+    return [method(mol) for mol in molecules]
+
 def toInChI(mol):
     """
     Convert a molecular structure to an InChI string. Uses
@@ -75,9 +120,7 @@ def toInChI(mol):
         pass
 
     obmol = toOBMol(mol)
-    obConversion = openbabel.OBConversion()
-    obConversion.SetOutFormat('inchi')
-    obConversion.SetOptions('w', openbabel.OBConversion.OUTOPTIONS)
+    obConversion = getOBConversion('inchi', ['w'])
     return obConversion.WriteString(obmol).strip()
 
 def create_U_layer(mol, auxinfo):
@@ -145,7 +188,7 @@ def toAugmentedInChI(mol):
                 ulayer=str,
                 aug_inchi=str,
                )
-    inchi = toInChI(mol)
+    inchi = mol.toInChI()
 
     ulayer, player = create_augmented_layers(mol)
 
@@ -169,7 +212,7 @@ def toInChIKey(mol):
     try:
         if not Chem.inchi.INCHI_AVAILABLE:
             return "RDKitInstalledWithoutInChI"
-        inchi = toInChI(mol)
+        inchi = mol.toInChI()
         return Chem.inchi.InchiToInchiKey(inchi)[:-2]
     except:
         pass
@@ -178,10 +221,7 @@ def toInChIKey(mol):
 #        for atom in mol.vertices:
 #           if atom.isNitrogen():
     obmol = toOBMol(mol)
-    obConversion = openbabel.OBConversion()
-    obConversion.SetOutFormat('inchi')
-    obConversion.SetOptions('w', openbabel.OBConversion.OUTOPTIONS)
-    obConversion.SetOptions('K', openbabel.OBConversion.OUTOPTIONS)
+    obConversion = getOBConversion('inchi', ['w', 'K'])
     return obConversion.WriteString(obmol).strip()[:-2]
 
 def toAugmentedInChIKey(mol):
@@ -195,7 +235,7 @@ def toAugmentedInChIKey(mol):
             ulayer=str
         )
 
-    key = toInChIKey(mol)
+    key = mol.toInChIKey()
 
     ulayer, player = create_augmented_layers(mol)
 
@@ -248,12 +288,7 @@ def toSMILES(mol):
     for atom in mol.vertices:
         if atom.isNitrogen():
             obmol = toOBMol(mol)
-            try:
-                SMILEwriter = openbabel.OBConversion()
-                SMILEwriter.SetOutFormat('smi')
-                SMILEwriter.SetOptions("i",SMILEwriter.OUTOPTIONS) # turn off isomer and stereochemistry information (the @ signs!)
-            except:
-                pass
+            SMILEwriter = getOBConversion('smi', ['i']) # turn off isomer and stereochemistry information (the @ signs!)
             return SMILEwriter.WriteString(obmol).strip()
 
     rdkitmol = toRDKitMol(mol, sanitize=False)
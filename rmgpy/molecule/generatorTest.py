@@ -382,6 +382,15 @@ multiplicity 3
         aug_inchi = 'InChI=1S/C5H6/c1-3-5-4-2/h1-3H2/u1,2/lp4,5'
         self.compare(adjlist, aug_inchi)
 
+class IdentifierBatchTest(unittest.TestCase):
+
+    def test_toIdentifiers(self):
+        mols = [Molecule().fromSMILES(smi) for smi in ['CC', 'C=CC', 'CCN', 'CCN']]
+        self.assertEqual(toIdentifiers(mols, 'SMILES'), [mol.toSMILES() for mol in mols])
+        self.assertEqual(toIdentifiers(mols, 'InChI'), [toInChI(mol) for mol in mols])
+        self.assertEqual(toIdentifiers(mols, 'AugmentedInChIKey'), [toAugmentedInChIKey(mol) for mol in mols])
+        self.assertRaises(ValueError, toIdentifiers, mols, 'CAS')
+
 class ExpectedLonePairsTest(unittest.TestCase):
 
     def test_SingletCarbon(self):
@@ -68,6 +68,13 @@ cdef class Edge(object):
 cdef class Graph:
 
     cdef public list vertices
+    cdef dict _ringCache
+    cdef list _ringCacheVertices
+    cdef int _ringCacheNumVertices, _ringCacheNumEdges
+
+    cpdef resetRingCache(self)
+
+    cdef dict getRingCache(self)
 
     cpdef Vertex addVertex(self, Vertex vertex)
 
@@ -132,5 +139,11 @@ cdef class Graph:
     cpdef list __exploreCyclesRecursively(self, list chain, list cycles)
 
     cpdef list getSmallestSetOfSmallestRings(self)
+
+    cdef list _getSmallestSetOfSmallestRings(self)
     
     cpdef bint isMappingValid(self, Graph other, dict mapping) except -2
+
+################################################################################
+
+cdef list copyRings(list rings)
@@ -217,12 +217,40 @@ cdef class Graph:
         """
         return (Graph, (self.vertices,))
 
+    cpdef resetRingCache(self):
+        """
+        Discard the cached results of ring perception. This is done
+        automatically whenever vertices or edges are added or removed using
+        the methods of the graph.
+        """
+        self._ringCache = None
+
+    cdef dict getRingCache(self):
+        """
+        Return the dictionary of cached ring perception results. The cache is
+        emptied first if the list of vertices or the total number of edges has
+        changed since it was filled, which catches changes made to the
+        vertices directly rather than through the methods of the graph.
+        """
+        cdef Vertex vertex
+        cdef int numEdges = 0
+        for vertex in self.vertices:
+            numEdges += len(vertex.edges)
+        if (self._ringCache is None or self._ringCacheVertices is not self.vertices or
+                self._ringCacheNumVertices != len(self.vertices) or self._ringCacheNumEdges != numEdges):
+            self._ringCache = {}
+            self._ringCacheVertices = self.vertices
+            self._ringCacheNumVertices = len(self.vertices)
+            self._ringCacheNumEdges = numEdges
+        return self._ringCache
+
     cpdef Vertex addVertex(self, Vertex vertex):
         """
         Add a `vertex` to the graph. The vertex is initialized with no edges.
         """
         self.vertices.append(vertex)
         vertex.edges = dict()
+        self._ringCache = None
         return vertex
 
     cpdef Edge addEdge(self, Edge edge):
@@ -234,6 +262,7 @@ cdef class Graph:
             raise ValueError('Attempted to add edge between vertices not in the graph.')
         edge.vertex1.edges[edge.vertex2] = edge
         edge.vertex2.edges[edge.vertex1] = edge
+        self._ringCache = None
         return edge
 
     cpdef dict getEdges(self, Vertex vertex):
@@ -276,6 +305,7 @@ cdef class Graph:
             del vertex2.edges[vertex]
         vertex.edges = dict()
         self.vertices.remove(vertex)
+        self._ringCache = None
 
     cpdef removeEdge(self, Edge edge):
         """
@@ -285,6 +315,7 @@ cdef class Graph:
         """
         del edge.vertex1.edges[edge.vertex2]
         del edge.vertex2.edges[edge.vertex1]
+        self._ringCache = None
 
     cpdef Graph copy(self, bint deep=False):
         """
@@ -562,6 +593,12 @@ cdef class Graph:
         Return all vertices belonging to two or more cycles, fused or spirocyclic.
         """
         cdef list SSSR, vertices, polycyclicVertices
+        cdef dict cache
+
+        cache = self.getRingCache()
+        if 'polycyclicVertices' in cache:
+            return cache['polycyclicVertices'][:]
+
         SSSR = self.getSmallestSetOfSmallestRings()
         polycyclicVertices = []
         if SSSR:            
@@ -573,6 +610,7 @@ cdef class Graph:
                     else:
                         if vertex not in polycyclicVertices:
                             polycyclicVertices.append(vertex)     
+        cache['polycyclicVertices'] = polycyclicVertices[:]
         return polycyclicVertices        
     
     cpdef list getPolycyclicRings(self):
@@ -585,6 +623,11 @@ cdef class Graph:
         cdef list polycyclicVertices, continuousCycles, SSSR
         cdef set polycyclicCycle
         cdef Vertex vertex
+        cdef dict cache
+
+        cache = self.getRingCache()
+        if 'polycyclicRings' in cache:
+            return copyRings(cache['polycyclicRings'])
         
         SSSR = self.getSmallestSetOfSmallestRings()
         if not SSSR:
@@ -594,6 +637,7 @@ cdef class Graph:
         
         if not polycyclicVertices:
             # no polycyclic vertices detected
+            cache['polycyclicRings'] = []
             return []
         else: 
             # polycyclic vertices found, merge cycles together
@@ -616,6 +660,7 @@ cdef class Graph:
                         
             # convert each set to a list
             continuousCycles = [list(cycle) for cycle in continuousCycles]
+            cache['polycyclicRings'] = copyRings(continuousCycles)
             return continuousCycles
     
     cpdef list getMonocyclicRings(self):
@@ -624,6 +669,11 @@ cdef class Graph:
         """
         cdef list polycyclicVertices, SSSR, monocyclicCycles, polycyclicSSSR
         cdef Vertex vertex
+        cdef dict cache
+
+        cache = self.getRingCache()
+        if 'monocyclicRings' in cache:
+            return copyRings(cache['monocyclicRings'])
         
         SSSR = self.getSmallestSetOfSmallestRings()
         if not SSSR:
@@ -634,6 +684,7 @@ cdef class Graph:
         if not polycyclicVertices:
             # No polycyclicVertices detected, all the rings from getSmallestSetOfSmallestRings
             # are monocyclic
+            cache['monocyclicRings'] = copyRings(SSSR)
             return SSSR
         
         polycyclicSSSR = []
@@ -647,6 +698,7 @@ cdef class Graph:
         monocyclicCycles = SSSR
         for cycle in polycyclicSSSR:
             monocyclicCycles.remove(cycle)
+        cache['monocyclicRings'] = copyRings(monocyclicCycles)
         return monocyclicCycles
     
     cpdef tuple getDisparateRings(self):
@@ -661,6 +713,11 @@ cdef class Graph:
         cdef set polycyclicCycle
         cdef Vertex vertex
         cdef list SSSR, vertices, polycyclicVertices, continuousCycles
+        cdef dict cache
+
+        cache = self.getRingCache()
+        if 'disparateRings' in cache:
+            return copyRings(cache['disparateRings'][0]), copyRings(cache['disparateRings'][1])
         
         SSSR = self.getSmallestSetOfSmallestRings()
         if not SSSR:
@@ -679,6 +736,7 @@ cdef class Graph:
         
         if not polycyclicVertices:
             # no polycyclic vertices detected
+            cache['disparateRings'] = (copyRings(SSSR), [])
             return SSSR, []
         else: 
             # polycyclic vertices found, merge cycles together and store them in continuousCycles list.
@@ -711,6 +769,7 @@ cdef class Graph:
             for cycle in polycyclicSSSR:
                 monocyclicCycles.remove(cycle)
                     
+            cache['disparateRings'] = (copyRings(monocyclicCycles), copyRings(continuousCycles))
             return monocyclicCycles, continuousCycles
        
        
@@ -740,6 +799,11 @@ cdef class Graph:
         cdef list cycleList, cycles, cycle, graphs, neighbors, verticesToRemove, vertices, cycleSetList
         cdef Vertex vertex, rootVertex
         cdef set set1, set2
+        cdef dict cache
+
+        cache = self.getRingCache()
+        if ('cyclesOfSize', size) in cache:
+            return copyRings(cache['cyclesOfSize', size])
 
         # Make a copy of the graph so we don't modify the original
         graph = self.copy(deep=True)
@@ -820,7 +884,9 @@ cdef class Graph:
             cycleList[i] = [self.vertices[vertices.index(v)] for v in cycleList[i]]
 
         #remove duplicates if there are more than 2 cycles:
-        if len(cycleList) <2 : return cycleList
+        if len(cycleList) <2 :
+            cache['cyclesOfSize', size] = copyRings(cycleList)
+            return cycleList
         cycleSetList = [set(cycleList[0])]
         for cycle1 in cycleList[1:]:
             set1 = set(cycle1)
@@ -833,6 +899,7 @@ cdef class Graph:
         #transform back to list of lists:
         cycleSetList = [list(set1) for set1 in cycleSetList]
 
+        cache['cyclesOfSize', size] = copyRings(cycleSetList)
         return cycleSetList
 
 
@@ -865,98 +932,167 @@ cdef class Graph:
 
     cpdef list getSmallestSetOfSmallestRings(self):
         """
-        Return a list of the smallest set of smallest rings in the graph. The
-        algorithm implements was adapted from a description by Fan, Panaye,
-        Doucet, and Barbu (doi: 10.1021/ci00015a002)
+        Return a list of the smallest set of smallest rings in the graph. Each
+        ring is a list of vertices in the order they are connected around the
+        ring. The result is cached on the graph until its vertices or edges
+        are changed.
 
-        B. T. Fan, A. Panaye, J. P. Doucet, and A. Barbu. "Ring Perception: A
-        New Algorithm for Directly Finding the Smallest Set of Smallest Rings
-        from a Connection Table." *J. Chem. Inf. Comput. Sci.* **33**,
-        p. 657-662 (1993).
-        """
-        cdef Graph graph
-        cdef bint done, found
-        cdef list cycleList, cycles, cycle, graphs, neighbors, verticesToRemove, vertices
-        cdef Vertex vertex, rootVertex
+        The rings are found as a minimum cycle basis using the method of
+        Horton. For each vertex and each edge, the candidate cycle formed by
+        the edge and the shortest paths from the vertex to its two ends is
+        generated. The candidates are then taken from shortest to longest and
+        kept if they are linearly independent (over GF(2), as sets of edges)
+        of the rings kept so far, until the basis is complete.
 
-        # Make a copy of the graph so we don't modify the original
-        graph = self.copy(deep=True)
-        vertices = graph.vertices[:]
-        
-        # Step 1: Remove all terminal vertices
-        done = False
-        while not done:
-            verticesToRemove = []
-            for vertex in graph.vertices:
-                if len(vertex.edges) == 1: verticesToRemove.append(vertex)
-            done = len(verticesToRemove) == 0
-            # Remove identified vertices from graph
-            for vertex in verticesToRemove:
-                graph.removeVertex(vertex)
-
-        # Step 2: Remove all other vertices that are not part of cycles
-        verticesToRemove = []
-        for vertex in graph.vertices:
-            found = graph.isVertexInCycle(vertex)
-            if not found:
-                verticesToRemove.append(vertex)
-        # Remove identified vertices from graph
-        for vertex in verticesToRemove:
-            graph.removeVertex(vertex)
+        J. D. Horton. "A Polynomial-Time Algorithm to Find the Shortest Cycle
+        Basis of a Graph." *SIAM J. Comput.* **16**, p. 358-366 (1987).
+        """
+        cdef dict cache
 
-        # Step 3: Split graph into remaining subgraphs
-        graphs = graph.split()
+        cache = self.getRingCache()
+        if 'SSSR' not in cache:
+            cache['SSSR'] = self._getSmallestSetOfSmallestRings()
+        return copyRings(cache['SSSR'])
 
-        # Step 4: Find ring sets in each subgraph
-        cycleList = []
-        for graph in graphs:
+    cdef list _getSmallestSetOfSmallestRings(self):
+        """
+        Compute the smallest set of smallest rings in the graph without using
+        the cache. See :meth:`getSmallestSetOfSmallestRings`.
+        """
+        cdef Vertex vertex, vertex2
+        cdef dict degrees, indices, edgeIndices, basis
+        cdef list vertices, verticesToRemove, adjacency, neighbors, edges1, edges2, distances, parents, branches
+        cdef list queue, ring, candidates, cycleList
+        cdef set core, seen
+        cdef int numVertices, numEdges, numRings, numComponents, root, head, i, j, k, e
+        cdef object bits, reduced, pivot
 
-            while len(graph.vertices) > 0:
+        # Step 1: Find the vertices in the 2-core of the graph by repeatedly
+        # removing vertices with fewer than two edges
+        degrees = {}
+        for vertex in self.vertices:
+            degrees[vertex] = len(vertex.edges)
+        verticesToRemove = [vertex for vertex in self.vertices if degrees[vertex] < 2]
+        core = set(self.vertices)
+        while verticesToRemove:
+            vertex = verticesToRemove.pop()
+            if vertex not in core:
+                continue
+            core.remove(vertex)
+            for vertex2 in vertex.edges:
+                if vertex2 in core:
+                    degrees[vertex2] -= 1
+                    if degrees[vertex2] < 2:
+                        verticesToRemove.append(vertex2)
+        if not core:
+            return []
 
-                # Choose root vertex as vertex with smallest number of edges
-                rootVertex = None
-                graph.updateConnectivityValues()
-                for vertex in graph.vertices:
-                    if rootVertex is None:
-                        rootVertex = vertex
-                    elif getVertexConnectivityValue(vertex) > getVertexConnectivityValue(rootVertex):
-                        rootVertex = vertex
+        # Step 2: Number the vertices and edges of the core and count its
+        # connected components, which gives the number of rings in the basis
+        vertices = [vertex for vertex in self.vertices if vertex in core]
+        numVertices = len(vertices)
+        indices = {}
+        for i in range(numVertices):
+            indices[vertices[i]] = i
+        adjacency = []
+        edges1 = []
+        edges2 = []
+        edgeIndices = {}
+        for i in range(numVertices):
+            neighbors = []
+            for vertex2 in (<Vertex>vertices[i]).edges:
+                if vertex2 in core:
+                    j = indices[vertex2]
+                    neighbors.append(j)
+                    if i < j:
+                        edgeIndices[i * numVertices + j] = len(edges1)
+                        edges1.append(i)
+                        edges2.append(j)
+            adjacency.append(neighbors)
+        numEdges = len(edges1)
+        numComponents = 0
+        distances = [-1] * numVertices
+        for root in range(numVertices):
+            if distances[root] >= 0:
+                continue
+            numComponents += 1
+            distances[root] = 0
+            queue = [root]
+            while queue:
+                i = queue.pop()
+                for j in adjacency[i]:
+                    if distances[j] < 0:
+                        distances[j] = 0
+                        queue.append(j)
+        numRings = numEdges - numVertices + numComponents
+        if numRings <= 0:
+            return []
 
-                # Get all cycles involving the root vertex
-                cycles = graph.getAllCycles(rootVertex)
-                if len(cycles) == 0:
-                    # This vertex is no longer in a ring, so remove it
-                    graph.removeVertex(rootVertex)
+        # Step 3: Generate the candidate cycles from a breadth-first shortest
+        # path tree rooted at each vertex. The tree paths to the two ends of an
+        # edge only meet at the root if they leave the root along different
+        # branches.
+        candidates = []
+        seen = set()
+        for root in range(numVertices):
+            distances = [-1] * numVertices
+            parents = [-1] * numVertices
+            branches = [-1] * numVertices
+            distances[root] = 0
+            queue = [root]
+            head = 0
+            while head < len(queue):
+                i = queue[head]
+                head += 1
+                for j in adjacency[i]:
+                    if distances[j] < 0:
+                        distances[j] = distances[i] + 1
+                        parents[j] = i
+                        branches[j] = j if i == root else branches[i]
+                        queue.append(j)
+            for e in range(numEdges):
+                i = edges1[e]
+                j = edges2[e]
+                if distances[i] < 0 or distances[i] + distances[j] < 2 or branches[i] == branches[j]:
                     continue
+                ring = []
+                k = i
+                while k != root:
+                    ring.append(k)
+                    k = parents[k]
+                ring.append(root)
+                ring.reverse()
+                k = j
+                while k != root:
+                    ring.append(k)
+                    k = parents[k]
+                bits = 0
+                for k in range(len(ring)):
+                    i = ring[k - 1]
+                    j = ring[k]
+                    bits |= (<object>1) << (edgeIndices[i * numVertices + j] if i < j else edgeIndices[j * numVertices + i])
+                if bits in seen:
+                    continue
+                seen.add(bits)
+                candidates.append((len(ring), len(candidates), bits, ring))
+        candidates.sort()
 
-                # Keep the smallest of the cycles found above
-                cycle = cycles[0]
-                for c in cycles[1:]:
-                    if len(c) < len(cycle):
-                        cycle = c
-                cycleList.append(cycle)
-                
-                # Remove the root vertex to create single edges, note this will not
-                # function properly if there is no vertex with 2 edges (i.e. cubane)
-                graph.removeVertex(rootVertex)
-
-                # Remove from the graph all vertices in the cycle that have only one edge
-                loneCarbon = True
-                while loneCarbon:
-                    loneCarbon = False
-                    verticesToRemove = []
-                    
-                    for vertex in cycle:
-                        if len(vertex.edges) == 1:
-                            loneCarbon = True
-                            verticesToRemove.append(vertex)
-                    else:
-                        for vertex in verticesToRemove:
-                            graph.removeVertex(vertex)
-
-        # Map atoms in cycles back to atoms in original graph
-        for i in range(len(cycleList)):
-            cycleList[i] = [self.vertices[vertices.index(v)] for v in cycleList[i]]
+        # Step 4: Keep the shortest candidates that are linearly independent of
+        # those already kept, reducing each against the current basis
+        basis = {}
+        cycleList = []
+        for candidate in candidates:
+            reduced = candidate[2]
+            while reduced:
+                pivot = reduced.bit_length() - 1
+                if pivot not in basis:
+                    break
+                reduced ^= basis[pivot]
+            if reduced:
+                basis[reduced.bit_length() - 1] = reduced
+                cycleList.append([vertices[k] for k in candidate[3]])
+                if len(cycleList) == numRings:
+                    break
 
         return cycleList
 
@@ -996,3 +1132,12 @@ cdef class Graph:
         # If we're here then the vertices and edges are equivalent, so the
         # mapping is valid
         return True
+
+################################################################################
+
+cdef list copyRings(list rings):
+    """
+    Return a copy of the list of `rings`, with each ring also copied, so that
+    cached rings are not modified by the caller.
+    """
+    return [ring[:] for ring in rings]
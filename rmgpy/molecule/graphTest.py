@@ -4,6 +4,7 @@
 import unittest
 
 from rmgpy.molecule.graph import Edge, Graph, Vertex 
+from rmgpy.molecule.vf2 import VF2
 
 ################################################################################
 
@@ -421,6 +422,43 @@ class TestGraph(unittest.TestCase):
         for mapping in mapList:
             self.assertTrue( graph1.isMappingValid(graph2,mapping) )
             self.assertTrue( graph1.isMappingValid(graph2,mapping) )
+
+    def test_orderedSubgraphIsomorphism(self):
+        """
+        Check that the VF2++-ordered matcher finds the same subgraph mappings
+        as the connectivity-ordered matcher, including for a disconnected
+        subgraph.
+        """
+        vertices1 = [Vertex() for i in range(7)]
+        graph1 = Graph()
+        for vertex in vertices1: graph1.addVertex(vertex)
+        for i, j in [(0,1), (1,2), (2,3), (3,4), (4,5), (5,0), (2,6)]:
+            graph1.addEdge(Edge(vertices1[i], vertices1[j]))
+
+        vertices2 = [Vertex() for i in range(5)]
+        graph2 = Graph()
+        for vertex in vertices2: graph2.addVertex(vertex)
+        for i, j in [(0,1), (1,2), (3,4)]:
+            graph2.addEdge(Edge(vertices2[i], vertices2[j]))
+
+        ordered = VF2(ordered=True).findSubgraphIsomorphisms(graph1, graph2, None)
+        self.assertTrue(len(ordered) > 0)
+        for mapping in ordered:
+            inverse = dict((vertex2, vertex1) for vertex1, vertex2 in mapping.items())
+            self.assertEqual(len(inverse), 5)
+            for i, j in [(0,1), (1,2), (3,4)]:
+                self.assertTrue(graph1.hasEdge(inverse[vertices2[i]], inverse[vertices2[j]]))
+
+        vertices3 = [Vertex() for i in range(3)]
+        graph3 = Graph()
+        for vertex in vertices3: graph3.addVertex(vertex)
+        for i, j in [(0,1), (1,2)]:
+            graph3.addEdge(Edge(vertices3[i], vertices3[j]))
+
+        ordered = VF2(ordered=True).findSubgraphIsomorphisms(graph1, graph3, None)
+        unordered = VF2(ordered=False).findSubgraphIsomorphisms(graph1, graph3, None)
+        self.assertEqual(len(ordered), len(unordered))
+        self.assertEqual(set(frozenset(m.items()) for m in ordered), set(frozenset(m.items()) for m in unordered))
     
     def test_pickle(self):
         """
@@ -557,6 +595,47 @@ class TestGraph(unittest.TestCase):
         self.assertEqual(len(cycleList), 1)
         self.assertEqual(len(cycleList[0]), 4)
 
+    def test_getSmallestSetOfSmallestRingsTetrahedron(self):
+        """
+        Test that all three rings of a complete graph of four vertices are
+        found, with each ring listed in the order of its edges.
+        """
+        vertices = [Vertex() for i in range(4)]
+        graph = Graph()
+        for vertex in vertices: graph.addVertex(vertex)
+        for i in range(4):
+            for j in range(i+1, 4):
+                graph.addEdge(Edge(vertices[i], vertices[j]))
+        cycleList = graph.getSmallestSetOfSmallestRings()
+        self.assertEqual(len(cycleList), 3)
+        for cycle in cycleList:
+            self.assertEqual(len(cycle), 3)
+            for i in range(len(cycle)):
+                self.assertTrue(graph.hasEdge(cycle[i-1], cycle[i]))
+
+    def test_ringCache(self):
+        """
+        Test that cached rings are returned as copies and are discarded when
+        the graph changes.
+        """
+        edge = Edge(self.graph.vertices[0], self.graph.vertices[5])
+        self.graph.addEdge(edge)
+        cycleList = self.graph.getSmallestSetOfSmallestRings()
+        self.assertEqual(len(cycleList), 1)
+        cycleList[0].pop()
+        self.assertEqual(len(self.graph.getSmallestSetOfSmallestRings()[0]), 6)
+        self.assertEqual(len(self.graph.getMonocyclicRings()), 1)
+
+        edge = Edge(self.graph.vertices[0], self.graph.vertices[3])
+        self.graph.addEdge(edge)
+        self.assertEqual(sorted([len(cycle) for cycle in self.graph.getSmallestSetOfSmallestRings()]), [4, 4])
+        self.assertEqual(len(self.graph.getMonocyclicRings()), 0)
+
+        # Changes made directly to the vertices are also detected
+        del self.graph.vertices[0].edges[self.graph.vertices[3]]
+        del self.graph.vertices[3].edges[self.graph.vertices[0]]
+        self.assertEqual(len(self.graph.getSmallestSetOfSmallestRings()), 1)
+
     def test_getPolycyclicRings(self):
         """
         Test that the Graph.getPolycyclicRings() method returns only polycyclic rings.
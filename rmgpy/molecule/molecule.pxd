@@ -121,6 +121,8 @@ cdef class Molecule(Graph):
     cdef public object rdMol
     cdef public int rdMolConfId
     cdef str _fingerprint
+    cdef dict _identifiers
+    cdef tuple _identifierState
     cdef public str InChI
     cdef public dict props
     
@@ -182,10 +184,16 @@ cdef class Molecule(Graph):
 
     cpdef fromSMILES(self, str smilesstr, backend=?)
 
-    cpdef fromAdjacencyList(self, str adjlist, bint saturateH=?)
+    cpdef fromAdjacencyList(self, str adjlist, bint saturateH=?, bint check=?)
 
     cpdef fromXYZ(self, numpy.ndarray atomicNums, numpy.ndarray coordinates)
     
+    cpdef tuple getIdentifierState(self)
+
+    cpdef str getIdentifier(self, str key, function)
+
+    cpdef clearIdentifiers(self)
+
     cpdef str toInChI(self)
 
     cpdef str toAugmentedInChI(self)
@@ -52,7 +52,7 @@ except:
 from rdkit import Chem
 from .graph import Vertex, Edge, Graph, getVertexConnectivityValue
 import rmgpy.molecule.group as gr
-from .atomtype import AtomType, atomTypes, getAtomType, AtomTypeError
+from .atomtype import AtomType, atomTypes, getAtomType, getAtomTypes, AtomTypeError
 import rmgpy.constants as constants
 import rmgpy.molecule.parser as parser
 import rmgpy.molecule.generator as generator
@@ -670,6 +670,8 @@ class Molecule(Graph):
         self.symmetryNumber = symmetry
         self.multiplicity = multiplicity
         self._fingerprint = None
+        self._identifiers = None
+        self._identifierState = None
         self.InChI = ''
         if SMILES != '': self.fromSMILES(SMILES)
         self.props = props or {}
@@ -727,6 +729,7 @@ class Molecule(Graph):
         Add an `atom` to the graph. The atom is initialized with no bonds.
         """
         self._fingerprint = None
+        self._identifiers = None
         return self.addVertex(atom)
     
     def addBond(self, bond):
@@ -735,6 +738,7 @@ class Molecule(Graph):
         and `atom2`.
         """
         self._fingerprint = None
+        self._identifiers = None
         return self.addEdge(bond)
 
     def getBonds(self, atom):
@@ -770,6 +774,7 @@ class Molecule(Graph):
         removal.
         """
         self._fingerprint = None
+        self._identifiers = None
         return self.removeVertex(atom)
 
     def removeBond(self, bond):
@@ -779,6 +784,7 @@ class Molecule(Graph):
         this removal.
         """
         self._fingerprint = None
+        self._identifiers = None
         return self.removeEdge(bond)
 
     def sortAtoms(self):
@@ -885,6 +891,11 @@ class Molecule(Graph):
         g = Graph.copy(self, deep)
         other = Molecule(g.vertices)
         other.multiplicity = self.multiplicity
+        if self._identifiers is not None:
+            # The identifiers only depend on the atoms and bonds, which the
+            # copy shares in the same order, so it can reuse them
+            other._identifiers = dict(self._identifiers)
+            other._identifierState = self._identifierState
         return other
 
     def merge(self, other):
@@ -981,13 +992,16 @@ class Molecule(Graph):
         to ensure they are correct (i.e. accurately describe their local bond
         environment) and complete (i.e. are as detailed as possible).
         """
-        for atom in self.vertices:
-            try:
-                atom.atomType = getAtomType(atom, atom.edges)
-            except AtomTypeError:
-                if logSpecies:
-                    logging.error("Could not update atomtypes for {0}.\n{1}".format(self, self.toAdjacencyList()))
-                raise
+        cython.declare(types=list, atom=Atom, index=cython.int)
+        try:
+            types = getAtomTypes(self.vertices)
+        except AtomTypeError:
+            if logSpecies:
+                logging.error("Could not update atomtypes for {0}.\n{1}".format(self, self.toAdjacencyList()))
+            raise
+        for index in range(len(types)):
+            atom = self.vertices[index]
+            atom.atomType = types[index]
             
     def updateMultiplicity(self):
         """
@@ -1268,24 +1282,27 @@ class Molecule(Graph):
         parser.fromSMARTS(self, smartsstr)
         return self
 
-    def fromAdjacencyList(self, adjlist, saturateH=False):
+    def fromAdjacencyList(self, adjlist, saturateH=False, check=True):
         """
         Convert a string adjacency list `adjlist` to a molecular structure.
         Skips the first line (assuming it's a label) unless `withLabel` is
-        ``False``.
+        ``False``. If `check` is ``False``, the adjacency list is trusted to
+        describe a valid molecule, and the valence and multiplicity checks
+        are skipped.
         """
         from .adjlist import fromAdjacencyList
         
-        self.vertices, self.multiplicity = fromAdjacencyList(adjlist, group=False, saturateH=saturateH)
+        self.vertices, self.multiplicity = fromAdjacencyList(adjlist, group=False, saturateH=saturateH, check=check)
         self.updateAtomTypes()
         
-        # Check if multiplicity is possible
-        n_rad = self.getRadicalCount() 
-        multiplicity = self.multiplicity
-        if not (n_rad + 1 == multiplicity or n_rad - 1 == multiplicity or n_rad - 3 == multiplicity or n_rad - 5 == multiplicity):
-            raise ValueError('Impossible multiplicity for molecule\n{0}\n multiplicity = {1} and number of unpaired electrons = {2}'.format(self.toAdjacencyList(),multiplicity,n_rad))
-        if self.getNetCharge() != 0:
-            raise ValueError('Non-neutral molecule encountered. Currently, RMG does not support ion chemistry.\n {0}'.format(adjlist))
+        if check:
+            # Check if multiplicity is possible
+            n_rad = self.getRadicalCount() 
+            multiplicity = self.multiplicity
+            if not (n_rad + 1 == multiplicity or n_rad - 1 == multiplicity or n_rad - 3 == multiplicity or n_rad - 5 == multiplicity):
+                raise ValueError('Impossible multiplicity for molecule\n{0}\n multiplicity = {1} and number of unpaired electrons = {2}'.format(self.toAdjacencyList(),multiplicity,n_rad))
+            if self.getNetCharge() != 0:
+                raise ValueError('Non-neutral molecule encountered. Currently, RMG does not support ion chemistry.\n {0}'.format(adjlist))
         return self
         
     def fromXYZ(self, atomicNums, coordinates):
@@ -1326,6 +1343,59 @@ class Molecule(Graph):
         newMol.updateAtomTypes()
         return newMol
 
+    def getIdentifierState(self):
+        """
+        Return a tuple describing the elements, electrons, and charges of the
+        atoms, the bonds between them, and the multiplicity of the molecule.
+        Identifiers generated from the molecule are cached together with this
+        tuple, and are regenerated if the molecule is later changed so that
+        the tuple no longer matches.
+        """
+        cython.declare(state=list, bonds=list, indices=dict, atom1=Atom, atom2=Atom, bond=Bond, index1=cython.int, index2=cython.int)
+        state = [self.multiplicity]
+        indices = {}
+        for index1, atom1 in enumerate(self.vertices):
+            indices[atom1] = index1
+            state.append((atom1.element.number, atom1.element.isotope, atom1.radicalElectrons, atom1.lonePairs, atom1.charge))
+        bonds = []
+        for atom1 in self.vertices:
+            index1 = indices[atom1]
+            for atom2, bond in atom1.edges.iteritems():
+                index2 = indices[atom2]
+                if index1 < index2:
+                    bonds.append((index1, index2, bond.order))
+        bonds.sort()
+        state.extend(bonds)
+        return tuple(state)
+
+    def getIdentifier(self, key, function):
+        """
+        Return the identifier of type `key` for the molecule, generating it
+        by calling `function` with the molecule if it has not been cached.
+        The cache is emptied first if the molecule has changed since the
+        cached identifiers were generated.
+        """
+        cython.declare(state=tuple)
+        state = self.getIdentifierState()
+        if self._identifiers is None or self._identifierState != state:
+            self._identifiers = {}
+            self._identifierState = state
+        try:
+            return self._identifiers[key]
+        except KeyError:
+            pass
+        identifier = function(self)
+        self._identifiers[key] = identifier
+        return identifier
+
+    def clearIdentifiers(self):
+        """
+        Remove the cached SMILES, InChI, and InChI key identifiers of the
+        molecule.
+        """
+        self._identifiers = None
+        self._identifierState = None
+
     def toInChI(self):
         """
         Convert a molecular structure to an InChI string. Uses
@@ -1337,7 +1407,7 @@ class Molecule(Graph):
         Convert a molecular structure to an InChI string. Uses
         `OpenBabel <http://openbabel.org/>`_ to perform the conversion.
         """
-        return generator.toInChI(self)            
+        return self.getIdentifier('InChI', generator.toInChI)
         
     def toAugmentedInChI(self):
         """
@@ -1346,7 +1416,7 @@ class Molecule(Graph):
         
         Separate layer with a forward slash character.
         """
-        return generator.toAugmentedInChI(self)
+        return self.getIdentifier('AugmentedInChI', generator.toAugmentedInChI)
         
     
     def toInChIKey(self):
@@ -1362,7 +1432,7 @@ class Molecule(Graph):
         Removes check-sum dash (-) and character so that only 
         the 14 + 9 characters remain.
         """
-        return generator.toInChIKey(self)
+        return self.getIdentifier('InChIKey', generator.toInChIKey)
     
     def toAugmentedInChIKey(self):
         """
@@ -1372,7 +1442,7 @@ class Molecule(Graph):
         Simply append the multiplicity string, do not separate by a
         character like forward slash.
         """
-        return generator.toAugmentedInChIKey(self)
+        return self.getIdentifier('AugmentedInChIKey', generator.toAugmentedInChIKey)
     
 
     def toSMARTS(self):
@@ -1398,7 +1468,7 @@ class Molecule(Graph):
         and removes Hydrogen atoms.
         """
         
-        return generator.toSMILES(self)
+        return self.getIdentifier('SMILES', generator.toSMILES)
 
     def toRDKitMol(self, *args, **kwargs):
         """
@@ -1186,6 +1186,31 @@ class TestMolecule(unittest.TestCase):
         
         self.assertEqual(mol.toAugmentedInChIKey(), 'VGGSQFUCUMXWEO-UHFFFAOYSA-u1,2')
 
+    def testIdentifierCache(self):
+        """
+        Test that identifiers are cached on the molecule and regenerated
+        after the molecule is changed.
+        """
+        mol = Molecule().fromSMILES('C=CC')
+        self.assertEqual(mol.toSMILES(), 'C=CC')
+        self.assertEqual(mol.getIdentifier('SMILES', None), 'C=CC')
+        inchi = mol.toInChI()
+        self.assertEqual(mol.copy(deep=True).getIdentifier('InChI', None), inchi)
+        # Changing the atoms and bonds directly invalidates the cache
+        for atom1 in mol.atoms:
+            for atom2, bond in atom1.bonds.iteritems():
+                if bond.isDouble(): break
+            else:
+                continue
+            break
+        bond.decrementOrder()
+        atom1.incrementRadical()
+        atom2.incrementRadical()
+        mol.updateMultiplicity()
+        self.assertNotEqual(mol.toInChI(), inchi)
+        mol.clearIdentifiers()
+        self.assertRaises(TypeError, mol.getIdentifier, 'SMILES', None)
+
     def testLinearMethane(self):
         """
         Test the Molecule.isLinear() method.
@@ -7,6 +7,12 @@ cpdef dict analyzeMolecule(Molecule mol)
 
 cpdef list generateResonanceStructures(Molecule mol)
 
+cpdef clearResonanceCache()
+
+cpdef long getStructureHash(Molecule mol)
+
+cpdef list _computeResonanceStructures(Molecule mol)
+
 cpdef list _generateResonanceStructures(list molList, list methodList, bint copy=?)
 
 cpdef list generateAdjacentResonanceStructures(Molecule mol)
@@ -56,6 +56,13 @@ from .molecule import Atom, Bond, Molecule
 from .atomtype import AtomTypeError
 import rmgpy.molecule.pathfinder as pathfinder
 
+# The resonance structures generated so far, stored as lists of molecules
+# keyed by the structure hash of the molecule they were generated from
+_resonanceCache = {}
+_resonanceCacheCount = 0
+# The maximum number of molecules whose resonance structures are cached
+maxResonanceCacheSize = 20000
+
 
 def populateResonanceAlgorithms(features=None):
     """
@@ -152,8 +159,89 @@ def generateResonanceStructures(mol):
     All are kept regardless of aromaticity because the radical is more likely to delocalize into the ring.
     - Stable polycyclic aromatic species: Clar structures are generated
     - Stable monocyclic aromatic species: Kekule structures are generated
+
+    The resonance structures of each molecule are cached by structure hash, so
+    that generating them again for an isomorphic molecule only costs a hash, an
+    isomorphism check and a copy of the cached structures. The first structure
+    returned is always `mol` itself. Molecules with labeled atoms are not
+    cached, since the labels of the cached structures would not match.
+    """
+    global _resonanceCacheCount
+    cython.declare(molList=list, entries=list, cached=list, structureHash=cython.long, atom=Atom, labeled=cython.bint)
+
+    labeled = False
+    for atom in mol.vertices:
+        if atom.label != '':
+            labeled = True
+            break
+    if labeled:
+        return _computeResonanceStructures(mol)
+
+    structureHash = getStructureHash(mol)
+    entries = _resonanceCache.get(structureHash)
+    if entries is not None:
+        for cached in entries:
+            if cached[0].isIsomorphic(mol):
+                return [mol] + [m.copy(deep=True) for m in cached[1:]]
+
+    molList = _computeResonanceStructures(mol)
+
+    if _resonanceCacheCount >= maxResonanceCacheSize:
+        _resonanceCache.clear()
+        _resonanceCacheCount = 0
+    _resonanceCache.setdefault(structureHash, []).append([m.copy(deep=True) for m in molList])
+    _resonanceCacheCount += 1
+
+    return molList
+
+def clearResonanceCache():
+    """
+    Remove all of the cached resonance structures.
+    """
+    global _resonanceCacheCount
+    _resonanceCache.clear()
+    _resonanceCacheCount = 0
+
+def getStructureHash(mol):
+    """
+    Return an integer hash of the structure of `mol` that does not depend on
+    the order of its atoms. Each atom is first labeled by its element,
+    radical electrons, lone pairs and charge. The labels are then refined by
+    combining each label with the labels and bond orders of the neighboring
+    atoms, until the number of distinct labels stops increasing.
+
+    Isomorphic molecules always have the same hash, so structures with
+    different hashes cannot be isomorphic. Structures with the same hash still
+    need a full isomorphism check.
     """
-    cython.declare(molList=list, newMolList=list, features=dict, methodList=list)
+    cython.declare(atoms=list, indices=dict, labels=list, neighbors=list, atom=Atom,
+                   index=cython.int, numLabels=cython.int, newNumLabels=cython.int)
+
+    atoms = mol.vertices
+    indices = {}
+    for index in range(len(atoms)):
+        indices[atoms[index]] = index
+    labels = [hash((atom.element.number, atom.radicalElectrons, atom.lonePairs, atom.charge)) for atom in atoms]
+    neighbors = [[(indices[atom2], bond.getOrderNum()) for atom2, bond in atom.edges.iteritems()] for atom in atoms]
+
+    numLabels = len(set(labels))
+    while True:
+        labels = [hash((labels[index], tuple(sorted([(labels[i], order) for i, order in neighbors[index]]))))
+                  for index in range(len(atoms))]
+        newNumLabels = len(set(labels))
+        if newNumLabels <= numLabels:
+            break
+        numLabels = newNumLabels
+
+    labels.sort()
+    return hash((mol.multiplicity, tuple(labels)))
+
+def _computeResonanceStructures(mol):
+    """
+    Generate and return all of the resonance structures for the input molecule
+    without using the cache. See :func:`generateResonanceStructures`.
+    """
+    cython.declare(molList=list, newMolList=list, features=dict, methodList=list, structureHash=cython.long)
 
     molList = [mol]
 
@@ -191,8 +279,9 @@ def generateResonanceStructures(mol):
                                                       generateOppositeKekuleStructure])
 
         # Check for isomorphism against the original molecule
+        structureHash = getStructureHash(mol)
         for newMol in newMolList:
-            if mol.isIsomorphic(newMol):
+            if getStructureHash(newMol) == structureHash and mol.isIsomorphic(newMol):
                 # There will be at most one isomorphic molecule, since the new molecules have
                 # already been checked against each other, so we can break after removing it
                 newMolList.remove(newMol)
@@ -216,12 +305,19 @@ def _generateResonanceStructures(molList, methodList, copy=False):
         copy         if False, append new resonance structures to input list (default)
                      if True, make a new list with all of the resonance structures
     """
-    cython.declare(index=cython.int, molecule=Molecule, newMolList=list, newMol=Molecule, mol=Molecule)
+    cython.declare(index=cython.int, molecule=Molecule, newMolList=list, newMol=Molecule, mol=Molecule,
+                   structures=dict, structureHash=cython.long)
 
     if copy:
         # Make a copy of the list so we don't modify the input list
         molList = molList[:]
 
+    # Group the structures by hash, so that each new structure only needs a
+    # full isomorphism check against the structures with the same hash
+    structures = {}
+    for mol in molList:
+        structures.setdefault(getStructureHash(mol), []).append(mol)
+
     # Iterate over resonance isomers
     index = 0
     while index < len(molList):
@@ -233,11 +329,13 @@ def _generateResonanceStructures(molList, methodList, copy=False):
 
         for newMol in newMolList:
             # Append to isomer list if unique
-            for mol in molList:
+            structureHash = getStructureHash(newMol)
+            for mol in structures.get(structureHash, []):
                 if mol.isIsomorphic(newMol):
                     break
             else:
                 molList.append(newMol)
+                structures.setdefault(structureHash, []).append(newMol)
 
         # Move to next resonance isomer
         index += 1
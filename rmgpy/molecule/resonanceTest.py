@@ -13,6 +13,28 @@ class ResonanceTest(unittest.TestCase):
         molList = generateResonanceStructures(Molecule(SMILES="C=C[CH]C=CC"))
         self.assertEqual(len(molList), 3)
 
+    def testStructureHash(self):
+        """Test that the structure hash is independent of atom order but distinguishes resonance structures"""
+        mol = Molecule(SMILES="C=C[CH]C=CC")
+        shuffled = mol.copy(deep=True)
+        shuffled.vertices.reverse()
+        self.assertEqual(getStructureHash(mol), getStructureHash(shuffled))
+        hashes = set([getStructureHash(m) for m in generateResonanceStructures(mol)])
+        self.assertEqual(len(hashes), 3)
+
+    def testResonanceCache(self):
+        """Test that cached resonance structures are returned as copies"""
+        clearResonanceCache()
+        molList1 = generateResonanceStructures(Molecule(SMILES="C=C[CH]C=CC"))
+        mol = Molecule(SMILES="CC=C[CH]C=C")
+        molList2 = generateResonanceStructures(mol)
+        self.assertEqual(len(molList2), 3)
+        self.assertTrue(molList2[0] is mol)
+        for mol2 in molList2[1:]:
+            self.assertTrue(any([mol1.isIsomorphic(mol2) for mol1 in molList1]))
+            self.assertFalse(any([mol1 is mol2 for mol1 in molList1]))
+        clearResonanceCache()
+
     def testOxime(self):
         """Test resonance structure generation for CC=N[O] radical
 
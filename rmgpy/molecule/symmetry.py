@@ -30,8 +30,92 @@ import rmgpy.molecule
 """
 This module provides functionality for estimating the symmetry number of a
 molecule from its chemical graph representation.
+
+The functional groups around an atom or bond are found directly from the
+atoms of the molecule, and only groups that could be isomorphic are built as
+separate molecules for an isomorphism check. Symmetry numbers are cached by
+the structure hash of the molecule, so that each structure is only analyzed
+once.
 """
 
+from .resonance import getStructureHash
+
+# The symmetry numbers calculated so far, stored as lists of (molecule,
+# symmetry number) pairs keyed by the structure hash of the molecule
+symmetryCache = {}
+symmetryCacheCount = 0
+# The maximum number of molecules whose symmetry numbers are cached
+maxSymmetryCacheSize = 20000
+
+################################################################################
+
+def getFragmentAtoms(atom, excluded):
+    """
+    Return the list of atoms that can be reached from `atom` without passing
+    through any of the atoms in the set `excluded`, including `atom` itself.
+    """
+    atoms = [atom]
+    seen = set(excluded)
+    seen.add(atom)
+    index = 0
+    while index < len(atoms):
+        for atom2 in atoms[index].edges:
+            if atom2 not in seen:
+                seen.add(atom2)
+                atoms.append(atom2)
+        index += 1
+    return atoms
+
+def getFragment(atoms):
+    """
+    Return a new :class:`Molecule` containing copies of the given `atoms` and
+    of the bonds between them. The fragment has the default multiplicity,
+    like the molecules returned by :meth:`Molecule.split()`.
+    """
+    mapping = {}
+    vertices = []
+    for atom in atoms:
+        atom2 = atom.copy()
+        atom2.edges = {}
+        mapping[atom] = atom2
+        vertices.append(atom2)
+    for atom in atoms:
+        for atom2, bond in atom.edges.iteritems():
+            if atom2 in mapping and atom2 not in mapping[atom].edges:
+                bond2 = bond.copy()
+                bond2.vertex1 = mapping[atom]
+                bond2.vertex2 = mapping[atom2]
+                mapping[atom].edges[mapping[atom2]] = bond2
+                mapping[atom2].edges[mapping[atom]] = bond2
+    return rmgpy.molecule.Molecule(atoms=vertices)
+
+def getFragmentKey(atoms):
+    """
+    Return a tuple summarizing the given `atoms` of a functional group. Two
+    groups with different keys cannot be isomorphic.
+    """
+    return (len(atoms), tuple(sorted([(atom.symbol, atom.radicalElectrons, atom.lonePairs, atom.charge) for atom in atoms])))
+
+def isFragmentIsomorphic(atoms1, atoms2, fragments):
+    """
+    Return ``True`` if the functional groups made up of `atoms1` and `atoms2`
+    are isomorphic, or ``False`` if not. The dictionary `fragments` is used to
+    store the fragment molecules built so far, keyed by the id of the atom
+    list.
+    """
+    if atoms1 is atoms2:
+        return True
+    if getFragmentKey(atoms1) != getFragmentKey(atoms2):
+        return False
+    if len(atoms1) == 1:
+        return atoms1[0].equivalent(atoms2[0])
+    for atoms in [atoms1, atoms2]:
+        if id(atoms) not in fragments:
+            fragments[id(atoms)] = getFragment(atoms)
+    return fragments[id(atoms1)].isIsomorphic(fragments[id(atoms2)])
+
+################################################################################
+
 def calculateAtomSymmetryNumber(molecule, atom):
     """
     Return the symmetry number centered at `atom` in the structure. The
@@ -51,23 +135,27 @@ def calculateAtomSymmetryNumber(molecule, atom):
     # If atom has zero or one neighbors, the symmetry number is 1
     if numNeighbors < 2: return symmetryNumber
 
-    # Create temporary structures for each functional group attached to atom
-    molecule0 = molecule
-    molecule = molecule0.copy(True)
-    atom = molecule.vertices[molecule0.vertices.index(atom)]
-    molecule.removeAtom(atom)
-    groups = molecule.split()
+    # Find the atoms of each functional group attached to atom
+    groups = []
+    for atom2 in atom.edges:
+        for group in groups:
+            if atom2 in group: break
+        else:
+            groups.append(getFragmentAtoms(atom2, set([atom])))
+    if sum([len(group) for group in groups]) + 1 != len(molecule.vertices) or atom.isNitrogen():
+        # Either the molecule has other fragments not attached to atom, or we
+        # need the functional groups as molecules for the nitro check below
+        molecule0 = molecule
+        molecule = molecule0.copy(True)
+        atom = molecule.vertices[molecule0.vertices.index(atom)]
+        molecule.removeAtom(atom)
+        groups = [group.atoms for group in molecule.split()]
 
     # Determine equivalence of functional groups around atom
-    groupIsomorphism = dict([(group, dict()) for group in groups])
+    fragments = {}
+    count = []
     for group1 in groups:
-        for group2 in groups:
-            if group1 is not group2 and group2 not in groupIsomorphism[group1]:
-                groupIsomorphism[group1][group2] = group1.isIsomorphic(group2)
-                groupIsomorphism[group2][group1] = groupIsomorphism[group1][group2]
-            elif group1 is group2:
-                groupIsomorphism[group1][group1] = True
-    count = [sum([int(groupIsomorphism[group1][group2]) for group2 in groups]) for group1 in groups]
+        count.append(sum([int(isFragmentIsomorphic(group1, group2, fragments)) for group2 in groups]))
     for i in range(count.count(2) / 2):
         count.remove(2)
     for i in range(count.count(3) / 3):
@@ -110,7 +198,7 @@ def calculateAtomSymmetryNumber(molecule, atom):
     
     if atom.isNitrogen():
         for groupN in groups:
-            if groupN.toSMILES() == "[N+](=O)[O-]":
+            if rmgpy.molecule.Molecule(atoms=groupN).toSMILES() == "[N+](=O)[O-]":
                 symmetryNumber *= 2
     
     return symmetryNumber
@@ -135,37 +223,38 @@ def calculateBondSymmetryNumber(molecule, atom1, atom2):
             elif len(molecule.vertices) == 2:
                 symmetryNumber = 2
             else:
-                molecule.removeBond(bond)
-                structure = molecule.copy(True)
-                molecule.addBond(bond)
-
-                atom1 = structure.atoms[molecule.atoms.index(atom1)]
-                atom2 = structure.atoms[molecule.atoms.index(atom2)]
-                fragments = structure.split()
-                
-                if len(fragments) != 2: return symmetryNumber
-
-                fragment1, fragment2 = fragments
-                if atom1 in fragment1.atoms: fragment1.removeAtom(atom1)
-                if atom2 in fragment1.atoms: fragment1.removeAtom(atom2)
-                if atom1 in fragment2.atoms: fragment2.removeAtom(atom1)
-                if atom2 in fragment2.atoms: fragment2.removeAtom(atom2)
-                groups1 = fragment1.split()
-                groups2 = fragment2.split()
-
-                # Test functional groups for symmetry
-                if len(groups1) == len(groups2) == 1:
-                    if groups1[0].isIsomorphic(groups2[0]): symmetryNumber *= 2
-                elif len(groups1) == len(groups2) == 2:
-                    if groups1[0].isIsomorphic(groups2[0]) and groups1[1].isIsomorphic(groups2[1]): symmetryNumber *= 2
-                    elif groups1[1].isIsomorphic(groups2[0]) and groups1[0].isIsomorphic(groups2[1]): symmetryNumber *= 2
-                elif len(groups1) == len(groups2) == 3:
-                    if groups1[0].isIsomorphic(groups2[0]) and groups1[1].isIsomorphic(groups2[1]) and groups1[2].isIsomorphic(groups2[2]): symmetryNumber *= 2
-                    elif groups1[0].isIsomorphic(groups2[0]) and groups1[1].isIsomorphic(groups2[2]) and groups1[2].isIsomorphic(groups2[1]): symmetryNumber *= 2
-                    elif groups1[0].isIsomorphic(groups2[1]) and groups1[1].isIsomorphic(groups2[2]) and groups1[2].isIsomorphic(groups2[0]): symmetryNumber *= 2
-                    elif groups1[0].isIsomorphic(groups2[1]) and groups1[1].isIsomorphic(groups2[0]) and groups1[2].isIsomorphic(groups2[2]): symmetryNumber *= 2
-                    elif groups1[0].isIsomorphic(groups2[2]) and groups1[1].isIsomorphic(groups2[0]) and groups1[2].isIsomorphic(groups2[1]): symmetryNumber *= 2
-                    elif groups1[0].isIsomorphic(groups2[2]) and groups1[1].isIsomorphic(groups2[1]) and groups1[2].isIsomorphic(groups2[0]): symmetryNumber *= 2
+                # Find the atoms on each side of the bond; if the two sides
+                # are connected, or do not make up the whole molecule, then
+                # the bond does not contribute to the symmetry
+                side1 = getFragmentAtoms(atom1, set([atom2]))
+                if atom2 in side1: return symmetryNumber
+                side2 = getFragmentAtoms(atom2, set([atom1]))
+                if len(side1) + len(side2) != len(molecule.vertices): return symmetryNumber
+
+                # Find the functional groups attached to each end of the bond
+                groups1 = []; groups2 = []
+                for atom, groups in [(atom1, groups1), (atom2, groups2)]:
+                    for atom3 in atom.edges:
+                        if atom3 is atom1 or atom3 is atom2: continue
+                        for group in groups:
+                            if atom3 in group: break
+                        else:
+                            groups.append(getFragmentAtoms(atom3, set([atom1, atom2])))
+
+                # Test functional groups for symmetry: each group on one end
+                # must be isomorphic to a different group on the other end
+                if len(groups1) == len(groups2) and 1 <= len(groups1) <= 3:
+                    fragments = {}
+                    unmatched = groups2[:]
+                    for group1 in groups1:
+                        for group2 in unmatched:
+                            if isFragmentIsomorphic(group1, group2, fragments):
+                                unmatched.remove(group2)
+                                break
+                        else:
+                            break
+                    else:
+                        symmetryNumber *= 2
                 
                 
     return symmetryNumber
@@ -432,20 +521,50 @@ def calculateSymmetryNumber(molecule):
     Return the symmetry number for the structure. The symmetry number
     includes both external and internal modes.
     """
+    global symmetryCacheCount
+
+    structureHash = getStructureHash(molecule)
+    for other, symmetryNumber in symmetryCache.get(structureHash, []):
+        if other.isIsomorphic(molecule):
+            return symmetryNumber
+
+    # Every atom and bond in a cycle is in at least one ring of the SSSR
+    cyclicAtoms = set()
+    cyclicBonds = set()
+    for ring in molecule.getSmallestSetOfSmallestRings():
+        cyclicAtoms.update(ring)
+        for i in range(len(ring)):
+            cyclicBonds.add(ring[i-1].edges[ring[i]])
+
     symmetryNumber = 1
 
     for atom in molecule.vertices:
-        if not molecule.isAtomInCycle(atom):
+        if atom not in cyclicAtoms:
             symmetryNumber *= calculateAtomSymmetryNumber(molecule, atom)
 
+    indices = dict([(atom, index) for index, atom in enumerate(molecule.vertices)])
     for atom1 in molecule.vertices:
-        for atom2 in atom1.edges:
-            if molecule.vertices.index(atom1) < molecule.vertices.index(atom2) and not molecule.isBondInCycle(atom1.edges[atom2]):
+        for atom2, bond in atom1.edges.iteritems():
+            if indices[atom1] < indices[atom2] and bond not in cyclicBonds:
                 symmetryNumber *= calculateBondSymmetryNumber(molecule, atom1, atom2)
 
     symmetryNumber *= calculateAxisSymmetryNumber(molecule)
 
-    if molecule.isCyclic():
+    if cyclicAtoms:
        symmetryNumber *= calculateCyclicSymmetryNumber(molecule)
 
+    if symmetryCacheCount >= maxSymmetryCacheSize:
+        symmetryCache.clear()
+        symmetryCacheCount = 0
+    symmetryCache.setdefault(structureHash, []).append((molecule.copy(deep=True), symmetryNumber))
+    symmetryCacheCount += 1
+
     return symmetryNumber
+
+def clearSymmetryCache():
+    """
+    Remove all of the cached symmetry numbers.
+    """
+    global symmetryCacheCount
+    symmetryCache.clear()
+    symmetryCacheCount = 0
@@ -5,7 +5,8 @@ import unittest
 from external.wip import work_in_progress
 
 from rmgpy.molecule.molecule import Molecule
-from rmgpy.molecule.symmetry import calculateAtomSymmetryNumber, calculateAxisSymmetryNumber, calculateBondSymmetryNumber, calculateCyclicSymmetryNumber
+from rmgpy.molecule.symmetry import calculateAtomSymmetryNumber, calculateAxisSymmetryNumber, calculateBondSymmetryNumber, calculateCyclicSymmetryNumber, clearSymmetryCache
+import rmgpy.molecule.symmetry
 from rmgpy.species import Species
 
 ################################################################################
@@ -383,6 +384,24 @@ class TestMoleculeSymmetry(unittest.TestCase):
         """
         self.assertEqual(Molecule().fromSMILES('C1=C=C=1').calculateSymmetryNumber(), 6)
     
+    def testSymmetryCache(self):
+        """
+        Test that symmetry numbers are reused for repeated and reordered
+        structures, and that clearSymmetryCache() empties the cache.
+        """
+        clearSymmetryCache()
+        molecule = Molecule().fromSMILES('CC(C)C')
+        self.assertEqual(molecule.calculateSymmetryNumber(), 81)
+        self.assertEqual(len(rmgpy.molecule.symmetry.symmetryCache), 1)
+        molecule.atoms.reverse()
+        self.assertEqual(molecule.calculateSymmetryNumber(), 81)
+        self.assertEqual(Molecule().fromSMILES('CC(C)C').calculateSymmetryNumber(), 81)
+        self.assertEqual(len(rmgpy.molecule.symmetry.symmetryCache), 1)
+        self.assertEqual(Molecule().fromSMILES('CCCC').calculateSymmetryNumber(), 18)
+        self.assertEqual(len(rmgpy.molecule.symmetry.symmetryCache), 2)
+        clearSymmetryCache()
+        self.assertEqual(len(rmgpy.molecule.symmetry.symmetryCache), 0)
+    
 ################################################################################
 
 if __name__ == '__main__':
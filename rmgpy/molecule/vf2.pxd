@@ -37,6 +37,13 @@ cdef class VF2:
     cdef bint isMatch
     cdef list mappingList
     
+    cdef public bint ordered
+    cdef list order
+    cdef list parents
+    cdef dict indices1
+    cdef dict knownPairs
+    cdef dict validPairs
+    
     cpdef bint isIsomorphic(self, Graph graph1, Graph graph2, dict initialMapping) except -2
         
     cpdef list findIsomorphism(self, Graph graph1, Graph graph2, dict initialMapping)
@@ -49,8 +56,12 @@ cdef class VF2:
 
     cdef bint match(self, int callDepth) except -2
         
+    cdef setOrder(self)
+    
     cdef bint feasible(self, Vertex vertex1, Vertex vertex2) except -2
     
+    cdef bint semanticMatch(self, Vertex vertex1, Vertex vertex2) except -2
+    
     cdef addToMapping(self, Vertex vertex1, Vertex vertex2)
         
     cdef removeFromMapping(self, Vertex vertex1, Vertex vertex2)
@@ -44,11 +44,24 @@ cdef class VF2:
     """
     An implementation of the second version of the Vento-Foggia (VF2) algorithm
     for graph and subgraph isomorphism.
+
+    If `ordered` is ``True`` (the default), the vertices of the query graph
+    in subgraph matching are matched in an order fixed before the search, in
+    the manner of VF2++: each next vertex is the one with the most neighbors
+    already in the order, breaking ties by degree. The candidates for a vertex
+    are then only the neighbors of the vertex its parent is mapped to, and
+    the result of the semantic check of each pair of vertices is kept in a
+    pair of bitsets per query vertex, so that it is evaluated at most once per
+    search. Otherwise, and always for full isomorphism (where the vertices are
+    already sorted by their connectivity values), the next vertex is the first
+    terminal of the second graph and all vertices of the first graph are tried
+    as candidates, as in the original VF2 algorithm.
     """
     
-    def __init__(self):
+    def __init__(self, ordered=True):
         self.graph1 = None
         self.graph2 = None
+        self.ordered = ordered
 
     cpdef bint isIsomorphic(self, Graph graph1, Graph graph2, dict initialMapping) except -2:
         """
@@ -146,8 +159,83 @@ cdef class VF2:
             for vertex1, vertex2 in self.initialMapping.items():
                 self.addToMapping(vertex1, vertex2)
             callDepth -= len(self.initialMapping)
+        
+        if self.ordered and self.subgraph:
+            self.indices1 = {}
+            for index1, vertex1 in enumerate(graph1.vertices):
+                self.indices1[vertex1] = index1
+            self.knownPairs = {}
+            self.validPairs = {}
+            self.setOrder()
             
         self.match(callDepth)
+        
+        # Release the references to the vertices
+        self.order = None
+        self.parents = None
+        self.indices1 = None
+        self.knownPairs = None
+        self.validPairs = None
+
+    cdef setOrder(self):
+        """
+        Set the order in which the unmapped vertices of the second graph are
+        matched, and the parent of each of them, i.e. a neighbor that is
+        earlier in the order or in the initial mapping, or ``None``. The next
+        vertex is chosen from those adjacent to the vertices placed so far,
+        which keeps the order connected. Ties are broken by degree and then by
+        the position in the (sorted) second graph, so the order is
+        reproducible.
+        """
+        cdef Vertex vertex, vertex2, best, parent
+        cdef dict numPlaced, keys
+        cdef tuple key, bestKey
+        cdef int index
+        
+        # The sort keys of the vertices that are not placed yet
+        keys = {}
+        for index, vertex in enumerate(self.graph2.vertices):
+            if vertex.mapping is None:
+                keys[vertex] = (len(vertex.edges), -index)
+        
+        # The number of placed neighbors of each unplaced vertex next to a placed one
+        numPlaced = {}
+        for vertex in self.graph2.vertices:
+            if vertex.mapping is not None:
+                for vertex2 in vertex.edges:
+                    if vertex2 in keys:
+                        numPlaced[vertex2] = numPlaced.get(vertex2, 0) + 1
+        
+        self.order = []
+        self.parents = []
+        while keys:
+            best = None
+            bestKey = None
+            if numPlaced:
+                for vertex2 in numPlaced:
+                    key = (numPlaced[vertex2], keys[vertex2])
+                    if best is None or key > bestKey:
+                        best = vertex2
+                        bestKey = key
+                del numPlaced[best]
+            else:
+                # Start a new connected component
+                for vertex2 in keys:
+                    key = keys[vertex2]
+                    if best is None or key > bestKey:
+                        best = vertex2
+                        bestKey = key
+            del keys[best]
+            parent = None
+            for vertex in best.edges:
+                if vertex not in keys:
+                    parent = vertex
+                    break
+            self.order.append(best)
+            self.parents.append(parent)
+            for vertex in best.edges:
+                if vertex in keys:
+                    numPlaced[vertex] = numPlaced.get(vertex, 0) + 1
 
     cdef bint match(self, int callDepth) except -2:
         """
@@ -155,9 +243,10 @@ cdef class VF2:
         are matched or the viable set of matches is exhausted. The `callDepth`
         parameter helps ensure we never enter an infinite loop.
         """
-        cdef Vertex vertex1, vertex2
+        cdef Vertex vertex1, vertex2, parent
         cdef dict mapping
         cdef bint hasTerminals
+        cdef int index
         
         # The call depth should never be negative!
         if callDepth < 0:
@@ -177,6 +266,23 @@ cdef class VF2:
             self.isMatch = True
             return True
 
+        if self.ordered and self.subgraph:
+            index = len(self.order) - callDepth
+            vertex2 = self.order[index]
+            parent = self.parents[index]
+            # The image of vertex2 must be a neighbor of the image of its parent
+            candidates = parent.mapping.edges if parent is not None else self.graph1.vertices
+            for vertex1 in candidates:
+                if vertex1.ignore or vertex1.mapping is not None:
+                    continue
+                if self.feasible(vertex1, vertex2):
+                    self.addToMapping(vertex1, vertex2)
+                    isMatch = self.match(callDepth-1)
+                    if isMatch and not self.findAll:
+                        return True
+                    self.removeFromMapping(vertex1, vertex2)
+            return False
+
         # Create list of pairs of candidates for inclusion in mapping
         hasTerminals = False
         for vertex2 in self.graph2.vertices:
@@ -228,7 +334,9 @@ cdef class VF2:
             if vertex1.connectivity3 != vertex2.connectivity3: return False
         
         # Semantic check #1: vertex1 and vertex2 must be equivalent
-        if self.subgraph:
+        if self.ordered and self.subgraph:
+            if not self.semanticMatch(vertex1, vertex2): return False
+        elif self.subgraph:
             if not vertex1.isSpecificCaseOf(vertex2): return False
         else:
             if not vertex1.equivalent(vertex2): return False
@@ -295,6 +403,29 @@ cdef class VF2:
         # All of our tests have been passed, so the two vertices are a feasible pair
         return True
     
+    cdef bint semanticMatch(self, Vertex vertex1, Vertex vertex2) except -2:
+        """
+        Return ``True`` if vertex `vertex1` is equivalent to (or, for subgraph
+        matching, a specific case of) vertex `vertex2`. The bits of the index
+        of `vertex1` in the known and valid bitsets of `vertex2` record
+        whether the pair has been checked and with what result.
+        """
+        cdef object bit, known
+        cdef bint result
+        
+        bit = (<object>1) << self.indices1[vertex1]
+        known = self.knownPairs.get(vertex2, 0)
+        if known & bit:
+            return (self.validPairs.get(vertex2, 0) & bit) != 0
+        if self.subgraph:
+            result = vertex1.isSpecificCaseOf(vertex2)
+        else:
+            result = vertex1.equivalent(vertex2)
+        self.knownPairs[vertex2] = known | bit
+        if result:
+            self.validPairs[vertex2] = self.validPairs.get(vertex2, 0) | bit
+        return result
+
     cdef addToMapping(self, Vertex vertex1, Vertex vertex2):
         """
         Add as valid a mapping of vertex `vertex1` from the first graph to
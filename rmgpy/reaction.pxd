@@ -71,19 +71,19 @@ cdef class Reaction:
 
     cpdef double getEquilibriumConstant(self, double T, str type=?)
 
-    cpdef numpy.ndarray getEnthalpiesOfReaction(self, numpy.ndarray Tlist)
+    cpdef numpy.ndarray getEnthalpiesOfReaction(self, Tlist)
 
-    cpdef numpy.ndarray getEntropiesOfReaction(self, numpy.ndarray Tlist)
+    cpdef numpy.ndarray getEntropiesOfReaction(self, Tlist)
 
-    cpdef numpy.ndarray getFreeEnergiesOfReaction(self, numpy.ndarray Tlist)
+    cpdef numpy.ndarray getFreeEnergiesOfReaction(self, Tlist)
 
-    cpdef numpy.ndarray getEquilibriumConstants(self, numpy.ndarray Tlist, str type=?)
+    cpdef numpy.ndarray getEquilibriumConstants(self, Tlist, str type=?)
 
     cpdef int getStoichiometricCoefficient(self, Species spec)
 
     cpdef double getRateCoefficient(self, double T, double P=?)
 
-    cpdef fixBarrierHeight(self, bint forcePositive=?)
+    cpdef fixBarrierHeight(self, bint forcePositive=?, H298=?, H0=?)
 
     cpdef reverseThisArrheniusRate(self, Arrhenius kForward, str reverseUnits)
 
@@ -587,21 +587,50 @@ class Reaction:
         Return the enthalpies of reaction in J/mol evaluated at temperatures
         `Tlist` in K.
         """
-        return numpy.array([self.getEnthalpyOfReaction(T) for T in Tlist], numpy.float64)
+        cython.declare(dHrxn=numpy.ndarray, reactant=Species, product=Species)
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        dHrxn = numpy.zeros(len(Tlist), numpy.float64)
+        for reactant in self.reactants:
+            dHrxn -= reactant.getEnthalpies(Tlist)
+        for product in self.products:
+            dHrxn += product.getEnthalpies(Tlist)
+        return dHrxn
 
     def getEntropiesOfReaction(self, Tlist):
         """
         Return the entropies of reaction in J/mol*K evaluated at temperatures
         `Tlist` in K.
         """
-        return numpy.array([self.getEntropyOfReaction(T) for T in Tlist], numpy.float64)
+        cython.declare(dSrxn=numpy.ndarray, reactant=Species, product=Species)
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        dSrxn = numpy.zeros(len(Tlist), numpy.float64)
+        for reactant in self.reactants:
+            dSrxn -= reactant.getEntropies(Tlist)
+        for product in self.products:
+            dSrxn += product.getEntropies(Tlist)
+        return dSrxn
 
     def getFreeEnergiesOfReaction(self, Tlist):
         """
         Return the Gibbs free energies of reaction in J/mol evaluated at
         temperatures `Tlist` in K.
         """
-        return numpy.array([self.getFreeEnergyOfReaction(T) for T in Tlist], numpy.float64)
+        cython.declare(dGrxn=numpy.ndarray, reactant=Species, product=Species)
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        dGrxn = numpy.zeros(len(Tlist), numpy.float64)
+        for reactant in self.reactants:
+            try:
+                dGrxn -= reactant.getFreeEnergies(Tlist)
+            except Exception as e:
+                logging.error("Problem with reactant {!r} in reaction {!s}".format(reactant, self))
+                raise
+        for product in self.products:
+            try:
+                dGrxn += product.getFreeEnergies(Tlist)
+            except Exception as e:
+                logging.error("Problem with product {!r} in reaction {!s}".format(product, self))
+                raise
+        return dGrxn
 
     def getEquilibriumConstants(self, Tlist, type='Kc'):
         """
@@ -611,7 +640,25 @@ class Reaction:
         ``Kc`` for concentrations (default), or ``Kp`` for pressures. Note that
         this function currently assumes an ideal gas mixture.
         """
-        return numpy.array([self.getEquilibriumConstant(T, type) for T in Tlist], numpy.float64)
+        cython.declare(dGrxn=numpy.ndarray, K=numpy.ndarray, C0=numpy.ndarray, P0=cython.double)
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        # Use free energy of reaction to calculate Ka
+        dGrxn = self.getFreeEnergiesOfReaction(Tlist)
+        K = numpy.exp(-dGrxn / constants.R / Tlist)
+        # Convert Ka to Kc or Kp if specified
+        P0 = 1e5
+        if type == 'Kc':
+            # Convert from Ka to Kc; C0 is the reference concentration
+            C0 = P0 / constants.R / Tlist
+            K *= C0 ** (len(self.products) - len(self.reactants))
+        elif type == 'Kp':
+            # Convert from Ka to Kp; P0 is the reference pressure
+            K *= P0 ** (len(self.products) - len(self.reactants))
+        elif type != 'Ka' and type != '':
+            raise ReactionError('Invalid type "%s" passed to Reaction.getEquilibriumConstants(); should be "Ka", "Kc", or "Kp".')
+        if numpy.any(K == 0):
+            raise ReactionError('Got equilibrium constant of 0')
+        return K
 
     def getStoichiometricCoefficient(self, spec):
         """
@@ -672,7 +719,7 @@ class Reaction:
              "diffusion factor {0.2g} evaluated at {1} K.").format(
                 diffusionFactor, T))
 
-    def fixBarrierHeight(self, forcePositive=False):
+    def fixBarrierHeight(self, forcePositive=False, H298=None, H0=None):
         """
         Turns the kinetics into Arrhenius (if they were ArrheniusEP)
         and ensures the activation energy is at least the endothermicity
@@ -680,12 +727,17 @@ class Reaction:
         of using Evans Polanyi with an exothermic reaction.
         If `forcePositive` is True, then all reactions
         are forced to have a non-negative barrier.
+        The enthalpy of reaction at 298 K `H298` and the difference in
+        ground-state energies `H0`, both in J/mol, are computed from the
+        species thermo unless they are given.
         """
-        cython.declare(H0=cython.double, H298=cython.double, Ea=cython.double)
+        cython.declare(Ea=cython.double)
 
-        H298 = self.getEnthalpyOfReaction(298)
-        H0 = sum([spec.getThermoData().E0.value_si for spec in self.products]) \
-            - sum([spec.getThermoData().E0.value_si for spec in self.reactants])
+        if H298 is None:
+            H298 = self.getEnthalpyOfReaction(298)
+        if H0 is None:
+            H0 = sum([spec.getThermoData().E0.value_si for spec in self.products]) \
+                - sum([spec.getThermoData().E0.value_si for spec in self.reactants])
         if isinstance(self.kinetics, ArrheniusEP):
             Ea = self.kinetics.E0.value_si # temporarily using Ea to store the intrinsic barrier height E0
             self.kinetics = self.kinetics.toArrhenius(H298)
@@ -712,14 +764,12 @@ class Reaction:
         The equilibrium constant is evaluated from the current reaction instance (self).
         """
         cython.declare(kf=Arrhenius, kr=Arrhenius)
-        cython.declare(Tlist=numpy.ndarray, klist=numpy.ndarray, i=cython.int)
+        cython.declare(Tlist=numpy.ndarray, klist=numpy.ndarray)
         kf = kForward
         assert isinstance(kf, Arrhenius), "Only reverses Arrhenius rates"
         Tlist = 1.0 / numpy.arange(0.0005, 0.0034, 0.0001)  # 294 K to 2000 K
         # Determine the values of the reverse rate coefficient k_r(T) at each temperature
-        klist = numpy.zeros_like(Tlist)
-        for i in range(len(Tlist)):
-            klist[i] = kf.getRateCoefficient(Tlist[i]) / self.getEquilibriumConstant(Tlist[i])
+        klist = kf.getRateCoefficients(Tlist) / self.getEquilibriumConstants(Tlist)
         kr = Arrhenius()
         kr.fitToData(Tlist, klist, reverseUnits, kf.T0.value_si)
         return kr
@@ -731,8 +781,8 @@ class Reaction:
         (but not necessarily all) kinetics types.
         """
         cython.declare(Tlist=numpy.ndarray, Plist=numpy.ndarray, K=numpy.ndarray,
-                       rxn=Reaction, klist=numpy.ndarray, i=cython.size_t,
-                       Tindex=cython.size_t, Pindex=cython.size_t)
+                       Keq=numpy.ndarray, rxn=Reaction, klist=numpy.ndarray,
+                       Pindex=cython.size_t)
 
         supported_types = (
                             KineticsData.__name__,
@@ -753,9 +803,7 @@ class Reaction:
         if isinstance(kf, KineticsData):
             
             Tlist = kf.Tdata.value_si
-            klist = numpy.zeros_like(Tlist)
-            for i in range(len(Tlist)):
-                klist[i] = kf.getRateCoefficient(Tlist[i]) / self.getEquilibriumConstant(Tlist[i])
+            klist = kf.getRateCoefficients(Tlist) / self.getEquilibriumConstants(Tlist)
             
             kr = KineticsData(Tdata=(Tlist,"K"), kdata=(klist,kunits), Tmin=(numpy.min(Tlist),"K"), Tmax=(numpy.max(Tlist),"K"))
             return kr
@@ -767,9 +815,9 @@ class Reaction:
             Tlist = 1.0/numpy.linspace(1.0/kf.Tmax.value, 1.0/kf.Tmin.value, 50)
             Plist = numpy.linspace(kf.Pmin.value, kf.Pmax.value, 20)
             K = numpy.zeros((len(Tlist), len(Plist)), numpy.float64)
-            for Tindex, T in enumerate(Tlist):
-                for Pindex, P in enumerate(Plist):
-                    K[Tindex, Pindex] = kf.getRateCoefficient(T, P) / self.getEquilibriumConstant(T)
+            Keq = self.getEquilibriumConstants(Tlist)
+            for Pindex, P in enumerate(Plist):
+                K[:, Pindex] = kf.getRateCoefficients(Tlist, P) / Keq
             kr = Chebyshev()
             kr.fitToData(Tlist, Plist, K, kunits, kf.degreeT, kf.degreeP, kf.Tmin.value, kf.Tmax.value, kf.Pmin.value, kf.Pmax.value)
             return kr
@@ -781,9 +829,9 @@ class Reaction:
                 Tlist = 1.0/numpy.arange(0.0005, 0.0035, 0.0001)
             Plist = kf.pressures.value_si
             K = numpy.zeros((len(Tlist), len(Plist)), numpy.float64)
-            for Tindex, T in enumerate(Tlist):
-                for Pindex, P in enumerate(Plist):
-                    K[Tindex, Pindex] = kf.getRateCoefficient(T, P) / self.getEquilibriumConstant(T)
+            Keq = self.getEquilibriumConstants(Tlist)
+            for Pindex, P in enumerate(Plist):
+                K[:, Pindex] = kf.getRateCoefficients(Tlist, P) / Keq
             kr = PDepArrhenius()
             kr.fitToData(Tlist, Plist, K, kunits, kf.arrhenius[0].T0.value)
             return kr       
@@ -341,6 +341,22 @@ class TestReaction(unittest.TestCase):
         for i in range(len(Tlist)):
             self.assertAlmostEqual(Glist[i] / 1000., Glist0[i] / 1000., 2)
 
+    def testThermoOfReactionFromList(self):
+        """
+        Test that the Reaction.get*OfReaction() methods also accept a list of
+        integer temperatures.
+        """
+        Tlist = range(200, 2001, 200)
+        Hlist = self.reaction2.getEnthalpiesOfReaction(Tlist)
+        Slist = self.reaction2.getEntropiesOfReaction(Tlist)
+        Glist = self.reaction2.getFreeEnergiesOfReaction(Tlist)
+        Kclist = self.reaction2.getEquilibriumConstants(Tlist)
+        for i, T in enumerate(Tlist):
+            self.assertAlmostEqual(Hlist[i] / 1000., self.reaction2.getEnthalpyOfReaction(T) / 1000., 2)
+            self.assertAlmostEqual(Slist[i], self.reaction2.getEntropyOfReaction(T), 2)
+            self.assertAlmostEqual(Glist[i] / 1000., self.reaction2.getFreeEnergyOfReaction(T) / 1000., 2)
+            self.assertAlmostEqual(Kclist[i] / self.reaction2.getEquilibriumConstant(T), 1.0, 4)
+
     def testEquilibriumConstantKa(self):
         """
         Test the Reaction.getEquilibriumConstant() method.
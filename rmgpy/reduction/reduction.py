@@ -409,11 +409,13 @@ class ConcentrationListener(object):
 
 def process(data):
     """
-    The data is structured as a list of lists.
+    The data is structured as a sequence of rows, e.g. the
+    :class:`ProfileRecorder` of a reaction system.
 
-    Each list contains [time, Volume, [species mole fractions]]
+    Each row contains [time, Volume, [species mole fractions]]
 
-    The volume is cut out of each list, the remaining part is stored as a tuple.
+    The volume is cut out of each row, the remaining part is stored as a tuple.
+    The mole fractions are views into the recorded rows and are not copied.
     """
     processed = []
 
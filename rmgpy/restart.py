@@ -70,6 +70,9 @@ def saveRestartFile(path, rmg, delay=0):
     if rmg.filterReactions:
         rmg_restart.unimolecularThreshold = rmg.unimolecularThreshold
         rmg_restart.bimolecularThreshold = rmg.bimolecularThreshold
+    # Keep the fitted states data so they are not fitted again on restart
+    if rmg.database and rmg.database.statmech:
+        rmg_restart.statmechCache = rmg.database.statmech.getStatmechCache()
     
     f = open(path, 'wb')
     cPickle.dump(rmg_restart, f, cPickle.HIGHEST_PROTOCOL)
@@ -62,6 +62,8 @@ def database(
              kineticsFamilies = 'default',
              kineticsDepositories = 'default',
              kineticsEstimator = 'rate rules',
+             snapshotDirectory = None,
+             lazyKinetics = False,
              ):
     # This function just stores the information about the database to be loaded
     # We don't actually load the database until after we're finished reading
@@ -78,6 +80,8 @@ def database(
     rmg.seedMechanisms = seedMechanisms or []
     rmg.statmechLibraries = frequenciesLibraries or []
     rmg.kineticsEstimator = kineticsEstimator
+    rmg.databaseSnapshotDirectory = snapshotDirectory
+    rmg.lazyKinetics = lazyKinetics
     if kineticsDepositories == 'default':
         rmg.kineticsDepositories = ['training']
     elif kineticsDepositories == 'all':
@@ -493,6 +497,10 @@ def saveInputFile(path, rmg):
     f.write('    kineticsDepositories = {0!r},\n'.format(rmg.kineticsDepositories))
     f.write('    kineticsFamilies = {0!r},\n'.format(rmg.kineticsFamilies))
     f.write('    kineticsEstimator = {0!r},\n'.format(rmg.kineticsEstimator))
+    if rmg.databaseSnapshotDirectory:
+        f.write('    snapshotDirectory = {0!r},\n'.format(rmg.databaseSnapshotDirectory))
+    if rmg.lazyKinetics:
+        f.write('    lazyKinetics = {0!r},\n'.format(rmg.lazyKinetics))
     f.write(')\n\n')
 
     # Species
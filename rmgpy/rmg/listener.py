@@ -42,6 +42,9 @@ class SimulationProfileWriter(object):
         Writes to a csv file:
             - header row with species names
             - each row with mole fractions of the core species in the given reaction system.
+
+        The same rows are also saved in binary form to a .npy file of the same
+        name, which downstream tools can memory-map without parsing the csv.
         """
 
         filename = os.path.join(
@@ -63,7 +66,9 @@ class SimulationProfileWriter(object):
             worksheet.writerow(header) 
 
             # add mole fractions:
-            worksheet.writerows(reactionSystem.snapshots)
+            worksheet.writerows(reactionSystem.snapshots.data.tolist())
+
+        reactionSystem.snapshots.save(os.path.splitext(filename)[0] + '.npy')
             
 
 class SimulationProfilePlotter(object):
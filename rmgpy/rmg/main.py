@@ -41,13 +41,12 @@ import shutil
 import numpy
 import csv
 import gc
-import copy
 
 from rmgpy.constraints import failsSpeciesConstraints
 from rmgpy.molecule import Molecule
 from rmgpy.solver.base import TerminationTime, TerminationConversion
 from rmgpy.solver.simple import SimpleReactor
-from rmgpy.data.rmg import RMGDatabase
+from rmgpy.data.rmg import RMGDatabase, getSnapshotKey
 from rmgpy.data.base import ForbiddenStructureException, DatabaseError
 from rmgpy.data.kinetics.library import KineticsLibrary, LibraryReaction
 from rmgpy.data.kinetics.family import KineticsFamily, TemplateReaction
@@ -65,6 +64,7 @@ from rmgpy.restart import RestartWriter
 from rmgpy.qm.main import QMDatabaseWriter
 from rmgpy.stats import ExecutionStatsWriter
 from rmgpy.thermo.thermoengine import submit
+from rmgpy.scoop_framework.util import setExecutor, shutdownExecutor
 from rmgpy.tools.sensitivity import plotSensitivity
 try:
     from cantera import ck2cti
@@ -92,6 +92,8 @@ class RMG(util.Subject):
     `kineticsFamilies`                  The kinetics families to use for reaction generation
     `kineticsDepositories`              The kinetics depositories to use for looking up kinetics in each family
     `kineticsEstimator`                 The method to use to estimate kinetics: 'group additivity' or 'rate rules'
+    `databaseSnapshotDirectory`         The directory in which to cache binary snapshots of the loaded database, or ``None`` for no caching
+    `lazyKinetics`                      ``True`` to load and process the rate rules of each kinetics family on first use, ``False`` otherwise
     `solvent`                           If solvation estimates are required, the name of the solvent.
     ----------------------------------- ------------------------------------------------
     `reactionModel`                     The core-edge reaction model generated by this job
@@ -156,6 +158,9 @@ class RMG(util.Subject):
         self.kineticsFamilies = None
         self.kineticsDepositories = None
         self.kineticsEstimator = 'group additivity'
+        self.databaseSnapshotDirectory = None
+        self.databaseSnapshot = None
+        self.lazyKinetics = False
         self.solvent = None
         self.diffusionLimiter = None
 
@@ -295,9 +300,7 @@ class RMG(util.Subject):
 
     def loadDatabase(self):
 
-        self.database = RMGDatabase()
-        self.database.load(
-            path = self.databaseDirectory,
+        loadArguments = dict(
             thermoLibraries = self.thermoLibraries,
             transportLibraries = self.transportLibraries,
             reactionLibraries = [library for library, option in self.reactionLibraries],
@@ -306,8 +309,27 @@ class RMG(util.Subject):
             kineticsDepositories = self.kineticsDepositories,
             #frequenciesLibraries = self.statmechLibraries,
             depository = False, # Don't bother loading the depository information, as we don't use it
+            # Writing the kinetics datastore requires the rate rules of every family
+            lazyKinetics = bool(self.lazyKinetics) and not self.kineticsdatastore,
         )
 
+        # The snapshot stores the processed rate rules, so it depends on how they are processed as well
+        # Writing the kinetics datastore requires the intermediate rules, so the snapshot is not used then
+        self.databaseSnapshot = None
+        if self.databaseSnapshotDirectory and not self.kineticsdatastore:
+            key = getSnapshotKey(self.databaseDirectory, kineticsEstimator=self.kineticsEstimator,
+                                 verboseComments=self.verboseComments, **loadArguments)
+            self.databaseSnapshot = os.path.join(self.databaseSnapshotDirectory, 'database_{0}.pkl'.format(key))
+
+        self.database = RMGDatabase()
+        if self.databaseSnapshot and os.path.exists(self.databaseSnapshot):
+            logging.info('Loading database snapshot {0}...'.format(self.databaseSnapshot))
+            self.database.loadSnapshot(self.databaseSnapshot)
+            snapshotLoaded = True
+        else:
+            self.database.load(path = self.databaseDirectory, **loadArguments)
+            snapshotLoaded = False
+
         #check libraries
         self.checkLibraries()
 
@@ -316,14 +338,24 @@ class RMG(util.Subject):
             global solvent
             solvent=self.solvent
 
-        if self.kineticsEstimator == 'rate rules':
+        if snapshotLoaded:
+            return
+
+        if self.kineticsEstimator == 'rate rules' and loadArguments['lazyKinetics']:
+            # The rate rules of each family are processed when they are first loaded
+            logging.info('Deferring the processing of rate rules in kinetics families until they are first used...')
+            for family in self.database.kinetics.families.values():
+                if '!training' not in self.kineticsDepositories:
+                    family.deferKineticsDataStep('addKineticsRulesFromTrainingSet', thermoDatabase=self.database.thermo,
+                                                 ignoreSpeciesConstraints=True)
+                family.deferKineticsDataStep('fillKineticsRulesByAveragingUp', verbose=self.verboseComments)
+        elif self.kineticsEstimator == 'rate rules':
             if '!training' not in self.kineticsDepositories:
                 logging.info('Adding rate rules from training set in kinetics families...')
-                # Temporarily remove species constraints for the training reactions
-                copySpeciesConstraints=copy.copy(self.speciesConstraints)
-                self.speciesConstraints={}
+                # The species constraints do not apply to the training reactions
                 for family in self.database.kinetics.families.values():
-                    family.addKineticsRulesFromTrainingSet(thermoDatabase=self.database.thermo)
+                    family.addKineticsRulesFromTrainingSet(thermoDatabase=self.database.thermo,
+                                                           ignoreSpeciesConstraints=True)
 
                     #If requested by the user, write a text file for each kinetics family detailing the source of each entry
                     if self.kineticsdatastore:
@@ -337,13 +369,20 @@ class RMG(util.Subject):
                                 f.write('\n')
                             f.write('\n')
 
-                self.speciesConstraints=copySpeciesConstraints
             else:
                 logging.info('Training set explicitly not added to rate rules in kinetics families...')
             logging.info('Filling in rate rules in kinetics families by averaging...')
             for family in self.database.kinetics.families.values():
                 family.fillKineticsRulesByAveragingUp(verbose=self.verboseComments)
 
+        if self.databaseSnapshot:
+            logging.info('Saving database snapshot {0}...'.format(self.databaseSnapshot))
+            try:
+                self.database.saveSnapshot(self.databaseSnapshot)
+            except Exception as e:
+                logging.warning('Could not save database snapshot: {0}'.format(e))
+                self.databaseSnapshot = None
+
     def initialize(self, **kwargs):
         """
         Initialize an RMG job using the command-line arguments `args` as returned
@@ -404,6 +443,15 @@ class RMG(util.Subject):
             diffusionLimiter.enable(Species.solventData, self.database.solvation)
             logging.info("Setting solvent data for {0}".format(self.solvent))
 
+        # Start the native pool used for thermo estimates; QM workers mostly
+        # wait on external programs, so they are run as threads
+        try:
+            nprocs = kwargs['nprocs']
+        except KeyError:
+            nprocs = 1
+        if nprocs > 1:
+            setExecutor(nprocs, kind='thread' if self.quantumMechanics else 'process')
+
         data = self.wallTime.split(':')
         self.wallTime = int(data[-1]) + 60 * int(data[-2]) + 3600 * int(data[-3]) + 86400 * int(data[-4])
         if not len(data) == 4:
@@ -733,6 +781,14 @@ class RMG(util.Subject):
         logging.info('The final model core has %s species and %s reactions' % (coreSpec, coreReac))
         logging.info('The final model edge has %s species and %s reactions' % (edgeSpec, edgeReac))
 
+        for family in self.database.kinetics.families.values():
+            # Use the instance dictionary to avoid loading the rules of lazily loaded families
+            rules = family.__dict__.get('rules')
+            hitRate = rules.getEstimateCacheHitRate() if rules is not None else None
+            if hitRate is not None:
+                logging.info('Rate rule estimate cache hit rate for family {0}: {1:.1%} of {2:d} estimates'.format(
+                    family.label, hitRate, rules.estimateCacheHits + rules.estimateCacheMisses))
+
         self.finish()
 
     def generateCanteraFiles(self, chemkinFile, **kwargs):
@@ -844,6 +900,8 @@ class RMG(util.Subject):
         """
         Complete the model generation.
         """
+        shutdownExecutor()
+
         # Log end timestamp
         logging.info('')
         logging.info('RMG execution terminated at ' + time.asctime())
@@ -988,6 +1046,10 @@ class RMG(util.Subject):
         if self.filterReactions:
             self.unimolecularThreshold = rmg_restart.unimolecularThreshold
             self.bimolecularThreshold = rmg_restart.bimolecularThreshold
+        # Restart files from older versions do not contain any states data
+        statmechCache = getattr(rmg_restart, 'statmechCache', None)
+        if statmechCache and self.database and self.database.statmech:
+            self.database.statmech.addStatmechCache(statmechCache)
 
     def loadRMGJavaInput(self, path):
         """
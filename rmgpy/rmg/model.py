@@ -35,6 +35,7 @@ Contains classes for working with the reaction model generated by RMG.
 import logging
 import math
 import numpy
+import scipy.sparse
 import itertools
 
 from rmgpy.display import display
@@ -42,8 +43,11 @@ from rmgpy.display import display
 import rmgpy.constants as constants
 from rmgpy.constraints import failsSpeciesConstraints
 from rmgpy.quantity import Quantity
+from rmgpy.statmech import Conformer
 import rmgpy.species
+from rmgpy.thermo import evaluateEnthalpies, evaluateFreeEnergies
 from rmgpy.thermo.thermoengine import submit
+from rmgpy.scoop_framework.util import poolMap_
 
 from rmgpy.data.base import ForbiddenStructureException
 from rmgpy.data.kinetics.depository import DepositoryReaction
@@ -633,42 +637,62 @@ class CoreEdgeReactionModel:
         # Begin processing the new species and reactions
         
         # Generate kinetics of new reactions
+        # If the reaction already has kinetics (e.g. from a library),
+        # assume the kinetics are satisfactory
         logging.info('Generating kinetics for new reactions...')
-        for reaction in self.newReactionList:
+        reactions = [reaction for reaction in self.newReactionList if reaction.kinetics is None]
+        for reaction, (kinetics, isForward) in zip(reactions, self.generateKineticsForReactions(reactions)):
             family = getFamilyLibraryObject(reaction.family)
 
-            # If the reaction already has kinetics (e.g. from a library),
-            # assume the kinetics are satisfactory
-            if reaction.kinetics is None:
-                # Set the reaction kinetics
-                kinetics, source, entry, isForward = self.generateKinetics(reaction)
-                reaction.kinetics = kinetics
-                # Flip the reaction direction if the kinetics are defined in the reverse direction
-                if not isForward:
-                    reaction.reactants, reaction.products = reaction.products, reaction.reactants
-                    reaction.pairs = [(p,r) for r,p in reaction.pairs]
-                if family.ownReverse and hasattr(reaction,'reverse'):
-                    if reaction.reverse:
-                        if not isForward:
-                            reaction.template = reaction.reverse.template
-                        # We're done with the "reverse" attribute, so delete it to save a bit of memory
-                        reaction.reverse = None
+            # Set the reaction kinetics
+            reaction.kinetics = kinetics
+            # Flip the reaction direction if the kinetics are defined in the reverse direction
+            if not isForward:
+                reaction.reactants, reaction.products = reaction.products, reaction.reactants
+                reaction.pairs = [(p,r) for r,p in reaction.pairs]
+            if family.ownReverse and hasattr(reaction,'reverse'):
+                if reaction.reverse:
+                    if not isForward:
+                        reaction.template = reaction.reverse.template
+                    # We're done with the "reverse" attribute, so delete it to save a bit of memory
+                    reaction.reverse = None
                     
         # For new reactions, convert ArrheniusEP to Arrhenius, and fix barrier heights.
         # self.newReactionList only contains *actually* new reactions, all in the forward direction.
+        # The enthalpies of reaction needed to fix the barriers of estimated
+        # kinetics are evaluated for all of these reactions at once
+        estimatedReactions = [reaction for reaction in self.newReactionList
+                              if isinstance(reaction,TemplateReaction) or isinstance(reaction,DepositoryReaction)] # i.e. not LibraryReaction
+        H298list, G298list = getReactionEnergies(estimatedReactions, 298)
+        H0list = getReactionGroundStateEnergies(estimatedReactions)
+        energies = dict([(id(reaction), (H298, H0)) for reaction, H298, H0 in zip(estimatedReactions, H298list, H0list)])
         for reaction in self.newReactionList:
             # convert KineticsData to Arrhenius forms
             if isinstance(reaction.kinetics, KineticsData):
                 reaction.kinetics = reaction.kinetics.toArrhenius()
+            H298, H0 = energies.get(id(reaction), (None, None))
             #  correct barrier heights of estimated kinetics
-            if isinstance(reaction,TemplateReaction) or isinstance(reaction,DepositoryReaction): # i.e. not LibraryReaction
-                reaction.fixBarrierHeight() # also converts ArrheniusEP to Arrhenius.
+            if H298 is not None:
+                reaction.fixBarrierHeight(H298=H298, H0=H0) # also converts ArrheniusEP to Arrhenius.
                 
             if self.pressureDependence and reaction.isUnimolecular():
                 # If this is going to be run through pressure dependence code,
                 # we need to make sure the barrier is positive.
-                reaction.fixBarrierHeight(forcePositive=True)
+                reaction.fixBarrierHeight(forcePositive=True, H298=H298, H0=H0)
             
+        # Estimate the transport properties of the new core species, and of
+        # the isomers of the pressure-dependent networks, which need them for
+        # their collision models, all at once; they are stored with each
+        # species, so species that already have them are skipped. Other edge
+        # species still get them on demand from Species.getTransportData()
+        database = rmgpy.data.rmg.database
+        if database and database.transport:
+            newSpecies = self.core.species[numOldCoreSpecies:]
+            if self.pressureDependence:
+                for network in self.networkList:
+                    newSpecies.extend([isomer.species[0] for isomer in network.isomers])
+            database.transport.setTransportData(newSpecies)
+
         # Update unimolecular (pressure dependent) reaction networks
         if self.pressureDependence:
             # Recalculate k(T,P) values for modified networks
@@ -783,98 +807,46 @@ class CoreEdgeReactionModel:
         """
         Generate best possible kinetics for the given `reaction` using the kinetics database.
         """
-        # Only reactions from families should be missing kinetics
-        assert isinstance(reaction, TemplateReaction)
-        
-        family = getFamilyLibraryObject(reaction.family)
+        return generateReactionKinetics(reaction, self.kineticsEstimator, self.verboseComments)
+
+    def generateKineticsForReactions(self, reactions):
+        """
+        Generate the best possible kinetics for each of the given template
+        `reactions` using the kinetics database, returning a list of
+        ``(kinetics, isForward)`` pairs in the same order. The enthalpies and
+        Gibbs free energies of reaction at 298 K are evaluated for all of the
+        reactions at once. The reactions are then grouped by family and
+        template, so each template is estimated once from the rate rules and
+        the other reactions in its group reuse the cached estimate, and the
+        groups are distributed over the worker processes in parallel runs.
+        """
+        H298list, G298list = getReactionEnergies(reactions, 298)
+        groups = {}
+        for index, reaction in enumerate(reactions):
+            groups.setdefault((reaction.family, tuple(reaction.template)), []).append(index)
+        groups = [groups[key] for key in sorted(groups)]
+
+        # Load the rate rules of any lazily loaded family in this process, so
+        # that the workers never load or process them themselves
+        families = rmgpy.data.rmg.getDB('kinetics').families
+        for label in set(reaction.family for reaction in reactions):
+            families[label].rules
+
+        results = poolMap_(
+            generateKineticsForGroup,
+            [[reactions[index] for index in group] for group in groups],
+            [[H298list[index] for index in group] for group in groups],
+            [[G298list[index] for index in group] for group in groups],
+            [self.kineticsEstimator] * len(groups),
+            [self.verboseComments] * len(groups),
+        )
+
+        kineticsList = [None] * len(reactions)
+        for group, groupResults in zip(groups, results):
+            for index, result in zip(group, groupResults):
+                kineticsList[index] = result
+        return kineticsList
 
-        # Get the kinetics for the reaction
-        kinetics, source, entry, isForward = family.getKinetics(reaction, templateLabels=reaction.template, degeneracy=reaction.degeneracy, estimator=self.kineticsEstimator, returnAllKinetics=False)
-        # Get the enthalpy of reaction at 298 K
-        H298 = reaction.getEnthalpyOfReaction(298)
-        G298 = reaction.getFreeEnergyOfReaction(298)
-        
-        
-        if family.ownReverse and hasattr(reaction,'reverse'):
-            if reaction.reverse:
-                # The kinetics family is its own reverse, so we could estimate kinetics in either direction
-                
-                # First get the kinetics for the other direction
-                rev_kinetics, rev_source, rev_entry, rev_isForward = family.getKinetics(reaction.reverse, templateLabels=reaction.reverse.template, degeneracy=reaction.reverse.degeneracy, estimator=self.kineticsEstimator, returnAllKinetics=False)
-                # Now decide which direction's kinetics to keep
-                keepReverse = False
-                if (entry is not None and rev_entry is None):
-                    # Only the forward has a source - use forward.
-                    reason = "This direction matched an entry in {0}, the other was just an estimate.".format(reaction.family)
-                elif (entry is None and rev_entry is not None):
-                    # Only the reverse has a source - use reverse.
-                    keepReverse = True
-                    reason = "This direction matched an entry in {0}, the other was just an estimate.".format(reaction.family)
-                elif (entry is not None and rev_entry is not None 
-                      and entry is rev_entry):
-                    # Both forward and reverse have the same source and entry
-                    # Use the one for which the kinetics is the forward kinetics          
-                    keepReverse = G298 > 0 and isForward and rev_isForward
-                    reason = "Both directions matched the same entry in {0}, but this direction is exergonic.".format(reaction.family)
-                elif self.kineticsEstimator == 'group additivity' and (kinetics.comment.find("Fitted to 1 rate")>0
-                      and not rev_kinetics.comment.find("Fitted to 1 rate")>0) :
-                        # forward kinetics were fitted to only 1 rate, but reverse are hopefully better
-                        keepReverse = True
-                        reason = "Other direction matched a group only fitted to 1 rate."
-                elif self.kineticsEstimator == 'group additivity' and (not kinetics.comment.find("Fitted to 1 rate")>0
-                      and rev_kinetics.comment.find("Fitted to 1 rate")>0) :
-                        # reverse kinetics were fitted to only 1 rate, but forward are hopefully better
-                        keepReverse = False
-                        reason = "Other direction matched a group only fitted to 1 rate."
-                elif entry is not None and rev_entry is not None:
-                    # Both directions matched explicit rate rules
-                    # Keep the direction with the lower (but nonzero) rank
-                    if entry.rank < rev_entry.rank and entry.rank != 0:
-                        keepReverse = False
-                        reason = "Both directions matched explicit rate rules, but this direction has a rule with a lower rank."
-                    elif rev_entry.rank < entry.rank and rev_entry.rank != 0:
-                        keepReverse = True
-                        reason = "Both directions matched explicit rate rules, but this direction has a rule with a lower rank."
-                    # Otherwise keep the direction that is exergonic at 298 K
-                    else:
-                        keepReverse = G298 > 0 and isForward and rev_isForward
-                        reason = "Both directions matched explicit rate rules, but this direction is exergonic."
-                else:
-                    # Keep the direction that is exergonic at 298 K
-                    # This must be done after the thermo generation step
-                    keepReverse = G298 > 0 and isForward and rev_isForward
-                    reason = "Both directions are estimates, but this direction is exergonic."
-                
-                if keepReverse:
-                    kinetics = rev_kinetics
-                    source = rev_source
-                    entry = rev_entry
-                    isForward = not rev_isForward
-                    H298 = -H298
-                    G298 = -G298
-                
-                if self.verboseComments:
-                    kinetics.comment += "\nKinetics were estimated in this direction instead of the reverse because:\n{0}".format(reason)
-                    kinetics.comment += "\ndHrxn(298 K) = {0:.2f} kJ/mol, dGrxn(298 K) = {1:.2f} kJ/mol".format(H298 / 1000., G298 / 1000.)
-            
-        # The comments generated by the database for estimated kinetics can
-        # be quite long, and therefore not very useful
-        # We don't want to waste lots of memory storing these long, 
-        # uninformative strings, so here we replace them with much shorter ones
-        if not self.verboseComments:
-            # Only keep a short comment (to save memory)
-            if 'Exact' in kinetics.comment:
-                # Exact match of rate rule
-                pass
-            elif 'Matched reaction' in kinetics.comment:
-                # Stems from matching a reaction from a depository
-                pass
-            else:
-                # Estimated (averaged) rate rule
-                kinetics.comment =  kinetics.comment[kinetics.comment.find('Estimated'):]
-                
-        return kinetics, source, entry, isForward
-    
     def printEnlargeSummary(self, newCoreSpecies, newCoreReactions, newEdgeSpecies, newEdgeReactions, reactionsMovedFromEdge=None, reactEdge=False):
         """
         Output a summary of a model enlargement step to the log. The details of
@@ -1463,6 +1435,14 @@ class CoreEdgeReactionModel:
         count = sum([1 for network in self.networkList if not network.valid and not (len(network.explored) == 0 and len(network.source) > 1)])
         logging.info('Updating {0:d} modified unimolecular reaction networks (out of {1:d})...'.format(count, len(self.networkList)))
         
+        # Generate the states data needed by all of the invalid networks at
+        # once, so the fits are run in parallel before any network is solved
+        species = []
+        for network in self.networkList:
+            if not network.valid and not (len(network.explored) == 0 and len(network.source) > 1):
+                species.extend(network.getStatMechSpecies())
+        generateSpeciesStatMech(species)
+
         # Iterate over all the networks, updating the invalid ones as necessary
         # self = reactionModel object
         updatedNetworks = []
@@ -1721,6 +1701,207 @@ def generateReactionId(rxn):
 
     return (reactants, products)
 
+def generateReactionKinetics(reaction, kineticsEstimator, verboseComments, H298=None, G298=None):
+    """
+    Generate best possible kinetics for the given template `reaction` using
+    the kinetics database and the given `kineticsEstimator`. The enthalpy
+    `H298` and Gibbs free energy `G298` of reaction at 298 K in J/mol are
+    computed from the species thermo unless they are given.
+    """
+    # Only reactions from families should be missing kinetics
+    assert isinstance(reaction, TemplateReaction)
+    
+    family = rmgpy.data.rmg.getDB('kinetics').families[reaction.family]
+
+    # Get the kinetics for the reaction
+    kinetics, source, entry, isForward = family.getKinetics(reaction, templateLabels=reaction.template, degeneracy=reaction.degeneracy, estimator=kineticsEstimator, returnAllKinetics=False)
+    # Get the enthalpy of reaction at 298 K
+    if H298 is None:
+        H298 = reaction.getEnthalpyOfReaction(298)
+    if G298 is None:
+        G298 = reaction.getFreeEnergyOfReaction(298)
+    
+    
+    if family.ownReverse and hasattr(reaction,'reverse'):
+        if reaction.reverse:
+            # The kinetics family is its own reverse, so we could estimate kinetics in either direction
+            
+            # First get the kinetics for the other direction
+            rev_kinetics, rev_source, rev_entry, rev_isForward = family.getKinetics(reaction.reverse, templateLabels=reaction.reverse.template, degeneracy=reaction.reverse.degeneracy, estimator=kineticsEstimator, returnAllKinetics=False)
+            # Now decide which direction's kinetics to keep
+            keepReverse = False
+            if (entry is not None and rev_entry is None):
+                # Only the forward has a source - use forward.
+                reason = "This direction matched an entry in {0}, the other was just an estimate.".format(reaction.family)
+            elif (entry is None and rev_entry is not None):
+                # Only the reverse has a source - use reverse.
+                keepReverse = True
+                reason = "This direction matched an entry in {0}, the other was just an estimate.".format(reaction.family)
+            elif (entry is not None and rev_entry is not None 
+                  and entry is rev_entry):
+                # Both forward and reverse have the same source and entry
+                # Use the one for which the kinetics is the forward kinetics          
+                keepReverse = G298 > 0 and isForward and rev_isForward
+                reason = "Both directions matched the same entry in {0}, but this direction is exergonic.".format(reaction.family)
+            elif kineticsEstimator == 'group additivity' and (kinetics.comment.find("Fitted to 1 rate")>0
+                  and not rev_kinetics.comment.find("Fitted to 1 rate")>0) :
+                    # forward kinetics were fitted to only 1 rate, but reverse are hopefully better
+                    keepReverse = True
+                    reason = "Other direction matched a group only fitted to 1 rate."
+            elif kineticsEstimator == 'group additivity' and (not kinetics.comment.find("Fitted to 1 rate")>0
+                  and rev_kinetics.comment.find("Fitted to 1 rate")>0) :
+                    # reverse kinetics were fitted to only 1 rate, but forward are hopefully better
+                    keepReverse = False
+                    reason = "Other direction matched a group only fitted to 1 rate."
+            elif entry is not None and rev_entry is not None:
+                # Both directions matched explicit rate rules
+                # Keep the direction with the lower (but nonzero) rank
+                if entry.rank < rev_entry.rank and entry.rank != 0:
+                    keepReverse = False
+                    reason = "Both directions matched explicit rate rules, but this direction has a rule with a lower rank."
+                elif rev_entry.rank < entry.rank and rev_entry.rank != 0:
+                    keepReverse = True
+                    reason = "Both directions matched explicit rate rules, but this direction has a rule with a lower rank."
+                # Otherwise keep the direction that is exergonic at 298 K
+                else:
+                    keepReverse = G298 > 0 and isForward and rev_isForward
+                    reason = "Both directions matched explicit rate rules, but this direction is exergonic."
+            else:
+                # Keep the direction that is exergonic at 298 K
+                # This must be done after the thermo generation step
+                keepReverse = G298 > 0 and isForward and rev_isForward
+                reason = "Both directions are estimates, but this direction is exergonic."
+            
+            if keepReverse:
+                kinetics = rev_kinetics
+                source = rev_source
+                entry = rev_entry
+                isForward = not rev_isForward
+                H298 = -H298
+                G298 = -G298
+            
+            if verboseComments:
+                kinetics.comment += "\nKinetics were estimated in this direction instead of the reverse because:\n{0}".format(reason)
+                kinetics.comment += "\ndHrxn(298 K) = {0:.2f} kJ/mol, dGrxn(298 K) = {1:.2f} kJ/mol".format(H298 / 1000., G298 / 1000.)
+        
+    # The comments generated by the database for estimated kinetics can
+    # be quite long, and therefore not very useful
+    # We don't want to waste lots of memory storing these long, 
+    # uninformative strings, so here we replace them with much shorter ones
+    if not verboseComments:
+        # Only keep a short comment (to save memory)
+        if 'Exact' in kinetics.comment:
+            # Exact match of rate rule
+            pass
+        elif 'Matched reaction' in kinetics.comment:
+            # Stems from matching a reaction from a depository
+            pass
+        else:
+            # Estimated (averaged) rate rule
+            kinetics.comment =  kinetics.comment[kinetics.comment.find('Estimated'):]
+            
+    return kinetics, source, entry, isForward
+
+def generateKineticsForGroup(reactions, H298list, G298list, kineticsEstimator, verboseComments):
+    """
+    Generate the best possible kinetics for each of the given template
+    `reactions`, whose enthalpies and Gibbs free energies of reaction at
+    298 K are given in `H298list` and `G298list`, returning a list of
+    ``(kinetics, isForward)`` pairs. This is the unit of work that is passed
+    to the worker processes in :meth:`CoreEdgeReactionModel.generateKineticsForReactions`.
+    """
+    results = []
+    for reaction, H298, G298 in zip(reactions, H298list, G298list):
+        kinetics, source, entry, isForward = generateReactionKinetics(reaction, kineticsEstimator, verboseComments, H298, G298)
+        results.append((kinetics, isForward))
+    return results
+
+def getReactionStoichiometry(reactions):
+    """
+    Return a list of the unique species in the given `reactions` and the
+    sparse stoichiometry matrix with a row for each reaction and a column for
+    each of these species.
+    """
+    speciesList = []
+    speciesIndices = {}
+    rows = []; columns = []; coefficients = []
+    for row, reaction in enumerate(reactions):
+        for species, nu in itertools.chain([(spec, -1) for spec in reaction.reactants], [(spec, 1) for spec in reaction.products]):
+            column = speciesIndices.get(id(species))
+            if column is None:
+                column = speciesIndices[id(species)] = len(speciesList)
+                speciesList.append(species)
+            rows.append(row); columns.append(column); coefficients.append(nu)
+    # Repeated species (e.g. in A + A) are summed by the sparse matrix
+    stoichiometry = scipy.sparse.csr_matrix((coefficients, (rows, columns)), shape=(len(reactions), len(speciesList)), dtype=numpy.float64)
+    return speciesList, stoichiometry
+
+def getReactionEnergies(reactions, T):
+    """
+    Return arrays of the enthalpies and Gibbs free energies of reaction in
+    J/mol at the temperature `T` in K for each of the given `reactions`. The
+    thermo of each species is evaluated only once, however many reactions it
+    takes part in.
+    """
+    speciesList, stoichiometry = getReactionStoichiometry(reactions)
+    H = numpy.zeros(len(speciesList), numpy.float64)
+    G = numpy.zeros(len(speciesList), numpy.float64)
+    indices = [i for i, species in enumerate(speciesList) if species.hasThermo()]
+    if indices:
+        models = [speciesList[i].getThermoData() for i in indices]
+        H[indices] = evaluateEnthalpies(models, T)
+        G[indices] = evaluateFreeEnergies(models, T)
+    for i, species in enumerate(speciesList):
+        if not species.hasThermo():
+            H[i] = species.getEnthalpy(T)
+            G[i] = species.getFreeEnergy(T)
+    return stoichiometry.dot(H), stoichiometry.dot(G)
+
+def getReactionGroundStateEnergies(reactions):
+    """
+    Return an array of the differences in the ground-state energies E0 of
+    the products and the reactants in J/mol for each of the given `reactions`.
+    """
+    speciesList, stoichiometry = getReactionStoichiometry(reactions)
+    E0 = numpy.array([species.getThermoData().E0.value_si for species in speciesList], numpy.float64)
+    return stoichiometry.dot(E0)
+
+def generateStatMech(molecule, thermoModel):
+    """
+    Return a conformer with the states data of `molecule`, fitted to the heat
+    capacity of `thermoModel` if necessary. This is the unit of work that is
+    passed to the worker processes in :func:`generateSpeciesStatMech`.
+    """
+    return rmgpy.data.rmg.getDB('statmech').getStatmechData(molecule, thermoModel)
+
+def generateSpeciesStatMech(speciesList):
+    """
+    Generate the states data of each species in `speciesList` that does not
+    have any yet, as :meth:`Species.generateStatMech` does. The species are
+    dispatched to the workers together, and the results are added to the
+    statmech cache of this process so they are also saved for restarts.
+    """
+    species = []
+    seen = set()
+    for spec in speciesList:
+        if id(spec) not in seen and not spec.hasStatMech():
+            seen.add(id(spec))
+            species.append(spec)
+    if not species:
+        return
+
+    statmechDB = rmgpy.data.rmg.getDB('statmech')
+    molecules = [spec.molecule[0] for spec in species]
+    thermos = [spec.getThermoData() for spec in species]
+    conformers = poolMap_(generateStatMech, molecules, thermos)
+    for spec, molecule, thermo, conformer in zip(species, molecules, thermos, conformers):
+        statmechDB.addStatmechData(molecule, thermo, conformer)
+        if spec.conformer is None:
+            spec.conformer = Conformer()
+        spec.conformer.E0 = thermo.E0
+        spec.conformer.modes = conformer.modes
+        spec.conformer.spinMultiplicity = conformer.spinMultiplicity
+
 def getFamilyLibraryObject(label):
     """
     Returns the KineticsFamily or KineticsLibrary object associated with the
@@ -37,6 +37,7 @@ from rmgpy.rmg.main import RMG
 from rmgpy.reaction import Reaction
 from rmgpy.rmg.react import react
 from rmgpy.rmg.model import *
+from rmgpy.thermo import ThermoData
 
 ###################################################
 
@@ -211,6 +212,51 @@ class TestCoreEdgeReactionModel(unittest.TestCase):
         import rmgpy.data.rmg
         rmgpy.data.rmg.database = None
 
+class TestReactionEnergies(unittest.TestCase):
+    """
+    Contains unit tests of the functions that evaluate the thermo of many reactions at once.
+    """
+
+    def setUp(self):
+        """
+        A method that is run before each unit test in this class.
+        """
+        def makeSpecies(label, H298, S298, E0):
+            thermo = ThermoData(
+                Tdata = ([300,400,500,600,800,1000,1500],'K'),
+                Cpdata = ([30.0,33.0,36.0,38.0,42.0,45.0,50.0],'J/(mol*K)'),
+                H298 = (H298,'kJ/mol'),
+                S298 = (S298,'J/(mol*K)'),
+                E0 = (E0,'kJ/mol'),
+            )
+            return Species(label=label, thermo=thermo)
+        A = makeSpecies('A', 10.0, 200.0, 5.0)
+        B = makeSpecies('B', -50.0, 150.0, -60.0)
+        C = makeSpecies('C', -20.0, 250.0, -30.0)
+        self.reactions = [
+            Reaction(reactants=[A, B], products=[C]),
+            Reaction(reactants=[C], products=[A, B]),
+            Reaction(reactants=[A, A], products=[B]),
+        ]
+
+    def testGetReactionEnergies(self):
+        """
+        Test that the batched enthalpies and free energies of reaction match those of each reaction.
+        """
+        H298list, G298list = getReactionEnergies(self.reactions, 298)
+        for reaction, H298, G298 in zip(self.reactions, H298list, G298list):
+            self.assertAlmostEqual(H298, reaction.getEnthalpyOfReaction(298), 6)
+            self.assertAlmostEqual(G298, reaction.getFreeEnergyOfReaction(298), 6)
+        self.assertEqual(len(getReactionEnergies([], 298)[0]), 0)
+
+    def testGetReactionGroundStateEnergies(self):
+        """
+        Test that the batched ground-state energies of reaction count repeated species.
+        """
+        H0list = getReactionGroundStateEnergies(self.reactions)
+        self.assertAlmostEqual(H0list[0] / 1000., 25.0, 6)
+        self.assertAlmostEqual(H0list[1] / 1000., -25.0, 6)
+        self.assertAlmostEqual(H0list[2] / 1000., -70.0, 6)
 
 if __name__ == '__main__':
     unittest.main()
@@ -449,6 +449,20 @@ class PDepNetwork(rmgpy.pdep.network.Network):
         for product in products:
             self.products.append(Configuration(*product))
 
+    def getStatMechSpecies(self):
+        """
+        Return a list of the species that need states data to update this
+        network: the unimolecular isomers, the species of the reactant
+        channels, and the reactants of all path reactions, so we can always
+        apply the ILT method in the direction the kinetics are known.
+        """
+        species = [isomer.species[0] for isomer in self.isomers]
+        for reactants in self.reactants:
+            species.extend(reactants.species)
+        for reaction in self.pathReactions:
+            species.extend(reaction.reactants)
+        return species
+
     def update(self, reactionModel, pdepSettings):
         """
         Regenerate the :math:`k(T,P)` values for this partial network if the
@@ -495,17 +509,8 @@ class PDepNetwork(rmgpy.pdep.network.Network):
         logging.info("Updating {0:s}".format(self))
 
         # Generate states data for unimolecular isomers and reactants if necessary
-        for isomer in self.isomers:
-            spec = isomer.species[0]
+        for spec in self.getStatMechSpecies():
             if not spec.hasStatMech(): spec.generateStatMech()
-        for reactants in self.reactants:
-            for spec in reactants.species:
-                if not spec.hasStatMech(): spec.generateStatMech()
-        # Also generate states data for any path reaction reactants, so we can
-        # always apply the ILT method in the direction the kinetics are known
-        for reaction in self.pathReactions:
-            for spec in reaction.reactants:
-                if not spec.hasStatMech(): spec.generateStatMech()
         # While we don't need the frequencies for product channels, we do need
         # the E0, so create a conformer object with the E0 for the product
         # channel species if necessary
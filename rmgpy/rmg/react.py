@@ -35,6 +35,7 @@ import logging
 import itertools
 
 from rmgpy.molecule.molecule import Molecule
+from rmgpy.molecule.compact import CompactMolecule
 from rmgpy.data.rmg import getDB
 from rmgpy.scoop_framework.util import map_
 from rmgpy.species import Species
@@ -58,16 +59,32 @@ def react(*spcTuples):
     
     combos = []
 
+    # Only the molecules of each species are needed, so they are created
+    # from the compact form of the species instead of deep copying the whole
+    # species. Each species is only converted once, however many tuples it
+    # appears in, and its molecules are shared by those tuples, except for the
+    # second species of a self-reaction, which must not share its atoms with
+    # the first
+    compacts = {}
+    copies = {}
     for t in spcTuples:
-        t = tuple([spc.copy(deep=True) for spc in t])
+        molLists = []
+        for spc in t:
+            if id(spc) not in compacts:
+                compacts[id(spc)] = [CompactMolecule().fromMolecule(mol) for mol in spc.molecule]
+                copies[id(spc)] = [compact.toMolecule() for compact in compacts[id(spc)]]
+            mols = copies[id(spc)]
+            if any([mols is other for other in molLists]):
+                mols = [compact.toMolecule() for compact in compacts[id(spc)]]
+            molLists.append(mols)
         if len(t) == 1:#unimolecular reaction
             spc, = t
-            mols = [(mol, spc.index) for mol in spc.molecule]
+            mols = [(mol, spc.index) for mol in molLists[0]]
             combos.extend([(combo,) for combo in mols])
         elif len(t) == 2:#bimolecular reaction
             spcA, spcB = t
-            molsA = [(mol, spcA.index) for mol in spcA.molecule]
-            molsB = [(mol, spcB.index) for mol in spcB.molecule]
+            molsA = [(mol, spcA.index) for mol in molLists[0]]
+            molsB = [(mol, spcB.index) for mol in molLists[1]]
             combos.extend(itertools.product(molsA, molsB))
 
     results = map_(
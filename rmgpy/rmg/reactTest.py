@@ -41,6 +41,7 @@ from rmgpy.reaction import Reaction
 from rmgpy.rmg.main import RMG
 from rmgpy.species import Species
 from rmgpy.rmg.react import *
+from rmgpy.scoop_framework.util import setExecutor, shutdownExecutor
 
 ###################################################
 
@@ -153,6 +154,30 @@ class TestReact(unittest.TestCase):
                 rxn.reactants[i] = Molecule().fromSMILES(indices[reactant])
             self.assertTrue(rxn.isBalanced())
 
+    def testReactThreadExecutor(self):
+        """
+        Test that reaction generation gives the same reactions as a serial
+        run while a native thread pool is running.
+        """
+        def getReactions():
+            spcs = [Species(index=index).fromSMILES(smiles) for index, smiles in enumerate(['[OH]', 'CC', '[CH3]', 'C=C[CH2]'])]
+            spcTuples = [(spcA, spcB) for spcA in spcs for spcB in spcs]
+            reactions = []
+            for rxn in react(*spcTuples):
+                reactants = tuple(sorted(rxn.reactants))
+                products = tuple(sorted([spc.molecule[0].toSMILES() for spc in rxn.products]))
+                reactions.append((reactants, products, rxn.degeneracy))
+            return sorted(reactions)
+
+        serial = getReactions()
+        setExecutor(2, 'thread')
+        try:
+            parallel = getReactions()
+        finally:
+            shutdownExecutor()
+        self.assertTrue(len(serial) > 0)
+        self.assertEqual(serial, parallel)
+
     def testReactAll(self):
         """
         Test that the reactAll function works.
@@ -35,10 +35,15 @@ This module contains functionality for the parallel execution of RMG-Py.
 import sys
 import traceback
 import warnings
+import multiprocessing
+import multiprocessing.pool
 from functools import wraps
 
 logger = None
 
+# The native pool of workers used by submit_ when SCOOP is not running
+executor = None
+
 try:
     from scoop import futures
     from scoop.futures import map, submit
@@ -150,16 +155,98 @@ def get(key):
         """
         logger.debug('SCOOP not loaded. Not retrieving the shared object with key {}'.format(key))
 
+class Future(object):
+    """
+    A future for a task submitted to the native executor. It exposes the
+    same ``result()`` method as a SCOOP future, so callers do not need to
+    know which backend ran the task.
+    """
+
+    def __init__(self, asyncResult):
+        self.asyncResult = asyncResult
+
+    def done(self):
+        """
+        Return ``True`` if the task has finished.
+        """
+        return self.asyncResult.ready()
+
+    def result(self):
+        """
+        Block until the task has finished and return its return value.
+        """
+        return self.asyncResult.get()
+
+def setExecutor(nprocs, kind='process'):
+    """
+    Start a native pool of `nprocs` workers that :func:`submit_` uses when
+    SCOOP is not running. Use `kind` = ``'process'`` for CPU-bound tasks such
+    as group additivity estimates, or ``'thread'`` for tasks that mostly wait
+    on external programs, such as QM calculations. Process workers are forked,
+    so the databases must be loaded before the pool is started. A value of
+    `nprocs` below 2 shuts down any running pool instead.
+    """
+    global executor
+
+    shutdownExecutor()
+    if nprocs < 2:
+        return
+    if kind == 'process':
+        executor = multiprocessing.Pool(nprocs)
+    elif kind == 'thread':
+        executor = multiprocessing.pool.ThreadPool(nprocs)
+    else:
+        raise ValueError('Invalid executor kind "{0}"; expected "process" or "thread".'.format(kind))
+    logger.info('Started a {0} pool with {1:d} workers.'.format(kind, nprocs))
+
+def shutdownExecutor():
+    """
+    Wait for the tasks of the native pool to finish and shut it down.
+    """
+    global executor
+
+    if executor is not None:
+        executor.close()
+        executor.join()
+        executor = None
+
+class ArgumentsWrapper(WorkerWrapper):
+    """
+    A :class:`WorkerWrapper` that calls the function with the items of the
+    tuple it is called with as its arguments, so that functions of several
+    arguments can be mapped with a native pool, whose ``map`` only passes one.
+    """
+    __name__ = 'ArgumentsWrapper'
+
+    def __call__(self, args):
+        return WorkerWrapper.__call__(self, *args)
+
 def map_(*args, **kwargs):
     return map(WorkerWrapper(args[0]), *args[1:], **kwargs)
 
+def poolMap_(*args, **kwargs):
+    """
+    Map the function `args[0]` over the iterables in the remaining `args`,
+    and return the list of results. When a native pool was started with
+    :func:`setExecutor`, the calls are distributed over its workers, and
+    otherwise :func:`map_` is used. Only use this for functions that do not
+    modify their arguments or other shared objects, as the workers may be
+    threads.
+    """
+    if executor is not None:
+        return executor.map(ArgumentsWrapper(args[0]), zip(*args[1:]), **kwargs)
+    return map_(*args, **kwargs)
+
 def submit_(func, *args, **kwargs):
     """
     Task submission of a function.
 
     returns the return value of the called function, or
-    when SCOOP is loaded, the future object.
+    when SCOOP is loaded or a native pool was started with
+    :func:`setExecutor`, the future object.
     """
+    if executor is not None:
+        return Future(executor.apply_async(WorkerWrapper(func), args, kwargs))
     try:
         task = submit(WorkerWrapper(func), *args, **kwargs)#returns immediately
         return task
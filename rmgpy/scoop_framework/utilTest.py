@@ -7,6 +7,7 @@ This module contains unit tests of the rmgpy.parallel module.
 
 import os
 import sys
+import threading
 import unittest
 from external.wip import work_in_progress
 
@@ -34,6 +35,26 @@ class WorkerWrapperTest(unittest.TestCase):
         with self.assertRaises(ZeroDivisionError):
             f()
 
+def workerThread(x, y):
+    return x + y, threading.current_thread().name
+
+class NativeExecutorTest(unittest.TestCase):
+
+    def tearDown(self):
+        shutdownExecutor()
+
+    def test_poolMap(self):
+        """
+        Test that poolMap_ distributes the calls over the workers of a native
+        pool and returns the results in order, while map_ stays serial.
+        """
+        setExecutor(2, 'thread')
+        for result, thread in map_(workerThread, range(3), range(3)):
+            self.assertEqual(thread, threading.current_thread().name)
+        results = poolMap_(workerThread, range(10), range(10, 20))
+        self.assertEqual([result for result, thread in results], range(10, 30, 2))
+        for result, thread in results:
+            self.assertNotEqual(thread, threading.current_thread().name)
 
 def funcBroadcast():
     """
@@ -63,6 +63,7 @@ cdef class ReactionSystem(DASx):
     cdef public numpy.ndarray Keq # equilibrium constants
     cdef public numpy.ndarray networkLeakCoefficients
     cdef public numpy.ndarray jacobianMatrix
+    cdef public object kineticsTable
 
     cdef public numpy.ndarray coreSpeciesConcentrations
     
@@ -86,6 +87,9 @@ cdef class ReactionSystem(DASx):
     # cdef public int sensmethod
     cdef public numpy.ndarray sensitivityCoefficients
     cdef public list sensitiveSpecies
+    cdef public list sensitiveParameters
+    cdef public numpy.ndarray sensitiveParameterIndices
+    cdef public object stoichiometricMatrix
     cdef public double sensitivityThreshold
     # cdef public numpy.ndarray senpar
 
@@ -93,7 +97,8 @@ cdef class ReactionSystem(DASx):
     cdef public numpy.ndarray atol_array
     cdef public numpy.ndarray rtol_array
     
-    cdef public list snapshots
+    cdef public object snapshots
+    cdef public object sensitivityProfile
 
     cdef public list termination
     
@@ -50,9 +50,12 @@ import cython
 import logging
 import csv
 import itertools
+import scipy.sparse
 
 from rmgpy.quantity import Quantity
 from rmgpy.chemkin import getSpeciesIdentifier
+from rmgpy.kinetics.table import KineticsTable
+from rmgpy.solver.recorder import ProfileRecorder, SensitivityRecorder
 
 ################################################################################
 
@@ -124,6 +127,13 @@ cdef class ReactionSystem(DASx):
         self.Keq = None # equilibrium constants
         self.networkLeakCoefficients = None
         self.jacobianMatrix = None
+
+        """
+        A packed table of the kinetics of all core and edge reactions, in
+        reaction index order, used to evaluate the rate coefficients and
+        equilibrium constants of all reactions in a single call.
+        """
+        self.kineticsTable = None
         
         self.coreSpeciesConcentrations = None
         
@@ -148,6 +158,9 @@ cdef class ReactionSystem(DASx):
         self.sensitivityCoefficients = None    
         self.sensitiveSpecies = sensitiveSpecies
         self.sensitivityThreshold = sensitivityThreshold
+        self.sensitiveParameters = None
+        self.sensitiveParameterIndices = None
+        self.stoichiometricMatrix = None
         self.senpar = None
 
         # tolerance settings
@@ -188,6 +201,7 @@ cdef class ReactionSystem(DASx):
         self.numEdgeSpecies = len(edgeSpecies)
         self.numEdgeReactions = len(edgeReactions)
 
+        self.generate_sensitive_parameter_indices(coreSpecies, coreReactions)
         self.initiate_tolerances(atol, rtol, sensitivity, sens_atol, sens_rtol)
 
         pdepNetworks = pdepNetworks or []
@@ -200,6 +214,8 @@ cdef class ReactionSystem(DASx):
         self.generate_species_indices(coreSpecies, edgeSpecies)
         self.generate_reaction_indices(coreReactions, edgeReactions)
         self.generate_reactant_product_indices(coreReactions, edgeReactions)
+        self.generate_stoichiometric_matrix()
+        self.generate_kinetics_table(coreReactions, edgeReactions)
 
         self.coreSpeciesConcentrations = numpy.zeros((self.numCoreSpecies), numpy.float64)
         self.coreReactionRates = numpy.zeros((self.numCoreReactions), numpy.float64)
@@ -229,7 +245,8 @@ cdef class ReactionSystem(DASx):
             # Set DASPK sensitivity analysis to ON
             self.sensitivity = True
             # Compute number of variables
-            self.neq = self.numCoreSpecies * (self.numCoreReactions + self.numCoreSpecies + 1)
+            numParameters = len(self.sensitiveParameterIndices)
+            self.neq = self.numCoreSpecies * (numParameters + 1)
             
             self.atol_array = numpy.ones(self.neq, numpy.float64) * sens_atol
             self.atol_array[:self.numCoreSpecies] = atol
@@ -237,7 +254,7 @@ cdef class ReactionSystem(DASx):
             self.rtol_array = numpy.ones(self.neq, numpy.float64) * sens_rtol
             self.rtol_array[:self.numCoreSpecies] = rtol
             
-            self.senpar = numpy.zeros(self.numCoreReactions + self.numCoreSpecies, numpy.float64)
+            self.senpar = numpy.zeros(numParameters, numpy.float64)
             
         else:
             self.neq = self.numCoreSpecies
@@ -271,6 +288,64 @@ cdef class ReactionSystem(DASx):
                 i = self.get_species_index(spec)
                 self.productIndices[j,l] = i
 
+    def generate_sensitive_parameter_indices(self, coreSpecies, coreReactions):
+        """
+        Determine the parameters for which sensitivities are computed. The
+        parameters are numbered with the rate coefficients of the core
+        reactions first, followed by the free energies of the core species.
+        If :attr:`sensitiveParameters` is set, only the listed core reactions
+        and core species are included; otherwise all parameters are.
+        """
+        if self.sensitiveParameters is None:
+            self.sensitiveParameterIndices = numpy.arange(self.numCoreReactions + self.numCoreSpecies)
+            return
+
+        reactionIndex = dict((rxn, j) for j, rxn in enumerate(coreReactions))
+        speciesIndex = dict((spec, i) for i, spec in enumerate(coreSpecies))
+        indices = []
+        for parameter in self.sensitiveParameters:
+            if parameter in reactionIndex:
+                indices.append(reactionIndex[parameter])
+            elif parameter in speciesIndex:
+                indices.append(self.numCoreReactions + speciesIndex[parameter])
+            else:
+                raise ValueError('Sensitive parameter {0!r} is not a core reaction or core species.'.format(parameter))
+        self.sensitiveParameterIndices = numpy.unique(numpy.array(indices, numpy.int))
+
+    def generate_stoichiometric_matrix(self):
+        """
+        Creates the sparse net stoichiometric matrix of the core reactions,
+        with one row per core species and one column per core reaction.
+        """
+        cdef numpy.ndarray[numpy.int_t, ndim=2] ir, ip
+        cdef numpy.ndarray[numpy.int_t, ndim=1] rows, cols
+        cdef numpy.ndarray[numpy.float64_t, ndim=1] data
+        cdef numpy.ndarray mask
+
+        ir = self.reactantIndices[:self.numCoreReactions]
+        ip = self.productIndices[:self.numCoreReactions]
+        reactions = numpy.repeat(numpy.arange(self.numCoreReactions), 3)
+        mask = numpy.concatenate((ir.ravel() != -1, ip.ravel() != -1))
+        rows = numpy.concatenate((ir.ravel(), ip.ravel()))[mask]
+        cols = numpy.concatenate((reactions, reactions))[mask]
+        data = numpy.concatenate((-numpy.ones(ir.size), numpy.ones(ip.size)))[mask]
+        # Duplicate entries (e.g. A + A) are summed on conversion to CSC
+        self.stoichiometricMatrix = scipy.sparse.coo_matrix((data, (rows, cols)),
+            shape=(self.numCoreSpecies, self.numCoreReactions)).tocsc()
+
+    def generate_kinetics_table(self, coreReactions, edgeReactions):
+        """
+        Pack the kinetics of the core and edge reactions into a
+        :class:`KineticsTable`, ordered by reaction index. The existing table
+        is reused if it holds the same reactions and kinetics, so the kinetics
+        are only packed again when the core or edge has changed.
+        """
+        reactions = [None] * (self.numCoreReactions + self.numEdgeReactions)
+        for rxn in itertools.chain(coreReactions, edgeReactions):
+            reactions[self.reactionIndex[rxn]] = rxn
+        if self.kineticsTable is None or not self.kineticsTable.matches(reactions):
+            self.kineticsTable = KineticsTable(reactions)
+
     def generate_species_indices(self, coreSpecies, edgeSpecies):
         """
         Assign an index to each species (core first, then edge) and 
@@ -373,12 +448,12 @@ cdef class ReactionSystem(DASx):
         cdef object maxSpecies, maxNetwork
         cdef int i, j, k
         cdef numpy.ndarray[numpy.float64_t, ndim=1] forwardRateCoefficients, coreSpeciesConcentrations
-        cdef double  prevTime, totalMoles, c, volume, RTP, unimolecularThresholdVal, bimolecularThresholdVal
+        cdef double  prevTime, totalMoles, volume, RTP, unimolecularThresholdVal, bimolecularThresholdVal
         
         # cython declations for sensitivity analysis
-        cdef numpy.ndarray[numpy.int_t, ndim=1] sensSpeciesIndices
-        cdef numpy.ndarray[numpy.float64_t, ndim=1] moleSens, dVdk, normSens
-        cdef list time_array, normSens_array 
+        cdef numpy.ndarray[numpy.int_t, ndim=1] sensSpeciesIndices, reactionsAboveThreshold, sensParameterIndices
+        cdef numpy.ndarray[numpy.float64_t, ndim=1] dVdk, c, sensParameterScales
+        cdef numpy.ndarray[numpy.float64_t, ndim=2] moleSens, normSens, speciesSens
         
         pdepNetworks = pdepNetworks or []
 
@@ -415,15 +490,20 @@ cdef class ReactionSystem(DASx):
         # Copy the initial conditions to use in evaluating conversions
         y0 = self.y.copy()
         
-        # a list with the time, Volume, mole fractions of core species
-        self.snapshots = []
+        # the time, Volume, mole fractions of core species at each time step
+        self.snapshots = ProfileRecorder(numCoreSpecies)
+        self.sensitivityProfile = None
 
         if sensitivity:
-            time_array = []
-            normSens_array = [[] for spec in self.sensitiveSpecies]    
+            sensParameterIndices = self.sensitiveParameterIndices
+            self.sensitivityProfile = SensitivityRecorder(len(self.sensitiveSpecies), len(sensParameterIndices))
             RTP = constants.R * self.T.value_si / self.P.value_si
             # identify sensitive species indices
             sensSpeciesIndices = numpy.array([speciesIndex[spec] for spec in self.sensitiveSpecies], numpy.int)  # index within coreSpecies list of the sensitive species
+            # normalize against k for the rate coefficients; no normalization against dG, conversion to kcal/mol units
+            sensParameterScales = 4184. * numpy.ones(len(sensParameterIndices), numpy.float64)
+            isReactionParameter = sensParameterIndices < numCoreReactions
+            sensParameterScales[isReactionParameter] = forwardRateCoefficients[sensParameterIndices[isReactionParameter]]
                 
         
         stepTime = 1e-12
@@ -445,28 +525,22 @@ cdef class ReactionSystem(DASx):
             y_coreSpecies = self.y[:numCoreSpecies]
             totalMoles = numpy.sum(y_coreSpecies)
             if sensitivity:
-                time_array.append(self.t)
-                moleSens = self.y[numCoreSpecies:]#   
+                # moleSens[j,i] is the sensitivity of the moles of core species i to parameter j
+                moleSens = self.y[numCoreSpecies:].reshape(len(sensParameterIndices), numCoreSpecies)
                 volume = self.V
                 
-                dVdk = numpy.zeros(numCoreReactions + numCoreSpecies, numpy.float64)
-                if not self.constantVolume:
-                    for j in xrange(numCoreReactions + numCoreSpecies):
-                        dVdk[j] = numpy.sum(moleSens[j*numCoreSpecies:(j+1)*numCoreSpecies])*RTP   # Contains [ dV_dk and dV_dG ]
+                if self.constantVolume:
+                    dVdk = numpy.zeros(len(sensParameterIndices), numpy.float64)
+                else:
+                    dVdk = numpy.sum(moleSens, axis=1) * RTP   # Contains [ dV_dk and dV_dG ]
+                normSens = self.sensitivityProfile.nextSensitivities(self.t)
+                normSens[:,:] = 0.0
+                c = self.coreSpeciesConcentrations[sensSpeciesIndices]
                 for i in xrange(len(self.sensitiveSpecies)):
-                    normSens = numpy.zeros(numCoreReactions + numCoreSpecies, numpy.float64)
-                    c = self.coreSpeciesConcentrations[sensSpeciesIndices[i]]
-                    if c != 0:                        
-                        for j in xrange(numCoreReactions):
-                            normSens[j] = 1/volume*(moleSens[j*numCoreSpecies+sensSpeciesIndices[i]]-c*dVdk[j])*forwardRateCoefficients[j]/c
-                        for j in xrange(numCoreReactions,numCoreReactions+numCoreSpecies):
-                            normSens[j] = 1/volume*(moleSens[j*numCoreSpecies+sensSpeciesIndices[i]]-c*dVdk[j])/c*4184   # no normalization against dG, converstion to kcal/mol units
-                    normSens_array[i].append(normSens)
+                    if c[i] != 0:
+                        normSens[i,:] = 1/volume*(moleSens[:,sensSpeciesIndices[i]]-c[i]*dVdk)/c[i]*sensParameterScales
 
-
-            snapshot = [self.t, self.V]
-            snapshot.extend(y_coreSpecies / numpy.sum(y_coreSpecies))
-            self.snapshots.append(snapshot)            
+            self.snapshots.record(self.t, self.V, y_coreSpecies / totalMoles)
 
             # Get the characteristic flux
             charRate = sqrt(numpy.sum(self.coreSpeciesRates * self.coreSpeciesRates))
@@ -580,22 +654,15 @@ cdef class ReactionSystem(DASx):
             for i in xrange(len(self.sensitiveSpecies)):
                 with open(sensWorksheet[i], 'wb') as outfile:
                     worksheet = csv.writer(outfile)
-                    reactionsAboveThreshold = []
-                    for j in xrange(numCoreReactions + numCoreSpecies):
-                        for k in xrange(len(time_array)):
-                            if abs(normSens_array[i][k][j]) > self.sensitivityThreshold:
-                                reactionsAboveThreshold.append(j)
-                                break
+                    speciesSens = self.sensitivityProfile.getSpeciesSensitivities(i)
+                    reactionsAboveThreshold = numpy.flatnonzero(numpy.any(numpy.abs(speciesSens) > self.sensitivityThreshold, axis=0))
                     species_name = getSpeciesIdentifier(self.sensitiveSpecies[i])
                     headers = ['Time (s)']
                     headers.extend(['dln[{0}]/dln[k{1}]: {2}'.format(species_name, j+1, coreReactions[j].toChemkin(kinetics=False)) if j < numCoreReactions 
-                                    else 'dln[{0}]/dG[{1}]'.format(species_name, getSpeciesIdentifier(coreSpecies[j-numCoreReactions])) for j in reactionsAboveThreshold])
+                                    else 'dln[{0}]/dG[{1}]'.format(species_name, getSpeciesIdentifier(coreSpecies[j-numCoreReactions])) for j in sensParameterIndices[reactionsAboveThreshold]])
                     worksheet.writerow(headers)               
                 
-                    for k in xrange(len(time_array)):
-                        row = [time_array[k]]
-                        row.extend([normSens_array[i][k][j] for j in reactionsAboveThreshold])       
-                        worksheet.writerow(row)  
+                    worksheet.writerows(numpy.column_stack((self.sensitivityProfile.time, speciesSens[:,reactionsAboveThreshold])).tolist())
         
         self.maxCoreSpeciesRates = maxCoreSpeciesRates
         self.maxEdgeSpeciesRates = maxEdgeSpeciesRates
@@ -637,87 +704,138 @@ cdef class ReactionSystem(DASx):
     @cython.boundscheck(False)
     def computeRateDerivative(self):
         """
-        Returns derivative vector df/dk_j where dy/dt = f(y, t, k) and
-        k_j is the rate parameter for the jth core reaction.
+        Returns derivative matrix df/dk where dy/dt = f(y, t, k) and k is the
+        vector of sensitive parameters: the rate coefficients of the core
+        reactions followed by the free energies of the core species, restricted
+        to :attr:`sensitiveParameterIndices`. The matrix has one row per core
+        species and is returned in sparse (CSC) form.
         """
         cdef numpy.ndarray[numpy.int_t, ndim=2] ir, ip
-        cdef numpy.ndarray[numpy.float64_t, ndim=1] kf, kr, C, deriv
-        cdef numpy.ndarray[numpy.float64_t, ndim=2] rateDeriv
-        cdef double fderiv, rderiv, flux, V
-        cdef int j, numCoreReactions, numCoreSpecies
-        
-        cdef double RT_inverse, gderiv
-        
-        ir = self.reactantIndices
-        ip = self.productIndices
-        
-        kf = self.kf
-        kr = self.kb    
+        cdef numpy.ndarray[numpy.int_t, ndim=1] parameters, reactionParameters, speciesParameters
+        cdef numpy.ndarray[numpy.float64_t, ndim=1] kf, kr, C, fderiv, rderiv, flux, gderiv
+        cdef int numCoreReactions, numCoreSpecies
+        cdef double RT_inverse, V
         
         numCoreReactions = len(self.coreReactionRates)
         numCoreSpecies = len(self.coreSpeciesConcentrations)      
+
+        ir = self.reactantIndices[:numCoreReactions]
+        ip = self.productIndices[:numCoreReactions]
+        
+        kf = self.kf[:numCoreReactions]
+        kr = self.kb[:numCoreReactions]
         
         # Use stored volume, since this function is only called from residual function. 
         RT_inverse = 1/(constants.R * self.T.value_si)
         V = self.V
 
-        C = self.coreSpeciesConcentrations
+        # Pad the concentrations with a trailing 1 so that the -1 entries of
+        # the reactant and product index arrays drop out of the products
+        C = numpy.append(self.coreSpeciesConcentrations, 1.0)
+        fderiv = numpy.prod(C[ir], axis=1)
+        rderiv = kr / kf * numpy.prod(C[ip], axis=1)
+        flux = fderiv - rderiv
+        gderiv = rderiv * kf * RT_inverse
 
-        rateDeriv = numpy.zeros((numCoreSpecies,numCoreReactions+numCoreSpecies), numpy.float64)
-        
-        for j in xrange(numCoreReactions):
-            if ir[j,1] == -1: # only one reactant
-                fderiv = C[ir[j,0]]
-            elif ir[j,2] == -1: # only two reactants
-                fderiv = C[ir[j,0]] * C[ir[j,1]]                             
-            else: # three reactants!! (really?)
-                fderiv = C[ir[j,0]] * C[ir[j,1]] * C[ir[j,2]]          
-                
-            if ip[j,1] == -1: # only one reactant
-                rderiv = kr[j] / kf[j] * C[ip[j,0]]
-            elif ip[j,2] == -1: # only two reactants
-                rderiv = kr[j] / kf[j] * C[ip[j,0]] * C[ip[j,1]]
-            else: # three reactants!! (really?)
-                rderiv = kr[j] / kf[j] * C[ip[j,0]] * C[ip[j,1]] * C[ip[j,2]]
-            
-            flux = fderiv - rderiv
-            gderiv = rderiv * kf[j] * RT_inverse
-            
-            deriv = numpy.zeros(numCoreSpecies, numpy.float64) # derivative for reaction j with respect to dG_species i
+        parameters = self.sensitiveParameterIndices
+        reactionParameters = parameters[parameters < numCoreReactions]
+        speciesParameters = parameters[parameters >= numCoreReactions] - numCoreReactions
 
-            deriv[ir[j,0]] += gderiv
-            if ir[j,1] != -1: # only two reactants
-                deriv[ir[j,1]] += gderiv
-                if ir[j,2] != -1: # three reactants!! (really?)
-                    deriv[ir[j,2]] += gderiv
-            
-            deriv[ip[j,0]] -= gderiv
-            if ip[j,1] != -1: # only two reactants
-                deriv[ip[j,1]] -= gderiv
-                if ip[j,2] != -1: # three reactants!! (really?)
-                    deriv[ip[j,2]] -= gderiv
-            
-            rateDeriv[ir[j,0], j] -= flux
-            rateDeriv[ir[j,0], numCoreReactions:numCoreReactions+numCoreSpecies] -= deriv
-            if ir[j,1] != -1:
-                rateDeriv[ir[j,1], j] -= flux
-                rateDeriv[ir[j,1], numCoreReactions:numCoreReactions+numCoreSpecies] -= deriv
-                if ir[j,2] != -1:
-                    rateDeriv[ir[j,2], j] -= flux
-                    rateDeriv[ir[j,2], numCoreReactions:numCoreReactions+numCoreSpecies] -= deriv
-                
-            rateDeriv[ip[j,0], j] += flux
-            rateDeriv[ip[j,0], numCoreReactions:numCoreReactions+numCoreSpecies] += deriv
-            if ip[j,1] != -1:
-                rateDeriv[ip[j,1], j] += flux
-                rateDeriv[ip[j,1], numCoreReactions:numCoreReactions+numCoreSpecies] += deriv
-                if ip[j,2] != -1:
-                    rateDeriv[ip[j,2], j] += flux  
-                    rateDeriv[ip[j,2], numCoreReactions:numCoreReactions+numCoreSpecies] += deriv
-                        
-        rateDeriv = V * rateDeriv
-
-        return rateDeriv
+        # With S the net stoichiometric matrix, df/dk = S diag(flux) and
+        # df/dG = -S diag(gderiv) S^T
+        S = self.stoichiometricMatrix
+        rateDeriv = scipy.sparse.hstack([
+            S[:,reactionParameters] * scipy.sparse.diags(flux[reactionParameters], 0),
+            -(S * scipy.sparse.diags(gderiv, 0)) * S[speciesParameters,:].T,
+        ], format='csc')
+
+        return V * rateDeriv
+
+    def getVolumeDerivative(self):
+        """
+        Return the derivative of the reactor volume in m^3 with respect to the
+        moles of any core species. The volume is constant unless a derived
+        class overrides this method.
+        """
+        return 0.0
+
+    @cython.boundscheck(False)
+    def computeSparseJacobian(self):
+        """
+        Return the Jacobian of the core species rates with respect to the moles
+        of the core species at the current concentrations, without the ``cj``
+        term. The Jacobian is returned as a sparse (CSR) matrix `J` and a
+        vector `u` such that the full Jacobian is `J` plus the outer product
+        of `u` with a vector of ones. The rank-one term arises from the change
+        in reactor volume with the total moles, and `u` is ``None`` if the
+        volume is constant.
+        """
+        cdef numpy.ndarray[numpy.int_t, ndim=2] ir, ip
+        cdef numpy.ndarray[numpy.float64_t, ndim=1] kf, kr, C, rateVolume
+        cdef int numCoreReactions, numCoreSpecies, l
+        cdef double dVdn
+
+        numCoreReactions = len(self.coreReactionRates)
+        numCoreSpecies = len(self.coreSpeciesConcentrations)
+
+        ir = self.reactantIndices[:numCoreReactions]
+        ip = self.productIndices[:numCoreReactions]
+        kf = self.kf[:numCoreReactions]
+        kr = self.kb[:numCoreReactions]
+
+        # Pad the concentrations with a trailing 1 so that the -1 entries of
+        # the reactant and product index arrays drop out of the products
+        C = numpy.append(self.coreSpeciesConcentrations, 1.0)
+
+        # D[j,m] is the derivative of the net rate of reaction j with respect
+        # to the moles of species m at constant volume; each reactant (or
+        # product) slot contributes the rate coefficient times the product of
+        # the concentrations in the other slots, and repeated species are
+        # summed on conversion
+        rows, cols, data = [], [], []
+        for indices, k, sign in [(ir, kf, 1.0), (ip, kr, -1.0)]:
+            for l in range(3):
+                others = numpy.prod(C[numpy.delete(indices, l, axis=1)], axis=1)
+                mask = indices[:,l] != -1
+                rows.append(numpy.flatnonzero(mask))
+                cols.append(indices[mask,l])
+                data.append(sign * k[mask] * others[mask])
+        D = scipy.sparse.coo_matrix((numpy.concatenate(data), (numpy.concatenate(rows), numpy.concatenate(cols))),
+            shape=(numCoreReactions, numCoreSpecies)).tocsc()
+        jacobian = (self.stoichiometricMatrix * D).tocsr()
+
+        dVdn = self.getVolumeDerivative()
+        if dVdn == 0:
+            return jacobian, None
+        # The rate of a reaction with n reactants varies with the volume as
+        # V^(1-n), which adds the same term to every column
+        rateVolume = -(numpy.sum(ir != -1, axis=1) - 1) * kf * numpy.prod(C[ir], axis=1) \
+                     + (numpy.sum(ip != -1, axis=1) - 1) * kr * numpy.prod(C[ip], axis=1)
+        return jacobian, self.stoichiometricMatrix.dot(rateVolume * dVdn)
+
+    def computeSensitivityResidual(self, double t, numpy.ndarray[numpy.float64_t, ndim=1] y, numpy.ndarray[numpy.float64_t, ndim=1] dydt, numpy.ndarray[numpy.float64_t, ndim=1] senpar):
+        """
+        Return the residual of the sensitivity equations, i.e. the time
+        derivatives of the moles of the core species with respect to each
+        sensitive parameter, laid out as in `y` after the core species. The
+        Jacobian and df/dk are used in sparse form, so that the cost scales
+        with their number of nonzero entries rather than the square of the
+        number of core species.
+        """
+        cdef numpy.ndarray[numpy.float64_t, ndim=2] ySens, sens
+        cdef int numCoreSpecies
+
+        numCoreSpecies = len(self.coreSpeciesConcentrations)
+        jacobian, u = self.computeSparseJacobian()
+        dgdk = self.computeRateDerivative()
+
+        # ySens[j,i] is the sensitivity of the moles of core species i to parameter j
+        ySens = y[numCoreSpecies:].reshape(-1, numCoreSpecies)
+        sens = jacobian.dot(ySens.T)
+        if u is not None:
+            sens += numpy.outer(u, numpy.sum(ySens, axis=1))
+        sens += dgdk.toarray()
+        return sens.T.ravel()
         
 ################################################################################
 
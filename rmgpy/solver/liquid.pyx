@@ -42,6 +42,8 @@ import rmgpy.constants as constants
 cimport rmgpy.constants as constants
 from rmgpy.quantity import Quantity
 from rmgpy.quantity cimport ScalarQuantity, ArrayQuantity
+from rmgpy.kinetics.diffusionLimited import diffusionLimiter
+from rmgpy.kinetics.table import KineticsTable
 
 cdef class LiquidReactor(ReactionSystem):
     """
@@ -121,13 +123,27 @@ cdef class LiquidReactor(ReactionSystem):
         arrays with the values computed at the temperature and (effective) pressure of the 
         reacion system.
         """
-        
-        for rxn in itertools.chain(coreReactions, edgeReactions):
-            j = self.reactionIndex[rxn]
-            self.kf[j] = rxn.getRateCoefficient(self.T.value_si, self.P.value_si)
-            if rxn.reversible:
-                self.Keq[j] = rxn.getEquilibriumConstant(self.T.value_si)
-                self.kb[j] = self.kf[j] / self.Keq[j]
+        cdef numpy.ndarray reversible
+
+        if diffusionLimiter.enabled:
+            # The diffusion-limited effective rates are not part of the kinetics
+            # table; evaluate them together for the reactions not yet seen at
+            # this temperature, and keep them in the cache of each reaction so
+            # they are reused when the model is next initialized
+            T = self.T.value_si
+            reactions = [rxn for rxn in self.kineticsTable.reactions if T not in rxn.k_effective_cache]
+            if reactions:
+                k_eff, Keq = diffusionLimiter.getEffectiveRates(KineticsTable(reactions), T)
+                for rxn, k in zip(reactions, k_eff):
+                    rxn.k_effective_cache[T] = k
+            self.kf[:] = [rxn.k_effective_cache[T] for rxn in self.kineticsTable.reactions]
+        else:
+            self.kf[:] = self.kineticsTable.getRateCoefficients(self.T.value_si, self.P.value_si)
+
+        reversible = self.kineticsTable.reversible
+        if numpy.any(reversible):
+            self.Keq[reversible] = self.kineticsTable.getEquilibriumConstants(self.T.value_si)[reversible]
+            self.kb[reversible] = self.kf[reversible] / self.Keq[reversible]
 
     def set_initial_conditions(self):
         """
@@ -167,11 +183,10 @@ cdef class LiquidReactor(ReactionSystem):
         cdef numpy.ndarray[numpy.int_t, ndim=2] ir, ip, inet
         cdef numpy.ndarray[numpy.float64_t, ndim=1] res, kf, kr, knet, delta, equilibriumConstants
         cdef int numCoreSpecies, numCoreReactions, numEdgeSpecies, numEdgeReactions, numPdepNetworks
-        cdef int i, j, z, first, second, third
+        cdef int i, j, first, second, third
         cdef double k, V, reactionRate
         cdef numpy.ndarray[numpy.float64_t, ndim=1] coreSpeciesConcentrations, coreSpeciesRates, coreReactionRates, edgeSpeciesRates, edgeReactionRates, networkLeakRates
         cdef numpy.ndarray[numpy.float64_t, ndim=1] C
-        cdef numpy.ndarray[numpy.float64_t, ndim=2] jacobian, dgdk
 
         ir = self.reactantIndices
         ip = self.productIndices
@@ -307,16 +322,7 @@ cdef class LiquidReactor(ReactionSystem):
         if self.sensitivity:
             delta = numpy.zeros(len(y), numpy.float64)
             delta[:numCoreSpecies] = res
-            if self.jacobianMatrix is None:
-                jacobian = self.jacobian(t,y,dydt,0,senpar)
-            else:
-                jacobian = self.jacobianMatrix
-            dgdk = ReactionSystem.computeRateDerivative(self)
-            for j in xrange(numCoreReactions+numCoreSpecies):
-                for i in xrange(numCoreSpecies):
-                    for z in xrange(numCoreSpecies):
-                        delta[(j+1)*numCoreSpecies + i] += jacobian[i,z]*y[(j+1)*numCoreSpecies + z] 
-                    delta[(j+1)*numCoreSpecies + i] += dgdk[i,j]
+            delta[numCoreSpecies:] = self.computeSensitivityResidual(t, y, dydt, senpar)
 
         else:
             delta = res
@@ -0,0 +1,245 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+################################################################################
+#
+#   RMG - Reaction Mechanism Generator
+#
+#   Copyright (c) 2002-2010 Prof. William H. Green (whgreen@mit.edu) and the
+#   RMG Team (rmg_dev@mit.edu)
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a
+#   copy of this software and associated documentation files (the 'Software'),
+#   to deal in the Software without restriction, including without limitation
+#   the rights to use, copy, modify, merge, publish, distribute, sublicense,
+#   and/or sell copies of the Software, and to permit persons to whom the
+#   Software is furnished to do so, subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#   FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#   DEALINGS IN THE SOFTWARE.
+#
+################################################################################
+
+"""
+Contains the :class:`SimulationRecorder` class, which records the rows of a
+simulation profile (e.g. time, volume and mole fractions, or sensitivity
+coefficients) into a preallocated, chunked NumPy buffer instead of a list of
+Python lists.
+"""
+
+import numpy
+
+################################################################################
+
+class SimulationRecorder(object):
+    """
+    A growable two-dimensional array of simulation data, with one row per
+    recorded time step. The attributes are:
+
+    =============== ============================================================
+    Attribute       Description
+    =============== ============================================================
+    `numColumns`    The number of values recorded at each time step
+    `chunkSize`     The minimum number of rows added when the buffer is full
+    `size`          The number of rows recorded so far
+    =============== ============================================================
+
+    Storage is allocated in chunks and doubled as needed, so appending a row
+    is amortized constant time and never allocates a Python object per
+    value. The recorded data are available through :attr:`data` and the
+    other accessors as views into the buffer, without copying.
+    """
+
+    def __init__(self, numColumns, chunkSize=1024):
+        self.numColumns = numColumns
+        self.chunkSize = chunkSize
+        self.size = 0
+        self._buffer = numpy.empty((chunkSize, numColumns), numpy.float64)
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        return self.data[index]
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __reduce__(self):
+        """
+        A helper function used when pickling a SimulationRecorder object.
+        Only the recorded rows are stored.
+        """
+        return (_restoreRecorder, (self.data.copy(), self.chunkSize))
+
+    @property
+    def data(self):
+        """A view of the recorded rows as a ``size`` x ``numColumns`` array."""
+        return self._buffer[:self.size]
+
+    def nextRow(self):
+        """
+        Reserve the next row of the recorder and return it as a writable view,
+        so that the caller can fill it in place.
+        """
+        if self.size == self._buffer.shape[0]:
+            self._grow()
+        row = self._buffer[self.size]
+        self.size += 1
+        return row
+
+    def append(self, row):
+        """
+        Append a single `row` of ``numColumns`` values to the recorder.
+        """
+        self.nextRow()[:] = row
+
+    def clear(self):
+        """
+        Discard all recorded rows, keeping the allocated storage.
+        """
+        self.size = 0
+
+    def _grow(self):
+        capacity = self._buffer.shape[0]
+        buffer = numpy.empty((capacity + max(capacity, self.chunkSize), self.numColumns), numpy.float64)
+        buffer[:capacity] = self._buffer
+        self._buffer = buffer
+
+    def save(self, path):
+        """
+        Save the recorded rows to a binary NumPy ``.npy`` file at `path`.
+        """
+        numpy.save(path, self.data)
+
+def loadSimulationRecorder(path, mmap=True):
+    """
+    Load the rows saved to a ``.npy`` file at `path` by
+    :meth:`SimulationRecorder.save` into a new :class:`SimulationRecorder`.
+    If `mmap` is ``True``, the file is memory-mapped read-only rather than
+    read into memory.
+    """
+    data = numpy.load(path, mmap_mode='r' if mmap else None)
+    return _restoreRecorder(data, 1024)
+
+def _restoreRecorder(data, chunkSize):
+    recorder = SimulationRecorder(data.shape[1], chunkSize)
+    recorder._buffer = data
+    recorder.size = data.shape[0]
+    return recorder
+
+################################################################################
+
+class ProfileRecorder(SimulationRecorder):
+    """
+    A :class:`SimulationRecorder` for the concentration profile of a reaction
+    system. Each row contains the time in s, the volume in m^3, and the mole
+    fractions of the `numSpecies` core species, in the same layout as the
+    rows of the simulation profile CSV files.
+    """
+
+    def __init__(self, numSpecies, chunkSize=1024):
+        SimulationRecorder.__init__(self, numSpecies + 2, chunkSize)
+
+    def __reduce__(self):
+        """
+        A helper function used when pickling a ProfileRecorder object.
+        """
+        return (_restoreProfileRecorder, (self.data.copy(), self.chunkSize))
+
+    def record(self, t, V, moleFractions):
+        """
+        Record the time `t` in s, volume `V` in m^3 and core species
+        `moleFractions` of one time step.
+        """
+        row = self.nextRow()
+        row[0] = t
+        row[1] = V
+        row[2:] = moleFractions
+
+    @property
+    def time(self):
+        """A view of the recorded times in s."""
+        return self.data[:,0]
+
+    @property
+    def volume(self):
+        """A view of the recorded volumes in m^3."""
+        return self.data[:,1]
+
+    @property
+    def moleFractions(self):
+        """A view of the recorded mole fractions, with one column per species."""
+        return self.data[:,2:]
+
+def _restoreProfileRecorder(data, chunkSize):
+    recorder = ProfileRecorder(data.shape[1] - 2, chunkSize)
+    recorder._buffer = data
+    recorder.size = data.shape[0]
+    return recorder
+
+################################################################################
+
+class SensitivityRecorder(SimulationRecorder):
+    """
+    A :class:`SimulationRecorder` for the normalized sensitivity coefficients
+    of `numSensitiveSpecies` species with respect to `numParameters`
+    parameters. Each row contains the time in s followed by the flattened
+    ``numSensitiveSpecies`` x ``numParameters`` sensitivity matrix.
+    """
+
+    def __init__(self, numSensitiveSpecies, numParameters, chunkSize=1024):
+        SimulationRecorder.__init__(self, numSensitiveSpecies * numParameters + 1, chunkSize)
+        self.numSensitiveSpecies = numSensitiveSpecies
+        self.numParameters = numParameters
+
+    def __reduce__(self):
+        """
+        A helper function used when pickling a SensitivityRecorder object.
+        """
+        return (_restoreSensitivityRecorder, (self.data.copy(), self.numSensitiveSpecies, self.numParameters, self.chunkSize))
+
+    def nextSensitivities(self, t):
+        """
+        Reserve a row for the time `t` in s and return its sensitivity
+        coefficients as a writable ``numSensitiveSpecies`` x ``numParameters``
+        view.
+        """
+        row = self.nextRow()
+        row[0] = t
+        return row[1:].reshape(self.numSensitiveSpecies, self.numParameters)
+
+    @property
+    def time(self):
+        """A view of the recorded times in s."""
+        return self.data[:,0]
+
+    @property
+    def sensitivities(self):
+        """
+        A view of the recorded sensitivities as a ``size`` x
+        ``numSensitiveSpecies`` x ``numParameters`` array.
+        """
+        return self.data[:,1:].reshape(self.size, self.numSensitiveSpecies, self.numParameters)
+
+    def getSpeciesSensitivities(self, index):
+        """
+        Return a view of the sensitivities of the sensitive species with the
+        given `index` as a ``size`` x ``numParameters`` array.
+        """
+        start = 1 + index * self.numParameters
+        return self.data[:,start:start + self.numParameters]
+
+def _restoreSensitivityRecorder(data, numSensitiveSpecies, numParameters, chunkSize):
+    recorder = SensitivityRecorder(numSensitiveSpecies, numParameters, chunkSize)
+    recorder._buffer = data
+    recorder.size = data.shape[0]
+    return recorder
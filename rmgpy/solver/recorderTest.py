@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+################################################################################
+#
+#   RMG - Reaction Mechanism Generator
+#
+#   Copyright (c) 2002-2010 Prof. William H. Green (whgreen@mit.edu) and the
+#   RMG Team (rmg_dev@mit.edu)
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a
+#   copy of this software and associated documentation files (the 'Software'),
+#   to deal in the Software without restriction, including without limitation
+#   the rights to use, copy, modify, merge, publish, distribute, sublicense,
+#   and/or sell copies of the Software, and to permit persons to whom the
+#   Software is furnished to do so, subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#   FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#   DEALINGS IN THE SOFTWARE.
+#
+################################################################################
+
+"""
+This script contains unit tests of the :mod:`rmgpy.solver.recorder` module.
+"""
+
+import unittest
+import os
+import shutil
+import tempfile
+import cPickle
+import numpy
+
+from rmgpy.solver.recorder import ProfileRecorder, SensitivityRecorder, loadSimulationRecorder
+
+################################################################################
+
+class TestProfileRecorder(unittest.TestCase):
+    """
+    Contains unit tests of the ProfileRecorder class.
+    """
+
+    def setUp(self):
+        """
+        A function run before each unit test in this class.
+        """
+        self.recorder = ProfileRecorder(3, chunkSize=4)
+        for i in range(10):
+            self.recorder.record(0.1 * i, 1.0 + i, numpy.array([0.5, 0.3, 0.2]))
+
+    def test_record(self):
+        """
+        Test that rows are recorded past the initial chunk size.
+        """
+        self.assertEqual(len(self.recorder), 10)
+        self.assertEqual(self.recorder.data.shape, (10, 5))
+        self.assertAlmostEqual(self.recorder.time[9], 0.9)
+        self.assertAlmostEqual(self.recorder.volume[3], 4.0)
+        self.assertEqual(list(self.recorder.moleFractions[5]), [0.5, 0.3, 0.2])
+        self.assertEqual(len(list(self.recorder)), 10)
+
+    def test_views(self):
+        """
+        Test that the accessors return views of the recorded data.
+        """
+        self.assertTrue(numpy.may_share_memory(self.recorder.moleFractions, self.recorder.data))
+        self.assertTrue(numpy.may_share_memory(self.recorder[2][2:], self.recorder.data))
+
+    def test_pickle(self):
+        """
+        Test that a ProfileRecorder can be pickled and unpickled.
+        """
+        recorder = cPickle.loads(cPickle.dumps(self.recorder, -1))
+        self.assertTrue(isinstance(recorder, ProfileRecorder))
+        self.assertTrue(numpy.all(recorder.data == self.recorder.data))
+        recorder.record(1.0, 11.0, numpy.array([0.1, 0.1, 0.8]))
+        self.assertEqual(len(recorder), 11)
+
+    def test_saveLoad(self):
+        """
+        Test that recorded rows can be saved and memory-mapped back.
+        """
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'profile.npy')
+            self.recorder.save(path)
+            recorder = loadSimulationRecorder(path)
+            self.assertTrue(numpy.all(recorder.data == self.recorder.data))
+        finally:
+            shutil.rmtree(directory)
+
+class TestSensitivityRecorder(unittest.TestCase):
+    """
+    Contains unit tests of the SensitivityRecorder class.
+    """
+
+    def test_sensitivities(self):
+        """
+        Test that sensitivities are stored and sliced per species.
+        """
+        recorder = SensitivityRecorder(2, 3, chunkSize=2)
+        for i in range(5):
+            sens = recorder.nextSensitivities(float(i))
+            sens[0,:] = [i, 2 * i, 3 * i]
+            sens[1,:] = -i
+        self.assertEqual(recorder.sensitivities.shape, (5, 2, 3))
+        self.assertEqual(list(recorder.time), [0., 1., 2., 3., 4.])
+        self.assertEqual(list(recorder.getSpeciesSensitivities(0)[4]), [4., 8., 12.])
+        self.assertEqual(list(recorder.sensitivities[3,1]), [-3., -3., -3.])
+
+################################################################################
+
+if __name__ == '__main__':
+    unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
@@ -172,15 +172,21 @@ cdef class SimpleReactor(ReactionSystem):
         and equilibrium constants (Keq) arrays with the values computed at the temperature
         and (effective) pressure of the reacion system.
         """
+        cdef numpy.ndarray[numpy.float64_t, ndim=1] y0_coreSpecies, Peff
+        cdef numpy.ndarray reversible
 
-        for rxn in itertools.chain(coreReactions, edgeReactions):
-            j = self.reactionIndex[rxn]
-            Peff = self.calculate_effective_pressure(rxn)
-            self.kf[j] = rxn.getRateCoefficient(self.T.value_si, Peff)
+        # Effective pressures of the reactions with specific collider efficiencies
+        Peff = numpy.ones_like(self.kf) * self.P.value_si
+        if self.pdepColliderReactionIndices.shape[0] != 0:
+            y0_coreSpecies = self.y0[:self.numCoreSpecies]
+            Peff[self.pdepColliderReactionIndices] = self.P.value_si * numpy.dot(self.colliderEfficiencies, y0_coreSpecies) / numpy.sum(y0_coreSpecies)
 
-            if rxn.reversible:
-                self.Keq[j] = rxn.getEquilibriumConstant(self.T.value_si)
-                self.kb[j] = self.kf[j] / self.Keq[j]
+        self.kf[:] = self.kineticsTable.getRateCoefficients(self.T.value_si, Peff)
+
+        reversible = self.kineticsTable.reversible
+        if numpy.any(reversible):
+            self.Keq[reversible] = self.kineticsTable.getEquilibriumConstants(self.T.value_si)[reversible]
+            self.kb[reversible] = self.kf[reversible] / self.Keq[reversible]
 
 
     def set_colliders(self, coreReactions, edgeReactions, coreSpecies):
@@ -240,11 +246,11 @@ cdef class SimpleReactor(ReactionSystem):
         cdef numpy.ndarray[numpy.int_t, ndim=2] ir, ip, inet
         cdef numpy.ndarray[numpy.float64_t, ndim=1] res, kf, kr, knet, delta, equilibriumConstants
         cdef int numCoreSpecies, numCoreReactions, numEdgeSpecies, numEdgeReactions, numPdepNetworks
-        cdef int i, j, z, first, second, third
+        cdef int i, j, first, second, third
         cdef double k, V, reactionRate, T, P, Peff
         cdef numpy.ndarray[numpy.float64_t, ndim=1] coreSpeciesConcentrations, coreSpeciesRates, coreReactionRates, edgeSpeciesRates, edgeReactionRates, networkLeakRates
         cdef numpy.ndarray[numpy.float64_t, ndim=1] C, y_coreSpecies
-        cdef numpy.ndarray[numpy.float64_t, ndim=2] jacobian, dgdk, colliderEfficiencies
+        cdef numpy.ndarray[numpy.float64_t, ndim=2] colliderEfficiencies
         cdef numpy.ndarray[numpy.int_t, ndim=1] pdepColliderReactionIndices
         cdef list pdepColliderKinetics
 
@@ -392,16 +398,7 @@ cdef class SimpleReactor(ReactionSystem):
         if self.sensitivity:
             delta = numpy.zeros(len(y), numpy.float64)
             delta[:numCoreSpecies] = res
-            if self.jacobianMatrix is None:
-                jacobian = self.jacobian(t,y,dydt,0,senpar)
-            else:
-                jacobian = self.jacobianMatrix
-            dgdk = ReactionSystem.computeRateDerivative(self)
-            for j in xrange(numCoreReactions+numCoreSpecies):
-                for i in xrange(numCoreSpecies):
-                    for z in xrange(numCoreSpecies):
-                        delta[(j+1)*numCoreSpecies + i] += jacobian[i,z]*y[(j+1)*numCoreSpecies + z] 
-                    delta[(j+1)*numCoreSpecies + i] += dgdk[i,j]
+            delta[numCoreSpecies:] = self.computeSensitivityResidual(t, y, dydt, senpar)
 
         else:
             delta = res
@@ -410,6 +407,14 @@ cdef class SimpleReactor(ReactionSystem):
         # Return DELTA, IRES.  IRES is set to 1 in order to tell DASPK to evaluate the sensitivity residuals
         return delta, 1
     
+    def getVolumeDerivative(self):
+        """
+        Return the derivative of the reactor volume in m^3 with respect to the
+        moles of any core species. The ideal gas mixture is held at constant
+        temperature and pressure, so this is :math:`RT/P`.
+        """
+        return constants.R * self.T.value_si / self.P.value_si
+
     @cython.boundscheck(False)
     def jacobian(self, double t, numpy.ndarray[numpy.float64_t, ndim=1] y, numpy.ndarray[numpy.float64_t, ndim=1] dydt, double cj, numpy.ndarray[numpy.float64_t, ndim=1] senpar = numpy.zeros(1, numpy.float64)):
         """
@@ -214,6 +214,111 @@ class SimpleReactorCheck(unittest.TestCase):
 #        pylab.show()
 
 
+    def testSensitiveParameters(self):
+        """
+        Test that the sensitivities can be restricted to a subset of the
+        parameters, and that the sparse sensitivity residual matches the
+        dense product of the Jacobian and the sensitivities.
+        """
+        Tdata = ([300,400,500,600,800,1000,1500],"K")
+        CH4 = Species(label='CH4', thermo=ThermoData(Tdata=Tdata, Cpdata=([ 8.615, 9.687,10.963,12.301,14.841,16.976,20.528],"cal/(mol*K)"), H298=(-17.714,"kcal/mol"), S298=(44.472,"cal/(mol*K)")))
+        CH3 = Species(label='CH3', thermo=ThermoData(Tdata=Tdata, Cpdata=([ 9.397,10.123,10.856,11.571,12.899,14.055,16.195],"cal/(mol*K)"), H298=(  9.357,"kcal/mol"), S298=(45.174,"cal/(mol*K)")))
+        C2H6 = Species(label='C2H6', thermo=ThermoData(Tdata=Tdata, Cpdata=([12.684,15.506,18.326,20.971,25.500,29.016,34.595],"cal/(mol*K)"), H298=(-19.521,"kcal/mol"), S298=(54.799,"cal/(mol*K)")))
+        C2H5 = Species(label='C2H5', thermo=ThermoData(Tdata=Tdata, Cpdata=([11.635,13.744,16.085,18.246,21.885,24.676,29.107],"cal/(mol*K)"), H298=( 29.496,"kcal/mol"), S298=(56.687,"cal/(mol*K)")))
+
+        rxn1 = Reaction(reactants=[C2H6], products=[CH3,CH3], kinetics=Arrhenius(A=(686.375e6,'1/s'), n=4.40721, Ea=(7.82799,'kcal/mol'), T0=(298.15,'K')))
+        rxn2 = Reaction(reactants=[C2H6,CH3], products=[C2H5,CH4], kinetics=Arrhenius(A=(46.375*6,'m^3/(mol*s)'), n=3.40721, Ea=(6.82799,'kcal/mol'), T0=(298.15,'K')))
+
+        coreSpecies = [CH4,CH3,C2H6,C2H5]
+        coreReactions = [rxn1, rxn2]
+        numCoreSpecies = len(coreSpecies)
+        initialMoleFractions = {CH4:0.2,CH3:0.1,C2H6:0.55,C2H5:0.15}
+
+        rxnSystem = SimpleReactor(1000, 1.0e5, initialMoleFractions=initialMoleFractions, termination=[])
+        rxnSystem.initializeModel(coreSpecies, coreReactions, [], [], sensitivity=True)
+        self.assertEqual(rxnSystem.neq, numCoreSpecies * (len(coreReactions) + numCoreSpecies + 1))
+        y = rxnSystem.y.copy()
+        y[numCoreSpecies:] = numpy.linspace(0.1, 1.0, y.size - numCoreSpecies)
+        rxnSystem.residual(0.0, y, numpy.zeros(y.shape))
+        dfdk = rxnSystem.computeRateDerivative().toarray()
+        jacobian = rxnSystem.jacobian(0.0, y, numpy.zeros(y.shape), 0.0)
+        sens = rxnSystem.computeSensitivityResidual(0.0, y, numpy.zeros(y.shape), rxnSystem.senpar)
+        ySens = y[numCoreSpecies:].reshape(-1, numCoreSpecies)
+        for j in range(ySens.shape[0]):
+            expected = numpy.dot(jacobian, ySens[j]) + dfdk[:,j]
+            for i in range(numCoreSpecies):
+                self.assertAlmostEqual(sens[j*numCoreSpecies+i], expected[i], delta=1e-8*abs(expected[i]))
+
+        rxnSystem = SimpleReactor(1000, 1.0e5, initialMoleFractions=initialMoleFractions, termination=[])
+        rxnSystem.sensitiveParameters = [C2H6, rxn2]
+        rxnSystem.initializeModel(coreSpecies, coreReactions, [], [], sensitivity=True)
+        self.assertEqual(list(rxnSystem.sensitiveParameterIndices), [1, len(coreReactions) + 2])
+        self.assertEqual(rxnSystem.neq, numCoreSpecies * 3)
+        y = rxnSystem.y.copy()
+        rxnSystem.residual(0.0, y, numpy.zeros(y.shape))
+        subsetDfdk = rxnSystem.computeRateDerivative().toarray()
+        for i in range(numCoreSpecies):
+            self.assertAlmostEqual(subsetDfdk[i,0], dfdk[i,1], delta=1e-8*abs(dfdk[i,1]))
+            self.assertAlmostEqual(subsetDfdk[i,1], dfdk[i,len(coreReactions) + 2], delta=1e-8*abs(dfdk[i,len(coreReactions) + 2]))
+
+    def testSparseJacobian(self):
+        """
+        Test that the sparse Jacobian and its rank-one volume term add up to
+        the dense analytical Jacobian.
+        """
+        Tdata = ([300,400,500,600,800,1000,1500],"K")
+        CH4 = Species(label='CH4', thermo=ThermoData(Tdata=Tdata, Cpdata=([ 8.615, 9.687,10.963,12.301,14.841,16.976,20.528],"cal/(mol*K)"), H298=(-17.714,"kcal/mol"), S298=(44.472,"cal/(mol*K)")))
+        CH3 = Species(label='CH3', thermo=ThermoData(Tdata=Tdata, Cpdata=([ 9.397,10.123,10.856,11.571,12.899,14.055,16.195],"cal/(mol*K)"), H298=(  9.357,"kcal/mol"), S298=(45.174,"cal/(mol*K)")))
+        C2H6 = Species(label='C2H6', thermo=ThermoData(Tdata=Tdata, Cpdata=([12.684,15.506,18.326,20.971,25.500,29.016,34.595],"cal/(mol*K)"), H298=(-19.521,"kcal/mol"), S298=(54.799,"cal/(mol*K)")))
+        C2H5 = Species(label='C2H5', thermo=ThermoData(Tdata=Tdata, Cpdata=([11.635,13.744,16.085,18.246,21.885,24.676,29.107],"cal/(mol*K)"), H298=( 29.496,"kcal/mol"), S298=(56.687,"cal/(mol*K)")))
+
+        coreSpecies = [CH4,CH3,C2H6,C2H5]
+        coreReactions = [
+            Reaction(reactants=[C2H6], products=[CH3,CH3], kinetics=Arrhenius(A=(686.375e6,'1/s'), n=4.40721, Ea=(7.82799,'kcal/mol'), T0=(298.15,'K'))),
+            Reaction(reactants=[C2H6,CH3], products=[C2H5,CH4], kinetics=Arrhenius(A=(46.375*6,'m^3/(mol*s)'), n=3.40721, Ea=(6.82799,'kcal/mol'), T0=(298.15,'K'))),
+            Reaction(reactants=[CH3,CH3], products=[C2H6], kinetics=Arrhenius(A=(1.0e7,'m^3/(mol*s)'), n=0.0, Ea=(0.0,'kcal/mol'), T0=(1,'K'))),
+        ]
+
+        rxnSystem = SimpleReactor(1000, 1.0e5, initialMoleFractions={CH4:0.2,CH3:0.1,C2H6:0.55,C2H5:0.15}, termination=[])
+        rxnSystem.initializeModel(coreSpecies, coreReactions, [], [])
+        y = rxnSystem.y.copy()
+        rxnSystem.residual(0.0, y, numpy.zeros(y.shape))
+        expected = rxnSystem.jacobian(0.0, y, numpy.zeros(y.shape), 0.0)
+        jacobian, u = rxnSystem.computeSparseJacobian()
+        actual = jacobian.toarray() + numpy.outer(u, numpy.ones(len(coreSpecies)))
+        for i in range(len(coreSpecies)):
+            for j in range(len(coreSpecies)):
+                self.assertAlmostEqual(actual[i,j], expected[i,j], delta=1e-8*numpy.max(numpy.abs(expected)))
+
+    def testKineticsTableReuse(self):
+        """
+        Test that the packed kinetics table is kept when the model is
+        initialized again with the same reactions, and rebuilt when the
+        edge changes.
+        """
+        Tdata = ([300,400,500,600,800,1000,1500],"K")
+        CH4 = Species(label='CH4', thermo=ThermoData(Tdata=Tdata, Cpdata=([ 8.615, 9.687,10.963,12.301,14.841,16.976,20.528],"cal/(mol*K)"), H298=(-17.714,"kcal/mol"), S298=(44.472,"cal/(mol*K)")))
+        CH3 = Species(label='CH3', thermo=ThermoData(Tdata=Tdata, Cpdata=([ 9.397,10.123,10.856,11.571,12.899,14.055,16.195],"cal/(mol*K)"), H298=(  9.357,"kcal/mol"), S298=(45.174,"cal/(mol*K)")))
+        C2H6 = Species(label='C2H6', thermo=ThermoData(Tdata=Tdata, Cpdata=([12.684,15.506,18.326,20.971,25.500,29.016,34.595],"cal/(mol*K)"), H298=(-19.521,"kcal/mol"), S298=(54.799,"cal/(mol*K)")))
+        C2H5 = Species(label='C2H5', thermo=ThermoData(Tdata=Tdata, Cpdata=([11.635,13.744,16.085,18.246,21.885,24.676,29.107],"cal/(mol*K)"), H298=( 29.496,"kcal/mol"), S298=(56.687,"cal/(mol*K)")))
+
+        rxn1 = Reaction(reactants=[C2H6], products=[CH3,CH3], kinetics=Arrhenius(A=(686.375e6,'1/s'), n=4.40721, Ea=(7.82799,'kcal/mol'), T0=(298.15,'K')))
+        rxn2 = Reaction(reactants=[C2H6,CH3], products=[C2H5,CH4], kinetics=Arrhenius(A=(46.375*6,'m^3/(mol*s)'), n=3.40721, Ea=(6.82799,'kcal/mol'), T0=(298.15,'K')))
+
+        coreSpecies = [CH4,CH3,C2H6]
+        rxnSystem = SimpleReactor(1000, 1.0e5, initialMoleFractions={CH4:0.2,CH3:0.1,C2H6:0.7}, termination=[])
+        rxnSystem.initializeModel(coreSpecies, [rxn1], [C2H5], [])
+        table = rxnSystem.kineticsTable
+        kf = rxnSystem.kf.copy()
+        rxnSystem.initializeModel(coreSpecies, [rxn1], [C2H5], [])
+        self.assertTrue(rxnSystem.kineticsTable is table)
+        self.assertTrue(numpy.all(rxnSystem.kf == kf))
+
+        rxnSystem.initializeModel(coreSpecies, [rxn1], [C2H5], [rxn2])
+        self.assertFalse(rxnSystem.kineticsTable is table)
+        self.assertEqual(len(rxnSystem.kineticsTable), 2)
+        self.assertAlmostEqual(rxnSystem.kf[1] / rxn2.getRateCoefficient(1000, 1.0e5), 1.0, 6)
+
     def testColliderModel(self):
         """
         Test the solver's ability to simulate a model with collision efficiencies.
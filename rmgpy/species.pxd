@@ -52,7 +52,7 @@ cdef class Species:
     
     cpdef bint isIsomorphic(self, other)
     
-    cpdef fromAdjacencyList(self, adjlist)
+    cpdef fromAdjacencyList(self, adjlist, bint check=?)
     cpdef fromSMILES(self, smiles)
     
     cpdef toAdjacencyList(self)
@@ -71,6 +71,14 @@ cdef class Species:
 
     cpdef double getFreeEnergy(self, double T) except 100000000
 
+    cpdef numpy.ndarray getHeatCapacities(self, Tlist)
+
+    cpdef numpy.ndarray getEnthalpies(self, Tlist)
+
+    cpdef numpy.ndarray getEntropies(self, Tlist)
+
+    cpdef numpy.ndarray getFreeEnergies(self, Tlist)
+
     cpdef numpy.ndarray getSumOfStates(self, numpy.ndarray Elist)
 
     cpdef numpy.ndarray getDensityOfStates(self, numpy.ndarray Elist)
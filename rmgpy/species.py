@@ -190,14 +190,15 @@ class Species(object):
             raise ValueError('Unexpected value "{0!r}" for other parameter; should be a Molecule or Species object.'.format(other))
         return False
     
-    def fromAdjacencyList(self, adjlist):
+    def fromAdjacencyList(self, adjlist, check=True):
         """
         Load the structure of a species as a :class:`Molecule` object from the
         given adjacency list `adjlist` and store it as the first entry of a 
         list in the `molecule` attribute. Does not generate resonance isomers
-        of the loaded molecule.
+        of the loaded molecule. If `check` is ``False``, the adjacency list is
+        trusted to describe a valid molecule and is not checked.
         """
-        self.molecule = [Molecule().fromAdjacencyList(adjlist)]
+        self.molecule = [Molecule().fromAdjacencyList(adjlist, check=check)]
         # If the first line is a label, then save it to the label attribute
         for label in adjlist.splitlines():
             if label.strip():
@@ -349,6 +350,46 @@ class Species(object):
         else:
             raise Exception('Unable to calculate free energy for species {0!r}: no thermo or statmech data available.'.format(self.label))
         return G
+
+    def getHeatCapacities(self, Tlist):
+        """
+        Return the heat capacities in J/mol*K for the species at the specified
+        temperatures `Tlist` in K.
+        """
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        if self.hasThermo():
+            return self.getThermoData().getHeatCapacities(Tlist)
+        return numpy.array([self.getHeatCapacity(T) for T in Tlist], numpy.float64)
+
+    def getEnthalpies(self, Tlist):
+        """
+        Return the enthalpies in J/mol for the species at the specified
+        temperatures `Tlist` in K.
+        """
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        if self.hasThermo():
+            return self.getThermoData().getEnthalpies(Tlist)
+        return numpy.array([self.getEnthalpy(T) for T in Tlist], numpy.float64)
+
+    def getEntropies(self, Tlist):
+        """
+        Return the entropies in J/mol*K for the species at the specified
+        temperatures `Tlist` in K.
+        """
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        if self.hasThermo():
+            return self.getThermoData().getEntropies(Tlist)
+        return numpy.array([self.getEntropy(T) for T in Tlist], numpy.float64)
+
+    def getFreeEnergies(self, Tlist):
+        """
+        Return the Gibbs free energies in J/mol for the species at the
+        specified temperatures `Tlist` in K.
+        """
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        if self.hasThermo():
+            return self.getThermoData().getFreeEnergies(Tlist)
+        return numpy.array([self.getFreeEnergy(T) for T in Tlist], numpy.float64)
         
     def getSumOfStates(self, Elist):
         """
@@ -40,6 +40,7 @@ cdef class Conformer:
     cdef public ArrayQuantity _number
     cdef public ArrayQuantity _mass
     cdef public ArrayQuantity _coordinates
+    cdef dict _densStatesCache
 
     cpdef double getPartitionFunction(self, double T) except -1
 
@@ -55,6 +56,8 @@ cdef class Conformer:
 
     cpdef numpy.ndarray getDensityOfStates(self, numpy.ndarray Elist)
 
+    cdef tuple getModesKey(self)
+
     cpdef double getTotalMass(self, atoms=?) except -1
 
     cpdef numpy.ndarray getCenterOfMass(self, atoms=?)
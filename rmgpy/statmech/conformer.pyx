@@ -78,6 +78,7 @@ cdef class Conformer:
         self.number = number
         self.mass = mass
         self.coordinates = coordinates
+        self._densStatesCache = {}
 
     def __repr__(self):
         """
@@ -192,14 +193,40 @@ cdef class Conformer:
     cpdef numpy.ndarray getDensityOfStates(self, numpy.ndarray Elist):
         """
         Return the density of states :math:`\\rho(E) \\ dE` at the specified
-        energies `Elist` above the ground state.
+        energies `Elist` above the ground state. The convolved density of
+        states of the modes is remembered for each energy grid, and is found
+        again as long as the modes are unchanged.
         """
         cdef numpy.ndarray densStates = None
         cdef Mode mode
-        for mode in self.modes:
-            densStates = mode.getDensityOfStates(Elist, densStates)
+        key = (numpy.asarray(Elist, numpy.float64).tostring(), self.getModesKey())
+        densStates = self._densStatesCache.get(key)
+        if densStates is None:
+            for mode in self.modes:
+                densStates = mode.getDensityOfStates(Elist, densStates)
+            if len(self._densStatesCache) >= 10:
+                self._densStatesCache.clear()
+            self._densStatesCache[key] = densStates
         return densStates * self.spinMultiplicity * self.opticalIsomers
 
+    cdef tuple getModesKey(self):
+        """
+        Return a hashable key containing the exact parameters of each of the
+        modes, for use in looking up the cached densities of states.
+        """
+        cdef Mode mode
+        key = []
+        for mode in self.modes:
+            cls, args = mode.__reduce__()
+            key.append((cls,) + tuple([numpy.asarray(arg.value_si).tostring() if isinstance(arg, (ScalarQuantity, ArrayQuantity)) else arg for arg in args]))
+        return tuple(key)
+
+    def clearDensityOfStatesCache(self):
+        """
+        Clear the densities of states remembered for each energy grid.
+        """
+        self._densStatesCache = {}
+
     cpdef double getTotalMass(self, atoms=None) except -1:
         """
         Calculate and return the total mass of the atoms in the conformer in 
@@ -164,6 +164,24 @@ class TestConformer(unittest.TestCase):
         Qexp = self.ethylene.getPartitionFunction(T)
         self.assertAlmostEqual(Qexp, Qact, delta=1e-1*Qexp)
 
+    def test_getDensityOfStates_cache(self):
+        """
+        Test that the StatMech.getDensityOfStates() method remembers the
+        density of states for each energy grid until the modes change.
+        """
+        Elist = numpy.arange(0, 5000*11.96, 2*11.96)
+        densStates1 = self.ethylene.getDensityOfStates(Elist)
+        densStates1[10] = 0.0
+        densStates2 = self.ethylene.getDensityOfStates(Elist)
+        self.assertNotEqual(densStates2[10], 0.0)
+        densStates3 = self.ethylene.getDensityOfStates(Elist[:1000])
+        self.assertTrue(numpy.allclose(densStates3, densStates2[:1000], rtol=1e-6, atol=0))
+        self.ethylene.modes[2].frequencies = ([800, 1000, 1200], "cm^-1")
+        densStates4 = self.ethylene.getDensityOfStates(Elist)
+        self.assertFalse(numpy.all(densStates4 == densStates2))
+        self.ethylene.clearDensityOfStatesCache()
+        self.assertTrue(numpy.all(self.ethylene.getDensityOfStates(Elist) == densStates4))
+
     def test_getPartitionFunction_oxygen(self):
         """
         Test the StatMech.getPartitionFunction() method for oxygen.
@@ -43,6 +43,16 @@ from libc.math cimport exp, log
 
 cimport rmgpy.constants as constants
 
+# Arrays with more than this number of elements are convolved using fast
+# Fourier transforms rather than by direct summation
+fftConvolveThreshold = 1024
+# The values of an FFT convolution smaller than this fraction of the largest
+# value are recomputed by direct summation
+fftConvolveTolerance = 1e-6
+# If more than this fraction of the values of an FFT convolution would be
+# recomputed, the arrays are convolved by direct summation instead
+fftConvolveMaxRecompute = 0.5
+
 ################################################################################
 
 def unitDegeneracy(n):
@@ -200,14 +210,28 @@ cpdef numpy.ndarray getDensityOfStates(numpy.ndarray Elist, energy, degeneracy=u
 @cython.wraparound(False)
 def convolve(numpy.ndarray[numpy.float64_t,ndim=1] rho1, numpy.ndarray[numpy.float64_t,ndim=1] rho2):
     """
-    Return the convolution of two arrays `rho1` and `rho2`.
+    Return the convolution of two arrays `rho1` and `rho2`. Arrays longer
+    than `fftConvolveThreshold` are convolved using fast Fourier transforms,
+    and shorter arrays by direct summation.
     """
-    cdef numpy.ndarray[numpy.float64_t,ndim=1] rho
-    cdef int i, j, nE
-    
     if rho1.shape[0] != rho2.shape[0]:
         raise ValueError('Attempted to convolve an array of length {0:d} with an array of length {1:d}.'.format(len(rho1), len(rho2)))
     
+    if rho1.shape[0] > fftConvolveThreshold:
+        return convolveFFT(rho1, rho2)
+    else:
+        return convolveDirect(rho1, rho2)
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def convolveDirect(numpy.ndarray[numpy.float64_t,ndim=1] rho1, numpy.ndarray[numpy.float64_t,ndim=1] rho2):
+    """
+    Return the convolution of two arrays `rho1` and `rho2` of equal length,
+    evaluated by direct summation.
+    """
+    cdef numpy.ndarray[numpy.float64_t,ndim=1] rho
+    cdef int i, j, nE
+    
     nE = rho1.shape[0]
     rho = numpy.zeros_like(rho1)
     
@@ -217,6 +241,38 @@ def convolve(numpy.ndarray[numpy.float64_t,ndim=1] rho1, numpy.ndarray[numpy.flo
 
     return rho
 
+def convolveFFT(numpy.ndarray[numpy.float64_t,ndim=1] rho1, numpy.ndarray[numpy.float64_t,ndim=1] rho2):
+    """
+    Return the convolution of two arrays `rho1` and `rho2` of equal length,
+    evaluated using fast Fourier transforms. The round-off error of the
+    transforms is small relative to the largest value in the result, so the
+    leading values that fall below `fftConvolveTolerance` times the largest
+    value are recomputed by direct summation. If that would be more than
+    `fftConvolveMaxRecompute` of the values, as for sparse comb-like
+    densities of states, the whole convolution is done by direct summation.
+    """
+    cdef numpy.ndarray[numpy.float64_t,ndim=1] rho
+    cdef int nE, nFFT, k
+    
+    nE = rho1.shape[0]
+    if nE == 0:
+        return numpy.zeros_like(rho1)
+    
+    # Pad to a power of two at least twice as long to avoid wrap-around
+    nFFT = 1
+    while nFFT < 2 * nE:
+        nFFT *= 2
+    rho = numpy.fft.irfft(numpy.fft.rfft(rho1, nFFT) * numpy.fft.rfft(rho2, nFFT), nFFT)[:nE]
+    
+    small = numpy.nonzero(rho < fftConvolveTolerance * numpy.max(rho))[0]
+    if small.shape[0] > 0:
+        k = small[-1] + 1
+        if k > fftConvolveMaxRecompute * nE:
+            return convolveDirect(rho1, rho2)
+        rho[:k] = convolveDirect(rho1[:k].copy(), rho2[:k].copy())
+    
+    return rho
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def convolveBS(numpy.ndarray[numpy.float64_t,ndim=1] Elist,
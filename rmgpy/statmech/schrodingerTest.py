@@ -36,7 +36,8 @@ module.
 import unittest
 
 import numpy
-from rmgpy.statmech.schrodinger import getPartitionFunction, getHeatCapacity, getEnthalpy, getEntropy, getDensityOfStates
+from rmgpy.statmech.schrodinger import getPartitionFunction, getHeatCapacity, getEnthalpy, getEntropy, getDensityOfStates, \
+                                      convolve, convolveDirect, convolveFFT
 import rmgpy.constants as constants
 
 ################################################################################
@@ -118,6 +119,34 @@ class TestSchrodinger(unittest.TestCase):
             Qact = numpy.sum(densStates * numpy.exp(-Elist / constants.R / T))
             Qexp = getPartitionFunction(T, self.energy, self.degeneracy, self.n0)
             self.assertAlmostEqual(Qexp / Qact, 1.0, 2, '{0} != {1} within 2 figures'.format(Qexp, Qact))
+
+    def test_convolve(self):
+        """
+        Test that the convolution evaluated using fast Fourier transforms
+        agrees with direct summation, including at the smallest values.
+        """
+        Elist = numpy.arange(0, 40000., 20.)
+        rho1 = getDensityOfStates(Elist, self.energy, self.degeneracy, self.n0)
+        rho2 = (Elist / 1000.) ** 6
+        rho2[0] = 1.0
+        rhoDirect = convolveDirect(rho1, rho2)
+        rhoFFT = convolveFFT(rho1, rho2)
+        self.assertEqual(rhoFFT.shape, rhoDirect.shape)
+        for direct, fft in zip(rhoDirect, rhoFFT):
+            if direct == 0:
+                self.assertEqual(fft, 0)
+            else:
+                self.assertAlmostEqual(fft / direct, 1.0, 6)
+        self.assertTrue(numpy.all(convolve(rho1, rho2) == rhoFFT))
+        self.assertRaises(ValueError, convolve, rho1, rho2[:-1])
+
+        # Sparse comb-like densities of states leave small values throughout
+        # the result, so they are convolved by direct summation
+        comb1 = numpy.zeros(2000)
+        comb1[::37] = 1.0
+        comb2 = numpy.zeros(2000)
+        comb2[::53] = 2.0
+        self.assertTrue(numpy.all(convolveFFT(comb1, comb2) == convolveDirect(comb1, comb2)))
             
 ################################################################################
 
@@ -48,6 +48,17 @@ import rmgpy.statmech.schrodinger as schrodinger
 
 import logging
 
+# The energy levels of hindered rotors found by solving the Schrodinger
+# equation, keyed by the rotor parameters and the number of basis functions
+_energyLevelCache = {}
+maxEnergyLevelCacheSize = 10000
+
+def clearEnergyLevelCache():
+    """
+    Clear the cache of hindered rotor energy levels.
+    """
+    _energyLevelCache.clear()
+
 ################################################################################
 
 cdef class Torsion(Mode):
@@ -243,6 +254,18 @@ cdef class HinderedRotor(Torsion):
         functions (the default). Returns the energy eigenvalues of the
         Hamiltonian matrix in J/mol.
         """
+        # Rotors with the same parameters have the same energy levels, so
+        # reuse the levels found for an earlier rotor if possible
+        if self._fourier is not None:
+            potential = tuple(self._fourier.value_si.flat)
+        else:
+            potential = self._barrier.value_si
+        key = (self._inertia.value_si, self.symmetry, potential, Nbasis)
+        E = _energyLevelCache.get(key)
+        if E is not None:
+            self.energies = E.copy()
+            return self.energies
+        
         # Populate Hamiltonian matrix (banded in lower triangular form)
         H = self.getHamiltonian(Nbasis)
         # The overlap matrix is the identity matrix, i.e. this is a standard
@@ -253,6 +276,10 @@ cdef class HinderedRotor(Torsion):
         # Don't consider zero-point energy here
         self.energies = E - numpy.min(E)
         
+        if len(_energyLevelCache) >= maxEnergyLevelCacheSize:
+            _energyLevelCache.clear()
+        _energyLevelCache[key] = self.energies.copy()
+        
         # Return the eigenvalues
         return self.energies
 
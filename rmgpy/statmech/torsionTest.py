@@ -36,7 +36,7 @@ import unittest
 import math
 import numpy
 
-from rmgpy.statmech.torsion import HinderedRotor
+from rmgpy.statmech.torsion import HinderedRotor, clearEnergyLevelCache
 import rmgpy.constants as constants
 
 ################################################################################
@@ -406,6 +406,28 @@ class TestHinderedRotor(unittest.TestCase):
         Qexp = self.mode.getPartitionFunction(T)
         self.assertAlmostEqual(Qexp, Qact, delta=1e-2*Qexp)
 
+    def test_solveSchrodingerEquation_cache(self):
+        """
+        Test that the energy levels of a rotor are reused for another rotor
+        with the same parameters, but not for one with different parameters.
+        """
+        clearEnergyLevelCache()
+        energies = self.mode.solveSchrodingerEquation()
+        mode = HinderedRotor(
+            inertia = (self.inertia,"amu*angstrom^2"), 
+            symmetry = self.symmetry,
+            fourier = ([ [4.58375, 0.841648, -5702.71, 6.02657, 4.7446], [0.726951, -0.677255, 0.207032, 0.553307, -0.503303] ],"J/mol"),
+            quantum = self.quantum,
+        )
+        cached = mode.solveSchrodingerEquation()
+        self.assertFalse(cached is energies)
+        self.assertTrue(numpy.all(cached == energies))
+        clearEnergyLevelCache()
+        self.assertTrue(numpy.allclose(mode.solveSchrodingerEquation(), energies))
+        mode.inertia = (2 * self.inertia,"amu*angstrom^2")
+        self.assertFalse(numpy.allclose(mode.solveSchrodingerEquation(), energies))
+        self.assertEqual(len(mode.solveSchrodingerEquation(Nbasis=201)), 201)
+
     def test_repr(self):
         """
         Test that a HinderedRotor object can be reconstructed from its repr()
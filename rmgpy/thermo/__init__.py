@@ -28,6 +28,8 @@
 #
 ################################################################################
 
+from .model import HeatCapacityModel, evaluateHeatCapacities, evaluateEnthalpies, \
+                   evaluateEntropies, evaluateFreeEnergies
 from .thermodata import ThermoData
 from .nasa import NASAPolynomial, NASA
 from .wilhoit import Wilhoit
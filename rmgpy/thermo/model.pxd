@@ -25,8 +25,22 @@
 #
 ################################################################################
 
+cimport numpy
+
 from rmgpy.quantity cimport ScalarQuantity, ArrayQuantity
 
+################################################################################
+
+cpdef numpy.ndarray evaluateHeatCapacities(list models, double T)
+
+cpdef numpy.ndarray evaluateEnthalpies(list models, double T)
+
+cpdef numpy.ndarray evaluateEntropies(list models, double T)
+
+cpdef numpy.ndarray evaluateFreeEnergies(list models, double T)
+
+################################################################################
+
 cdef class HeatCapacityModel:
     
     cdef public ScalarQuantity _Tmin, _Tmax, _E0, _Cp0, _CpInf
@@ -41,6 +55,14 @@ cdef class HeatCapacityModel:
     cpdef double getEntropy(self, double T) except -1000000000
 
     cpdef double getFreeEnergy(self, double T) except 1000000000
+
+    cpdef numpy.ndarray getHeatCapacities(self, Tlist)
+
+    cpdef numpy.ndarray getEnthalpies(self, Tlist)
+
+    cpdef numpy.ndarray getEntropies(self, Tlist)
+
+    cpdef numpy.ndarray getFreeEnergies(self, Tlist)
     
     cpdef bint isSimilarTo(self, HeatCapacityModel other) except -2
 
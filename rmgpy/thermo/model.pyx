@@ -26,13 +26,18 @@
 #   DEALINGS IN THE SOFTWARE.
 #
 ################################################################################
-import rmgpy.quantity as quantity
 
 """
 This module contains base classes that represent various thermodynamic
 property calculation methods.
 """
 
+import numpy
+cimport numpy
+import cython
+
+import rmgpy.quantity as quantity
+
 
 ################################################################################
 
@@ -148,6 +153,132 @@ cdef class HeatCapacityModel:
         """
         raise NotImplementedError('Unexpected call to HeatCapacityModel.getFreeEnergy(); you should be using a class derived from HeatCapacityModel.')
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef numpy.ndarray getHeatCapacities(self, Tlist):
+        """
+        Return the constant-pressure heat capacities in J/mol*K at the
+        specified temperatures `Tlist` in K. Derived classes may overload this
+        method with a faster loop.
+        """
+        cdef double[:] T = numpy.asarray(Tlist, numpy.float64)
+        cdef double[:] Cp = numpy.empty(T.shape[0], numpy.float64)
+        cdef Py_ssize_t i
+        for i in range(T.shape[0]):
+            Cp[i] = self.getHeatCapacity(T[i])
+        return numpy.asarray(Cp)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef numpy.ndarray getEnthalpies(self, Tlist):
+        """
+        Return the enthalpies in J/mol at the specified temperatures `Tlist`
+        in K. Derived classes may overload this method with a faster loop.
+        """
+        cdef double[:] T = numpy.asarray(Tlist, numpy.float64)
+        cdef double[:] H = numpy.empty(T.shape[0], numpy.float64)
+        cdef Py_ssize_t i
+        for i in range(T.shape[0]):
+            H[i] = self.getEnthalpy(T[i])
+        return numpy.asarray(H)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef numpy.ndarray getEntropies(self, Tlist):
+        """
+        Return the entropies in J/mol*K at the specified temperatures `Tlist`
+        in K. Derived classes may overload this method with a faster loop.
+        """
+        cdef double[:] T = numpy.asarray(Tlist, numpy.float64)
+        cdef double[:] S = numpy.empty(T.shape[0], numpy.float64)
+        cdef Py_ssize_t i
+        for i in range(T.shape[0]):
+            S[i] = self.getEntropy(T[i])
+        return numpy.asarray(S)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef numpy.ndarray getFreeEnergies(self, Tlist):
+        """
+        Return the Gibbs free energies in J/mol at the specified temperatures
+        `Tlist` in K. Derived classes may overload this method with a faster
+        loop.
+        """
+        cdef double[:] T = numpy.asarray(Tlist, numpy.float64)
+        cdef double[:] G = numpy.empty(T.shape[0], numpy.float64)
+        cdef Py_ssize_t i
+        for i in range(T.shape[0]):
+            G[i] = self.getFreeEnergy(T[i])
+        return numpy.asarray(G)
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def evaluateHeatCapacities(list models, double T):
+        """
+        Return the constant-pressure heat capacities in J/mol*K of each of
+        the `models`, all of this class, at the specified temperature `T` in
+        K. Derived classes may overload this method with a faster loop.
+        """
+        cdef double[:] Cp = numpy.empty(len(models), numpy.float64)
+        cdef HeatCapacityModel model
+        cdef Py_ssize_t i
+        for i in range(len(models)):
+            model = models[i]
+            Cp[i] = model.getHeatCapacity(T)
+        return numpy.asarray(Cp)
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def evaluateEnthalpies(list models, double T):
+        """
+        Return the enthalpies in J/mol of each of the `models`, all of this
+        class, at the specified temperature `T` in K. Derived classes may
+        overload this method with a faster loop.
+        """
+        cdef double[:] H = numpy.empty(len(models), numpy.float64)
+        cdef HeatCapacityModel model
+        cdef Py_ssize_t i
+        for i in range(len(models)):
+            model = models[i]
+            H[i] = model.getEnthalpy(T)
+        return numpy.asarray(H)
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def evaluateEntropies(list models, double T):
+        """
+        Return the entropies in J/mol*K of each of the `models`, all of this
+        class, at the specified temperature `T` in K. Derived classes may
+        overload this method with a faster loop.
+        """
+        cdef double[:] S = numpy.empty(len(models), numpy.float64)
+        cdef HeatCapacityModel model
+        cdef Py_ssize_t i
+        for i in range(len(models)):
+            model = models[i]
+            S[i] = model.getEntropy(T)
+        return numpy.asarray(S)
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def evaluateFreeEnergies(list models, double T):
+        """
+        Return the Gibbs free energies in J/mol of each of the `models`, all
+        of this class, at the specified temperature `T` in K. Derived classes
+        may overload this method with a faster loop.
+        """
+        cdef double[:] G = numpy.empty(len(models), numpy.float64)
+        cdef HeatCapacityModel model
+        cdef Py_ssize_t i
+        for i in range(len(models)):
+            model = models[i]
+            G[i] = model.getFreeEnergy(T)
+        return numpy.asarray(G)
+
     cpdef bint isSimilarTo(self, HeatCapacityModel other) except -2:
         """
         Returns ``True`` if `self` and `other` report similar thermo values
@@ -211,3 +342,51 @@ cdef class HeatCapacityModel:
             #discrepancy += abs(self.getEntropy(T) - other.getEntropy(T) )
             discrepancy += abs(self.getFreeEnergy(T) - other.getFreeEnergy(T) )/1000
         return discrepancy
+
+################################################################################
+
+cdef numpy.ndarray evaluateModels(list models, double T, str methodName):
+    """
+    Return the values at the specified temperature `T` in K of a property of
+    each of the heat capacity `models`. The models are grouped by class, and
+    each group is evaluated together by the static method `methodName` of its
+    class, e.g. ``'evaluateEnthalpies'``.
+    """
+    cdef dict groups = {}
+    cdef numpy.ndarray values
+    cdef list indices
+    cdef Py_ssize_t i
+    for i in range(len(models)):
+        groups.setdefault(type(models[i]), []).append(i)
+    values = numpy.empty(len(models), numpy.float64)
+    for cls, indices in groups.iteritems():
+        values[indices] = getattr(cls, methodName)([models[i] for i in indices], T)
+    return values
+
+cpdef numpy.ndarray evaluateHeatCapacities(list models, double T):
+    """
+    Return the constant-pressure heat capacities in J/mol*K of each of the
+    heat capacity `models` at the specified temperature `T` in K.
+    """
+    return evaluateModels(models, T, 'evaluateHeatCapacities')
+
+cpdef numpy.ndarray evaluateEnthalpies(list models, double T):
+    """
+    Return the enthalpies in J/mol of each of the heat capacity `models` at
+    the specified temperature `T` in K.
+    """
+    return evaluateModels(models, T, 'evaluateEnthalpies')
+
+cpdef numpy.ndarray evaluateEntropies(list models, double T):
+    """
+    Return the entropies in J/mol*K of each of the heat capacity `models` at
+    the specified temperature `T` in K.
+    """
+    return evaluateModels(models, T, 'evaluateEntropies')
+
+cpdef numpy.ndarray evaluateFreeEnergies(list models, double T):
+    """
+    Return the Gibbs free energies in J/mol of each of the heat capacity
+    `models` at the specified temperature `T` in K.
+    """
+    return evaluateModels(models, T, 'evaluateFreeEnergies')
@@ -44,6 +44,14 @@ cdef class NASAPolynomial(HeatCapacityModel):
     cpdef double getEntropy(self, double T) except -1000000000
 
     cpdef double getFreeEnergy(self, double T) except 1000000000    
+
+    cpdef numpy.ndarray getHeatCapacities(self, Tlist)
+
+    cpdef numpy.ndarray getEnthalpies(self, Tlist)
+
+    cpdef numpy.ndarray getEntropies(self, Tlist)
+
+    cpdef numpy.ndarray getFreeEnergies(self, Tlist)
     
     cpdef changeBaseEnthalpy(self, double deltaH)
 
@@ -65,6 +73,18 @@ cdef class NASA(HeatCapacityModel):
 
     cpdef double getFreeEnergy(self, double T) except 1000000000
 
+    cdef numpy.ndarray selectPolynomials(self, numpy.ndarray Tlist)
+
+    cdef numpy.ndarray evaluatePolynomials(self, Tlist, str methodName)
+
+    cpdef numpy.ndarray getHeatCapacities(self, Tlist)
+
+    cpdef numpy.ndarray getEnthalpies(self, Tlist)
+
+    cpdef numpy.ndarray getEntropies(self, Tlist)
+
+    cpdef numpy.ndarray getFreeEnergies(self, Tlist)
+
     cpdef ThermoData toThermoData(self)
 
     cpdef Wilhoit toWilhoit(self)
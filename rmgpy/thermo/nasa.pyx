@@ -129,6 +129,83 @@ cdef class NASAPolynomial(HeatCapacityModel):
         """
         return self.getEnthalpy(T) - T * self.getEntropy(T)
     
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef numpy.ndarray getHeatCapacities(self, Tlist):
+        """
+        Return the constant-pressure heat capacities in J/mol*K at the
+        specified temperatures `Tlist` in K.
+        """
+        cdef double[:] T = numpy.asarray(Tlist, numpy.float64)
+        cdef double[:] Cp = numpy.empty(T.shape[0], numpy.float64)
+        cdef double cm2 = self.cm2, cm1 = self.cm1, c0 = self.c0, c1 = self.c1, c2 = self.c2, c3 = self.c3, c4 = self.c4
+        cdef double t
+        cdef Py_ssize_t i
+        for i in range(T.shape[0]):
+            t = T[i]
+            Cp[i] = ((cm2 / t + cm1) / t + c0 + t*(c1 + t*(c2 + t*(c3 + c4*t)))) * constants.R
+        return numpy.asarray(Cp)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef numpy.ndarray getEnthalpies(self, Tlist):
+        """
+        Return the enthalpies in J/mol at the specified temperatures `Tlist`
+        in K.
+        """
+        cdef double[:] T = numpy.asarray(Tlist, numpy.float64)
+        cdef double[:] H = numpy.empty(T.shape[0], numpy.float64)
+        cdef double cm2 = self.cm2, cm1 = self.cm1, c0 = self.c0, c1 = self.c1, c2 = self.c2, c3 = self.c3, c4 = self.c4, c5 = self.c5
+        cdef double t, T2, T4
+        cdef Py_ssize_t i
+        for i in range(T.shape[0]):
+            t = T[i]
+            T2 = t * t
+            T4 = T2 * T2
+            H[i] = ((-cm2 / t + cm1 * log(t)) / t + c0 + c1*t/2. + c2*T2/3. + c3*T2*t/4. + c4*T4/5. + c5/t) * constants.R * t
+        return numpy.asarray(H)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef numpy.ndarray getEntropies(self, Tlist):
+        """
+        Return the entropies in J/mol*K at the specified temperatures `Tlist`
+        in K.
+        """
+        cdef double[:] T = numpy.asarray(Tlist, numpy.float64)
+        cdef double[:] S = numpy.empty(T.shape[0], numpy.float64)
+        cdef double cm2 = self.cm2, cm1 = self.cm1, c0 = self.c0, c1 = self.c1, c2 = self.c2, c3 = self.c3, c4 = self.c4, c6 = self.c6
+        cdef double t, T2, T4
+        cdef Py_ssize_t i
+        for i in range(T.shape[0]):
+            t = T[i]
+            T2 = t * t
+            T4 = T2 * T2
+            S[i] = ((-cm2 / t / 2. - cm1) / t + c0*log(t) + c1*t + c2*T2/2. + c3*T2*t/3. + c4*T4/4. + c6) * constants.R
+        return numpy.asarray(S)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef numpy.ndarray getFreeEnergies(self, Tlist):
+        """
+        Return the Gibbs free energies in J/mol at the specified temperatures
+        `Tlist` in K.
+        """
+        cdef double[:] T = numpy.asarray(Tlist, numpy.float64)
+        cdef double[:] G = numpy.empty(T.shape[0], numpy.float64)
+        cdef double cm2 = self.cm2, cm1 = self.cm1, c0 = self.c0, c1 = self.c1, c2 = self.c2, c3 = self.c3, c4 = self.c4, c5 = self.c5, c6 = self.c6
+        cdef double t, T2, T4, logT, H, S
+        cdef Py_ssize_t i
+        for i in range(T.shape[0]):
+            t = T[i]
+            T2 = t * t
+            T4 = T2 * T2
+            logT = log(t)
+            H = ((-cm2 / t + cm1 * logT) / t + c0 + c1*t/2. + c2*T2/3. + c3*T2*t/4. + c4*T4/5. + c5/t) * constants.R * t
+            S = ((-cm2 / t / 2. - cm1) / t + c0*logT + c1*t + c2*T2/2. + c3*T2*t/3. + c4*T4/4. + c6) * constants.R
+            G[i] = H - t * S
+        return numpy.asarray(G)
+    
     cpdef changeBaseEnthalpy(self, double deltaH):
         """
         Add deltaH in J/mol to the base enthalpy of formation H298.
@@ -289,6 +366,151 @@ cdef class NASA(HeatCapacityModel):
         """
         return self.selectPolynomial(T).getFreeEnergy(T)
 
+    cdef numpy.ndarray selectPolynomials(self, numpy.ndarray Tlist):
+        """
+        Return the index in :attr:`polynomials` of the polynomial used at each
+        of the temperatures `Tlist` in K.
+        """
+        cdef list polys = self.polynomials
+        cdef NASAPolynomial poly
+        cdef numpy.ndarray index, valid
+        cdef int j
+        index = numpy.empty(Tlist.shape[0], numpy.int)
+        index.fill(-1)
+        # Go backwards so the first valid polynomial is the one that is used
+        for j in range(len(polys) - 1, -1, -1):
+            poly = polys[j]
+            valid = numpy.ones(Tlist.shape[0], numpy.bool)
+            if poly._Tmin is not None: valid &= poly._Tmin.value_si <= Tlist
+            if poly._Tmax is not None: valid &= Tlist <= poly._Tmax.value_si
+            index[valid] = j
+        if (index == -1).any():
+            raise ValueError('No valid NASA polynomial at temperature {0:g} K.'.format(Tlist[index == -1][0]))
+        return index
+
+    cdef numpy.ndarray evaluatePolynomials(self, Tlist, str methodName):
+        """
+        Return the values of a property at the specified temperatures `Tlist`
+        in K, computed by the array method `methodName` of each polynomial for
+        the temperatures at which it is used, e.g. ``'getEnthalpies'``.
+        """
+        cdef numpy.ndarray T, index, values, mask
+        cdef int j
+        T = numpy.asarray(Tlist, numpy.float64)
+        index = self.selectPolynomials(T)
+        values = numpy.empty(T.shape[0], numpy.float64)
+        for j, poly in enumerate(self.polynomials):
+            mask = index == j
+            if mask.any():
+                values[mask] = getattr(poly, methodName)(T[mask])
+        return values
+
+    cpdef numpy.ndarray getHeatCapacities(self, Tlist):
+        """
+        Return the constant-pressure heat capacities in J/mol*K at the
+        specified temperatures `Tlist` in K.
+        """
+        return self.evaluatePolynomials(Tlist, 'getHeatCapacities')
+
+    cpdef numpy.ndarray getEnthalpies(self, Tlist):
+        """
+        Return the enthalpies in J/mol at the specified temperatures `Tlist`
+        in K.
+        """
+        return self.evaluatePolynomials(Tlist, 'getEnthalpies')
+
+    cpdef numpy.ndarray getEntropies(self, Tlist):
+        """
+        Return the entropies in J/mol*K at the specified temperatures `Tlist`
+        in K.
+        """
+        return self.evaluatePolynomials(Tlist, 'getEntropies')
+
+    cpdef numpy.ndarray getFreeEnergies(self, Tlist):
+        """
+        Return the Gibbs free energies in J/mol at the specified temperatures
+        `Tlist` in K.
+        """
+        return self.evaluatePolynomials(Tlist, 'getFreeEnergies')
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def evaluateHeatCapacities(list models, double T):
+        """
+        Return the constant-pressure heat capacities in J/mol*K of each of
+        the NASA `models` at the specified temperature `T` in K.
+        """
+        cdef double[:] Cp = numpy.empty(len(models), numpy.float64)
+        cdef NASA model
+        cdef NASAPolynomial poly
+        cdef Py_ssize_t i
+        for i in range(len(models)):
+            model = models[i]
+            poly = model.selectPolynomial(T)
+            Cp[i] = ((poly.cm2 / T + poly.cm1) / T + poly.c0 + T*(poly.c1 + T*(poly.c2 + T*(poly.c3 + poly.c4*T)))) * constants.R
+        return numpy.asarray(Cp)
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def evaluateEnthalpies(list models, double T):
+        """
+        Return the enthalpies in J/mol of each of the NASA `models` at the
+        specified temperature `T` in K.
+        """
+        cdef double[:] H = numpy.empty(len(models), numpy.float64)
+        cdef NASA model
+        cdef NASAPolynomial poly
+        cdef double T2 = T * T, T4 = T2 * T2, logT = log(T)
+        cdef Py_ssize_t i
+        for i in range(len(models)):
+            model = models[i]
+            poly = model.selectPolynomial(T)
+            H[i] = ((-poly.cm2 / T + poly.cm1 * logT) / T + poly.c0 + poly.c1*T/2. + poly.c2*T2/3. + poly.c3*T2*T/4. + poly.c4*T4/5. + poly.c5/T) * constants.R * T
+        return numpy.asarray(H)
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def evaluateEntropies(list models, double T):
+        """
+        Return the entropies in J/mol*K of each of the NASA `models` at the
+        specified temperature `T` in K.
+        """
+        cdef double[:] S = numpy.empty(len(models), numpy.float64)
+        cdef NASA model
+        cdef NASAPolynomial poly
+        cdef double T2 = T * T, T4 = T2 * T2, logT = log(T)
+        cdef Py_ssize_t i
+        for i in range(len(models)):
+            model = models[i]
+            poly = model.selectPolynomial(T)
+            S[i] = ((-poly.cm2 / T / 2. - poly.cm1) / T + poly.c0*logT + poly.c1*T + poly.c2*T2/2. + poly.c3*T2*T/3. + poly.c4*T4/4. + poly.c6) * constants.R
+        return numpy.asarray(S)
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def evaluateFreeEnergies(list models, double T):
+        """
+        Return the Gibbs free energies in J/mol of each of the NASA `models` at
+        the specified temperature `T` in K.
+        """
+        cdef double[:] G = numpy.empty(len(models), numpy.float64)
+        cdef NASA model
+        cdef NASAPolynomial poly
+        cdef double T2 = T * T, T4 = T2 * T2, logT = log(T)
+        cdef double H, S
+        cdef Py_ssize_t i
+        for i in range(len(models)):
+            model = models[i]
+            poly = model.selectPolynomial(T)
+            H = ((-poly.cm2 / T + poly.cm1 * logT) / T + poly.c0 + poly.c1*T/2. + poly.c2*T2/3. + poly.c3*T2*T/4. + poly.c4*T4/5. + poly.c5/T) * constants.R * T
+            S = ((-poly.cm2 / T / 2. - poly.cm1) / T + poly.c0*logT + poly.c1*T + poly.c2*T2/2. + poly.c3*T2*T/3. + poly.c4*T4/4. + poly.c6) * constants.R
+            G[i] = H - T * S
+        return numpy.asarray(G)
+
     cpdef ThermoData toThermoData(self):
         """
         Convert the Wilhoit model to a :class:`ThermoData` object.
@@ -38,6 +38,7 @@ import os.path
 import logging
 
 from rmgpy.thermo.nasa import NASA, NASAPolynomial
+from rmgpy.thermo.model import evaluateEnthalpies, evaluateFreeEnergies
 import rmgpy.constants as constants
 
 ################################################################################
@@ -162,7 +163,44 @@ class TestNASA(unittest.TestCase):
             Gexp = self.nasa.getEnthalpy(T) - T * self.nasa.getEntropy(T)
             Gact = self.nasa.getFreeEnergy(T)
             self.assertAlmostEqual(Gexp / Gact, 1.0, 4, '{0} != {1}'.format(Gexp, Gact))
+
+    def test_getThermoArrays(self):
+        """
+        Test the vectorized NASA.getHeatCapacities(), getEnthalpies(),
+        getEntropies() and getFreeEnergies() methods.
+        """
+        Tlist = numpy.array([400,600,800,1000,1200,1400,1600,1800,2000], numpy.float64)
+        Cplist = self.nasa.getHeatCapacities(Tlist)
+        Hlist = self.nasa.getEnthalpies(Tlist)
+        Slist = self.nasa.getEntropies(Tlist)
+        Glist = self.nasa.getFreeEnergies(Tlist)
+        self.assertEqual(Cplist.shape, Tlist.shape)
+        for i, T in enumerate(Tlist):
+            self.assertAlmostEqual(Cplist[i], self.nasa.getHeatCapacity(T), 6)
+            self.assertAlmostEqual(Hlist[i], self.nasa.getEnthalpy(T), 6)
+            self.assertAlmostEqual(Slist[i], self.nasa.getEntropy(T), 6)
+            self.assertAlmostEqual(Glist[i], self.nasa.getFreeEnergy(T), 6)
+
+    def test_evaluateFreeEnergies(self):
+        """
+        Test the evaluation of several heat capacity models at a single
+        temperature.
+        """
+        models = [self.nasa, self.nasa.poly1, self.nasa.poly2]
+        Glist = evaluateFreeEnergies(models, 1000.)
+        Hlist = evaluateEnthalpies(models, 1000.)
+        for G, H, model in zip(Glist, Hlist, models):
+            self.assertAlmostEqual(G, model.getFreeEnergy(1000.), 6)
+            self.assertAlmostEqual(H, model.getEnthalpy(1000.), 6)
     
+    def test_getThermoArraysInvalidTemperature(self):
+        """
+        Test that the vectorized NASA methods raise ValueError outside the
+        range of the polynomials, as the scalar methods do.
+        """
+        self.assertRaises(ValueError, self.nasa.getEnthalpies, [300., 1e5])
+        self.assertRaises(ValueError, self.nasa.getEnthalpy, 1e5)
+
     def test_pickle(self):
         """
         Test that a NASA object can be pickled and unpickled with no loss of
@@ -47,6 +47,14 @@ cdef class ThermoData(HeatCapacityModel):
 
     cpdef double getFreeEnergy(self, double T) except 1000000000
 
+    cpdef numpy.ndarray getHeatCapacities(self, Tlist)
+
+    cpdef numpy.ndarray getEnthalpies(self, Tlist)
+
+    cpdef numpy.ndarray getEntropies(self, Tlist)
+
+    cpdef numpy.ndarray getFreeEnergies(self, Tlist)
+
     cpdef Wilhoit toWilhoit(self, object B=?)
 
     cpdef NASA toNASA(self, double Tmin, double Tmax, double Tint, bint fixedTint=?, bint weighting=?, int continuity=?)
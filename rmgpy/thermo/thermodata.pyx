@@ -112,228 +112,110 @@ cdef class ThermoData(HeatCapacityModel):
         def __set__(self, value):
             self._S298 = quantity.Entropy(value)
 
-    @cython.boundscheck(False)
-    @cython.wraparound(False)
     cpdef double getHeatCapacity(self, double T) except -1000000000:
         """
         Return the constant-pressure heat capacity in J/mol*K at the specified
         temperature `T` in K.
         """
-        cdef numpy.ndarray[numpy.float64_t,ndim=1] Tdata, Cpdata
-        cdef double Cp0, CpInf
-        cdef double Tlow, Thigh, Cplow, Cphigh
-        cdef double Cp
-        cdef int i, N
-        
-        Tdata = self._Tdata.value_si
-        Cpdata = self._Cpdata.value_si
-        Cp0 = self._Cp0.value_si if self._Cp0 is not None else 0.0
-        CpInf = self._CpInf.value_si if self._CpInf is not None else 0.0
-        N = Cpdata.shape[0]
-        
-        # If T is outside the range of Cp data, make sure we have a value of
-        # Cp0 or CpInf we need for reasonable extrapolation
-        # Allow a small window of safe extrapolation past each endpoint
-        # (ostensibly so we can extrapolate from 300 K to 298 K)
-        if T < Tdata[0] - 5 and Cp0 == 0.0:
-            raise ValueError('Unable to compute heat capacity at {0:g} K using ThermoData model; please supply a value for Cp0.'.format(T))
-        elif T > Tdata[N-1] + 5 and CpInf == 0.0:
-            raise ValueError('Unable to compute heat capacity at {0:g} K using ThermoData model; please supply a value for CpInf.'.format(T))
-
-        if T < Tdata[0] and Cp0 != 0.0:
-            # Extrapolate towards zero temperature using the slope at the lowest temperature
-            # However, if the computed value is less than Cp0, use Cp0 instead
-            Tlow = Tdata[0]; Thigh = Tdata[1]
-            Cplow = Cpdata[0]; Cphigh = Cpdata[1]
-            Cp = Cplow + (T - Tlow) / (Thigh - Tlow) * (Cphigh - Cplow)
-            if Cp < Cp0: Cp = Cp0
-        elif T > Tdata[N-1] and CpInf != 0.0:
-            # Extrapolate towards infinite temperature using the slope at 1500 K
-            # However, if the computed value is greater than CpInf, use CpInf instead
-            Tlow = Tdata[N-2]; Thigh = Tdata[N-1]
-            Cplow = Cpdata[N-2]; Cphigh = Cpdata[N-1]
-            Cp = Cplow + (T - Tlow) / (Thigh - Tlow) * (Cphigh - Cplow)
-            if Cp > CpInf: Cp = CpInf
-        else:
-            for i in range(N-1):
-                Tlow = Tdata[i]; Thigh = Tdata[i+1]
-                Cplow = Cpdata[i]; Cphigh = Cpdata[i+1]
-                if Tlow <= T and T <= Thigh:
-                    Cp = (Cphigh - Cplow) * ((T - Tlow) / (Thigh - Tlow)) + Cplow
-                    break
-                
-        return Cp
-    
-    @cython.boundscheck(False)
-    @cython.wraparound(False)
+        cdef double Cp0 = self._Cp0.value_si if self._Cp0 is not None else 0.0
+        cdef double CpInf = self._CpInf.value_si if self._CpInf is not None else 0.0
+        return heatCapacity(T, self._Tdata.value_si, self._Cpdata.value_si, Cp0, CpInf)
+
     cpdef double getEnthalpy(self, double T) except 1000000000:
         """
         Return the enthalpy in J/mol at the specified temperature `T` in K.
         """
-        cdef numpy.ndarray[numpy.float64_t,ndim=1] Tdata, Cpdata
-        cdef double Cp0, CpInf
-        cdef double Tlow, Thigh, Cplow, Cphigh
-        cdef double H, slope, intercept, T0
-        cdef int i, N
-
-        Tdata = self._Tdata.value_si
-        Cpdata = self._Cpdata.value_si
-        Cp0 = self._Cp0.value_si if self._Cp0 is not None else 0.0
-        CpInf = self._CpInf.value_si if self._CpInf is not None else 0.0
-        N = Cpdata.shape[0]
+        cdef double Cp0 = self._Cp0.value_si if self._Cp0 is not None else 0.0
+        cdef double CpInf = self._CpInf.value_si if self._CpInf is not None else 0.0
+        return enthalpy(T, self._Tdata.value_si, self._Cpdata.value_si, Cp0, CpInf, self._H298.value_si)
 
-        H = self._H298.value_si
-        
-        # If T is outside the range of Cp data, make sure we have a value of
-        # Cp0 or CpInf we need for reasonable extrapolation
-        # Allow a small window of safe extrapolation past each endpoint
-        # (ostensibly so we can extrapolate from 300 K to 298 K)
-        if T < Tdata[0] - 5 and Cp0 == 0.0:
-            raise ValueError('Unable to compute enthalpy at {0:g} K using ThermoData model; please supply a value for Cp0.'.format(T))
-        elif T > Tdata[N-1] + 5 and CpInf == 0.0:
-            raise ValueError('Unable to compute enthalpy at {0:g} K using ThermoData model; please supply a value for CpInf.'.format(T))
-
-        # Correct the enthalpy from 298 K to the temperature of the lowest heat capacity point
-        assert Tdata[0] >= 298
-        Tlow = Tdata[0]; Thigh = Tdata[1]
-        Cplow = Cpdata[0]; Cphigh = Cpdata[1]
-        slope = (Cphigh - Cplow) / (Thigh - Tlow)
-        intercept = (Cplow * Thigh - Cphigh * Tlow) / (Thigh - Tlow)
-        H -= 0.5 * slope * (298*298 - Tlow*Tlow) + intercept * (298 - Tlow)
-        
-        if T < Tdata[0]:
-            Tlow = Tdata[0]; Thigh = Tdata[1]
-            Cplow = Cpdata[0]; Cphigh = Cpdata[1]
-            slope = (Cphigh - Cplow) / (Thigh - Tlow)
-            intercept = (Cplow * Thigh - Cphigh * Tlow) / (Thigh - Tlow)
-            T0 = (Cp0 - Tlow) / slope + Tlow
-            if T > T0 or slope <= 0 or T0 > Tlow:
-                H += 0.5 * slope * (T*T - Tlow*Tlow) + intercept * (T - Tlow)
-            else:
-                H += 0.5 * slope * (T0*T0 - Tlow*Tlow) + intercept * (T0 - Tlow) + Cp0 * (T0 - T)
-        
-        for i in range(N-1):
-            Tlow = Tdata[i]; Thigh = Tdata[i+1]
-            Cplow = Cpdata[i]; Cphigh = Cpdata[i+1]
-            if T > Tlow:
-                slope = (Cphigh - Cplow) / (Thigh - Tlow)
-                intercept = (Cplow * Thigh - Cphigh * Tlow) / (Thigh - Tlow)
-                if T <= Thigh: 
-                    H += 0.5 * slope * (T*T - Tlow*Tlow) + intercept * (T - Tlow)
-                    break
-                else:
-                    H += 0.5 * slope * (Thigh*Thigh - Tlow*Tlow) + intercept * (Thigh - Tlow)
-
-        if T > Tdata[N-1]:
-            Tlow = Tdata[N-2]; Thigh = Tdata[N-1]
-            Cplow = Cpdata[N-2]; Cphigh = Cpdata[N-1]
-            slope = (Cphigh - Cplow) / (Thigh - Tlow)
-            intercept = (Cplow * Thigh - Cphigh * Tlow) / (Thigh - Tlow)
-            T0 = (CpInf - Cphigh) / slope + Thigh
-            if T <= T0 or slope <= 0 or T0 < Thigh:
-                H += 0.5 * slope * (T*T - Thigh*Thigh) + intercept * (T - Thigh)
-            else:
-                H += 0.5 * slope * (T0*T0 - Thigh*Thigh) + intercept * (T0 - Thigh) + CpInf * (T - T0)
-        
-        return H
-        
-    @cython.boundscheck(False)
-    @cython.wraparound(False)
     cpdef double getEntropy(self, double T) except -1000000000:
         """
         Return the entropy in J/mol*K at the specified temperature `T` in K.
         """
-        cdef numpy.ndarray[numpy.float64_t,ndim=1] Tdata, Cpdata
-        cdef double Cp0, CpInf
-        cdef double Tlow, Thigh, Cplow, Cphigh
-        cdef double S, slope, intercept, T0
-        cdef int i, N
-
-        Tdata = self._Tdata.value_si
-        Cpdata = self._Cpdata.value_si
-        Cp0 = self._Cp0.value_si if self._Cp0 is not None else 0.0
-        CpInf = self._CpInf.value_si if self._CpInf is not None else 0.0
-        N = Cpdata.shape[0]
-
-        S = self._S298.value_si
-         
-        # Correct the entropy from 298 K to the temperature of the lowest heat capacity point
-        assert Tdata[0] > 298
-        Tlow = Tdata[0]; Thigh = Tdata[1]
-        Cplow = Cpdata[0]; Cphigh = Cpdata[1]
-        slope = (Cphigh - Cplow) / (Thigh - Tlow)
-        intercept = (Cplow * Thigh - Cphigh * Tlow) / (Thigh - Tlow)
-        S -= slope * (298 - Tlow) + intercept * log(298 / Tlow)
-        
-        # If T is outside the range of Cp data, make sure we have a value of
-        # Cp0 or CpInf we need for reasonable extrapolation
-        # Allow a small window of safe extrapolation past each endpoint
-        # (ostensibly so we can extrapolate from 300 K to 298 K)
-        if T < Tdata[0] - 5 and Cp0 == 0.0:
-            raise ValueError('Unable to compute entropy at {0:g} K using ThermoData model; please supply a value for Cp0.'.format(T))
-        elif T > Tdata[N-1] + 5 and CpInf == 0.0:
-            raise ValueError('Unable to compute entropy at {0:g} K using ThermoData model; please supply a value for CpInf.'.format(T))
-
-        if T < Tdata[0]:
-            Tlow = Tdata[0]; Thigh = Tdata[1]
-            Cplow = Cpdata[0]; Cphigh = Cpdata[1]
-            slope = (Cphigh - Cplow) / (Thigh - Tlow)
-            intercept = (Cplow * Thigh - Cphigh * Tlow) / (Thigh - Tlow)
-            T0 = (Cp0 - Tlow) / slope + Tlow
-            if T > T0 or slope <= 0 or T0 >= Tlow:
-                S += slope * (T - Tlow) + intercept * log(T / Tlow)
-            else:
-                S += slope * (T0 - Tlow) + intercept * log(T0 / Tlow) + Cp0 * log(T0 / T)
-        
-        for i in range(N-1):
-            Tlow = Tdata[i]; Thigh = Tdata[i+1]
-            Cplow = Cpdata[i]; Cphigh = Cpdata[i+1]
-            if T > Tlow:
-                slope = (Cphigh - Cplow) / (Thigh - Tlow)
-                intercept = (Cplow * Thigh - Cphigh * Tlow) / (Thigh - Tlow)
-                if T <= Thigh:
-                    S += slope * (T - Tlow) + intercept * log(T / Tlow)
-                else:
-                    S += slope * (Thigh - Tlow) + intercept * log(Thigh / Tlow)
-
-        if T > Tdata[N-1]:
-            Tlow = Tdata[N-2]; Thigh = Tdata[N-1]
-            Cplow = Cpdata[N-2]; Cphigh = Cpdata[N-1]
-            slope = (Cphigh - Cplow) / (Thigh - Tlow)
-            intercept = (Cplow * Thigh - Cphigh * Tlow) / (Thigh - Tlow)
-            if slope > 0:
-                T0 = (CpInf - Cphigh) / slope + Thigh
-                if T <= T0:
-                    S += slope * (T - Thigh) + intercept * log(T / Thigh)
-                else:
-                    S += slope * (T0 - Thigh) + intercept * log(T0 / Thigh) + CpInf * log(T / T0)
-
-        return S
+        cdef double Cp0 = self._Cp0.value_si if self._Cp0 is not None else 0.0
+        cdef double CpInf = self._CpInf.value_si if self._CpInf is not None else 0.0
+        return entropy(T, self._Tdata.value_si, self._Cpdata.value_si, Cp0, CpInf, self._S298.value_si)
     
     cpdef double getFreeEnergy(self, double T) except 1000000000:
         """
         Return the Gibbs free energy in J/mol at the specified temperature
         `T` in K.
         """
-        cdef numpy.ndarray[numpy.float64_t,ndim=1] Tdata
-        cdef double Cp0, CpInf
-        cdef int N
+        cdef double Cp0 = self._Cp0.value_si if self._Cp0 is not None else 0.0
+        cdef double CpInf = self._CpInf.value_si if self._CpInf is not None else 0.0
+        return freeEnergy(T, self._Tdata.value_si, self._Cpdata.value_si, Cp0, CpInf, self._H298.value_si, self._S298.value_si)
 
-        Tdata = self._Tdata.value_si
-        Cp0 = self._Cp0.value_si if self._Cp0 is not None else 0.0
-        CpInf = self._CpInf.value_si if self._CpInf is not None else 0.0
-        N = Tdata.shape[0]
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef numpy.ndarray getHeatCapacities(self, Tlist):
+        """
+        Return the constant-pressure heat capacities in J/mol*K at the
+        specified temperatures `Tlist` in K.
+        """
+        cdef double[:] T = numpy.asarray(Tlist, numpy.float64)
+        cdef double[:] Tdata = self._Tdata.value_si, Cpdata = self._Cpdata.value_si
+        cdef double Cp0 = self._Cp0.value_si if self._Cp0 is not None else 0.0
+        cdef double CpInf = self._CpInf.value_si if self._CpInf is not None else 0.0
+        cdef double[:] Cp = numpy.empty(T.shape[0], numpy.float64)
+        cdef Py_ssize_t i
+        for i in range(T.shape[0]):
+            Cp[i] = heatCapacity(T[i], Tdata, Cpdata, Cp0, CpInf)
+        return numpy.asarray(Cp)
 
-        # If T is outside the range of Cp data, make sure we have a value of
-        # Cp0 or CpInf we need for reasonable extrapolation
-        # Allow a small window of safe extrapolation past each endpoint
-        # (ostensibly so we can extrapolate from 300 K to 298 K)
-        if T < Tdata[0] - 5 and Cp0 == 0.0:
-            raise ValueError('Unable to compute Gibbs free energy at {0:g} K using ThermoData model; please supply a value for Cp0.'.format(T))
-        elif T > Tdata[N-1] + 5 and CpInf == 0.0:
-            raise ValueError('Unable to compute Gibbs free energy at {0:g} K using ThermoData model; please supply a value for CpInf.'.format(T))
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef numpy.ndarray getEnthalpies(self, Tlist):
+        """
+        Return the enthalpies in J/mol at the specified temperatures `Tlist`
+        in K.
+        """
+        cdef double[:] T = numpy.asarray(Tlist, numpy.float64)
+        cdef double[:] Tdata = self._Tdata.value_si, Cpdata = self._Cpdata.value_si
+        cdef double Cp0 = self._Cp0.value_si if self._Cp0 is not None else 0.0
+        cdef double CpInf = self._CpInf.value_si if self._CpInf is not None else 0.0
+        cdef double H298 = self._H298.value_si
+        cdef double[:] H = numpy.empty(T.shape[0], numpy.float64)
+        cdef Py_ssize_t i
+        for i in range(T.shape[0]):
+            H[i] = enthalpy(T[i], Tdata, Cpdata, Cp0, CpInf, H298)
+        return numpy.asarray(H)
 
-        return self.getEnthalpy(T) - T * self.getEntropy(T)
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef numpy.ndarray getEntropies(self, Tlist):
+        """
+        Return the entropies in J/mol*K at the specified temperatures `Tlist`
+        in K.
+        """
+        cdef double[:] T = numpy.asarray(Tlist, numpy.float64)
+        cdef double[:] Tdata = self._Tdata.value_si, Cpdata = self._Cpdata.value_si
+        cdef double Cp0 = self._Cp0.value_si if self._Cp0 is not None else 0.0
+        cdef double CpInf = self._CpInf.value_si if self._CpInf is not None else 0.0
+        cdef double S298 = self._S298.value_si
+        cdef double[:] S = numpy.empty(T.shape[0], numpy.float64)
+        cdef Py_ssize_t i
+        for i in range(T.shape[0]):
+            S[i] = entropy(T[i], Tdata, Cpdata, Cp0, CpInf, S298)
+        return numpy.asarray(S)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef numpy.ndarray getFreeEnergies(self, Tlist):
+        """
+        Return the Gibbs free energies in J/mol at the specified temperatures
+        `Tlist` in K.
+        """
+        cdef double[:] T = numpy.asarray(Tlist, numpy.float64)
+        cdef double[:] Tdata = self._Tdata.value_si, Cpdata = self._Cpdata.value_si
+        cdef double Cp0 = self._Cp0.value_si if self._Cp0 is not None else 0.0
+        cdef double CpInf = self._CpInf.value_si if self._CpInf is not None else 0.0
+        cdef double H298 = self._H298.value_si, S298 = self._S298.value_si
+        cdef double[:] G = numpy.empty(T.shape[0], numpy.float64)
+        cdef Py_ssize_t i
+        for i in range(T.shape[0]):
+            G[i] = freeEnergy(T[i], Tdata, Cpdata, Cp0, CpInf, H298, S298)
+        return numpy.asarray(G)
 
     cpdef Wilhoit toWilhoit(self, B=None):
         """
@@ -393,3 +275,211 @@ cdef class ThermoData(HeatCapacityModel):
         :class:`NASAPolynomial` objects.
         """
         return self.toWilhoit().toNASA(Tmin, Tmax, Tint, fixedTint, weighting, continuity)
+
+################################################################################
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef double heatCapacity(double T, double[:] Tdata, double[:] Cpdata, double Cp0, double CpInf) except -1000000000:
+    """
+    Return the constant-pressure heat capacity in J/mol*K at the specified
+    temperature `T` in K by interpolating the heat capacities `Cpdata` known
+    at the temperatures `Tdata`. The limits `Cp0` and `CpInf`, or zero if
+    unknown, are used for extrapolation.
+    """
+    cdef double Tlow, Thigh, Cplow, Cphigh
+    cdef double Cp
+    cdef Py_ssize_t i, N
+
+    N = Cpdata.shape[0]
+
+    # If T is outside the range of Cp data, make sure we have a value of
+    # Cp0 or CpInf we need for reasonable extrapolation
+    # Allow a small window of safe extrapolation past each endpoint
+    # (ostensibly so we can extrapolate from 300 K to 298 K)
+    if T < Tdata[0] - 5 and Cp0 == 0.0:
+        raise ValueError('Unable to compute heat capacity at {0:g} K using ThermoData model; please supply a value for Cp0.'.format(T))
+    elif T > Tdata[N-1] + 5 and CpInf == 0.0:
+        raise ValueError('Unable to compute heat capacity at {0:g} K using ThermoData model; please supply a value for CpInf.'.format(T))
+
+    if T < Tdata[0] and Cp0 != 0.0:
+        # Extrapolate towards zero temperature using the slope at the lowest temperature
+        # However, if the computed value is less than Cp0, use Cp0 instead
+        Tlow = Tdata[0]; Thigh = Tdata[1]
+        Cplow = Cpdata[0]; Cphigh = Cpdata[1]
+        Cp = Cplow + (T - Tlow) / (Thigh - Tlow) * (Cphigh - Cplow)
+        if Cp < Cp0: Cp = Cp0
+    elif T > Tdata[N-1] and CpInf != 0.0:
+        # Extrapolate towards infinite temperature using the slope at 1500 K
+        # However, if the computed value is greater than CpInf, use CpInf instead
+        Tlow = Tdata[N-2]; Thigh = Tdata[N-1]
+        Cplow = Cpdata[N-2]; Cphigh = Cpdata[N-1]
+        Cp = Cplow + (T - Tlow) / (Thigh - Tlow) * (Cphigh - Cplow)
+        if Cp > CpInf: Cp = CpInf
+    else:
+        for i in range(N-1):
+            Tlow = Tdata[i]; Thigh = Tdata[i+1]
+            Cplow = Cpdata[i]; Cphigh = Cpdata[i+1]
+            if Tlow <= T and T <= Thigh:
+                Cp = (Cphigh - Cplow) * ((T - Tlow) / (Thigh - Tlow)) + Cplow
+                break
+
+    return Cp
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef double enthalpy(double T, double[:] Tdata, double[:] Cpdata, double Cp0, double CpInf, double H298) except 1000000000:
+    """
+    Return the enthalpy in J/mol at the specified temperature `T` in K for
+    the heat capacity data, given the enthalpy `H298` in J/mol at 298 K.
+    """
+    cdef double Tlow, Thigh, Cplow, Cphigh
+    cdef double H, slope, intercept, T0
+    cdef Py_ssize_t i, N
+
+    N = Cpdata.shape[0]
+
+    H = H298
+
+    # If T is outside the range of Cp data, make sure we have a value of
+    # Cp0 or CpInf we need for reasonable extrapolation
+    # Allow a small window of safe extrapolation past each endpoint
+    # (ostensibly so we can extrapolate from 300 K to 298 K)
+    if T < Tdata[0] - 5 and Cp0 == 0.0:
+        raise ValueError('Unable to compute enthalpy at {0:g} K using ThermoData model; please supply a value for Cp0.'.format(T))
+    elif T > Tdata[N-1] + 5 and CpInf == 0.0:
+        raise ValueError('Unable to compute enthalpy at {0:g} K using ThermoData model; please supply a value for CpInf.'.format(T))
+
+    # Correct the enthalpy from 298 K to the temperature of the lowest heat capacity point
+    assert Tdata[0] >= 298
+    Tlow = Tdata[0]; Thigh = Tdata[1]
+    Cplow = Cpdata[0]; Cphigh = Cpdata[1]
+    slope = (Cphigh - Cplow) / (Thigh - Tlow)
+    intercept = (Cplow * Thigh - Cphigh * Tlow) / (Thigh - Tlow)
+    H -= 0.5 * slope * (298*298 - Tlow*Tlow) + intercept * (298 - Tlow)
+
+    if T < Tdata[0]:
+        Tlow = Tdata[0]; Thigh = Tdata[1]
+        Cplow = Cpdata[0]; Cphigh = Cpdata[1]
+        slope = (Cphigh - Cplow) / (Thigh - Tlow)
+        intercept = (Cplow * Thigh - Cphigh * Tlow) / (Thigh - Tlow)
+        T0 = (Cp0 - Tlow) / slope + Tlow
+        if T > T0 or slope <= 0 or T0 > Tlow:
+            H += 0.5 * slope * (T*T - Tlow*Tlow) + intercept * (T - Tlow)
+        else:
+            H += 0.5 * slope * (T0*T0 - Tlow*Tlow) + intercept * (T0 - Tlow) + Cp0 * (T0 - T)
+
+    for i in range(N-1):
+        Tlow = Tdata[i]; Thigh = Tdata[i+1]
+        Cplow = Cpdata[i]; Cphigh = Cpdata[i+1]
+        if T > Tlow:
+            slope = (Cphigh - Cplow) / (Thigh - Tlow)
+            intercept = (Cplow * Thigh - Cphigh * Tlow) / (Thigh - Tlow)
+            if T <= Thigh: 
+                H += 0.5 * slope * (T*T - Tlow*Tlow) + intercept * (T - Tlow)
+                break
+            else:
+                H += 0.5 * slope * (Thigh*Thigh - Tlow*Tlow) + intercept * (Thigh - Tlow)
+
+    if T > Tdata[N-1]:
+        Tlow = Tdata[N-2]; Thigh = Tdata[N-1]
+        Cplow = Cpdata[N-2]; Cphigh = Cpdata[N-1]
+        slope = (Cphigh - Cplow) / (Thigh - Tlow)
+        intercept = (Cplow * Thigh - Cphigh * Tlow) / (Thigh - Tlow)
+        T0 = (CpInf - Cphigh) / slope + Thigh
+        if T <= T0 or slope <= 0 or T0 < Thigh:
+            H += 0.5 * slope * (T*T - Thigh*Thigh) + intercept * (T - Thigh)
+        else:
+            H += 0.5 * slope * (T0*T0 - Thigh*Thigh) + intercept * (T0 - Thigh) + CpInf * (T - T0)
+
+    return H
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef double entropy(double T, double[:] Tdata, double[:] Cpdata, double Cp0, double CpInf, double S298) except -1000000000:
+    """
+    Return the entropy in J/mol*K at the specified temperature `T` in K for
+    the heat capacity data, given the entropy `S298` in J/mol*K at 298 K.
+    """
+    cdef double Tlow, Thigh, Cplow, Cphigh
+    cdef double S, slope, intercept, T0
+    cdef Py_ssize_t i, N
+
+    N = Cpdata.shape[0]
+
+    S = S298
+
+    # Correct the entropy from 298 K to the temperature of the lowest heat capacity point
+    assert Tdata[0] > 298
+    Tlow = Tdata[0]; Thigh = Tdata[1]
+    Cplow = Cpdata[0]; Cphigh = Cpdata[1]
+    slope = (Cphigh - Cplow) / (Thigh - Tlow)
+    intercept = (Cplow * Thigh - Cphigh * Tlow) / (Thigh - Tlow)
+    S -= slope * (298 - Tlow) + intercept * log(298 / Tlow)
+
+    # If T is outside the range of Cp data, make sure we have a value of
+    # Cp0 or CpInf we need for reasonable extrapolation
+    # Allow a small window of safe extrapolation past each endpoint
+    # (ostensibly so we can extrapolate from 300 K to 298 K)
+    if T < Tdata[0] - 5 and Cp0 == 0.0:
+        raise ValueError('Unable to compute entropy at {0:g} K using ThermoData model; please supply a value for Cp0.'.format(T))
+    elif T > Tdata[N-1] + 5 and CpInf == 0.0:
+        raise ValueError('Unable to compute entropy at {0:g} K using ThermoData model; please supply a value for CpInf.'.format(T))
+
+    if T < Tdata[0]:
+        Tlow = Tdata[0]; Thigh = Tdata[1]
+        Cplow = Cpdata[0]; Cphigh = Cpdata[1]
+        slope = (Cphigh - Cplow) / (Thigh - Tlow)
+        intercept = (Cplow * Thigh - Cphigh * Tlow) / (Thigh - Tlow)
+        T0 = (Cp0 - Tlow) / slope + Tlow
+        if T > T0 or slope <= 0 or T0 >= Tlow:
+            S += slope * (T - Tlow) + intercept * log(T / Tlow)
+        else:
+            S += slope * (T0 - Tlow) + intercept * log(T0 / Tlow) + Cp0 * log(T0 / T)
+
+    for i in range(N-1):
+        Tlow = Tdata[i]; Thigh = Tdata[i+1]
+        Cplow = Cpdata[i]; Cphigh = Cpdata[i+1]
+        if T > Tlow:
+            slope = (Cphigh - Cplow) / (Thigh - Tlow)
+            intercept = (Cplow * Thigh - Cphigh * Tlow) / (Thigh - Tlow)
+            if T <= Thigh:
+                S += slope * (T - Tlow) + intercept * log(T / Tlow)
+            else:
+                S += slope * (Thigh - Tlow) + intercept * log(Thigh / Tlow)
+
+    if T > Tdata[N-1]:
+        Tlow = Tdata[N-2]; Thigh = Tdata[N-1]
+        Cplow = Cpdata[N-2]; Cphigh = Cpdata[N-1]
+        slope = (Cphigh - Cplow) / (Thigh - Tlow)
+        intercept = (Cplow * Thigh - Cphigh * Tlow) / (Thigh - Tlow)
+        if slope > 0:
+            T0 = (CpInf - Cphigh) / slope + Thigh
+            if T <= T0:
+                S += slope * (T - Thigh) + intercept * log(T / Thigh)
+            else:
+                S += slope * (T0 - Thigh) + intercept * log(T0 / Thigh) + CpInf * log(T / T0)
+
+    return S
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef double freeEnergy(double T, double[:] Tdata, double[:] Cpdata, double Cp0, double CpInf, double H298, double S298) except 1000000000:
+    """
+    Return the Gibbs free energy in J/mol at the specified temperature `T` in
+    K for the heat capacity data.
+    """
+    cdef Py_ssize_t N
+
+    N = Tdata.shape[0]
+
+    # If T is outside the range of Cp data, make sure we have a value of
+    # Cp0 or CpInf we need for reasonable extrapolation
+    # Allow a small window of safe extrapolation past each endpoint
+    # (ostensibly so we can extrapolate from 300 K to 298 K)
+    if T < Tdata[0] - 5 and Cp0 == 0.0:
+        raise ValueError('Unable to compute Gibbs free energy at {0:g} K using ThermoData model; please supply a value for Cp0.'.format(T))
+    elif T > Tdata[N-1] + 5 and CpInf == 0.0:
+        raise ValueError('Unable to compute Gibbs free energy at {0:g} K using ThermoData model; please supply a value for CpInf.'.format(T))
+
+    return enthalpy(T, Tdata, Cpdata, Cp0, CpInf, H298) - T * entropy(T, Tdata, Cpdata, Cp0, CpInf, S298)
@@ -186,6 +186,22 @@ class TestThermoData(unittest.TestCase):
             Gact = self.thermodata.getFreeEnergy(T)
             self.assertAlmostEqual(Gexp, Gact, 3)
     
+    def test_getThermoArrays(self):
+        """
+        Test the vectorized ThermoData.getHeatCapacities(), getEnthalpies(),
+        getEntropies() and getFreeEnergies() methods.
+        """
+        Tlist = numpy.array([200,300,400,600,800,1000,1200,1400,1600,1800,2000])
+        Cplist = self.thermodata.getHeatCapacities(Tlist)
+        Hlist = self.thermodata.getEnthalpies(Tlist)
+        Slist = self.thermodata.getEntropies(Tlist)
+        Glist = self.thermodata.getFreeEnergies(Tlist)
+        for i, T in enumerate(Tlist):
+            self.assertAlmostEqual(Cplist[i], self.thermodata.getHeatCapacity(T), 8)
+            self.assertAlmostEqual(Hlist[i], self.thermodata.getEnthalpy(T), 6)
+            self.assertAlmostEqual(Slist[i], self.thermodata.getEntropy(T), 8)
+            self.assertAlmostEqual(Glist[i], self.thermodata.getFreeEnergy(T), 6)
+
     def test_pickle(self):
         """
         Test that a ThermoData object can be successfully pickled and
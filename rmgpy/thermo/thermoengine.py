@@ -3,10 +3,13 @@ import numpy
 import math
 
 import logging as logging
+from copy import deepcopy
 from rmgpy.scoop_framework.util import submit_
+import rmgpy.scoop_framework.util
 from rmgpy.data.rmg import getDB
 import rmgpy.constants as constants
 from rmgpy.molecule import Molecule
+from rmgpy.molecule.resonance import getStructureHash
 from rmgpy.statmech import Conformer
 from rmgpy.thermo import Wilhoit, NASA, ThermoData
 import rmgpy.data.rmg
@@ -123,6 +126,124 @@ def evaluator(spc):
 
     return thermo
 
+def requestEvaluator(spc):
+    """
+    Module-level function passed to the workers of the native executor.
+
+    Returns the thermo of `spc` from :func:`evaluator`, and the list of its
+    resonance isomers afterwards, in which each of the original isomers is
+    given by its index and each newly generated one by the molecule itself,
+    so the order chosen by the thermo database can be applied to the species
+    the request was made for.
+    """
+    molecules = list(spc.molecule)
+    thermo = evaluator(spc)
+
+    order = []
+    for molecule in spc.molecule:
+        for index, molecule0 in enumerate(molecules):
+            if molecule is molecule0:
+                order.append(index)
+                break
+        else:
+            order.append(molecule)
+
+    return thermo, order
+
+# The thermo requests waiting to be dispatched to the native executor
+pendingRequests = []
+
+class ThermoRequest(object):
+    """
+    A lazily evaluated thermo estimate for the Species object `spc`, stored in
+    its `thermo` attribute by :func:`submit` while a native executor is
+    running. All pending requests are dispatched together by
+    :func:`flushRequests` the first time any of them is needed.
+
+    A request whose species is isomorphic to that of an earlier request in the
+    same batch keeps a reference to it as its `source` instead of a future of
+    its own, so each structure is only estimated once.
+
+    As in a serial run, the resonance isomers of the species are left in the
+    order chosen by the thermo database once the request is resolved.
+    """
+
+    def __init__(self, spc):
+        self.spc = spc
+        self.future = None
+        self.source = None
+        self.resolved = False
+        self.thermo = None
+
+    def __reduce__(self):
+        """
+        A helper function used when pickling or copying the request; the
+        thermo is resolved first, so the copy is the thermo object itself.
+        """
+        return (deepcopy, (self.result(),))
+
+    def result(self):
+        """
+        Return the thermo of the species, dispatching the pending requests
+        first if this one has not been dispatched yet.
+        """
+        if self.resolved:
+            return self.thermo
+        if self.future is None and self.source is None:
+            flushRequests()
+        if self.source is not None:
+            thermo = deepcopy(self.source.result())
+            # Use the order of the isomorphic source species, keeping the
+            # molecules of this species where they match
+            molecules = []
+            for molecule0 in self.source.spc.molecule:
+                for molecule in self.spc.molecule:
+                    if molecule.isIsomorphic(molecule0):
+                        molecules.append(molecule)
+                        break
+                else:
+                    molecules.append(molecule0.copy(deep=True))
+        else:
+            thermo, order = self.future.result()
+            molecules = [self.spc.molecule[item] if isinstance(item, int) else item for item in order]
+        self.spc.molecule = molecules
+        # The worker set E0 on its own copy of the species
+        if thermo is not None:
+            if self.spc.conformer is None:
+                self.spc.conformer = Conformer()
+            self.spc.conformer.E0 = thermo.E0
+        self.thermo = thermo
+        self.resolved = True
+        return thermo
+
+def flushRequests():
+    """
+    Dispatch all pending thermo requests to the executor. Requests for
+    isomorphic species share the estimate of the first one, so the thermo of
+    each distinct structure is only computed once per batch.
+    """
+    from rmgpy.species import Species
+
+    requests = pendingRequests[:]
+    del pendingRequests[:]
+
+    buckets = {}
+    for request in requests:
+        bucket = buckets.setdefault(getStructureHash(request.spc.molecule[0]), [])
+        for other in bucket:
+            if other.spc.isIsomorphic(request.spc):
+                request.source = other
+                break
+        else:
+            bucket.append(request)
+            # Send a bare copy of the species, since the workers modify it
+            # and its thermo attribute is this very request
+            spc = Species(label=request.spc.label, molecule=[molecule.copy(deep=True) for molecule in request.spc.molecule])
+            request.future = submit_(requestEvaluator, spc)
+
+    logging.debug('Dispatched {0:d} thermo requests for {1:d} distinct structures.'.format(
+        len(requests), sum([len(bucket) for bucket in buckets.values()])))
+
 def submit(spc):
     """
     Submits a request to calculate chemical data for the Species object.
@@ -132,5 +253,14 @@ def submit(spc):
     is called, which replaces the future object with 
     the result.
 
+    When a native executor was started with
+    :func:`rmgpy.scoop_framework.util.setExecutor`, the thermo attribute
+    stores a :class:`ThermoRequest` instead, and the request is batched
+    with the others submitted before it is first needed.
     """
-    spc.thermo = submit_(evaluator, spc)
\ No newline at end of file
+    if rmgpy.scoop_framework.util.executor is not None:
+        request = ThermoRequest(spc)
+        pendingRequests.append(request)
+        spc.thermo = request
+    else:
+        spc.thermo = submit_(evaluator, spc)
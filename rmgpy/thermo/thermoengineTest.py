@@ -17,7 +17,9 @@ from rmgpy.rmg.main import RMG
 from rmgpy.scoop_framework.framework import TestScoopCommon
 
 from rmgpy.species import Species
-from rmgpy.thermo.thermoengine import submit
+from rmgpy.thermo import NASA
+from rmgpy.thermo.thermoengine import submit, generateThermoData, ThermoRequest
+from rmgpy.scoop_framework.util import setExecutor, shutdownExecutor
 
 try:
     from scoop import futures, _control, shared
@@ -140,5 +142,79 @@ class AsyncThermoTest(TestScoopCommon):
         result = futures._startup(funcGet)
         self.assertEquals(result, True)
 
+class NativeExecutorTest(unittest.TestCase):
+    """
+    Contains unit tests of thermo requests batched for the native executor.
+    """
+
+    def setUp(self):
+        load()
+        setExecutor(2, kind='thread')
+
+    def tearDown(self):
+        shutdownExecutor()
+        tearDown()
+
+    def testSubmitBatch(self):
+        """
+        Test that requests are dispatched together on first access and that
+        isomorphic species share a single estimate.
+        """
+        spcs = [
+                Species().fromSMILES('C'),
+                Species().fromSMILES('CC'),
+                Species().fromSMILES('CC'),
+                Species().fromSMILES('C[CH2]'),
+                ]
+
+        for spc in spcs:
+            submit(spc)
+        requests = [spc.thermo for spc in spcs]
+        for request in requests:
+            self.assertTrue(isinstance(request, ThermoRequest))
+            self.assertTrue(request.future is None)
+
+        data = spcs[3].getThermoData()
+        self.assertTrue(isinstance(data, NASA))
+        self.assertTrue(requests[0].future is not None)
+        self.assertTrue(requests[2].future is None)
+        self.assertTrue(requests[2].source is requests[1])
+
+        data1 = spcs[1].getThermoData()
+        data2 = spcs[2].getThermoData()
+        self.assertTrue(data1 is not data2)
+        self.assertAlmostEqual(data1.getEnthalpy(298), data2.getEnthalpy(298))
+        self.assertAlmostEqual(spcs[2].conformer.E0.value_si, data2.E0.value_si)
+
+    def testResonanceOrder(self):
+        """
+        Test that the resonance isomers of the species are ordered as in a
+        serial run once their thermo is resolved.
+        """
+        serial = Species().fromSMILES('CC=C[CH2]')
+        serial.generateResonanceIsomers()
+        generateThermoData(serial)
+
+        spcs = [Species().fromSMILES('CC=C[CH2]'), Species().fromSMILES('C=C[CH]C')]
+        spcs[1].generateResonanceIsomers()
+        spcs[1].molecule.reverse()
+        for spc in spcs:
+            submit(spc)
+        for spc in spcs:
+            spc.getThermoData()
+            self.assertEqual(len(spc.molecule), len(serial.molecule))
+            for molecule, molecule0 in zip(spc.molecule, serial.molecule):
+                self.assertTrue(molecule.isIsomorphic(molecule0))
+
+class ProcessExecutorTest(NativeExecutorTest):
+    """
+    Contains the unit tests of thermo requests batched for the native
+    executor, run with a pool of worker processes.
+    """
+
+    def setUp(self):
+        load()
+        setExecutor(2, kind='process')
+
 if __name__ == '__main__' and os.environ.get('IS_ORIGIN', "1") == "1":
     unittest.main()
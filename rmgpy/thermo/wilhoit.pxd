@@ -47,6 +47,14 @@ cdef class Wilhoit(HeatCapacityModel):
 
     cpdef double getFreeEnergy(self, double T) except 1000000000
     
+    cpdef numpy.ndarray getHeatCapacities(self, Tlist)
+
+    cpdef numpy.ndarray getEnthalpies(self, Tlist)
+
+    cpdef numpy.ndarray getEntropies(self, Tlist)
+
+    cpdef numpy.ndarray getFreeEnergies(self, Tlist)
+
     cpdef Wilhoit copy(self)
     
     cdef double integral_T0(self, double T)
@@ -172,6 +172,80 @@ cdef class Wilhoit(HeatCapacityModel):
         """
         return self.getEnthalpy(T) - T * self.getEntropy(T)
     
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef numpy.ndarray getHeatCapacities(self, Tlist):
+        """
+        Return the constant-pressure heat capacities in J/mol*K at the
+        specified temperatures `Tlist` in K.
+        """
+        cdef double[:] T = numpy.asarray(Tlist, numpy.float64)
+        cdef double[:] Cp = numpy.empty(T.shape[0], numpy.float64)
+        cdef double Cp0, CpInf, B, a0, a1, a2, a3
+        cdef double y
+        cdef Py_ssize_t i
+        Cp0, CpInf, B, a0, a1, a2, a3 = self._Cp0.value_si, self._CpInf.value_si, self._B.value_si, self.a0, self.a1, self.a2, self.a3
+        for i in range(T.shape[0]):
+            y = T[i] / (T[i] + B)
+            Cp[i] = Cp0 + (CpInf - Cp0) * y * y * (
+                1 + (y - 1) * (a0 + y * (a1 + y * (a2 + y * a3)))
+            )
+        return numpy.asarray(Cp)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef numpy.ndarray getEnthalpies(self, Tlist):
+        """
+        Return the enthalpies in J/mol at the specified temperatures `Tlist`
+        in K.
+        """
+        cdef double[:] T = numpy.asarray(Tlist, numpy.float64)
+        cdef double[:] H = numpy.empty(T.shape[0], numpy.float64)
+        cdef double Cp0, CpInf, B, a0, a1, a2, a3, H0
+        cdef double y
+        cdef Py_ssize_t i
+        Cp0, CpInf, B, a0, a1, a2, a3 = self._Cp0.value_si, self._CpInf.value_si, self._B.value_si, self.a0, self.a1, self.a2, self.a3
+        H0 = self._H0.value_si
+        for i in range(T.shape[0]):
+            y = T[i] / (T[i] + B)
+            H[i] = H0 + Cp0 * T[i] - (CpInf - Cp0) * T[i] * (
+                y * y * ((3 * a0 + a1 + a2 + a3) / 6. +
+                         (4 * a1 + a2 + a3) * y / 12. +
+                         (5 * a2 + a3) * y * y / 20. +
+                         a3 * y * y * y / 5.) +
+                (2 + a0 + a1 + a2 + a3) * (y / 2. - 1 + (1.0 / y - 1.) * log(B + T[i]))
+            )
+        return numpy.asarray(H)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef numpy.ndarray getEntropies(self, Tlist):
+        """
+        Return the entropies in J/mol*K at the specified temperatures `Tlist`
+        in K.
+        """
+        cdef double[:] T = numpy.asarray(Tlist, numpy.float64)
+        cdef double[:] S = numpy.empty(T.shape[0], numpy.float64)
+        cdef double Cp0, CpInf, B, a0, a1, a2, a3, S0
+        cdef double y
+        cdef Py_ssize_t i
+        Cp0, CpInf, B, a0, a1, a2, a3 = self._Cp0.value_si, self._CpInf.value_si, self._B.value_si, self.a0, self.a1, self.a2, self.a3
+        S0 = self._S0.value_si
+        for i in range(T.shape[0]):
+            y = T[i] / (T[i] + B)
+            S[i] = S0 + CpInf * log(T[i]) - (CpInf - Cp0) * (
+                log(y) + y * (1 + y * (a0 / 2. + y * (a1 / 3. + y * (a2 / 4. + y * a3 / 5.))))
+            )
+        return numpy.asarray(S)
+
+    cpdef numpy.ndarray getFreeEnergies(self, Tlist):
+        """
+        Return the Gibbs free energies in J/mol at the specified temperatures
+        `Tlist` in K.
+        """
+        cdef numpy.ndarray T = numpy.asarray(Tlist, numpy.float64)
+        return self.getEnthalpies(T) - T * self.getEntropies(T)
+    
     cpdef Wilhoit copy(self):
         """
         Return a copy of the Wilhoit object.
@@ -80,14 +80,16 @@ class ObservablesTestCase:
         if os.path.exists(os.path.join(newDir,'tran.dat')):
             newTransportPath = os.path.join(newDir,'tran.dat')
 
-        # load the species and reactions from each model
+        # load the species and reactions from each model, whose dictionaries were written by RMG
         oldSpeciesList, oldReactionList = loadChemkinFile(os.path.join(oldDir,'chem_annotated.inp'),
                                                           os.path.join(oldDir,'species_dictionary.txt'),
-                                                          oldTransportPath)
+                                                          oldTransportPath,
+                                                          checkDictionary=False)
 
         newSpeciesList, newReactionList = loadChemkinFile(os.path.join(newDir,'chem_annotated.inp'),
                                                           os.path.join(newDir,'species_dictionary.txt'),
-                                                          newTransportPath)
+                                                          newTransportPath,
+                                                          checkDictionary=False)
 
         self.oldSim = Cantera(speciesList = oldSpeciesList,
                               reactionList = oldReactionList,
@@ -1,4 +1,5 @@
 import os
+import copy
 import numpy
 import rmgpy.util as util 
 from rmgpy.tools.plot import *
@@ -62,7 +63,35 @@ class ThermoParameterUncertainty:
         """
         dG = self.getUncertaintyValue(source)
         f = numpy.sqrt(3)*dG
+        return f
+    
+    def getUncertaintyComponents(self, source, index):
+        """
+        Decompose the uncertainty in kcal/mol of the species with the given
+        `index` and thermo `source` into contributions from independent
+        uncertain parameters. Returns a dictionary mapping a key for each
+        parameter to its contribution, such that the sum of the squared
+        contributions is the square of :meth:`getUncertaintyValue`.
         
+        Parameters that are shared between species, i.e. library and QM values
+        (keyed by the index of the species they belong to) and group additivity
+        groups (keyed by group type and entry), have the same key for every
+        species that uses them, so that sampling over the keys gives correlated
+        perturbations. The fixed group additivity uncertainty is keyed by the
+        species `index` and is independent for each species.
+        """
+        components = {}
+        if 'Library' in source:
+            components[('Library', source['Library'])] = self.dG_library
+        if 'QM' in source:
+            components[('QM', source['QM'])] = self.dG_QM
+        if 'GAV' in source:
+            components[('Estimation', index)] = self.dG_GAV
+            for groupType, groupEntries in source['GAV'].iteritems():
+                for groupTuple in groupEntries:
+                    key = ('GAV', groupType, groupTuple[0])
+                    components[key] = components.get(key, 0.0) + groupTuple[-1]*self.dG_group
+        return components
     
     
 class KineticParameterUncertainty:
@@ -133,6 +162,43 @@ class KineticParameterUncertainty:
         """
         dlnk = self.getUncertaintyValue(source)
         f = numpy.sqrt(3)/numpy.log(10)*dlnk
+        return f
+    
+    def getUncertaintyComponents(self, source, index):
+        """
+        Decompose the dlnk uncertainty of the reaction with the given `index`
+        and kinetics `source` into contributions from independent uncertain
+        parameters. Returns a dictionary mapping a key for each parameter to its
+        contribution, such that the sum of the squared contributions is the
+        square of :meth:`getUncertaintyValue`.
+        
+        Training reactions and rate rules are keyed by family label and entry,
+        so that reactions estimated from the same rules are perturbed together.
+        Library and pressure-dependent kinetics, as well as the family and
+        nonexactness uncertainties of rate rule estimates, are keyed by the
+        reaction `index` and are independent for each reaction.
+        """
+        components = {}
+        if 'Library' in source:
+            components[('Library', index)] = self.dlnk_library
+        elif 'PDep' in source:
+            components[('PDep', index)] = self.dlnk_pdep
+        elif 'Training' in source:
+            familyLabel, trainingEntry = source['Training']
+            components[('Training', familyLabel, trainingEntry)] = self.dlnk_training
+        elif 'Rate Rules' in source:
+            familyLabel = source['Rate Rules'][0]
+            sourceDict = source['Rate Rules'][1]
+            ruleTuples = list(sourceDict['rules']) + list(sourceDict['training'])
+            
+            dlnk2 = self.dlnk_family**2
+            if not sourceDict['exact']:
+                dlnk2 += (numpy.log10(len(ruleTuples)+1)*self.dlnk_nonexact)**2
+            components[('Estimation', index)] = numpy.sqrt(dlnk2)
+            for ruleTuple in ruleTuples:
+                key = ('Rate Rules', familyLabel, ruleTuple[0])
+                components[key] = components.get(key, 0.0) + ruleTuple[-1]*self.dlnk_rule
+        return components
 
 class Uncertainty:
     """
@@ -213,7 +279,8 @@ class Uncertainty:
 
         self.speciesList, self.reactionList = loadChemkinFile(chemkinPath,
                                                               dictionaryPath=dictionaryPath,
-                                                              transportPath=transportPath)
+                                                              transportPath=transportPath,
+                                                              checkDictionary=False)
 
 
     def extractSourcesFromModel(self):
@@ -344,12 +411,311 @@ class Uncertainty:
         
         self.thermoInputUncertainties = []
         self.kineticInputUncertainties = []
+        self.thermoInputUncertaintyComponents = []
+        self.kineticInputUncertaintyComponents = []
         
-        for species in self.speciesList:
+        for index, species in enumerate(self.speciesList):
             dG = gParamEngine.getUncertaintyValue(self.speciesSourcesDict[species])
             self.thermoInputUncertainties.append(dG)
-        for reaction in self.reactionList:
+            self.thermoInputUncertaintyComponents.append(gParamEngine.getUncertaintyComponents(self.speciesSourcesDict[species], index))
+        for index, reaction in enumerate(self.reactionList):
             dlnk = kParamEngine.getUncertaintyValue(self.reactionSourcesDict[reaction])
             self.kineticInputUncertainties.append(dlnk)
+            self.kineticInputUncertaintyComponents.append(kParamEngine.getUncertaintyComponents(self.reactionSourcesDict[reaction], index))
+    
+    def getUncertaintyMatrices(self, correlated=False):
+        """
+        Return a tuple (thermoMatrix, kineticMatrix) of the matrices that map a
+        vector of independent uncertain parameters to the free energy
+        uncertainties in kcal/mol of the species and the dlnk uncertainties of
+        the reactions, respectively. Each row corresponds to a species or
+        reaction, and each column to an independent parameter. If `correlated`
+        is ``False``, every species and reaction is its own parameter, so the
+        matrices are diagonal; otherwise the columns correspond to the shared
+        sources found by :meth:`assignParameterUncertainties`.
+        """
+        if not correlated:
+            return numpy.diag(self.thermoInputUncertainties), numpy.diag(self.kineticInputUncertainties)
+        return (buildUncertaintyMatrix(self.thermoInputUncertaintyComponents)[0],
+                buildUncertaintyMatrix(self.kineticInputUncertaintyComponents)[0])
+    
+    def sampleParameters(self, numSamples, correlated=False, seed=None):
+        """
+        Draw `numSamples` random perturbations of the model parameters. Each
+        independent uncertain parameter is taken to be uniformly distributed,
+        with a standard deviation equal to its uncertainty. Returns a tuple
+        (dG, dlnk) of arrays with one row per sample, containing the free
+        energy perturbations in kcal/mol of each species and the perturbations
+        of ln(k) for each reaction. If `correlated` is ``True``, species and
+        reactions that share thermo groups, rate rules or training reactions
+        are perturbed together.
+        """
+        thermoMatrix, kineticMatrix = self.getUncertaintyMatrices(correlated)
+        return drawParameterSamples(numpy.random.RandomState(seed), numSamples, thermoMatrix, kineticMatrix)
+    
+    def monteCarloAnalysis(self, conditions, outputSpeciesList, numSamples=1000, correlated=False, kReactions=None, gSpecies=None, 
+                           nprocs=None, seed=None, batchSize=100):
+        """
+        Propagate the parameter uncertainties to the final mole fractions of
+        the species in `outputSpeciesList` by Monte Carlo sampling over the
+        list of `CanteraCondition` objects in `conditions`.
+        
+        The perturbed simulations are run in a pool of `nprocs` processes
+        (all available processors by default), each of which builds the
+        Cantera model once and reuses it for every sample. The samples are
+        drawn in batches of `batchSize` and the outputs are accumulated as they
+        arrive, so memory use does not grow with `numSamples`. Only the
+        reactions and species with indices in `kReactions` and `gSpecies` are
+        perturbed; by default all are.
+        
+        Returns a :class:`RunningStatistics` object over the output vector
+        [Condition1_outputMoleFraction1, Condition1_outputMoleFraction2, ...
+        ConditionN_outputMoleFractionM].
+        """
+        import multiprocessing
+        global _monteCarloWorker
+        
+        if kReactions is None:
+            kReactions = range(len(self.reactionList))
+        if gSpecies is None:
+            gSpecies = range(len(self.speciesList))
+        outputSpeciesIndices = [self.speciesList.index(species) for species in outputSpeciesList]
+        initargs = (self.speciesList, self.reactionList, conditions, outputSpeciesIndices, kReactions, gSpecies)
+        
+        thermoMatrix, kineticMatrix = self.getUncertaintyMatrices(correlated)
+        def generateSamples():
+            random = numpy.random.RandomState(seed)
+            for start in xrange(0, numSamples, batchSize):
+                dG, dlnk = drawParameterSamples(random, min(batchSize, numSamples - start), thermoMatrix, kineticMatrix)
+                for i in xrange(dG.shape[0]):
+                    yield dG[i,gSpecies], dlnk[i,kReactions]
+        
+        statistics = RunningStatistics(len(conditions)*len(outputSpeciesList))
+        if nprocs == 1:
+            # The worker runs in this process and modifies the species and
+            # reactions of the model, so put their original thermo and
+            # kinetics back once all samples have been evaluated
+            _initializeMonteCarloWorker(*initargs)
+            try:
+                for sample in generateSamples():
+                    statistics.update(_evaluateMonteCarloSample(sample))
+            finally:
+                _monteCarloWorker.restore()
+                _monteCarloWorker = None
+        else:
+            pool = multiprocessing.Pool(nprocs, _initializeMonteCarloWorker, initargs)
+            try:
+                for output in pool.imap_unordered(_evaluateMonteCarloSample, generateSamples(), chunksize=max(1, batchSize // 10)):
+                    statistics.update(output)
+            finally:
+                pool.close()
+                pool.join()
+        return statistics
+    
+    def propagateLocalUncertainty(self, reactionSensitivities, thermoSensitivities, correlated=False):
+        """
+        Estimate the uncertainty of an output from its first-order
+        sensitivities: `reactionSensitivities` to ln(k) of each reaction and
+        `thermoSensitivities` to the free energy in kcal/mol of each species,
+        in the order of the reaction and species lists. Either may be ``None``.
+        
+        Returns a tuple (variance, reactionContributions, thermoContributions)
+        with the variance of the output and the contribution of each
+        independent parameter to it. If `correlated` is ``False`` the
+        contributions are ordered as the reactions and species; otherwise they
+        are dictionaries keyed by the shared sources of the parameters.
+        """
+        contributions = []
+        for sensitivities, uncertainties, components in [
+                (reactionSensitivities, self.kineticInputUncertainties, self.kineticInputUncertaintyComponents),
+                (thermoSensitivities, self.thermoInputUncertainties, self.thermoInputUncertaintyComponents)]:
+            if sensitivities is None:
+                contributions.append(numpy.zeros(0) if not correlated else {})
+            elif not correlated:
+                contributions.append((numpy.asarray(sensitivities) * numpy.asarray(uncertainties))**2)
+            else:
+                matrix, keys = buildUncertaintyMatrix(components)
+                contributions.append(dict(zip(keys, numpy.dot(numpy.asarray(sensitivities), matrix)**2)))
+        
+        if correlated:
+            variance = sum(contributions[0].values()) + sum(contributions[1].values())
+        else:
+            variance = numpy.sum(contributions[0]) + numpy.sum(contributions[1])
+        return variance, contributions[0], contributions[1]
+    
+    def localAnalysis(self, sensitiveSpecies, reactionSystemIndex=0, correlated=False):
+        """
+        Run a local (first-order) uncertainty analysis from the sensitivity
+        results saved by an RMG job in the `solver` subdirectory of the output
+        directory, using the sensitivities at the final time. This is much
+        cheaper than :meth:`monteCarloAnalysis` but neglects nonlinear effects.
+        
+        Returns a dictionary mapping each species in `sensitiveSpecies` to the
+        result of :meth:`propagateLocalUncertainty` for ln of its
+        concentration.
+        """
+        from rmgpy.chemkin import getSpeciesIdentifier
+        
+        speciesIdentifiers = dict((getSpeciesIdentifier(species), index) for index, species in enumerate(self.speciesList))
+        results = {}
+        for species in sensitiveSpecies:
+            csvFile = os.path.join(self.outputDirectory, 'solver', 
+                                   'sensitivity_{0}_SPC_{1}.csv'.format(reactionSystemIndex+1, species.index))
+            time, dataList = parseCSVData(csvFile)
+            reactionSensitivities = numpy.zeros(len(self.reactionList))
+            thermoSensitivities = numpy.zeros(len(self.speciesList))
+            for data in dataList:
+                if data.reaction is not None:
+                    reactionSensitivities[int(data.index)-1] = data.data[-1]
+                elif data.species is not None:
+                    thermoSensitivities[speciesIdentifiers[data.species]] = data.data[-1]
+            results[species] = self.propagateLocalUncertainty(reactionSensitivities, thermoSensitivities, correlated)
+        return results
+
+################################################################################
+
+def buildUncertaintyMatrix(componentsList):
+    """
+    Assemble a list of dictionaries of uncertainty contributions, as returned by
+    the `getUncertaintyComponents` methods, into a matrix with one row per item
+    and one column per independent parameter. Returns a tuple (matrix, keys)
+    where `keys` lists the parameter key of each column.
+    """
+    keys = []
+    columns = {}
+    for components in componentsList:
+        for key in components:
+            if key not in columns:
+                columns[key] = len(keys)
+                keys.append(key)
+    matrix = numpy.zeros((len(componentsList), len(keys)))
+    for row, components in enumerate(componentsList):
+        for key, value in components.iteritems():
+            matrix[row, columns[key]] = value
+    return matrix, keys
+
+def drawParameterSamples(random, numSamples, thermoMatrix, kineticMatrix):
+    """
+    Draw `numSamples` samples of the independent uncertain parameters using the
+    NumPy RandomState `random`, each uniformly distributed with unit variance,
+    and map them through `thermoMatrix` and `kineticMatrix` as returned by
+    :meth:`Uncertainty.getUncertaintyMatrices`. Returns a tuple (dG, dlnk) of
+    arrays with one row per sample.
+    """
+    # A uniform variable on [-sqrt(3), sqrt(3)] has unit variance
+    uG = random.uniform(-numpy.sqrt(3), numpy.sqrt(3), (numSamples, thermoMatrix.shape[1]))
+    uk = random.uniform(-numpy.sqrt(3), numpy.sqrt(3), (numSamples, kineticMatrix.shape[1]))
+    return numpy.dot(uG, thermoMatrix.T), numpy.dot(uk, kineticMatrix.T)
+
+class RunningStatistics:
+    """
+    Accumulates the mean, variance, minimum and maximum of a stream of output
+    vectors one sample at a time, using Welford's algorithm, without storing
+    the samples.
+    """
+    
+    def __init__(self, size):
+        self.count = 0
+        self.mean = numpy.zeros(size)
+        self.M2 = numpy.zeros(size)
+        self.min = numpy.inf * numpy.ones(size)
+        self.max = -numpy.inf * numpy.ones(size)
+    
+    def update(self, value):
+        """
+        Add the output vector `value` of a single sample to the statistics.
+        """
+        value = numpy.asarray(value, numpy.float64)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.M2 += delta * (value - self.mean)
+        self.min = numpy.minimum(self.min, value)
+        self.max = numpy.maximum(self.max, value)
+    
+    @property
+    def variance(self):
+        """The sample variance of the outputs."""
+        if self.count < 2:
+            return numpy.zeros_like(self.mean)
+        return self.M2 / (self.count - 1)
+    
+    @property
+    def stddev(self):
+        """The sample standard deviation of the outputs."""
+        return numpy.sqrt(self.variance)
+
+################################################################################
+
+class MonteCarloWorker:
+    """
+    Evaluates perturbed simulations of a single Cantera model. The model is
+    built once, and the thermo and kinetics of the uncertain species and
+    reactions are reset from pristine copies before each sample is applied.
+    Call :meth:`restore` to put the original thermo and kinetics objects back
+    on the species and reactions when done.
+    """
+    
+    def __init__(self, speciesList, reactionList, conditions, outputSpeciesIndices, kReactions, gSpecies):
+        from rmgpy.tools.canteraModel import Cantera
+        
+        self.cantera = Cantera(speciesList=speciesList, reactionList=reactionList, conditions=conditions)
+        self.cantera.loadModel()
+        self.outputSpeciesIndices = outputSpeciesIndices
+        self.kReactions = kReactions
+        self.gSpecies = gSpecies
+        # Each sample perturbs a copy, so the original objects are never modified
+        self.originalKinetics = [reactionList[index].kinetics for index in kReactions]
+        self.originalThermo = [speciesList[index].thermo for index in gSpecies]
+    
+    def evaluate(self, dG, dlnk):
+        """
+        Simulate all conditions with the free energies of the species in
+        `gSpecies` shifted by `dG` in kcal/mol and the rate coefficients of the
+        reactions in `kReactions` scaled by exp(`dlnk`), and return the final
+        mole fractions of the output species.
+        """
+        cantera = self.cantera
+        for i, index in enumerate(self.kReactions):
+            reaction = cantera.reactionList[index]
+            reaction.kinetics = copy.deepcopy(self.originalKinetics[i])
+            reaction.kinetics.changeRate(numpy.exp(dlnk[i]))
+            cantera.modifyReactionKinetics(index, reaction)
+        for i, index in enumerate(self.gSpecies):
+            species = cantera.speciesList[index]
+            species.thermo = copy.deepcopy(self.originalThermo[i])
+            species.thermo.changeBaseEnthalpy(dG[i]*4184.0)   # Convert kcal/mol to J/mol
+            cantera.modifySpeciesThermo(index, species)
+        if self.gSpecies:
+            cantera.refreshModel()
+        
+        allData = cantera.simulate()
+        output = numpy.zeros(len(allData)*len(self.outputSpeciesIndices))
+        for i, conditionData in enumerate(allData):
+            speciesGenericData = conditionData[1][2:]
+            for j, speciesIndex in enumerate(self.outputSpeciesIndices):
+                output[i*len(self.outputSpeciesIndices)+j] = speciesGenericData[speciesIndex].data[-1]
+        return output
+    
+    def restore(self):
+        """
+        Put the original thermo and kinetics objects back on the uncertain
+        species and reactions of the model.
+        """
+        cantera = self.cantera
+        for kinetics, index in zip(self.originalKinetics, self.kReactions):
+            cantera.reactionList[index].kinetics = kinetics
+        for thermo, index in zip(self.originalThermo, self.gSpecies):
+            cantera.speciesList[index].thermo = thermo
+
+# The MonteCarloWorker of the current process, created once per pool worker
+_monteCarloWorker = None
+
+def _initializeMonteCarloWorker(*args):
+    global _monteCarloWorker
+    _monteCarloWorker = MonteCarloWorker(*args)
+
+def _evaluateMonteCarloSample(sample):
+    return _monteCarloWorker.evaluate(*sample)
 
  
\ No newline at end of file
@@ -0,0 +1,121 @@
+import os
+import unittest
+import numpy
+
+import rmgpy
+import rmgpy.tools.uncertainty
+from rmgpy.tools.uncertainty import *
+
+class UncertaintyTest(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Build an Uncertainty object with hand-made thermo and kinetics sources,
+        where the first two species share a group and the last two reactions
+        share a rate rule.
+        """
+        self.uncertainty = Uncertainty(speciesList=['A', 'B', 'C'], reactionList=['r1', 'r2', 'r3'])
+        self.uncertainty.speciesSourcesDict = {
+            'A': {'GAV': {'group': [('CH3', 2), ('CH2', 1)]}},
+            'B': {'GAV': {'group': [('CH3', 1)]}},
+            'C': {'Library': 2},
+        }
+        self.uncertainty.reactionSourcesDict = {
+            'r1': {'Library': 0},
+            'r2': {'Rate Rules': ('H_Abstraction', {'exact': True, 'rules': [('rule1', 1.0)], 'training': []})},
+            'r3': {'Rate Rules': ('H_Abstraction', {'exact': False, 'rules': [('rule1', 0.5), ('rule2', 0.5)], 'training': []})},
+        }
+        self.uncertainty.assignParameterUncertainties()
+
+    def test_uncertainty_components(self):
+        """
+        Test that the uncertainty components add in quadrature to the total uncertainty.
+        """
+        for values, componentsList in [(self.uncertainty.thermoInputUncertainties, self.uncertainty.thermoInputUncertaintyComponents),
+                                       (self.uncertainty.kineticInputUncertainties, self.uncertainty.kineticInputUncertaintyComponents)]:
+            for value, components in zip(values, componentsList):
+                self.assertAlmostEqual(numpy.sqrt(numpy.sum(numpy.array(components.values())**2)), value)
+
+        thermoMatrix, kineticMatrix = self.uncertainty.getUncertaintyMatrices(correlated=True)
+        # A, B share the CH3 group; r2, r3 share rule1
+        self.assertNotEqual(numpy.dot(thermoMatrix[0], thermoMatrix[1]), 0)
+        self.assertEqual(numpy.dot(thermoMatrix[0], thermoMatrix[2]), 0)
+        self.assertNotEqual(numpy.dot(kineticMatrix[1], kineticMatrix[2]), 0)
+        self.assertEqual(numpy.dot(kineticMatrix[0], kineticMatrix[1]), 0)
+
+    def test_sample_parameters(self):
+        """
+        Test that the sampled perturbations have the expected covariance.
+        """
+        dG, dlnk = self.uncertainty.sampleParameters(200000, correlated=True, seed=1)
+        thermoMatrix, kineticMatrix = self.uncertainty.getUncertaintyMatrices(correlated=True)
+        expected = numpy.dot(thermoMatrix, thermoMatrix.T)
+        covariance = numpy.cov(dG.T)
+        for i in range(3):
+            for j in range(3):
+                self.assertAlmostEqual(covariance[i,j], expected[i,j], delta=0.02*expected.max())
+        self.assertTrue(numpy.allclose(numpy.std(dlnk, axis=0), self.uncertainty.kineticInputUncertainties, rtol=0.02))
+
+    def test_running_statistics(self):
+        """
+        Test that the streaming statistics match those of the full sample.
+        """
+        samples = numpy.random.RandomState(0).normal(size=(100, 4))
+        statistics = RunningStatistics(4)
+        for sample in samples:
+            statistics.update(sample)
+        self.assertEqual(statistics.count, 100)
+        self.assertTrue(numpy.allclose(statistics.mean, numpy.mean(samples, axis=0)))
+        self.assertTrue(numpy.allclose(statistics.variance, numpy.var(samples, axis=0, ddof=1)))
+        self.assertTrue(numpy.allclose(statistics.max, numpy.max(samples, axis=0)))
+
+    def test_propagate_local_uncertainty(self):
+        """
+        Test first-order propagation of uncertainties from sensitivities.
+        """
+        reactionSensitivities = numpy.array([0.1, -0.5, 0.5])
+        thermoSensitivities = numpy.array([0.2, 0.0, -1.0])
+        variance, reactionContributions, thermoContributions = self.uncertainty.propagateLocalUncertainty(reactionSensitivities, thermoSensitivities)
+        expected = numpy.sum((reactionSensitivities*self.uncertainty.kineticInputUncertainties)**2) + \
+                   numpy.sum((thermoSensitivities*self.uncertainty.thermoInputUncertainties)**2)
+        self.assertAlmostEqual(variance, expected)
+        self.assertEqual(len(reactionContributions), 3)
+
+        # With correlations, the opposite sensitivities to r2 and r3 partially cancel through rule1
+        correlatedVariance = self.uncertainty.propagateLocalUncertainty(reactionSensitivities, thermoSensitivities, correlated=True)[0]
+        thermoMatrix, kineticMatrix = self.uncertainty.getUncertaintyMatrices(correlated=True)
+        expected = numpy.sum(numpy.dot(reactionSensitivities, kineticMatrix)**2) + numpy.sum(numpy.dot(thermoSensitivities, thermoMatrix)**2)
+        self.assertAlmostEqual(correlatedVariance, expected)
+        self.assertLess(correlatedVariance, variance)
+
+    def test_monte_carlo_restores_model(self):
+        """
+        Test that a serial Monte Carlo analysis leaves the thermo and kinetics
+        of the model unchanged.
+        """
+        from rmgpy.chemkin import loadChemkinFile
+        from rmgpy.tools.canteraModel import CanteraCondition
+
+        folder = os.path.join(os.path.dirname(rmgpy.__file__), 'tools', 'data', 'sens')
+        speciesList, reactionList = loadChemkinFile(os.path.join(folder, 'chem.inp'), os.path.join(folder, 'species_dictionary.txt'))
+        uncertainty = Uncertainty(speciesList=speciesList, reactionList=reactionList)
+        uncertainty.thermoInputUncertainties = 0.5 * numpy.ones(len(speciesList))
+        uncertainty.kineticInputUncertainties = 0.5 * numpy.ones(len(reactionList))
+
+        kinetics = [reaction.kinetics for reaction in reactionList]
+        thermo = [species.thermo for species in speciesList]
+        k0 = [reaction.getRateCoefficient(1000., 1e5) for reaction in reactionList]
+        H0 = [species.getEnthalpy(1000.) for species in speciesList]
+
+        ethane = speciesList[0]
+        conditions = [CanteraCondition('IdealGasConstPressureTemperatureReactor', (1e-3,'s'), {ethane: 1.0}, T0=(1350,'K'), P0=(1.0,'bar'))]
+        statistics = uncertainty.monteCarloAnalysis(conditions, [ethane], numSamples=3, nprocs=1, seed=1)
+        self.assertEqual(statistics.count, 3)
+
+        for reaction, kin, k in zip(reactionList, kinetics, k0):
+            self.assertTrue(reaction.kinetics is kin)
+            self.assertAlmostEqual(reaction.getRateCoefficient(1000., 1e5) / k, 1.0, 8)
+        for species, th, H in zip(speciesList, thermo, H0):
+            self.assertTrue(species.thermo is th)
+            self.assertAlmostEqual(species.getEnthalpy(1000.), H, 6)
+        self.assertTrue(rmgpy.tools.uncertainty._monteCarloWorker is None)
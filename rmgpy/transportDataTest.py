@@ -311,5 +311,42 @@ class TestTransportDatabase(unittest.TestCase):
         transportData, blank, blank2 = self.transportdb.getTransportPropertiesViaGroupEstimates(species)
         self.assertIsNotNone(transportData)
 
+    def testGroupContributionCache(self):
+        "Test that cached group contributions give the same estimates as descending the trees"
+        smiles = ['CCCCCC', 'CC(C)CC(=O)O', 'C1CCCCC1', 'CC=CC#N']
+        cached = [self.transportdb.estimateCriticalPropertiesViaGroupAdditivity(Molecule(SMILES=s)) for s in smiles]
+        self.assertTrue(len(self.transportdb._groupContributionCache) > 0)
+        self.transportdb._groupTreeRadius = dict([(label, -1) for label in self.groups])
+        for s, criticalPoint in zip(smiles, cached):
+            expected = self.transportdb.estimateCriticalPropertiesViaGroupAdditivity(Molecule(SMILES=s))
+            self.assertAlmostEqual(criticalPoint.Tc, expected.Tc, 6)
+            self.assertAlmostEqual(criticalPoint.Pc, expected.Pc, 6)
+            self.assertAlmostEqual(criticalPoint.Vc, expected.Vc, 6)
+            self.assertAlmostEqual(criticalPoint.Tb, expected.Tb, 6)
+            self.assertEqual(criticalPoint.linear, expected.linear)
+
+    def testGroupContributionCacheMultiplicity(self):
+        "Test that group contributions are cached separately for molecules of different multiplicity"
+        self.transportdb.clearGroupCache()
+        singlet = Molecule(SMILES='CCO')
+        triplet = singlet.copy(deep=True)
+        triplet.multiplicity = 3
+        self.transportdb.estimateCriticalPropertiesViaGroupAdditivity(singlet)
+        numEntries = len(self.transportdb._groupContributionCache)
+        self.transportdb.estimateCriticalPropertiesViaGroupAdditivity(triplet)
+        self.assertEqual(len(self.transportdb._groupContributionCache), 2 * numEntries)
+        multiplicities = set([key[0] for label, key in self.transportdb._groupContributionCache])
+        self.assertEqual(multiplicities, set([1, 3]))
+
+    def testSetTransportData(self):
+        "Test that transport data are estimated in bulk and stored with each species"
+        species = [Species(molecule=[Molecule(SMILES=s)]) for s in ['CCO', 'OCC', 'C1=CC=CC=C1']]
+        self.transportdb.setTransportData(species)
+        for spec in species:
+            self.assertTrue(isinstance(spec.transportData, TransportData))
+            self.assertTrue(spec.getTransportData() is spec.transportData)
+        self.assertFalse(species[0].transportData is species[1].transportData)
+        self.assertAlmostEqual(species[0].transportData.sigma.value_si, species[1].transportData.sigma.value_si)
+
 if __name__ == '__main__':
     unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
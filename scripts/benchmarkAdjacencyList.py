@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+This script measures the time taken to read and write the adjacency lists in
+the species dictionaries of the RMG test data. Every dictionary is split into
+its adjacency lists, which are then read into molecules with and without the
+consistency checks and written back out, and the time taken for each step is
+reported. Loading each dictionary as species with
+:func:`rmgpy.chemkin.loadSpeciesDictionary`, which also generates resonance
+isomers, is timed with and without the checks as well. The script also checks
+that writing each molecule gives back an adjacency list that reads as the same
+molecule.
+"""
+
+import os
+import os.path
+import argparse
+import time
+
+from rmgpy import settings
+from rmgpy.chemkin import loadSpeciesDictionary
+from rmgpy.molecule.molecule import Molecule
+from rmgpy.molecule.adjlist import splitAdjacencyLists
+
+################################################################################
+
+def parse_arguments():
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('-r', '--repeat', metavar='N', type=int, default=10,
+        help='the number of times to repeat each step')
+    parser.add_argument('files', metavar='FILE', type=str, nargs='*',
+        help='the species dictionaries to read (default is all of those in the test data)')
+
+    args = parser.parse_args()
+
+    files = args.files
+    if not files:
+        for root, dirs, filenames in os.walk(settings['test_data.directory']):
+            for filename in filenames:
+                if filename in ['species_dictionary.txt', 'dictionary.txt']:
+                    files.append(os.path.join(root, filename))
+    files.sort()
+
+    return files, args.repeat
+
+def main():
+
+    files, repeat = parse_arguments()
+
+    t0 = time.time()
+    for i in range(repeat):
+        adjlists = []
+        for path in files:
+            with open(path, 'r') as f:
+                adjlists.extend(splitAdjacencyLists(f.read()))
+    splitTime = time.time() - t0
+
+    print 'Read {0:d} adjacency lists from {1:d} files'.format(len(adjlists), len(files))
+
+    t0 = time.time()
+    for i in range(repeat):
+        molecules = [Molecule().fromAdjacencyList(adjlist) for adjlist in adjlists]
+    checkedTime = time.time() - t0
+
+    t0 = time.time()
+    for i in range(repeat):
+        molecules = [Molecule().fromAdjacencyList(adjlist, check=False) for adjlist in adjlists]
+    uncheckedTime = time.time() - t0
+
+    t0 = time.time()
+    for i in range(repeat):
+        output = [molecule.toAdjacencyList() for molecule in molecules]
+    writeTime = time.time() - t0
+
+    t0 = time.time()
+    for i in range(repeat):
+        for path in files:
+            loadSpeciesDictionary(path)
+    checkedLoadTime = time.time() - t0
+
+    t0 = time.time()
+    for i in range(repeat):
+        for path in files:
+            loadSpeciesDictionary(path, check=False)
+    uncheckedLoadTime = time.time() - t0
+
+    print 'Splitting dictionaries:         {0:8.3f} s'.format(splitTime)
+    print 'Reading with checks:            {0:8.3f} s'.format(checkedTime)
+    print 'Reading without checks:         {0:8.3f} s ({1:.2f}x)'.format(uncheckedTime, checkedTime / uncheckedTime)
+    print 'Writing:                        {0:8.3f} s'.format(writeTime)
+    print 'Loading species with checks:    {0:8.3f} s'.format(checkedLoadTime)
+    print 'Loading species without checks: {0:8.3f} s ({1:.2f}x)'.format(uncheckedLoadTime, checkedLoadTime / uncheckedLoadTime)
+
+    for molecule, adjlist in zip(molecules, output):
+        if not molecule.isIsomorphic(Molecule().fromAdjacencyList(adjlist)):
+            raise Exception('The adjacency list\n{0}\ndoes not read back as the same molecule.'.format(adjlist))
+    print 'All adjacency lists were read back correctly.'
+
+if __name__ == '__main__':
+    main()
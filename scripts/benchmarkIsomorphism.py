@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+This script compares the speed of the connectivity-ordered and the
+VF2++-ordered subgraph matchers in :mod:`rmgpy.molecule.vf2`. A set of
+molecules is matched against every group in the thermo group trees and the
+reactant templates of the kinetics families in the testing database, and the
+total time taken by each matcher is reported. The script also checks that both
+matchers find the same number of mappings for every molecule-group pair.
+"""
+
+import os.path
+import argparse
+import time
+
+from rmgpy import settings
+from rmgpy.data.rmg import RMGDatabase
+from rmgpy.molecule.molecule import Molecule
+from rmgpy.molecule.group import Group
+from rmgpy.molecule.vf2 import VF2
+
+SMILES = [
+    'C', 'CC', 'C=C', 'C#C', 'CCO', 'CC=O', 'OO', 'C[CH2]', '[CH2]C=C',
+    'CCCCCC', 'CC(C)(C)C', 'C=CC=CC=C', 'c1ccccc1', 'Cc1ccccc1', 'C1CCCCC1',
+    'C1CC2CCC1C2', 'CC(O)C(=O)O', 'CCOC(=O)C', '[O]OCC=C', 'CC(C)C[CH]C(C)=O',
+]
+
+################################################################################
+
+def parse_arguments():
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('-r', '--repeat', metavar='N', type=int, default=5,
+        help='the number of times to repeat each matching pass')
+    parser.add_argument('-d', '--database', metavar='DIR', type=str, default=None,
+        help='the RMG database directory to use (default is the testing database)')
+
+    args = parser.parse_args()
+
+    path = os.path.abspath(args.database) if args.database else os.path.join(settings['test_data.directory'], 'testing_database')
+
+    return path, args.repeat
+
+def loadGroups(path):
+    """
+    Return a list of the :class:`Group` objects in the thermo group trees and
+    the forward templates of the kinetics families in the database at `path`.
+    """
+    database = RMGDatabase()
+    database.loadThermo(os.path.join(path, 'thermo'), thermoLibraries=[], depository=False)
+    database.loadKinetics(os.path.join(path, 'kinetics'), kineticsFamilies='all', reactionLibraries=[])
+
+    groups = []
+    for tree in database.thermo.groups.values():
+        for entry in tree.entries.values():
+            if isinstance(entry.item, Group):
+                groups.append(entry.item)
+    for family in database.kinetics.families.values():
+        for entry in family.groups.entries.values():
+            if isinstance(entry.item, Group):
+                groups.append(entry.item)
+    return groups
+
+def timeMatcher(vf2, molecules, groups, repeat):
+    """
+    Match every molecule against every group `repeat` times using the given
+    `vf2` matcher. Return the total time in seconds and the number of mappings
+    found for each molecule-group pair.
+    """
+    counts = []
+    t0 = time.time()
+    for i in range(repeat):
+        counts = []
+        for molecule in molecules:
+            for group in groups:
+                counts.append(len(vf2.findSubgraphIsomorphisms(molecule, group, None)))
+    return time.time() - t0, counts
+
+def main():
+
+    path, repeat = parse_arguments()
+
+    groups = loadGroups(path)
+    molecules = [Molecule().fromSMILES(smiles) for smiles in SMILES]
+
+    print 'Matching {0:d} molecules against {1:d} groups from {2}'.format(len(molecules), len(groups), path)
+
+    oldTime, oldCounts = timeMatcher(VF2(ordered=False), molecules, groups, repeat)
+    newTime, newCounts = timeMatcher(VF2(ordered=True), molecules, groups, repeat)
+
+    print 'Connectivity-ordered matcher: {0:8.3f} s'.format(oldTime)
+    print 'VF2++-ordered matcher:        {0:8.3f} s'.format(newTime)
+    print 'Speedup:                      {0:8.2f}x'.format(oldTime / newTime)
+
+    if oldCounts != newCounts:
+        mismatches = sum(1 for old, new in zip(oldCounts, newCounts) if old != new)
+        raise Exception('The two matchers disagreed on {0:d} molecule-group pairs.'.format(mismatches))
+    print 'Both matchers found {0:d} mappings in total.'.format(sum(newCounts))
+
+if __name__ == '__main__':
+    main()
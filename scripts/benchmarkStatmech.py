@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+This script times the evaluation of densities of states for the cases used in
+the unit tests of :mod:`rmgpy.statmech`. It compares solving the Schrodinger
+equation for hindered rotors with and without the cache of energy levels, the
+direct and fast Fourier transform convolutions of densities of states on
+increasingly fine energy grids, for both smooth and sparse comb-like
+densities of states, and the first and repeated evaluations of
+:meth:`Conformer.getDensityOfStates`. The script also checks that the
+different methods agree with one another.
+"""
+
+import argparse
+import time
+
+import numpy
+
+from rmgpy.statmech import Conformer, IdealGasTranslation, NonlinearRotor, HarmonicOscillator, HinderedRotor
+from rmgpy.statmech.torsion import clearEnergyLevelCache
+from rmgpy.statmech.schrodinger import convolveDirect, convolveFFT
+
+GRAIN_COUNTS = [250, 500, 1000, 2000, 4000]
+
+################################################################################
+
+def parse_arguments():
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('-r', '--repeat', metavar='N', type=int, default=10,
+        help='the number of times to repeat each evaluation')
+
+    args = parser.parse_args()
+
+    return args.repeat
+
+def getRotors():
+    """
+    Return a list of the :class:`HinderedRotor` objects used in the unit
+    tests, with quantum mechanical treatment enabled.
+    """
+    return [
+        HinderedRotor(
+            inertia = (1.56764,"amu*angstrom^2"),
+            symmetry = 3,
+            fourier = ([ [4.58375, 0.841648, -5702.71, 6.02657, 4.7446], [0.726951, -0.677255, 0.207032, 0.553307, -0.503303] ],"J/mol"),
+            quantum = True,
+        ),
+        HinderedRotor(
+            inertia = (1.56764,"amu*angstrom^2"),
+            symmetry = 3,
+            barrier = (11.373,"kJ/mol"),
+            quantum = True,
+        ),
+    ]
+
+def getConformers():
+    """
+    Return a list of the :class:`Conformer` objects used in the unit tests.
+    """
+    ethylene = Conformer(
+        E0 = (0.0,"kJ/mol"),
+        modes = [
+            IdealGasTranslation(mass=(28.03,"amu")),
+            NonlinearRotor(inertia=([3.41526,16.6498,20.065],"amu*angstrom^2"), symmetry=4),
+            HarmonicOscillator(frequencies=([828.397,970.652,977.223,1052.93,1233.55,1367.56,1465.09,1672.25,3098.46,3111.7,3165.79,3193.54],"cm^-1")),
+        ],
+        spinMultiplicity = 1,
+        opticalIsomers = 1,
+    )
+    ethane = Conformer(
+        E0 = (0.0,"kJ/mol"),
+        modes = [
+            IdealGasTranslation(mass=(30.0469,"amu")),
+            NonlinearRotor(inertia=([6.27071,25.3832,25.3833],"amu*angstrom^2"), symmetry=6),
+            HarmonicOscillator(frequencies=([818.917,819.479,987.099,1206.76,1207.05,1396,1411.35,1472.76,1475.63,1475.85,1479.84,3040.39,3040.91,3061.11,3061.35,3075.93,3076.29],"cm^-1")),
+            HinderedRotor(inertia=(1.56764,"amu*angstrom^2"), symmetry=3, barrier=(11.373,"kJ/mol")),
+        ],
+        spinMultiplicity = 1,
+        opticalIsomers = 1,
+    )
+    return [ethylene, ethane]
+
+def timeRotors(rotors, repeat, cache):
+    """
+    Solve the Schrodinger equation for each of the `rotors` `repeat` times,
+    clearing the cache of energy levels before every solution unless `cache`
+    is ``True``. Return the total time in seconds and the energy levels.
+    """
+    energies = []
+    clearEnergyLevelCache()
+    t0 = time.time()
+    for i in range(repeat):
+        energies = []
+        for rotor in rotors:
+            if not cache: clearEnergyLevelCache()
+            energies.append(rotor.solveSchrodingerEquation())
+    return time.time() - t0, energies
+
+def getCombs(Ngrains):
+    """
+    Return two sparse comb-like densities of states on `Ngrains` grains, like
+    those of quantum oscillators on a fine energy grid.
+    """
+    rho1 = numpy.zeros(Ngrains)
+    rho1[::37] = 1.0
+    rho2 = numpy.zeros(Ngrains)
+    rho2[::53] = 2.0
+    return rho1, rho2
+
+def timeConvolve(convolve, rho1, rho2, repeat):
+    """
+    Convolve the densities of states `rho1` and `rho2` using the function
+    `convolve` `repeat` times. Return the total time in seconds and the
+    convolved density of states.
+    """
+    t0 = time.time()
+    for i in range(repeat):
+        rho = convolve(rho1, rho2)
+    return time.time() - t0, rho
+
+def timeConformer(conformer, Elist, repeat, cache):
+    """
+    Evaluate the density of states of `conformer` on the energy grid `Elist`
+    `repeat` times, clearing the remembered densities of states before every
+    evaluation unless `cache` is ``True``. Return the total time in seconds and
+    the density of states.
+    """
+    conformer.clearDensityOfStatesCache()
+    t0 = time.time()
+    for i in range(repeat):
+        if not cache: conformer.clearDensityOfStatesCache()
+        densStates = conformer.getDensityOfStates(Elist)
+    return time.time() - t0, densStates
+
+def checkAgreement(label, old, new, rtol=1e-6):
+    """
+    Raise an exception if the arrays `old` and `new` differ by more than the
+    relative tolerance `rtol`.
+    """
+    if not numpy.allclose(old, new, rtol=rtol, atol=0):
+        raise Exception('The two methods disagreed for {0}.'.format(label))
+
+def main():
+
+    repeat = parse_arguments()
+
+    rotors = getRotors()
+    conformers = getConformers()
+
+    print 'Solving the Schrodinger equation for {0:d} hindered rotors'.format(len(rotors))
+    oldTime, oldEnergies = timeRotors(rotors, repeat, cache=False)
+    newTime, newEnergies = timeRotors(rotors, repeat, cache=True)
+    for old, new in zip(oldEnergies, newEnergies):
+        checkAgreement('the hindered rotor energy levels', old, new)
+    print '    Without cache:   {0:8.3f} s'.format(oldTime)
+    print '    With cache:      {0:8.3f} s'.format(newTime)
+    print '    Speedup:         {0:8.2f}x'.format(oldTime / newTime)
+    print
+
+    print 'Convolving densities of states'
+    for Ngrains in GRAIN_COUNTS:
+        Elist = numpy.linspace(0, 200000., Ngrains)
+        rho1 = conformers[0].modes[0].getDensityOfStates(Elist)
+        rho2 = conformers[0].modes[1].getDensityOfStates(Elist)
+        oldTime, oldRho = timeConvolve(convolveDirect, rho1, rho2, repeat)
+        newTime, newRho = timeConvolve(convolveFFT, rho1, rho2, repeat)
+        checkAgreement('the convolution on {0:d} grains'.format(Ngrains), oldRho, newRho)
+        print '    {0:5d} grains: direct {1:8.3f} s, FFT {2:8.3f} s, speedup {3:8.2f}x'.format(Ngrains, oldTime, newTime, oldTime / newTime)
+    print
+
+    print 'Convolving sparse comb-like densities of states'
+    for Ngrains in GRAIN_COUNTS:
+        rho1, rho2 = getCombs(Ngrains)
+        oldTime, oldRho = timeConvolve(convolveDirect, rho1, rho2, repeat)
+        newTime, newRho = timeConvolve(convolveFFT, rho1, rho2, repeat)
+        checkAgreement('the comb convolution on {0:d} grains'.format(Ngrains), oldRho, newRho)
+        print '    {0:5d} grains: direct {1:8.3f} s, FFT {2:8.3f} s, speedup {3:8.2f}x'.format(Ngrains, oldTime, newTime, oldTime / newTime)
+    print
+
+    print 'Evaluating the densities of states of {0:d} conformers'.format(len(conformers))
+    for Ngrains in GRAIN_COUNTS:
+        Elist = numpy.linspace(0, 200000., Ngrains)
+        oldTime = newTime = 0.0
+        for conformer in conformers:
+            t, oldDensStates = timeConformer(conformer, Elist, repeat, cache=False)
+            oldTime += t
+            t, newDensStates = timeConformer(conformer, Elist, repeat, cache=True)
+            newTime += t
+            checkAgreement('the conformer density of states on {0:d} grains'.format(Ngrains), oldDensStates, newDensStates)
+        print '    {0:5d} grains: uncached {1:8.3f} s, memoized {2:8.3f} s, speedup {3:8.2f}x'.format(Ngrains, oldTime, newTime, oldTime / newTime)
+
+if __name__ == '__main__':
+    main()
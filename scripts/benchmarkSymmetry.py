@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+This script measures the time taken to estimate the symmetry numbers of the
+molecules used in the symmetry unit tests. Each molecule is analyzed both
+with an empty symmetry cache, so that every structure is analyzed from
+scratch, and with the cache filled, so that repeated structures are looked up.
+The time spent in each of the atom, bond, axis, and cyclic symmetry functions
+is also reported, along with the symmetry number of each molecule.
+"""
+
+import argparse
+import time
+
+from rmgpy.molecule.molecule import Molecule
+from rmgpy.molecule.symmetry import calculateAtomSymmetryNumber, calculateAxisSymmetryNumber, calculateBondSymmetryNumber, calculateCyclicSymmetryNumber, calculateSymmetryNumber, clearSymmetryCache
+
+SMILES = [
+    'C', 'C#C', 'C#CC#C', 'C(=CC(c1ccccc1)C([CH]CCCCCC)C=Cc1ccccc1)[CH]CCCCCC',
+    'C1=C=C=1', 'C1CCCCC1', 'C=C', 'C=C=C', 'C=C=C(C(C(C(C=C=C)=C=C)=C=C)=C=C)',
+    'C=C=C=C', 'C=C=C=N', 'C=C=C=O', 'C=C=C=[CH]', 'C=C=C=[N]', 'C=C=CCCC',
+    'C=C=[C]', 'C=C=[C]C(C)(C)[C]=C=C', 'C=O', 'C=[CH]', 'CC', 'CC(C)=C=C(CC)CC',
+    'CC(C)C', 'CC=C=C=O', 'CC=C=[C]', 'CCC', 'CCCC', 'Cc1ccc(C)cc1', 'Cc1ccccc1C',
+    'O', 'O=O', '[CH3]', '[C]#[C]', '[H][H]', '[OH]', 'c1ccccc1', 'c1ccccc1C',
+]
+
+################################################################################
+
+def parse_arguments():
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('-r', '--repeat', metavar='N', type=int, default=20,
+        help='the number of times to repeat each timing pass')
+
+    args = parser.parse_args()
+
+    return args.repeat
+
+def timeSymmetryNumbers(molecules, repeat, cached):
+    """
+    Calculate the symmetry number of every molecule `repeat` times. If
+    `cached` is ``False``, the symmetry cache is cleared before each
+    calculation. Return the total time in seconds and the symmetry numbers.
+    """
+    clearSymmetryCache()
+    symmetryNumbers = []
+    t0 = time.time()
+    for i in range(repeat):
+        symmetryNumbers = []
+        for molecule in molecules:
+            if not cached: clearSymmetryCache()
+            symmetryNumbers.append(calculateSymmetryNumber(molecule))
+    return time.time() - t0, symmetryNumbers
+
+def timeComponents(molecules, repeat):
+    """
+    Call each of the atom, bond, axis, and cyclic symmetry functions on every
+    applicable part of each molecule `repeat` times. Return a dictionary of
+    the total time in seconds spent in each function.
+    """
+    times = {'atom': 0.0, 'bond': 0.0, 'axis': 0.0, 'cyclic': 0.0}
+    for molecule in molecules:
+        atoms = [atom for atom in molecule.vertices if not molecule.isAtomInCycle(atom)]
+        bonds = [(atom1, atom2) for atom1 in molecule.vertices for atom2 in atom1.edges
+            if molecule.vertices.index(atom1) < molecule.vertices.index(atom2) and not molecule.isBondInCycle(atom1.edges[atom2])]
+        cyclic = molecule.isCyclic()
+        for i in range(repeat):
+            t0 = time.time()
+            for atom in atoms:
+                calculateAtomSymmetryNumber(molecule, atom)
+            t1 = time.time()
+            for atom1, atom2 in bonds:
+                calculateBondSymmetryNumber(molecule, atom1, atom2)
+            t2 = time.time()
+            calculateAxisSymmetryNumber(molecule)
+            t3 = time.time()
+            if cyclic:
+                calculateCyclicSymmetryNumber(molecule)
+            t4 = time.time()
+            times['atom'] += t1 - t0
+            times['bond'] += t2 - t1
+            times['axis'] += t3 - t2
+            times['cyclic'] += t4 - t3
+    return times
+
+def main():
+
+    repeat = parse_arguments()
+
+    molecules = [Molecule().fromSMILES(smiles) for smiles in SMILES]
+
+    print 'Calculating symmetry numbers of {0:d} molecules {1:d} times'.format(len(molecules), repeat)
+
+    coldTime, coldNumbers = timeSymmetryNumbers(molecules, repeat, cached=False)
+    warmTime, warmNumbers = timeSymmetryNumbers(molecules, repeat, cached=True)
+    clearSymmetryCache()
+
+    print 'Without cache: {0:8.3f} s'.format(coldTime)
+    print 'With cache:    {0:8.3f} s'.format(warmTime)
+    print 'Speedup:       {0:8.2f}x'.format(coldTime / warmTime)
+
+    times = timeComponents(molecules, repeat)
+    for label in ['atom', 'bond', 'axis', 'cyclic']:
+        print 'Time in {0:6} symmetry: {1:8.3f} s'.format(label, times[label])
+
+    if coldNumbers != warmNumbers:
+        raise Exception('The cached symmetry numbers do not match the calculated ones.')
+    print
+    for smiles, symmetryNumber in zip(SMILES, coldNumbers):
+        print '{0:6d}  {1}'.format(symmetryNumber, smiles)
+
+if __name__ == '__main__':
+    main()